@@ -63,6 +63,9 @@ version = __version__
 
 #
 
-from pyedb.generic.design_types import Edb, Siwave
+# Backends are loaded on first access of ``pyedb.Edb`` or ``pyedb.Siwave``.
+from pyedb.misc.lazy_import import attach
+
+__getattr__, __dir__ = attach(__name__, {"Edb": ".generic.design_types", "Siwave": ".generic.design_types"})[:2]
 
 __all__ = ["Edb", "Siwave", "__version__", "version", "pyedb_path"]
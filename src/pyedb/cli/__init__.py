@@ -36,7 +36,7 @@ except ImportError as e:  # pragma: no cover
     ) from e
 
 from pyedb import __version__
-from pyedb.cli import common
+from pyedb.cli import common, daemon
 
 app = typer.Typer(no_args_is_help=True, help="PyEDB command line interface.")
 config_app = typer.Typer(help="Configuration commands.")
@@ -51,10 +51,23 @@ def _set_json(json_output: bool) -> None:
 
 @app.callback()
 def main_callback(
+    ctx: typer.Context,
     json_output: bool = _JSON_OPTION,
+    use_daemon: bool = typer.Option(
+        True, "--daemon/--no-daemon", help="Attach to a running 'pyedb serve' daemon when available."
+    ),
+    profile_rpc: Path = typer.Option(
+        None,
+        "--profile-rpc",
+        help="Record the RPC calls of the command and write a JSON report to this path, "
+        "plus a flame graph ('.folded') next to it.",
+    ),
 ) -> None:
     """CLI entrypoint for PyEDB."""
     _set_json(json_output)
+    common.use_daemon = use_daemon
+    if profile_rpc is not None:
+        ctx.call_on_close(common.start_rpc_profiler(profile_rpc))
 
 
 @export_app.callback()
@@ -84,6 +97,48 @@ def version() -> None:
         typer.secho(__version__, fg="cyan")
 
 
+@app.command()
+def serve(
+    version: str = typer.Option(None, "--version", help="AEDT/EDB version to use."),
+    max_open: int = typer.Option(daemon.DEFAULT_MAX_OPEN, "--max-open", help="Maximum number of open databases."),
+    idle_timeout: float = typer.Option(
+        daemon.DEFAULT_IDLE_TIMEOUT,
+        "--idle-timeout",
+        help="Seconds before an unused database is closed. Use 0 to keep databases open.",
+    ),
+    port: int = typer.Option(0, "--port", help="Local daemon port. Selected automatically by default."),
+    status: bool = typer.Option(False, "--status", help="Show the running daemon state and exit."),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon and exit."),
+) -> None:
+    """Run a daemon keeping an RPC server and databases open for the other commands."""
+
+    def _run() -> None:
+        client = common.find_daemon()
+        if status or stop:
+            if client is None:
+                raise RuntimeError("No pyedb daemon is running.")
+            data = client.request("shutdown" if stop else "status")
+            if common.json_mode:
+                common.print_output(data=data)
+            elif stop:
+                typer.secho("pyedb daemon stopped", fg="green")
+            else:
+                typer.echo(
+                    f"pyedb daemon pid {data['pid']}, {len(data['databases'])}/{data['max_open']} databases open"
+                )
+                for entry in data["databases"]:
+                    typer.echo(f"  {entry['edb_path']} (in use: {entry['in_use']}, idle: {entry['idle']:.0f}s)")
+            return
+        if client is not None:
+            raise RuntimeError("A pyedb daemon is already running. Stop it with 'pyedb serve --stop'.")
+        server = daemon.EdbDaemon(version=common.resolve_version(version), max_open=max_open, idle_timeout=idle_timeout)
+        if not common.json_mode:
+            typer.secho(f"pyedb daemon listening (state file '{daemon.state_file_path()}')", fg="green")
+        server.serve_forever(port=port)
+
+    common.run_with_error_handling(_run)
+
+
 @app.command()
 def create(
     path: str = typer.Option(..., "--path", "-p", help="Path for the new .aedb database."),
@@ -37,12 +37,14 @@ except ImportError as e:  # pragma: no cover
     ) from e
 
 json_mode = False
+use_daemon = True
 
 
 def reset_state() -> None:
     """Reset module-level state. Call between CLI invocations (e.g. in tests)."""
-    global json_mode
+    global json_mode, use_daemon
     json_mode = False
+    use_daemon = True
 
 
 CONFIG_EXPORT_FLAGS = {
@@ -95,6 +97,36 @@ def get_edb_class():
     return Edb
 
 
+def find_daemon():
+    """Return a client of the running ``pyedb serve`` daemon, or ``None`` when no daemon answers."""
+    from pyedb.cli.daemon import DaemonClient
+
+    return DaemonClient.find()
+
+
+def start_rpc_profiler(path: str | Path):
+    """Start recording RPC calls and return a callback writing the reports to *path* when the command ends.
+
+    The JSON report is written to *path* and the collapsed flame-graph stacks to the same path with a
+    ``.folded`` suffix.
+    """
+    from pyedb.grpc.rpc_profiler import RpcProfiler
+
+    path = Path(path)
+    profiler = RpcProfiler().start()
+
+    def _finish() -> None:
+        profiler.stop()
+        profiler.write_json(path)
+        flamegraph = profiler.write_flamegraph(path.with_suffix(".folded"))
+        typer.echo(
+            f"RPC profile: {profiler.total_calls} calls, report '{path}', flame graph '{flamegraph}'",
+            err=True,
+        )
+
+    return _finish
+
+
 def resolve_version(version: str | None) -> str | None:
     """Return *version* if given, otherwise detect the latest installed AEDT version."""
     if version:
@@ -146,7 +178,11 @@ def managed_edb(
     cellname: str | None = None,
     isreadonly: bool = False,
 ):
-    """Open an EDB from an explicit path and close it on exit."""
+    """Open an EDB from an explicit path and close it on exit.
+
+    When a ``pyedb serve`` daemon is running, the database kept open by the daemon is attached instead and left open
+    on exit.
+    """
     existing_path = ensure_existing_edb_path(edb_path)
     context = {
         "edb_path": existing_path,
@@ -154,6 +190,11 @@ def managed_edb(
         "cellname": cellname,
         "isreadonly": bool(isreadonly),
     }
+    daemon = find_daemon() if use_daemon else None
+    if daemon is not None:
+        with daemon.attached_edb(existing_path, cellname=cellname, isreadonly=isreadonly, version=version) as edb:
+            yield edb, context
+        return
     Edb = get_edb_class()
     edb = Edb(
         existing_path,
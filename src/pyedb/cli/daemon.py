@@ -0,0 +1,476 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Warm EDB daemon used by ``pyedb serve``.
+
+The daemon keeps one EDB RPC server running and an LRU pool of open databases. CLI commands find the daemon through
+a state file, ask it for a database over an authenticated local socket, and attach to the already open database with
+:meth:`RpcSession.connect_to_existing_server <pyedb.grpc.rpc_session.RpcSession.connect_to_existing_server>`. Server
+startup and database open costs are then paid once instead of on every command.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+from multiprocessing.connection import Client, Listener
+import os
+from pathlib import Path
+import secrets
+import threading
+import time
+from typing import Any, Callable
+
+import psutil
+
+DEFAULT_MAX_OPEN = 4
+DEFAULT_IDLE_TIMEOUT = 600.0
+DEFAULT_HOST = "127.0.0.1"
+STATE_FILE_ENV = "PYEDB_DAEMON_STATE"
+
+
+def state_file_path() -> Path:
+    """Return the path of the daemon state file.
+
+    The location can be overridden with the ``PYEDB_DAEMON_STATE`` environment variable.
+    """
+    override = os.getenv(STATE_FILE_ENV)
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".pyedb" / "daemon.json"
+
+
+def definition_mtime(edb_path: str) -> float | None:
+    """Return the modification time of the ``edb.def`` file of ``edb_path``, or ``None`` if it cannot be read."""
+    path = Path(edb_path)
+    if path.name.lower() != "edb.def":
+        path = path / "edb.def"
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _same_version(requested: str | None, opened: str | None) -> bool:
+    """Compare EDB versions written either as ``"2026.1"`` or ``"26.1"``. No requested version matches any."""
+    if not requested:
+        return True
+
+    def short(version):
+        version = str(version)
+        return version[2:] if len(version) == 6 and version.startswith("20") else version
+
+    return short(requested) == short(opened)
+
+
+@dataclass
+class _PoolEntry:
+    edb: Any
+    isreadonly: bool
+    last_used: float
+    mtime: float | None = None
+    in_use: int = 0
+    dirty: bool = False
+
+
+@dataclass
+class DatabasePool:
+    """LRU pool of open databases.
+
+    A pooled database is only handed out again while it matches what is on disk: it is reopened when a previous
+    writer may have left unsaved edits in it, when its ``edb.def`` file changed, or when another EDB version or
+    write access is requested.
+
+    Parameters
+    ----------
+    open_edb : callable
+        Factory called as ``open_edb(edb_path, isreadonly, version)`` that returns an open ``Edb`` object.
+        ``version`` is ``None`` when the caller accepts any version.
+    max_open : int, optional
+        Maximum number of databases kept open. The least recently used idle database is closed first.
+    idle_timeout : float, optional
+        Seconds after which an unused database is closed by :meth:`evict_idle`. ``0`` disables idle eviction.
+    clock : callable, optional
+        Monotonic clock returning seconds.
+    mtime : callable, optional
+        Function returning the modification time of a database, used to detect databases changed on disk.
+    """
+
+    open_edb: Callable[[str, bool, str | None], Any]
+    max_open: int = DEFAULT_MAX_OPEN
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    clock: Callable[[], float] = time.monotonic
+    mtime: Callable[[str], float | None] = definition_mtime
+    _entries: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, edb_path):
+        return edb_path in self._entries
+
+    @staticmethod
+    def _incompatibility(entry: _PoolEntry, isreadonly: bool, version: str | None) -> str:
+        if entry.isreadonly and not isreadonly:
+            return "is open read-only"
+        if not _same_version(version, getattr(entry.edb, "version", None)):
+            return f"is open with EDB version {entry.edb.version}"
+        return ""
+
+    def acquire(self, edb_path: str, isreadonly: bool = False, version: str | None = None):
+        """Return the open database for ``edb_path``, opening it when needed.
+
+        An idle pooled database is reopened when it is read-only and write access is requested, when it was opened
+        with another EDB version, when a previous writer released it, or when its ``edb.def`` file changed.
+
+        Raises
+        ------
+        RuntimeError
+            When the pooled database is in use and cannot serve the request, because it is read-only and write
+            access is requested or because it was opened with another EDB version.
+        """
+        entry = self._entries.get(edb_path)
+        if entry is not None:
+            incompatibility = self._incompatibility(entry, isreadonly, version)
+            if incompatibility and entry.in_use:
+                raise RuntimeError(f"'{edb_path}' {incompatibility} and is in use by another command.")
+            if not entry.in_use and (incompatibility or entry.dirty or self.mtime(edb_path) != entry.mtime):
+                self.close(edb_path)
+                entry = None
+        if entry is None:
+            self._make_room()
+            mtime = self.mtime(edb_path)
+            entry = _PoolEntry(self.open_edb(edb_path, isreadonly, version), isreadonly, self.clock(), mtime)
+            self._entries[edb_path] = entry
+        self._entries.move_to_end(edb_path)
+        entry.in_use += 1
+        entry.last_used = self.clock()
+        return entry.edb
+
+    def release(self, edb_path: str, discard: bool = False, dirty: bool = False):
+        """Mark one use of ``edb_path`` as finished.
+
+        Parameters
+        ----------
+        edb_path : str
+            Database path given to :meth:`acquire`.
+        discard : bool, optional
+            Close the database once it is no longer used, for example because the client saved it elsewhere.
+        dirty : bool, optional
+            Whether the client may have edited the database without saving it. A dirty database is reopened
+            before it is handed out again.
+        """
+        entry = self._entries.get(edb_path)
+        if entry is None:
+            return False
+        entry.in_use = max(entry.in_use - 1, 0)
+        entry.last_used = self.clock()
+        entry.dirty = entry.dirty or dirty
+        if discard and not entry.in_use:
+            self.close(edb_path)
+        return True
+
+    def close(self, edb_path: str) -> bool:
+        """Close ``edb_path`` and remove it from the pool."""
+        entry = self._entries.pop(edb_path, None)
+        if entry is None:
+            return False
+        entry.edb.close(terminate_rpc_session=False)
+        return True
+
+    def evict_idle(self) -> list[str]:
+        """Close the databases unused for longer than ``idle_timeout``.
+
+        Returns
+        -------
+        list[str]
+            Paths of the closed databases.
+        """
+        if not self.idle_timeout:
+            return []
+        now = self.clock()
+        expired = [
+            path
+            for path, entry in self._entries.items()
+            if not entry.in_use and now - entry.last_used > self.idle_timeout
+        ]
+        for path in expired:
+            self.close(path)
+        return expired
+
+    def close_all(self):
+        """Close every database of the pool."""
+        for path in list(self._entries):
+            self.close(path)
+
+    def status(self) -> list[dict]:
+        """Return the pool content, least recently used first."""
+        now = self.clock()
+        return [
+            {
+                "edb_path": path,
+                "isreadonly": entry.isreadonly,
+                "in_use": entry.in_use,
+                "dirty": entry.dirty,
+                "idle": now - entry.last_used,
+            }
+            for path, entry in self._entries.items()
+        ]
+
+    def _make_room(self):
+        while len(self._entries) >= max(self.max_open, 1):
+            idle = [path for path, entry in self._entries.items() if not entry.in_use]
+            if not idle:
+                raise RuntimeError(f"All {len(self._entries)} pooled databases are in use.")
+            self.close(idle[0])
+
+
+class EdbDaemon:
+    """Daemon serving open databases to CLI commands.
+
+    Parameters
+    ----------
+    version : str, optional
+        AEDT/EDB version of the RPC server.
+    max_open : int, optional
+        Maximum number of databases kept open.
+    idle_timeout : float, optional
+        Seconds after which an unused database is closed.
+    open_edb : callable, optional
+        Factory called as ``open_edb(edb_path, isreadonly, version)``. The default opens a gRPC ``Edb`` that keeps
+        the RPC server running when it is closed.
+    """
+
+    def __init__(
+        self,
+        version: str | None = None,
+        max_open: int = DEFAULT_MAX_OPEN,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        open_edb: Callable[[str, bool, str | None], Any] | None = None,
+    ):
+        self.version = version
+        self.pool = DatabasePool(open_edb or self._open_edb, max_open=max_open, idle_timeout=idle_timeout)
+        self._owns_rpc_server = open_edb is None
+        self._lock = threading.Lock()
+        self._running = False
+
+    def _open_edb(self, edb_path: str, isreadonly: bool, version: str | None = None):
+        from pyedb.grpc.edb import Edb
+
+        return Edb(edb_path, version=version or self.version, isreadonly=isreadonly)
+
+    @staticmethod
+    def _rpc_port() -> int:
+        from pyedb.grpc.rpc_session import RpcSession
+
+        return RpcSession.port
+
+    def handle(self, request: dict) -> dict:
+        """Execute one client request.
+
+        Supported commands are ``ping``, ``acquire``, ``release``, ``close``, ``status`` and ``shutdown``.
+
+        Returns
+        -------
+        dict
+            ``{"status": "ok", "data": ...}`` or ``{"status": "error", "error": message}``.
+        """
+        command = request.get("command")
+        try:
+            with self._lock:
+                if command == "ping":
+                    data = {"pid": os.getpid()}
+                elif command == "acquire":
+                    edb_path = request["edb_path"]
+                    edb = self.pool.acquire(edb_path, bool(request.get("isreadonly", False)), request.get("version"))
+                    data = {
+                        "edb_path": edb_path,
+                        "version": edb.version,
+                        "rpc_port": self._rpc_port(),
+                        "database_id": edb.db.id,
+                    }
+                elif command == "release":
+                    data = {
+                        "released": self.pool.release(
+                            request["edb_path"], bool(request.get("discard", False)), bool(request.get("dirty", False))
+                        )
+                    }
+                elif command == "close":
+                    data = {"closed": self.pool.close(request["edb_path"])}
+                elif command == "status":
+                    data = {
+                        "pid": os.getpid(),
+                        "rpc_port": self._rpc_port() if len(self.pool) else None,
+                        "max_open": self.pool.max_open,
+                        "idle_timeout": self.pool.idle_timeout,
+                        "databases": self.pool.status(),
+                    }
+                elif command == "shutdown":
+                    self._running = False
+                    data = {"shutdown": True}
+                else:
+                    raise RuntimeError(f"Unknown daemon command '{command}'.")
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+        return {"status": "ok", "data": data}
+
+    def serve_forever(self, host: str = DEFAULT_HOST, port: int = 0, state_file: Path | None = None):
+        """Listen for CLI requests until a ``shutdown`` command is received.
+
+        Parameters
+        ----------
+        host : str, optional
+            Local interface to listen on.
+        port : int, optional
+            Port to listen on. The default is ``0`` (auto-select).
+        state_file : pathlib.Path, optional
+            State file advertising the daemon to clients. The default is :func:`state_file_path`.
+        """
+        state_file = state_file or state_file_path()
+        authkey = secrets.token_bytes(32)
+        self._running = True
+        with Listener((host, port), authkey=authkey) as listener:
+            _write_state(state_file, listener.address, authkey)
+            evictor = threading.Thread(target=self._evict_loop, daemon=True)
+            evictor.start()
+            try:
+                while self._running:
+                    try:
+                        connection = listener.accept()
+                    except Exception:  # Failed authentication or interrupted handshake.
+                        continue
+                    with connection:
+                        try:
+                            connection.send(self.handle(connection.recv()))
+                        except (EOFError, OSError):
+                            continue
+            finally:
+                self._running = False
+                with self._lock:
+                    self.pool.close_all()
+                if self._owns_rpc_server:
+                    from pyedb.grpc.rpc_session import RpcSession
+
+                    RpcSession.close()
+                if state_file.exists():
+                    state_file.unlink()
+
+    def _evict_loop(self):
+        interval = min(max(self.pool.idle_timeout / 10, 1.0), 30.0) if self.pool.idle_timeout else 30.0
+        while self._running:
+            time.sleep(interval)
+            with self._lock:
+                self.pool.evict_idle()
+
+
+def _write_state(state_file: Path, address, authkey: bytes):
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"host": address[0], "port": address[1], "authkey": authkey.hex(), "pid": os.getpid()}
+    state_file.write_text(json.dumps(payload), encoding="utf-8")
+    try:
+        state_file.chmod(0o600)
+    except OSError:  # pragma: no cover
+        pass
+
+
+class DaemonClient:
+    """Client of a running :class:`EdbDaemon`.
+
+    Parameters
+    ----------
+    host : str
+        Daemon interface.
+    port : int
+        Daemon port.
+    authkey : bytes
+        Authentication key shared through the state file.
+    """
+
+    def __init__(self, host: str, port: int, authkey: bytes):
+        self.address = (host, port)
+        self._authkey = authkey
+
+    @classmethod
+    def find(cls, state_file: Path | None = None) -> "DaemonClient | None":
+        """Return a client of the running daemon, or ``None`` when no daemon answers."""
+        state_file = state_file or state_file_path()
+        if not state_file.exists():
+            return None
+        try:
+            state = json.loads(state_file.read_text(encoding="utf-8"))
+            if not psutil.pid_exists(state["pid"]):
+                return None
+            client = cls(state["host"], state["port"], bytes.fromhex(state["authkey"]))
+            client.request("ping")
+        except Exception:
+            return None
+        return client
+
+    def request(self, command: str, **kwargs) -> Any:
+        """Send a command to the daemon and return its data.
+
+        Raises
+        ------
+        RuntimeError
+            When the daemon reports an error.
+        """
+        with Client(self.address, authkey=self._authkey) as connection:
+            connection.send({"command": command, **kwargs})
+            response = connection.recv()
+        if response.get("status") != "ok":
+            raise RuntimeError(f"pyedb daemon: {response.get('error')}")
+        return response["data"]
+
+    @contextmanager
+    def attached_edb(
+        self, edb_path: str, cellname: str | None = None, isreadonly: bool = False, version: str | None = None
+    ):
+        """Attach to the database kept open by the daemon.
+
+        The database is not closed on exit. It is released back to the daemon, which discards it when the command
+        saved it to another location. A database attached for writing is released as possibly modified, so the
+        daemon reopens it before serving the next command instead of leaking unsaved edits into it.
+        """
+        from pyedb.grpc.edb import Edb
+
+        if Path(edb_path).name.lower() == "edb.def":
+            edb_path = str(Path(edb_path).parent)
+        info = self.request("acquire", edb_path=edb_path, isreadonly=isreadonly, version=version)
+        edb = None
+        try:
+            edb = Edb(
+                info["edb_path"],
+                version=info["version"],
+                cellname=cellname,
+                isreadonly=isreadonly,
+                port=info["rpc_port"],
+                database_id=info["database_id"],
+            )
+            yield edb
+        finally:
+            moved = edb is not None and os.path.normcase(str(edb.edbpath)) != os.path.normcase(edb_path)
+            if edb is not None:
+                edb.close(terminate_rpc_session=False)
+            self.request("release", edb_path=edb_path, discard=moved, dirty=not isreadonly)
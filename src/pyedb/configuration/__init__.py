@@ -22,10 +22,13 @@
 
 """Public API for the PyEDB configuration system."""
 
-from pyedb.configuration.cfg_data import CfgData
-from pyedb.configuration.cfg_ports_sources import CfgTerminalInfo as TerminalInfo
+from pyedb.misc.lazy_import import attach
 
-__all__ = [
-    "CfgData",
-    "TerminalInfo",
-]
+# The pydantic configuration models are loaded on first access.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "CfgData": ".cfg_data",
+        "TerminalInfo": ".cfg_ports_sources:CfgTerminalInfo",
+    },
+)
@@ -623,13 +623,17 @@ class CfgPorts:
                 name = f"Port_{reference_designator}_{positive_net}_{pos_pin.component_pin}"
             positive_terminal = CfgTerminalInfo.pin(pos_pin.component_pin, reference_designator=reference_designator)
             if negative_net is not None:
-                ref_pins = pos_pin.get_reference_pins(reference_net=negative_net, max_limit=1, component_only=True)
-                # Filter out pins that already have a terminal assigned
-                ref_pins = [p for p in ref_pins if p.terminal is None]
+                padstacks = self._pedb.padstacks
+                position = pos_pin.position
+
+                def is_free(pin):
+                    # Skip pins that already have a terminal assigned
+                    return pin.terminal is None
+
+                ref_pins = padstacks.reference_pin_index(negative_net, comp).query_radius(position, 5e-3, 1, is_free)
                 if not ref_pins:
-                    # Retry without the terminal filter – widen search to whole layout
-                    ref_pins = pos_pin.get_reference_pins(reference_net=negative_net, max_limit=1, component_only=False)
-                    ref_pins = [p for p in ref_pins if p.terminal is None]
+                    # Widen search to whole layout
+                    ref_pins = padstacks.reference_pin_index(negative_net).query_radius(position, 5e-3, 1, is_free)
                 if not ref_pins:
                     raise ValueError(
                         f"No available (terminal-free) pins found for negative net '{negative_net}' "
@@ -1306,18 +1310,16 @@ class CfgCircuitElement(CfgBase):
                 )
             elif neg_type == "nearest_pin":
                 ref_net = neg_value.get("reference_net", "GND")
-                search_radius = neg_value.get("search_radius", "5e-3")
-                ref_pins = {
-                    pin: pin.position
-                    for pin in list(pos_objs.values())[0].component.pins.values()
-                    if pin.net_name == ref_net
-                }
-                temp = {
-                    i: self._pedb.padstacks.get_reference_pins(
-                        j, ref_net, search_radius, max_limit=1, pinlist_position=ref_pins
-                    )[0]
-                    for i, j in pos_objs.items()
-                }
+                search_radius = float(self._pedb.value(neg_value.get("search_radius", "5e-3")))
+                index = self._pedb.padstacks.reference_pin_index(ref_net, list(pos_objs.values())[0].component)
+                nearest_pins = index.query_radius_many(
+                    [j.position for j in pos_objs.values()], search_radius, max_limit=1
+                )
+                temp = {}
+                for i, ref_pins in zip(pos_objs, nearest_pins):
+                    if not ref_pins:
+                        raise ValueError(f"No pin of net '{ref_net}' found within {search_radius} m of '{i}'.")
+                    temp[i] = ref_pins[0]
                 self.neg_terminal = {
                     i: j.create_terminal(i + "_ref") if not j.terminal else j.terminal for i, j in temp.items()
                 }
@@ -794,8 +794,13 @@ class Configuration:
         # does it. This ensures the EDB duplicate check is truly bypassed when reading materials back from the database.
         object.__setattr__(self.cfg_data.stackup, "_pedb", None)
         try:
-            for name, mat in self._pedb.materials.materials.items():
-                self.cfg_data.stackup.add_material(**mat.to_dict())
+            materials = self._pedb.materials
+            if hasattr(materials, "snapshot"):
+                for name, properties in materials.snapshot().items():
+                    self.cfg_data.stackup.add_material(name=name, **properties)
+            else:
+                for name, mat in materials.materials.items():
+                    self.cfg_data.stackup.add_material(**mat.to_dict())
         finally:
             object.__setattr__(self.cfg_data.stackup, "_pedb", saved_pedb)
 
@@ -825,33 +830,40 @@ class Configuration:
         input_signal_layers = [i for i in layers if (i.type or "").lower() == "signal"]
         if len(input_signal_layers) == 0:
             return
-        else:  # Create materials with default properties used in stackup but not defined
+        else:  # Create materials used in stackup but not defined, from syslib or with default properties
+            edb_materials = self._pedb.materials.materials
+            try:
+                syslib_index = self._pedb.materials.syslib_index
+            except OSError:
+                syslib_index = None
 
             def _material_known(mat_name):
                 """Return True if mat_name is already in the builder or in EDB."""
                 if any(m.name == mat_name for m in self.cfg_data.stackup.materials):
                     return True
-                if mat_name in self._pedb.materials.materials:
+                if mat_name in edb_materials:
                     return True
                 return False
 
+            def _add_missing_material(mat_name, default_properties):
+                properties = syslib_index.get(mat_name) if syslib_index is not None else None
+                if properties:
+                    self._pedb.logger.info(f"Material {mat_name} found in syslib. Adding it to aedb project.")
+                else:
+                    properties = default_properties
+                self.cfg_data.stackup.add_material(name=mat_name, **properties)
+
             for i in self.cfg_data.stackup.layers:
                 if i.type == "signal":
                     if not _material_known(i.material):
-                        self.cfg_data.stackup.add_material(
-                            name=i.material, **self._pedb.materials.default_conductor_property_values
-                        )
+                        _add_missing_material(i.material, self._pedb.materials.default_conductor_property_values)
 
                     if i.fill_material and not _material_known(i.fill_material):
-                        self.cfg_data.stackup.add_material(
-                            name=i.fill_material, **self._pedb.materials.default_dielectric_property_values
-                        )
+                        _add_missing_material(i.fill_material, self._pedb.materials.default_dielectric_property_values)
 
                 elif i.type == "dielectric":
                     if not _material_known(i.material):
-                        self.cfg_data.stackup.add_material(
-                            name=i.material, **self._pedb.materials.default_dielectric_property_values
-                        )
+                        _add_missing_material(i.material, self._pedb.materials.default_dielectric_property_values)
 
         if len(self._pedb.stackup.signal_layers) == 0:
             self.__create_stackup()
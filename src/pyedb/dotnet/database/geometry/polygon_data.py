@@ -26,6 +26,7 @@ import warnings
 from pyedb.dotnet.database.general import convert_py_list_to_net_list
 from pyedb.dotnet.database.geometry.point_data import PointData
 from pyedb.dotnet.database.utilities.obj_base import BBox
+from pyedb.generic.polygon_arrays import ARC_SENTINEL, as_vertex_array, flat_point_array
 from pyedb.misc.decorators import deprecated
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -71,6 +72,36 @@ class PolygonData:
         core = pedb.core.Geometry.PolygonData(convert_py_list_to_net_list(list_of_point_data), closed)
         return cls(pedb, core)
 
+    @classmethod
+    def create_from_array(cls, pedb, points, arc_heights=None, voids=None, closed: bool = True) -> "PolygonData":
+        """Create a polygon from NumPy vertex arrays.
+
+        Coordinates are converted in bulk and passed to EDB as plain doubles, without parsing or checking each
+        vertex for parameters.
+
+        Parameters
+        ----------
+        pedb : :class:`Edb <pyedb.dotnet.edb.Edb>`
+            EDB object.
+        points : numpy.ndarray
+            ``(N, 2)`` vertices in meters, or ``(N, 3)`` vertices whose third column is the height of the arc
+            ending at each vertex.
+        arc_heights : numpy.ndarray, optional
+            ``(N,)`` heights of the arcs ending at each vertex. ``0`` is a straight segment.
+        voids : list[numpy.ndarray], optional
+            Vertex arrays of the voids, with the same format as ``points``.
+        closed : bool, optional
+            Whether the polygon is closed. The default is ``True``.
+
+        Returns
+        -------
+        :class:`PolygonData <pyedb.dotnet.database.geometry.polygon_data.PolygonData>`
+        """
+        core = _core_polygon_from_array(pedb, points, arc_heights, closed)
+        for void in voids or []:
+            core.AddHole(_core_polygon_from_array(pedb, void, None, True))
+        return cls(pedb, core)
+
     @property
     @deprecated_property("Use `core` property instead.", category=None)
     def _edb_object(self):
@@ -198,3 +229,17 @@ class PolygonData:
     def set_point(self, index: int, point_data: PointData) -> None:
         """Sets the point at the index from a PointData object."""
         self.core.SetPoint(index, point_data)
+
+
+def _core_polygon_from_array(pedb, points, arc_heights, closed) -> Any:
+    vertices = as_vertex_array(points, arc_heights)
+    if vertices is None:
+        raise TypeError("Polygon vertices must be a numeric (N, 2) or (N, 3) array.")
+    geometry = pedb.core.Geometry
+    point_data = geometry.PointData
+    value = pedb.core.Utility.Value
+    points = [
+        point_data(value(x)) if y == ARC_SENTINEL else point_data(value(x), value(y))
+        for x, y in flat_point_array(*vertices).tolist()
+    ]
+    return geometry.PolygonData(convert_py_list_to_net_list(points, point_data), closed)
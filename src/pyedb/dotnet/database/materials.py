@@ -40,6 +40,7 @@ from pyedb.dotnet.database.definition.definition_obj import (
 )
 from pyedb.dotnet.database.general import convert_py_list_to_net_list
 from pyedb.exceptions import MaterialModelException
+from pyedb.generic.amat_index import load_amat_index
 from pyedb.misc.decorators import deprecate_argument_name, deprecated
 
 logger = logging.getLogger(__name__)
@@ -119,6 +120,11 @@ class Materials(object):
         """Get the project sys library."""
         return self.__syslib
 
+    @property
+    def syslib_index(self):
+        """Parsed index of the syslib ``Materials.amat`` file, cached until the file changes."""
+        return load_amat_index(os.path.join(self.__syslib, "Materials.amat"))
+
     @property
     def materials(self):
         """Get materials."""
@@ -615,65 +621,7 @@ class Materials(object):
         """
         if amat_file is None:
             amat_file = os.path.join(self.__edb.base_path, "syslib", "Materials.amat")
-
-        begin_regex = re.compile(r"^\$begin '(.+)'")
-        end_regex = re.compile(r"^\$end '(.+)'")
-        material_properties = ATTRIBUTES.copy()
-        # Remove cases manually handled
-        material_properties.remove("conductivity")
-
-        with open(amat_file, "r") as amat_fh:
-            in_material_def = False
-            material_description = {}
-            for line in amat_fh:
-                if in_material_def:
-                    # Yield material definition
-                    if end_regex.search(line):
-                        in_material_def = False
-                        yield material_description
-                        material_description = {}
-                    # Extend material definition if possible
-                    else:
-                        for material_property in material_properties:
-                            if material_property in line:
-                                value = get_line_float_value(line)
-                                if value is not None:
-                                    material_description[material_property] = value
-                                break
-                        # Extra case to cover bug in syslib AMAT file (see #364)
-                        if "thermal_expansion_coeffcient" in line:
-                            value = get_line_float_value(line)
-                            if value is not None:
-                                material_description["thermal_expansion_coefficient"] = value
-                        # Extra case to avoid confusion ("conductivity" is included in "thermal_conductivity")
-                        if "conductivity" in line and "thermal_conductivity" not in line:
-                            value = get_line_float_value(line)
-                            if value is not None:
-                                material_description["conductivity"] = value
-                        # Extra case to avoid confusion ("conductivity" is included in "thermal_conductivity")
-                        if (
-                            "loss_tangent" in line
-                            and "dielectric_loss_tangent" not in line
-                            and "magnetic_loss_tangent" not in line
-                        ):
-                            warnings.warn(
-                                "This key is deprecated in versions >0.7.0 and will soon be removed. "
-                                "Use key dielectric_loss_tangent instead.",
-                                DeprecationWarning,
-                            )
-                            value = get_line_float_value(line)
-                            if value is not None:
-                                material_description["dielectric_loss_tangent"] = value
-                # Check if we reach the beginning of a material description
-                else:
-                    match = begin_regex.search(line)
-                    if match:
-                        material_name = match.group(1)
-                        # Skip unwanted data
-                        if material_name in ("$index$", "$base_index$"):
-                            continue
-                        material_description["name"] = match.group(1)
-                        in_material_def = True
+        yield from load_amat_index(amat_file).iter_descriptions()
 
     def read_materials(self, amat_file):
         """Read materials from an AMAT file.
@@ -688,15 +636,7 @@ class Materials(object):
         dict
             {material name: dict of material properties}.
         """
-        res = {}
-        for material in self.iterate_materials_in_amat(amat_file):
-            material_name = material["name"]
-            res[material_name] = {}
-            for material_property, value in material.items():
-                if material_property != "name":
-                    res[material_name][material_property] = value
-
-        return res
+        return load_amat_index(amat_file).to_dict()
 
     def read_syslib_material(self, material_name):
         """Read a specific material from syslib AMAT file.
@@ -711,23 +651,15 @@ class Materials(object):
         dict
             {material name: dict of material properties}.
         """
-        res = {}
-        amat_file = os.path.join(self.__edb.base_path, "syslib", "Materials.amat")
-        for material in self.iterate_materials_in_amat(amat_file):
-            iter_material_name = material["name"]
-            if iter_material_name == material_name or iter_material_name.lower() == material_name.lower():
-                for material_property, value in material.items():
-                    if material_property != "name":
-                        res[material_property] = value
-                return res
-
-        self.__edb.logger.error(f"Material {material_name} does not exist in syslib AMAT file.")
-        return res
+        properties = self.syslib_index.get(material_name)
+        if properties is None:
+            self.__edb.logger.error(f"Material {material_name} does not exist in syslib AMAT file.")
+            return {}
+        return properties
 
     def update_materials_from_sys_library(self, update_all: bool = True, material_name: Union[str, list] = None):
         """Update material properties from syslib AMAT file."""
-        amat_file = os.path.join(self.__edb.base_path, "syslib", "Materials.amat")
-        materials_dict = self.read_materials(amat_file)
+        materials_dict = self.syslib_index.to_dict()
         if update_all:
             for name, obj in self.materials.items():
                 if name in materials_dict:
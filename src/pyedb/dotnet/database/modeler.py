@@ -27,6 +27,8 @@ This module contains these classes: `EdbLayout` and `Shape`.
 import math
 import warnings
 
+import numpy as np
+
 from pyedb.dotnet.clr_module import Tuple
 from pyedb.dotnet.database.cell.primitive.bondwire import Bondwire
 from pyedb.dotnet.database.dotnet.primitive import CircleDotNet, PathDotNet, RectangleDotNet
@@ -35,6 +37,7 @@ from pyedb.dotnet.database.edb_data.utilities import EDBStatistics
 from pyedb.dotnet.database.general import convert_py_list_to_net_list
 from pyedb.dotnet.database.geometry.point_data import PointData
 from pyedb.dotnet.database.geometry.polygon_data import PolygonData
+from pyedb.generic.polygon_arrays import as_vertex_array
 from pyedb.misc.decorators import deprecate_argument_name, deprecated, deprecated_property
 
 
@@ -321,16 +324,17 @@ class Modeler:
 
         Parameters
         ----------
-        points : list of points or PolygonData or ``modeler.Shape``
+        points : list of points or numpy.ndarray or PolygonData or ``modeler.Shape``
             Shape or point lists of the main object. Point list can be in the format of `[[x1,y1], [x2,y2],..,[xn,yn]]`.
             Each point can be:
             - [x, y] coordinate
             - [x, y, height] for an arc with specific height (between previous point and actual point)
             - [x, y, rotation, xc, yc] for an arc given a point, rotation and center.
+            A ``(N, 2)`` or ``(N, 3)`` array is converted in bulk with :meth:`PolygonData.create_from_array`.
         layer_name : str
             Name of the layer on which to create the polygon.
         voids : list, optional
-            List of shape objects for voids or points that creates the shapes. The default is``[]``.
+            List of shape objects, points or vertex arrays for voids. The default is``[]``.
         net_name : str, optional
             Name of the net. The default is ``""``.
 
@@ -343,8 +347,14 @@ class Modeler:
         from pyedb.dotnet.database.geometry.polygon_data import PolygonData
 
         net = self._pedb.nets.find_or_create_net(net_name)
-
-        if isinstance(points, list):
+        vertices = as_vertex_array(points) if isinstance(points, list) else None
+
+        if isinstance(points, np.ndarray):
+            polygonData = PolygonData.create_from_array(self._pedb, points).core
+        elif vertices is not None and not vertices[1].any():
+            # Plain numeric points: no per-vertex value parsing is needed.
+            polygonData = PolygonData.create_from_array(self._pedb, vertices[0]).core
+        elif isinstance(points, list):
             arcs = []
             for _ in range(len(points)):
                 arcs.append(
@@ -372,7 +382,9 @@ class Modeler:
             if polygonData.IsNull():
                 raise RuntimeError("Failed to create main shape polygon data")
         for void in voids:
-            if isinstance(void, list):
+            if isinstance(void, np.ndarray):
+                voidPolygonData = PolygonData.create_from_array(self._pedb, void).core
+            elif isinstance(void, list):
                 void = self.Shape("polygon", points=void)
                 voidPolygonData = self.shape_to_polygon_data(void)
             elif isinstance(void, Modeler.Shape):
@@ -610,6 +622,9 @@ class Modeler:
 
     def _createPolygonDataFromPolygon(self, shape):
         points = shape.points
+        vertices = as_vertex_array(points)
+        if vertices is not None and not vertices[1].any():
+            return PolygonData.create_from_array(self._pedb, vertices[0]).core
         if not self._validatePoint(points[0]):
             self._logger.error("Error validating point.")
             return None
@@ -40,6 +40,8 @@ from pyedb.dotnet.database.general import convert_py_list_to_net_list
 from pyedb.dotnet.database.geometry.polygon_data import PolygonData
 from pyedb.generic.general_methods import generate_unique_name
 from pyedb.generic.geometry_operators import GeometryOperators
+from pyedb.generic.reference_pin_index import ReferencePinIndex
+from pyedb.generic.via_reduction import ViaSnapshot, plan_cell_reduction, plan_grid_sampling
 from pyedb.misc.decorators import deprecated
 
 
@@ -79,6 +81,11 @@ class EdbPadstacks(object):
         self._pedb = p_edb
         self._instances = {}
         self._definitions = {}
+        self._reference_pin_indexes = {}
+
+    def clear_instances_cache(self):
+        """Clear the cached reference pin indexes."""
+        self._reference_pin_indexes = {}
 
     @property
     def _edb(self):
@@ -615,6 +622,7 @@ class EdbPadstacks(object):
             if p.net_name in net_names:
                 if not p.delete():  # pragma: no cover
                     return False
+        self.clear_instances_cache()
         return True
 
     def set_solderball(self, padstackInst, sballLayer_name, isTopPlaced=True, ballDiam=100e-6):
@@ -1272,7 +1280,7 @@ class EdbPadstacks(object):
             )
             padstack_instance.SetIsLayoutPin(is_pin)
             py_padstack_instance = EDBPadstackInstance(padstack_instance, self._pedb)
-
+            self.clear_instances_cache()
             return py_padstack_instance
         else:
             return False
@@ -1510,11 +1518,14 @@ class EdbPadstacks(object):
         component_only : bool, optional
             Whether to limit the search to component padstack instances only. The
             default is ``True``. When ``False``, the search is extended to the entire layout.
+        pinlist_position : dict, optional
+            Candidate reference pins mapped to their position. When provided, the search is limited to these pins.
 
         Returns
         -------
         list
-            List of :class:`dotnet.database.edb_data.padstacks_data.EDBPadstackInstance`.
+            List of :class:`dotnet.database.edb_data.padstacks_data.EDBPadstackInstance` sorted by increasing
+            distance.
 
         Examples
         --------
@@ -1523,33 +1534,62 @@ class EdbPadstacks(object):
         >>> reference_pins = edbapp.padstacks.get_reference_pins(positive_pin=pin, reference_net="GND",
         >>> search_radius=5e-3, max_limit=0, component_only=True)
         """
-        if not pinlist_position:
-            pinlist = []
+        if isinstance(search_radius, str):
+            search_radius = float(self._pedb.value(search_radius))
+        if pinlist_position:
+            index = ReferencePinIndex.from_pin_positions(pinlist_position)
+        else:
             if not positive_pin:
                 search_radius = 10e-2
                 component_only = True
             if component_only:
-                references_pins = [
-                    pin for pin in list(positive_pin.component.pins.values()) if pin.net_name == reference_net
-                ]
-                if not references_pins:
-                    return pinlist
+                index = self.reference_pin_index(reference_net, positive_pin.component)
             else:
-                references_pins = self.get_padstack_instance_by_net_name(reference_net)
-                if not references_pins:
-                    return pinlist
-            pinlist_position = {p: p.position for p in references_pins}
-        pos_position = positive_pin.position
-        pinlist = [
-            p
-            for p, pos in pinlist_position.items()
-            if GeometryOperators.points_distance(pos_position, pos) <= search_radius
-        ]
+                index = self.reference_pin_index(reference_net)
+        return index.query_radius(positive_pin.position, search_radius, max_limit)
 
-        if max_limit and len(pinlist) > max_limit:
-            pin_dict = {GeometryOperators.points_distance(positive_pin.position, p.position): p for p in pinlist}
-            pinlist = [pin[1] for pin in sorted(pin_dict.items())[:max_limit]]
-        return pinlist
+    def reference_pin_index(self, reference_net, component=None):
+        """Spatial index of the pins of a reference net.
+
+        The index is built once per reference net and component, and shared by the port, source and
+        configuration terminal methods that search for the nearest reference pins. It is cleared by
+        :meth:`clear_instances_cache` and when padstack instances are added or deleted through this class.
+
+        Parameters
+        ----------
+        reference_net : str
+            Reference net name.
+        component : str or :class:`pyedb.dotnet.database.cell.hierarchy.component.EDBComponent`, optional
+            Reference designator or component to restrict the index to. The default is ``None``, in which case
+            all padstack instances of the net are indexed.
+
+        Returns
+        -------
+        :class:`pyedb.generic.reference_pin_index.ReferencePinIndex`
+            Index answering radius and nearest-pin queries.
+
+        Examples
+        --------
+        >>> index = edbapp.padstacks.reference_pin_index("GND", "U1")
+        >>> signal_pins = [pin for pin in edbapp.components["U1"].pins.values() if pin.net_name == "DDR_DQ0"]
+        >>> nearest = index.nearest([pin.position for pin in signal_pins])
+        """
+        if component is None or isinstance(component, str):
+            refdes = component
+        else:
+            refdes = component.refdes
+        key = (reference_net, refdes)
+        index = self._reference_pin_indexes.get(key)
+        if index is None:
+            if refdes is None:
+                pins = self.get_instances(net_name=reference_net)
+            else:
+                if isinstance(component, str):
+                    component = self._pedb.components.instances[refdes]
+                pins = [pin for pin in component.pins.values() if pin.net_name == reference_net]
+            index = ReferencePinIndex(pins)
+            self._reference_pin_indexes[key] = index
+        return index
 
     def get_padstack_instances_rtree_index(self, nets=None):
         """Returns padstack instances Rtree index.
@@ -1848,7 +1888,7 @@ class EdbPadstacks(object):
 
     def reduce_via_in_bounding_box(self, bounding_box, x_samples, y_samples, nets=None):
         """
-        Reduce the number of vias intersecting bounding box and nets by x and y samples.
+        Reduce the number of vias located in a bounding box and nets by x and y samples.
 
         Parameters
         ----------
@@ -1865,39 +1905,42 @@ class EdbPadstacks(object):
         bool
             ``True`` when succeeded ``False`` when failed. <
         """
-        padstacks_inbox = self.get_padstack_instances_intersecting_bounding_box(bounding_box, nets)
-        if not padstacks_inbox:
+        plan = self.plan_via_reduction_in_bounding_box(bounding_box, x_samples, y_samples, nets)
+        if not len(plan):
             self._logger.info("no padstack in bounding box")
             return False
-        else:
-            if len(padstacks_inbox) <= (x_samples * y_samples):
-                self._logger.info(f"more samples {x_samples * y_samples} than existing {len(padstacks_inbox)}")
-                return False
-            else:
-                # extract ids and positions
-                all_instances = self.instances
-                vias = {item: all_instances[item].position for item in padstacks_inbox}
-                ids, positions = zip(*vias.items())
-                pt_x, pt_y = zip(*positions)
-
-                # meshgrid
-                _x_min, _x_max = min(pt_x), max(pt_x)
-                _y_min, _y_max = min(pt_y), max(pt_y)
-
-                x_grid, y_grid = np.meshgrid(
-                    np.linspace(_x_min, _x_max, x_samples), np.linspace(_y_min, _y_max, y_samples)
-                )
+        if len(plan) <= (x_samples * y_samples):
+            self._logger.info(f"more samples {x_samples * y_samples} than existing {len(plan)}")
+            return False
+        self.apply_via_reduction(plan)
+        return True
 
-                # mapping to meshgrid
-                to_keep = {
-                    ids[np.argmin(np.square(_x - pt_x) + np.square(_y - pt_y))]
-                    for _x, _y in zip(x_grid.ravel(), y_grid.ravel())
-                }
-                for item in padstacks_inbox:
-                    if item not in to_keep:
-                        all_instances[item].delete()
+    def plan_via_reduction_in_bounding_box(self, bounding_box, x_samples, y_samples, nets=None):
+        """
+        Plan the reduction of the vias in a bounding box to the ones nearest to a grid of samples.
 
-                return True
+        Nothing is deleted, pass the plan to :meth:`apply_via_reduction` to delete the removed vias.
+
+        Vias are selected by their position, boundary included, as with the position index of
+        :meth:`get_padstack_instances_intersecting_bounding_box`. A via located outside the box is not selected even
+        when its pads overlap the box edge.
+
+        Parameters
+        ----------
+        bounding_box : tuple or list.
+            bounding box, [x1, y1, x2, y2]
+        x_samples : int
+        y_samples : int
+        nets : str or list, optional
+            net name of list of nets name applying filtering on padstack instances selection. If ``None`` is provided
+            all instances are included. Default value is ``None``.
+
+        Returns
+        -------
+        :class:`pyedb.generic.via_reduction.ViaReductionPlan`
+        """
+        snapshot = ViaSnapshot.from_instances(self._pedb.layout.padstack_instances, nets=nets)
+        return plan_grid_sampling(snapshot.in_bounding_box(bounding_box), x_samples, y_samples)
 
     @staticmethod
     def dbscan(
@@ -1997,59 +2040,62 @@ class EdbPadstacks(object):
             coordinates for grid lines (for plotting).
 
         """
-        to_keep = set()
-
-        all_instances = self.instances
-        positions = np.array([all_instances[_id].position for _id in padstacks])
-
-        x_coords, y_coords = positions[:, 0], positions[:, 1]
-        x_min, x_max = np.min(x_coords), np.max(x_coords)
-        y_min, y_max = np.min(y_coords), np.max(y_coords)
-
-        padstacks_array = np.array(padstacks)
-        cell_map = {}  # {(cell_x, cell_y): [(id1, [x1, y1]), (id2, [x2, y2), ...]}
-        grid = []
-
-        for idx, pos in enumerate(positions):
-            i = int((pos[0] - x_min) // cell_size_x)
-            j = int((pos[1] - y_min) // cell_size_y)
-            cell_key = (i, j)
-            cell_map.setdefault(cell_key, []).append((padstacks_array[idx], pos))
-
-        for (i, j), items in cell_map.items():
-            # cell center
-            cell_x_min = x_min + i * cell_size_x
-            cell_y_min = y_min + j * cell_size_y
-            cell_x_mid = cell_x_min + 0.5 * cell_size_x
-            cell_y_mid = cell_y_min + 0.5 * cell_size_y
-
-            grid.append(
-                [
-                    [
-                        cell_x_min,
-                        cell_x_min + cell_size_x,
-                        cell_x_min + cell_size_x,
-                        cell_x_min,
-                        cell_x_min,
-                    ],
-                    [
-                        cell_y_min,
-                        cell_y_min,
-                        cell_y_min + cell_size_y,
-                        cell_y_min + cell_size_y,
-                        cell_y_min,
-                    ],
-                ]
-            )
+        plan = self.plan_via_reduction_by_density(padstacks, cell_size_x, cell_size_y)
+        if delete:
+            self.apply_via_reduction(plan)
+        return plan.kept_ids, plan.grid
 
-            # Find closest via to cell center
-            distances = [np.linalg.norm(pos - [cell_x_mid, cell_y_mid]) for _, pos in items]
-            closest_idx = np.argmin(distances)
-            to_keep.add(items[closest_idx][0])
+    def plan_via_reduction_by_density(self, padstacks: List[int], cell_size_x: float = 1e-3, cell_size_y: float = 1e-3):
+        """
+        Plan the reduction of vias to the one closest to the center of each grid cell.
 
-        if delete:
-            to_delete = set(padstacks) - to_keep
-            for _id in to_delete:
-                all_instances[_id].delete()
+        Nothing is deleted, pass the plan to :meth:`apply_via_reduction` to delete the removed vias.
+
+        Parameters
+        ----------
+        padstacks: List[int]
+            List of padstack ids to be reduced.
+
+        cell_size_x : float
+            Width of each grid cell (default is 1e-3).
+
+        cell_size_y : float
+            Height of each grid cell (default is 1e-3).
 
-        return list(to_keep), grid
+        Returns
+        -------
+        :class:`pyedb.generic.via_reduction.ViaReductionPlan`
+        """
+        snapshot = ViaSnapshot.from_instances(self._pedb.layout.padstack_instances, ids=padstacks)
+        return plan_cell_reduction(snapshot, cell_size_x, cell_size_y)
+
+    def apply_via_reduction(self, plan) -> int:
+        """
+        Delete the vias removed by a reduction plan.
+
+        Parameters
+        ----------
+        plan : :class:`pyedb.generic.via_reduction.ViaReductionPlan`
+            Plan returned by :meth:`plan_via_reduction_in_bounding_box` or :meth:`plan_via_reduction_by_density`.
+
+        Returns
+        -------
+        int
+            Number of deleted vias.
+
+        Examples
+        --------
+        >>> plan = edb.padstacks.plan_via_reduction_by_density(gnd_via_ids, 2e-3, 2e-3)
+        >>> plan.summary()
+        >>> edb.padstacks.apply_via_reduction(plan)
+        """
+        return plan.apply(self._delete_instances)
+
+    def _delete_instances(self, instances):
+        for instance in instances:
+            instance.core.Delete()
+        self._pedb.modeler._primitives = []
+        self._instances = {}
+        self._definitions = {}
+        self._pedb.layout.clear_cache()
+        self.clear_instances_cache()
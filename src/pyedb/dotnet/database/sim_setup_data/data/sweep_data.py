@@ -22,6 +22,7 @@
 
 import re
 
+from pyedb.generic.frequency_sweep import expand
 from pyedb.misc.decorators import deprecated
 
 
@@ -551,7 +552,7 @@ class SweepData(object):
         """A string describing the frequency sweep. Below is an example.
         ['LIN 0GHz 20GHz 0.05GHz', 'LINC 20GHz 30GHz 10', 'DEC 40GHz 50GHz 10']
         """
-        pattern = r"(?:LIN[C]?|DEC) [^ ]+ [^ ]+ [^ ]+"
+        pattern = r"(?:LIN[C]?|DEC|ESTP|OCT) [^ ]+ [^ ]+ [^ ]+"
         grouped = re.findall(pattern, self._edb_object.FrequencyString)
         return grouped
 
@@ -578,6 +579,8 @@ class SweepData(object):
                     frequencies.extend(self._edb_object.SetLogFrequencies(start, stop, increment))
                 elif sweep_type == "LINC":
                     frequencies.extend(self._edb_object.SetFrequencies(start, stop, increment))
+                elif sweep_type in ("ESTP", "OCT"):
+                    frequencies.extend(expand(i).tolist())
 
         self.clear()
         self.add_frequencies(frequencies)
@@ -587,9 +590,11 @@ class SweepData(object):
             frequencies = [frequencies]
 
         temp = []
+        seen = set(self.frequencies)
         for i in frequencies:
             i = self._pedb.edb_value(i).ToDouble()
-            if i not in temp and i not in self.frequencies:
+            if i not in seen:
+                seen.add(i)
                 temp.append(i)
         frequencies = temp
 
@@ -2125,28 +2125,28 @@ class SourceExcitation:
                     else:
                         self._pedb.logger.info("No pins found on component {} for the net {}".format(component, net))
             else:
+                reference_index = None
+                if not ref_pins and extend_reference_pins_outside_component:
+                    reference_index = self._pedb.padstacks.reference_pin_index(reference_net[0])
                 for net in nets:
                     pins = [pin for pin in cmp_pins if pin.GetNet().GetName() == net]
-                    for pin in pins:
-                        if ref_pins:
+                    if ref_pins:
+                        for pin in pins:
                             self.create_port_on_pins(component, pin, ref_pins)
-                        else:
-                            if extend_reference_pins_outside_component:
-                                _pin = EDBPadstackInstance(pin, self._pedb)
-                                ref_pin = _pin.get_reference_pins(
-                                    reference_net=reference_net[0],
-                                    max_limit=1,
-                                    component_only=False,
-                                    search_radius=3e-3,
+                    elif reference_index is not None:
+                        pins = [EDBPadstackInstance(pin, self._pedb) for pin in pins]
+                        nearest_pins = reference_index.query_radius_many(
+                            [pin.position for pin in pins], 3e-3, max_limit=1
+                        )
+                        for pin, ref_pin in zip(pins, nearest_pins):
+                            if ref_pin:
+                                self.create_port_on_pins(
+                                    component,
+                                    [pin.name],
+                                    [EDBPadstackInstance(ref_pin[0]._edb_object, self._pedb).id],
                                 )
-                                if ref_pin:
-                                    self.create_port_on_pins(
-                                        component,
-                                        [EDBPadstackInstance(pin, self._pedb).name],
-                                        [EDBPadstackInstance(ref_pin[0]._edb_object, self._pedb).id],
-                                    )
-                            else:
-                                self._pedb.logger.error("Skipping port creation no reference pin found.")
+                    elif pins:
+                        self._pedb.logger.error("Skipping port creation no reference pin found.")
         return True
 
     def _normalize_net_list(self, net_list) -> Set[str]:
@@ -0,0 +1,287 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Parsed, cached index of AMAT material libraries.
+
+AMAT files such as ``syslib/Materials.amat`` hold a few hundred material blocks. They are parsed once into an
+:class:`AmatIndex`, kept in memory and persisted as JSON in the pyedb cache folder, keyed by the file modification
+time and size. Later lookups, including those of new processes, do not re-read the library until it changes.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Dict, Iterator, Optional, Union
+
+CACHE_DIR_ENV = "PYEDB_CACHE_DIR"
+CACHE_FORMAT_VERSION = 1
+
+# Properties matched by substring, in priority order. "conductivity", the "thermal_expansion_coeffcient" typo of the
+# syslib file and the legacy "loss_tangent" key are handled separately.
+_SUBSTRING_PROPERTIES = (
+    "dielectric_loss_tangent",
+    "magnetic_loss_tangent",
+    "mass_density",
+    "permittivity",
+    "permeability",
+    "poisson_ratio",
+    "specific_heat",
+    "thermal_conductivity",
+    "youngs_modulus",
+    "thermal_expansion_coefficient",
+)
+_SKIPPED_BLOCKS = ("$index$", "$base_index$")
+_BEGIN_REGEX = re.compile(r"^\$begin '(.+)'")
+_END_REGEX = re.compile(r"^\$end '(.+)'")
+_VALUE_SPLIT = re.compile(",|=")
+
+_memory_cache = {}
+_lock = threading.Lock()
+
+
+def _line_float_value(line):
+    try:
+        return float(_VALUE_SPLIT.split(line)[-1].strip("'\n)"))
+    except ValueError:
+        return None
+
+
+def _parse_line(line, description):
+    for material_property in _SUBSTRING_PROPERTIES:
+        if material_property in line:
+            value = _line_float_value(line)
+            if value is not None:
+                description[material_property] = value
+            break
+    if "thermal_expansion_coeffcient" in line:
+        value = _line_float_value(line)
+        if value is not None:
+            description["thermal_expansion_coefficient"] = value
+    if "conductivity" in line and "thermal_conductivity" not in line:
+        value = _line_float_value(line)
+        if value is not None:
+            description["conductivity"] = value
+    if "loss_tangent" in line and "dielectric_loss_tangent" not in line and "magnetic_loss_tangent" not in line:
+        value = _line_float_value(line)
+        if value is not None:
+            description["dielectric_loss_tangent"] = value
+
+
+def parse_amat(amat_file: Union[str, Path]) -> Dict[str, Dict[str, float]]:
+    """Parse an AMAT file in a single pass.
+
+    Parameters
+    ----------
+    amat_file : str or pathlib.Path
+        Path to the AMAT file.
+
+    Returns
+    -------
+    dict
+        {material name: dict of material properties}, in file order.
+    """
+    materials = {}
+    name = None
+    description = {}
+    with open(amat_file, "r") as amat_fh:
+        for line in amat_fh:
+            if name is not None:
+                if _END_REGEX.search(line):
+                    materials[name] = description
+                    name, description = None, {}
+                elif "=" in line or "," in line:
+                    _parse_line(line, description)
+            elif line.startswith("$begin"):
+                match = _BEGIN_REGEX.search(line)
+                if match and match.group(1) not in _SKIPPED_BLOCKS:
+                    name = match.group(1)
+    return materials
+
+
+class AmatIndex:
+    """Materials of an AMAT file with case-insensitive lookup.
+
+    Returned property dictionaries are copies and can be modified freely.
+
+    Parameters
+    ----------
+    materials : dict
+        {material name: dict of material properties}.
+    source : str, optional
+        Path of the parsed AMAT file.
+    """
+
+    def __init__(self, materials: Dict[str, Dict[str, float]], source: Optional[str] = None):
+        self.source = source
+        self._materials = materials
+        self._lower_names = {}
+        for name in materials:
+            self._lower_names.setdefault(name.lower(), name)
+
+    def __len__(self):
+        return len(self._materials)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materials)
+
+    def __contains__(self, name):
+        return self.resolve_name(name) is not None
+
+    @property
+    def names(self):
+        """Material names in file order."""
+        return list(self._materials)
+
+    def resolve_name(self, name: str) -> Optional[str]:
+        """Return the library spelling of ``name``, matched exactly first and then case-insensitively.
+
+        Returns
+        -------
+        str or None
+        """
+        if not isinstance(name, str):
+            return None
+        if name in self._materials:
+            return name
+        return self._lower_names.get(name.lower())
+
+    def get(self, name: str, default=None):
+        """Return a copy of the properties of a material.
+
+        Parameters
+        ----------
+        name : str
+            Material name, case-insensitive.
+        default : optional
+            Value returned when the material is not in the library.
+
+        Returns
+        -------
+        dict
+        """
+        resolved = self.resolve_name(name)
+        if resolved is None:
+            return default
+        return dict(self._materials[resolved])
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return a copy of all materials as {material name: dict of material properties}."""
+        return {name: dict(properties) for name, properties in self._materials.items()}
+
+    def iter_descriptions(self):
+        """Yield one dictionary per material with its ``"name"`` and properties, in file order."""
+        for name, properties in self._materials.items():
+            description = dict(properties)
+            description["name"] = name
+            yield description
+
+
+def cache_dir() -> Path:
+    """Return the folder holding persisted AMAT indexes.
+
+    Defaults to ``~/.pyedb/cache``. Set the ``PYEDB_CACHE_DIR`` environment variable to override it.
+    """
+    return Path(os.environ.get(CACHE_DIR_ENV) or Path.home() / ".pyedb" / "cache")
+
+
+def _disk_cache_file(source):
+    digest = hashlib.sha1(source.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return cache_dir() / f"amat_{digest}.json"
+
+
+def _read_disk_cache(source, signature):
+    try:
+        payload = json.loads(_disk_cache_file(source).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        payload.get("format") != CACHE_FORMAT_VERSION
+        or payload.get("source") != source
+        or payload.get("signature") != list(signature)
+    ):
+        return None
+    return payload.get("materials")
+
+
+def _write_disk_cache(source, signature, materials):
+    path = _disk_cache_file(source)
+    payload = {"format": CACHE_FORMAT_VERSION, "source": source, "signature": list(signature), "materials": materials}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload), encoding="utf-8")
+        temp_path.replace(path)
+    except OSError:
+        # The cache is an optimization only, a read-only home folder must not break material loading.
+        pass
+
+
+def load_amat_index(amat_file: Union[str, Path], use_disk_cache: bool = True) -> AmatIndex:
+    """Return the parsed index of an AMAT file, parsing it only when it changed.
+
+    Parameters
+    ----------
+    amat_file : str or pathlib.Path
+        Path to the AMAT file.
+    use_disk_cache : bool, optional
+        Whether to read and write the persisted index in :func:`cache_dir`. The default is ``True``.
+
+    Returns
+    -------
+    AmatIndex
+    """
+    try:
+        source = os.path.realpath(amat_file)
+        stat = os.stat(source)
+    except OSError:
+        # Not a regular file (or not reachable), parse it directly without caching.
+        return AmatIndex(parse_amat(amat_file), str(amat_file))
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _memory_cache.get(source)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    materials = _read_disk_cache(source, signature) if use_disk_cache else None
+    if materials is None:
+        materials = parse_amat(source)
+        if use_disk_cache:
+            _write_disk_cache(source, signature, materials)
+    index = AmatIndex(materials, source)
+    with _lock:
+        _memory_cache[source] = (signature, index)
+    return index
+
+
+def clear_cache(disk: bool = False):
+    """Drop the in-memory AMAT indexes, and the persisted ones when ``disk`` is ``True``."""
+    with _lock:
+        _memory_cache.clear()
+    if disk:
+        for path in cache_dir().glob("amat_*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
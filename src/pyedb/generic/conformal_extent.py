@@ -0,0 +1,176 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Local computation of conformal cutout extents.
+
+A conformal extent is the union of the signal geometry expanded by the cutout expansion size. When the expanded
+pieces do not touch, the expansion is increased just enough to bridge the widest gap of the minimum spanning tree of
+the pieces, so the extent is always a single polygon without trying several expansion sizes. Geometry is handled by
+Shapely, which is part of the ``geometry`` extra.
+"""
+
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+_QUAD_SEGS = 8
+"""Segments per quarter circle of the rounded corners."""
+
+
+class ConformalExtent(NamedTuple):
+    """Conformal extent polygon."""
+
+    points: np.ndarray
+    """``(N, 2)`` vertices of the outline, without repeating the first vertex."""
+    voids: List[np.ndarray]
+    """Vertex arrays of the voids."""
+    expansion_size: float
+    """Expansion actually applied to the geometry, including the bridging expansion."""
+
+
+def _import_shapely():
+    try:
+        import shapely
+    except ImportError:
+        raise ImportError(
+            "Shapely library is required to compute conformal extents locally. "
+            "Please install it using 'pip install pyedb[geometry]' or 'pip install shapely'."
+        )
+    return shapely
+
+
+def _to_polygons(shapely, shells, voids, void_area_ratio):
+    """Build valid Shapely polygons, keeping the voids larger than ``void_area_ratio`` of their shell."""
+    polygons = []
+    for index, shell in enumerate(shells):
+        shell = np.asarray(shell, dtype=np.float64)
+        if shell.ndim != 2 or len(shell) < 3:
+            continue
+        polygon = shapely.Polygon(shell)
+        if voids is not None and len(voids[index]):
+            holes = [np.asarray(void, dtype=np.float64) for void in voids[index] if len(void) >= 3]
+            minimum_area = void_area_ratio * polygon.area
+            holes = [hole for hole in holes if shapely.Polygon(hole).area >= minimum_area]
+            if holes:
+                polygon = shapely.Polygon(shell, holes)
+        polygons.append(polygon)
+    polygons = np.array(polygons, dtype=object)
+    invalid = ~shapely.is_valid(polygons)
+    if invalid.any():
+        polygons[invalid] = shapely.make_valid(polygons[invalid])
+    return polygons
+
+
+def _bridging_distance(shapely, parts) -> float:
+    """Return the longest edge of the minimum spanning tree of ``parts`` by Prim's algorithm."""
+    count = len(parts)
+    connected = np.zeros(count, dtype=bool)
+    connected[0] = True
+    nearest = shapely.distance(parts[0], parts)
+    longest = 0.0
+    for _ in range(count - 1):
+        candidates = np.where(connected, np.inf, nearest)
+        index = int(np.argmin(candidates))
+        longest = max(longest, float(candidates[index]))
+        connected[index] = True
+        nearest = np.minimum(nearest, shapely.distance(parts[index], parts))
+    return longest
+
+
+def conformal_extent(
+    shells: Sequence[np.ndarray],
+    expansion_size: float,
+    voids: Optional[Sequence[Sequence[np.ndarray]]] = None,
+    defeature: float = 0.0,
+    round_corner: bool = False,
+    void_area_ratio: float = 0.05,
+    tolerance: float = 1e-9,
+) -> Optional[ConformalExtent]:
+    """Compute a single conformal extent polygon around a set of polygons.
+
+    Parameters
+    ----------
+    shells : sequence of numpy.ndarray
+        ``(N, 2)`` outlines of the primitives in meters. Arcs must already be discretized.
+    expansion_size : float
+        Minimum expansion applied around the geometry in meters.
+    voids : sequence of sequence of numpy.ndarray, optional
+        Void outlines of each shell. Voids are shrunk by the expansion and kept in the extent.
+    defeature : float, optional
+        Tolerance in meters used to simplify the primitives and the extent. The default is ``0``, in which case no
+        simplification is done.
+    round_corner : bool, optional
+        Whether expanded corners are rounded. Otherwise, they are mitered, with the corner extension limited to
+        the expansion size. The default is ``False``.
+    void_area_ratio : float, optional
+        Voids smaller than this fraction of their shell area are ignored. The default is ``0.05``.
+    tolerance : float, optional
+        Extra expansion in meters that makes the bridged pieces overlap instead of touching. The default is
+        ``1e-9``.
+
+    Returns
+    -------
+    :class:`ConformalExtent` or None
+        Extent polygon, or ``None`` when there is no geometry.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> square = np.array([[0, 0], [1e-3, 0], [1e-3, 1e-3], [0, 1e-3]])
+    >>> extent = conformal_extent([square, square + 3e-3], expansion_size=0.5e-3)
+    >>> extent.expansion_size > 0.5e-3
+    True
+    """
+    shapely = _import_shapely()
+    polygons = _to_polygons(shapely, shells, voids, void_area_ratio)
+    if not len(polygons):
+        return None
+    if defeature > 0:
+        polygons = shapely.simplify(polygons, defeature, preserve_topology=True)
+    join_style = "round" if round_corner else "mitre"
+
+    def expand(distance):
+        return shapely.union_all(
+            shapely.buffer(polygons, distance, quad_segs=_QUAD_SEGS, join_style=join_style, mitre_limit=2.0)
+        )
+
+    extent = expand(expansion_size)
+    parts = shapely.get_parts(extent)
+    if len(parts) > 1:
+        # Expanding every piece by half of a gap closes it, so half the longest spanning tree edge connects all.
+        expansion_size += _bridging_distance(shapely, parts) / 2 + tolerance
+        if round_corner:
+            # Rounded corners are chords of the expansion circle, which fall short of it by this factor.
+            expansion_size /= np.cos(np.pi / (4 * _QUAD_SEGS))
+        extent = expand(expansion_size)
+        parts = shapely.get_parts(extent)
+    if not len(parts):
+        return None
+    extent = parts[int(np.argmax(shapely.area(parts)))]
+    if defeature > 0:
+        extent = shapely.simplify(extent, defeature, preserve_topology=True)
+    return ConformalExtent(
+        points=shapely.get_coordinates(extent.exterior)[:-1],
+        voids=[shapely.get_coordinates(interior)[:-1] for interior in extent.interiors],
+        expansion_size=expansion_size,
+    )
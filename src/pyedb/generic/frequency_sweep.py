@@ -0,0 +1,442 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Local expansion of frequency sweep distributions.
+
+Sweep setups describe their frequencies with distribution segments such as ``"LIN 0GHz 20GHz 50MHz"``. This module
+expands them into NumPy frequency arrays without EDB, so that the frequency points of many setups can be counted,
+merged, deduplicated and written back as the shortest equivalent list of segments.
+
+Supported distributions, with the meaning of the third argument:
+
+- ``LIN start stop step``: linear step.
+- ``LINC start stop count``: linear count, ``count`` points including both ends.
+- ``DEC start stop count``: logarithmic, ``count`` points per decade.
+- ``OCT start stop count``: logarithmic, ``count`` points per octave.
+- ``ESTP start stop count``: exponential, ``count`` points including both ends.
+"""
+
+import math
+import re
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from pyedb.generic.value_evaluator import evaluate_expression
+
+DISTRIBUTIONS = ("LIN", "LINC", "DEC", "OCT", "ESTP")
+
+_DISTRIBUTION_ALIASES = {
+    "LIN": "LIN",
+    "LINEAR": "LIN",
+    "LINEARSTEP": "LIN",
+    "LINC": "LINC",
+    "LINEARCOUNT": "LINC",
+    "DEC": "DEC",
+    "DECADE": "DEC",
+    "LOGSCALE": "DEC",
+    "OCT": "OCT",
+    "OCTAVECOUNT": "OCT",
+    "ESTP": "ESTP",
+    "EXPONENTIAL": "ESTP",
+}
+
+_FREQUENCY_UNITS = {"hz": "Hz", "khz": "kHz", "mhz": "MHz", "ghz": "GHz", "thz": "THz"}
+
+_SEGMENT = re.compile(
+    r"(?P<distribution>Linear\s+Count|Log\s+Scale|Octave\s+Count|[A-Za-z]+)\s+(?P<start>\S+)\s+(?P<stop>\S+)\s+"
+    r"(?P<parameter>\S+)"
+)
+
+RTOL = 1e-9
+"""Relative tolerance under which two frequencies are considered equal."""
+
+STEP_RTOL = 1e-6
+"""Relative tolerance under which consecutive steps or ratios are considered constant."""
+
+
+class FrequencySegment(NamedTuple):
+    """One distribution segment with its values in SI units."""
+
+    distribution: str
+    start: float
+    stop: float
+    parameter: float
+
+    def expand(self) -> np.ndarray:
+        """Frequency points of the segment in Hz.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return expand_segment(self)
+
+    @property
+    def step(self) -> str:
+        """Third argument of the segment as written in distribution strings, a frequency or a count."""
+        if self.distribution == "LIN":
+            return format_frequency(self.parameter)
+        return str(int(round(self.parameter)))
+
+    def __str__(self):
+        return f"{self.distribution} {format_frequency(self.start)} {format_frequency(self.stop)} {self.step}"
+
+
+class SweepEstimate(NamedTuple):
+    """Point counts and cost of a sweep."""
+
+    points: int
+    solved_points: int
+    cost: float
+
+
+def to_hz(value: Union[str, float]) -> float:
+    """Convert a frequency to Hz without EDB.
+
+    Parameters
+    ----------
+    value : str or float
+        Frequency, for example ``"2.5GHz"``, ``"10mhz"`` or ``1e9``. Unit case is ignored.
+
+    Returns
+    -------
+    float
+
+    Raises
+    ------
+    ValueError
+        If the value is an expression that cannot be evaluated locally, for example a design variable.
+    """
+    if not isinstance(value, str):
+        return float(value)
+    text = value.strip()
+    match = re.match(r"^(.*?)([A-Za-z]+)$", text)
+    if match and match.group(2).lower() in _FREQUENCY_UNITS:
+        text = match.group(1) + _FREQUENCY_UNITS[match.group(2).lower()]
+    result = evaluate_expression(text)
+    if result is None:
+        raise ValueError(f"Frequency '{value}' cannot be evaluated without EDB.")
+    return result
+
+
+def format_frequency(value: float) -> str:
+    """Format a frequency in Hz with the largest unit that keeps a readable number.
+
+    Parameters
+    ----------
+    value : float
+        Frequency in Hz.
+
+    Returns
+    -------
+    str
+        For example ``"50MHz"`` or ``"2.5GHz"``.
+
+    Examples
+    --------
+    >>> from pyedb.generic.frequency_sweep import format_frequency
+    >>> format_frequency(2.5e9), format_frequency(0), format_frequency(1234.5)
+    ('2.5GHz', '0Hz', '1.2345kHz')
+    """
+    for unit, scale in (("THz", 1e12), ("GHz", 1e9), ("MHz", 1e6), ("kHz", 1e3)):
+        if abs(value) >= scale:
+            return f"{value / scale:.12g}{unit}"
+    return f"{value:.12g}Hz"
+
+
+def parse_distribution(distribution: Union[str, Iterable[str]]) -> List[FrequencySegment]:
+    """Parse distribution strings into segments.
+
+    Parameters
+    ----------
+    distribution : str or list[str]
+        One or several segments, for example ``"LIN 0GHz 1GHz 10MHz LINC 1GHz 2GHz 11"``. Full names such as
+        ``"Linear"``, ``"LinearCount"``, ``"LogScale"``, ``"Decade"``, ``"Exponential"`` and ``"OctaveCount"`` are
+        accepted.
+
+    Returns
+    -------
+    list[:class:`FrequencySegment`]
+
+    Raises
+    ------
+    ValueError
+        If a distribution is unknown or a value cannot be evaluated locally.
+    """
+    if not isinstance(distribution, str):
+        distribution = " ".join(distribution)
+    segments = []
+    for match in _SEGMENT.finditer(distribution):
+        name = re.sub(r"\s+", "", match.group("distribution")).upper()
+        if name not in _DISTRIBUTION_ALIASES:
+            raise ValueError(f"Unsupported distribution '{match.group('distribution')}'.")
+        name = _DISTRIBUTION_ALIASES[name]
+        start = to_hz(match.group("start"))
+        stop = to_hz(match.group("stop"))
+        parameter = to_hz(match.group("parameter")) if name == "LIN" else float(match.group("parameter"))
+        segments.append(FrequencySegment(name, start, stop, parameter))
+    return segments
+
+
+def _log_points(start, stop, per_unit, base):
+    if start <= 0 or stop <= 0:
+        raise ValueError("Logarithmic distributions need strictly positive start and stop frequencies.")
+    intervals = max(int(round(per_unit * math.log(stop / start, base))), 1)
+    return np.geomspace(start, stop, intervals + 1)
+
+
+def expand_segment(segment: FrequencySegment) -> np.ndarray:
+    """Frequency points of one segment in Hz.
+
+    Parameters
+    ----------
+    segment : :class:`FrequencySegment`
+
+    Returns
+    -------
+    numpy.ndarray
+        Frequencies in increasing order of the segment.
+    """
+    distribution, start, stop, parameter = segment
+    if start == stop:
+        return np.array([start])
+    if distribution == "LIN":
+        if parameter <= 0:
+            raise ValueError("Linear step must be strictly positive.")
+        count = int(math.floor(abs(stop - start) / parameter * (1 + RTOL) + RTOL)) + 1
+        return start + math.copysign(parameter, stop - start) * np.arange(count)
+    count = int(round(parameter))
+    if distribution == "LINC":
+        return np.linspace(start, stop, max(count, 1)) if count > 1 else np.array([start])
+    if distribution == "ESTP":
+        if start <= 0 or stop <= 0:
+            raise ValueError("Exponential distributions need strictly positive start and stop frequencies.")
+        return np.geomspace(start, stop, max(count, 1)) if count > 1 else np.array([start])
+    if distribution == "DEC":
+        return _log_points(start, stop, count, 10)
+    if distribution == "OCT":
+        return _log_points(start, stop, count, 2)
+    raise ValueError(f"Unsupported distribution '{distribution}'.")
+
+
+def unique_frequencies(frequencies: Iterable[float], rtol: float = RTOL) -> np.ndarray:
+    """Sort frequencies and drop the ones equal to their predecessor within a relative tolerance.
+
+    Parameters
+    ----------
+    frequencies : array_like
+        Frequencies in Hz.
+    rtol : float, optional
+        Relative tolerance. The default is ``1e-9``.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    frequencies = np.sort(np.asarray(frequencies, dtype=float).ravel())
+    if len(frequencies) < 2:
+        return frequencies
+    keep = np.empty(len(frequencies), dtype=bool)
+    keep[0] = True
+    keep[1:] = np.diff(frequencies) > rtol * np.maximum(np.abs(frequencies[1:]), 1.0)
+    return frequencies[keep]
+
+
+def expand(distributions, rtol: float = RTOL) -> np.ndarray:
+    """Expand and merge distributions into sorted unique frequencies.
+
+    Parameters
+    ----------
+    distributions : str, :class:`FrequencySegment` or list of them
+        Distribution strings or segments. Strings of several setups can be passed together to merge their points.
+    rtol : float, optional
+        Relative tolerance under which two frequencies are merged. The default is ``1e-9``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Frequencies in Hz.
+
+    Examples
+    --------
+    >>> from pyedb.generic.frequency_sweep import expand
+    >>> expand(["LIN 0GHz 1GHz 0.5GHz", "LINC 1GHz 2GHz 3"])
+    array([0.0e+00, 5.0e+08, 1.0e+09, 1.5e+09, 2.0e+09])
+    """
+    segments = _segments(distributions)
+    if not segments:
+        return np.array([], dtype=float)
+    return unique_frequencies(np.concatenate([expand_segment(segment) for segment in segments]), rtol)
+
+
+def _segments(distributions) -> List[FrequencySegment]:
+    if isinstance(distributions, (str, FrequencySegment)):
+        distributions = [distributions]
+    segments = []
+    for distribution in distributions:
+        if isinstance(distribution, FrequencySegment):
+            segments.append(distribution)
+        else:
+            segments.extend(parse_distribution(distribution))
+    return segments
+
+
+def count_points(distributions) -> int:
+    """Number of distinct frequency points of distributions.
+
+    Parameters
+    ----------
+    distributions : str, :class:`FrequencySegment` or list of them
+
+    Returns
+    -------
+    int
+    """
+    return len(expand(distributions))
+
+
+def estimate_cost(
+    distributions, sweep_type: str = "discrete", seconds_per_point: float = 1.0, max_solutions: int = 250
+) -> SweepEstimate:
+    """Estimate the number of solved frequencies and the solve cost of a sweep.
+
+    Parameters
+    ----------
+    distributions : str, :class:`FrequencySegment` or list of them
+    sweep_type : str, optional
+        ``"discrete"`` solves every point. ``"interpolating"`` and ``"broadband"`` solve at most ``max_solutions``
+        points. The default is ``"discrete"``.
+    seconds_per_point : float, optional
+        Cost of one solved frequency. The default is ``1.0``.
+    max_solutions : int, optional
+        Maximum number of solutions of an interpolating sweep. The default is ``250``, the EDB default.
+
+    Returns
+    -------
+    :class:`SweepEstimate`
+        Number of points, number of solved points and cost.
+    """
+    points = count_points(distributions)
+    solved = points if sweep_type.lower().startswith("discrete") else min(points, max_solutions)
+    return SweepEstimate(points, solved, solved * seconds_per_point)
+
+
+def _run_length(frequencies, start, geometric):
+    """Number of frequencies from ``start`` with a constant step, or a constant ratio when ``geometric``."""
+    values = np.log(frequencies[start:]) if geometric else frequencies[start:]
+    if len(values) < 3:
+        return len(values)
+    steps = np.diff(values)
+    mismatch = np.flatnonzero(~np.isclose(steps, steps[0], rtol=STEP_RTOL, atol=0))
+    return int(mismatch[0]) + 1 if len(mismatch) else len(values)
+
+
+def minimal_distribution(frequencies, rtol: float = RTOL) -> List[str]:
+    """Shortest list of segments producing the given frequencies.
+
+    Runs of equally spaced frequencies become ``LIN`` segments. Runs with a constant ratio become ``DEC`` or ``OCT``
+    segments when they have a whole number of points per decade or octave, ``ESTP`` segments otherwise. Remaining
+    frequencies become ``LINC`` segments of one or two points.
+
+    Parameters
+    ----------
+    frequencies : array_like or str or list[str]
+        Frequencies in Hz or distribution strings to compact.
+    rtol : float, optional
+        Relative tolerance used to merge frequencies and detect constant steps. The default is ``1e-9``.
+
+    Returns
+    -------
+    list[str]
+        Distribution strings.
+
+    Examples
+    --------
+    >>> from pyedb.generic.frequency_sweep import minimal_distribution
+    >>> minimal_distribution(["LIN 0GHz 1GHz 0.1GHz", "LIN 0.5GHz 2GHz 0.1GHz"])
+    ['LIN 0Hz 2GHz 100MHz']
+    """
+    if isinstance(frequencies, (str, FrequencySegment)) or (
+        isinstance(frequencies, (list, tuple)) and frequencies and isinstance(frequencies[0], (str, FrequencySegment))
+    ):
+        frequencies = expand(frequencies, rtol)
+    else:
+        frequencies = unique_frequencies(frequencies, rtol)
+    segments = []
+    index = 0
+    count = len(frequencies)
+    while index < count:
+        linear = _run_length(frequencies, index, geometric=False)
+        geometric = _run_length(frequencies, index, geometric=True) if frequencies[index] > 0 else 0
+        if max(linear, geometric) < 3:
+            end = min(index + 1, count - 1)
+            if (
+                end > index
+                and max(_run_length(frequencies, end, geometric=False), _run_length(frequencies, end, geometric=True))
+                >= 3
+            ):
+                # Leave the next frequency to the run it starts.
+                end = index
+            segments.append(str(FrequencySegment("LINC", frequencies[index], frequencies[end], end - index + 1)))
+            index = end + 1
+            continue
+        if linear >= geometric:
+            end = index + linear - 1
+            step = (frequencies[end] - frequencies[index]) / (linear - 1)
+            segments.append(str(FrequencySegment("LIN", frequencies[index], frequencies[end], step)))
+        else:
+            end = index + geometric - 1
+            start, stop = frequencies[index], frequencies[end]
+            per_decade = (geometric - 1) / math.log10(stop / start)
+            per_octave = (geometric - 1) / math.log2(stop / start)
+            if abs(per_decade - round(per_decade)) < STEP_RTOL * per_decade:
+                segments.append(str(FrequencySegment("DEC", start, stop, round(per_decade))))
+            elif abs(per_octave - round(per_octave)) < STEP_RTOL * per_octave:
+                segments.append(str(FrequencySegment("OCT", start, stop, round(per_octave))))
+            else:
+                segments.append(str(FrequencySegment("ESTP", start, stop, geometric)))
+        index = end + 1
+    return segments
+
+
+def optimize_distribution(distributions, rtol: float = RTOL) -> Optional[List[str]]:
+    """Rewrite distributions as the shortest equivalent list when it has fewer segments.
+
+    Parameters
+    ----------
+    distributions : str or list[str]
+        Distribution strings, for example the ``frequency_string`` of a sweep.
+    rtol : float, optional
+        Relative tolerance. The default is ``1e-9``.
+
+    Returns
+    -------
+    list[str] or None
+        Shorter distribution strings producing the same frequencies, or ``None`` when the input is already minimal.
+    """
+    segments = _segments(distributions)
+    minimal = minimal_distribution(expand(segments, rtol), rtol)
+    if len(minimal) < len(segments):
+        return minimal
+    return None
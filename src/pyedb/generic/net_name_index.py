@@ -0,0 +1,303 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Sorted index of net names answering exact, prefix, suffix, wildcard and regex selectors.
+
+Net names are kept in two sorted lists, one on the names and one on the reversed names, so that a
+selector anchored on a literal prefix or suffix only visits the matching range (found by bisection)
+instead of every net in the design. Case-insensitive variants of both lists are built on first use.
+Wildcard and regex selectors are compiled once and cached.
+
+Only ``*`` (any run of characters) and ``?`` (any single character) are special in wildcard selectors;
+every other character, brackets included, is literal so that bus names such as ``DQ[0]`` can be used
+as they are.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from functools import lru_cache
+import re
+from typing import Iterable, Iterator
+
+_LAST_CHAR = chr(0x10FFFF)
+_WILDCARD_CHARS = frozenset("*?")
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]|()\\")
+_REBUILD_THRESHOLD = 64
+
+
+def _is_wildcard(selector: str) -> bool:
+    return any(char in _WILDCARD_CHARS for char in selector)
+
+
+@lru_cache(maxsize=1024)
+def _compile_wildcard(pattern: str, case_sensitive: bool) -> tuple[str, str, re.Pattern]:
+    """Return the literal prefix, the literal suffix and the compiled form of a wildcard pattern."""
+    first = min(pattern.find(char) for char in _WILDCARD_CHARS if char in pattern)
+    last = max(pattern.rfind(char) for char in _WILDCARD_CHARS)
+    body = "".join(".*" if char == "*" else "." if char == "?" else re.escape(char) for char in pattern)
+    compiled = re.compile(body, re.DOTALL if case_sensitive else re.DOTALL | re.IGNORECASE)
+    return pattern[:first], pattern[last + 1 :], compiled
+
+
+@lru_cache(maxsize=1024)
+def _regex_literal_prefix(pattern: str) -> str:
+    """Return the literal text every match of ``pattern`` (anchored at the start) must begin with."""
+    if "|" in pattern:
+        return ""
+    prefix = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if index + 1 >= len(pattern) or pattern[index + 1].isalnum():
+                break
+            prefix.append(pattern[index + 1])
+            index += 2
+            continue
+        if char in _REGEX_SPECIAL:
+            # A quantifier makes the preceding character optional.
+            if char in "*?{" and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+        index += 1
+    return "".join(prefix)
+
+
+class NetNameIndex:
+    """Sorted index of net names.
+
+    Parameters
+    ----------
+    names : iterable of str, optional
+        Initial net names. Duplicates are ignored.
+
+    Examples
+    --------
+    >>> index = NetNameIndex(["DDR4_DQ0", "DDR4_DQ1", "PCIe_RX0_P", "PCIe_RX0_N", "GND"])
+    >>> index.prefix("DDR4_")
+    ['DDR4_DQ0', 'DDR4_DQ1']
+    >>> index.select("PCIe*_P", "GND")
+    ['GND', 'PCIe_RX0_P']
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: set[str] = set(names)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._forward = sorted(self._names)
+        self._backward = sorted(name[::-1] for name in self._names)
+        self._folded_forward: list[tuple[str, str]] | None = None
+        self._folded_backward: list[tuple[str, str]] | None = None
+
+    def _folded(self, backward: bool) -> list[tuple[str, str]]:
+        if backward:
+            if self._folded_backward is None:
+                self._folded_backward = sorted((name[::-1].lower(), name) for name in self._names)
+            return self._folded_backward
+        if self._folded_forward is None:
+            self._folded_forward = sorted((name.lower(), name) for name in self._names)
+        return self._folded_forward
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._forward)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} names)"
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+    def add(self, name: str) -> None:
+        """Add a net name to the index."""
+        if not name or name in self._names:
+            return
+        self._names.add(name)
+        insort(self._forward, name)
+        insort(self._backward, name[::-1])
+        if self._folded_forward is not None:
+            insort(self._folded_forward, (name.lower(), name))
+        if self._folded_backward is not None:
+            insort(self._folded_backward, (name[::-1].lower(), name))
+
+    def update(self, names: Iterable[str]) -> None:
+        """Add several net names, re-sorting once when many names are new."""
+        new_names = [name for name in set(names) if name and name not in self._names]
+        if len(new_names) > _REBUILD_THRESHOLD:
+            self._names.update(new_names)
+            self._rebuild()
+            return
+        for name in new_names:
+            self.add(name)
+
+    def discard(self, name: str) -> None:
+        """Remove a net name from the index if it is present."""
+        if name not in self._names:
+            return
+        self._names.discard(name)
+        self._pop(self._forward, name)
+        self._pop(self._backward, name[::-1])
+        if self._folded_forward is not None:
+            self._pop(self._folded_forward, (name.lower(), name))
+        if self._folded_backward is not None:
+            self._pop(self._folded_backward, (name[::-1].lower(), name))
+
+    def rename(self, old_name: str, new_name: str) -> None:
+        """Replace ``old_name`` by ``new_name``."""
+        if old_name == new_name:
+            return
+        self.discard(old_name)
+        self.add(new_name)
+
+    @staticmethod
+    def _pop(keys: list, key) -> None:
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _range(self, literal: str, backward: bool, case_sensitive: bool) -> list[str]:
+        """Return the names whose start (or end when ``backward``) is ``literal``."""
+        if case_sensitive:
+            keys = self._backward if backward else self._forward
+            key = literal[::-1] if backward else literal
+            found = keys[bisect_left(keys, key) : bisect_left(keys, key + _LAST_CHAR)]
+            return [name[::-1] for name in found] if backward else found
+        keys = self._folded(backward)
+        key = (literal[::-1] if backward else literal).lower()
+        return [name for _, name in keys[bisect_left(keys, (key,)) : bisect_left(keys, (key + _LAST_CHAR,))]]
+
+    def _range_size(self, literal: str, backward: bool, case_sensitive: bool) -> int:
+        if case_sensitive:
+            keys = self._backward if backward else self._forward
+            key = literal[::-1] if backward else literal
+            return bisect_left(keys, key + _LAST_CHAR) - bisect_left(keys, key)
+        keys = self._folded(backward)
+        key = (literal[::-1] if backward else literal).lower()
+        return bisect_left(keys, (key + _LAST_CHAR,)) - bisect_left(keys, (key,))
+
+    def prefix(self, prefix: str, case_sensitive: bool = True) -> list[str]:
+        """Return the sorted names starting with ``prefix``."""
+        names = self._range(prefix, False, case_sensitive)
+        return names if case_sensitive else sorted(names)
+
+    def suffix(self, suffix: str, case_sensitive: bool = True) -> list[str]:
+        """Return the sorted names ending with ``suffix``."""
+        return sorted(self._range(suffix, True, case_sensitive))
+
+    def exact(self, name: str, case_sensitive: bool = True) -> list[str]:
+        """Return ``[name]`` if it is indexed, or every case variant of it when not case sensitive."""
+        if case_sensitive:
+            return [name] if name in self._names else []
+        folded = name.lower()
+        return sorted(candidate for candidate in self._range(name, False, False) if candidate.lower() == folded)
+
+    def wildcard(self, pattern: str, case_sensitive: bool = True) -> list[str]:
+        """Return the sorted names matching a wildcard pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Pattern where ``*`` matches any run of characters and ``?`` a single character.
+        case_sensitive : bool, optional
+            Whether the match is case sensitive. The default is ``True``.
+
+        Returns
+        -------
+        list[str]
+        """
+        if not _is_wildcard(pattern):
+            return self.exact(pattern, case_sensitive)
+        literal_prefix, literal_suffix, compiled = _compile_wildcard(pattern, case_sensitive)
+        if literal_prefix and (
+            not literal_suffix
+            or self._range_size(literal_prefix, False, case_sensitive)
+            <= self._range_size(literal_suffix, True, case_sensitive)
+        ):
+            candidates = self._range(literal_prefix, False, case_sensitive)
+        elif literal_suffix:
+            candidates = self._range(literal_suffix, True, case_sensitive)
+        else:
+            candidates = self._forward
+        return sorted(name for name in candidates if compiled.fullmatch(name))
+
+    def regex(self, pattern: str | re.Pattern, flags: int = 0) -> list[str]:
+        """Return the sorted names matching a regular expression.
+
+        The expression is applied with :func:`re.match`, that is anchored at the start of the name.
+        When it starts with literal text, only the names sharing that prefix are tested.
+
+        Parameters
+        ----------
+        pattern : str or re.Pattern
+            Regular expression.
+        flags : int, optional
+            Flags used to compile ``pattern`` when it is a string.
+
+        Returns
+        -------
+        list[str]
+        """
+        compiled = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+        case_sensitive = not compiled.flags & re.IGNORECASE
+        literal_prefix = _regex_literal_prefix(compiled.pattern) if isinstance(compiled.pattern, str) else ""
+        candidates = self._range(literal_prefix, False, case_sensitive) if literal_prefix else self._forward
+        return sorted(name for name in candidates if compiled.match(name))
+
+    def select(self, *selectors: str | re.Pattern, case_sensitive: bool = True) -> list[str]:
+        """Return the sorted union of the names matched by several selectors.
+
+        A selector is either a compiled regular expression, a net name, or a wildcard pattern. A string is
+        first looked up as a net name, so names that contain ``?`` or ``*`` are still found as they are.
+
+        Parameters
+        ----------
+        *selectors : str or re.Pattern
+            Net names, wildcard patterns or compiled regular expressions.
+        case_sensitive : bool, optional
+            Whether string selectors are case sensitive. The default is ``True``.
+
+        Returns
+        -------
+        list[str]
+        """
+        found: set[str] = set()
+        for selector in selectors:
+            if isinstance(selector, re.Pattern):
+                found.update(self.regex(selector))
+            elif selector in self._names:
+                found.add(selector)
+                if not case_sensitive:
+                    found.update(self.exact(selector, False))
+            else:
+                found.update(self.wildcard(selector, case_sensitive))
+        return sorted(found)
@@ -0,0 +1,187 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Conversion between NumPy vertex arrays and the flat point lists of EDB polygon data."""
+
+import sys
+
+import numpy as np
+
+ARC_SENTINEL = sys.float_info.max
+"""Y value marking an arc-height point in EDB polygon point lists."""
+
+
+def as_vertex_array(points, arc_heights=None):
+    """Return polygon vertices as a float array, or ``None`` when they are parametric.
+
+    Parameters
+    ----------
+    points : array_like
+        ``(N, 2)`` vertices, or ``(N, 3)`` vertices whose third column is the height of the arc ending at the
+        vertex.
+    arc_heights : array_like, optional
+        ``(N,)`` heights of the arcs ending at each vertex. ``0`` is a straight segment. When given, it
+        overrides the third column of ``points``.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray] or None
+        ``(N, 2)`` float64 vertices and ``(N,)`` float64 arc heights, or ``None`` when the input contains
+        strings or other non-numeric values that must be evaluated by EDB.
+    """
+    array = points if isinstance(points, np.ndarray) else _try_asarray(points)
+    if array is None or array.dtype.kind not in "fiu" or array.ndim != 2 or array.shape[1] not in (2, 3):
+        return None
+    array = array.astype(np.float64, copy=False)
+    xy = np.ascontiguousarray(array[:, :2])
+    if arc_heights is not None:
+        heights = np.asarray(arc_heights, dtype=np.float64).reshape(-1)
+        if len(heights) != len(xy):
+            raise ValueError("One arc height is required per vertex.")
+    elif array.shape[1] == 3:
+        heights = array[:, 2].copy()
+    else:
+        heights = np.zeros(len(xy))
+    return xy, heights
+
+
+def _try_asarray(points):
+    try:
+        return np.asarray(points)
+    except (ValueError, TypeError):
+        # Ragged point lists, e.g. mixed [x, y] and [x, y, h] points.
+        return None
+
+
+def flat_point_array(xy, arc_heights=None) -> np.ndarray:
+    """Interleave arc-height points with vertices the way EDB stores them.
+
+    The arc ending at vertex ``i`` is stored as an extra ``(height, ARC_SENTINEL)`` point right before it. The
+    arc ending at the first vertex closes the polygon and is stored after the last vertex.
+
+    Parameters
+    ----------
+    xy : numpy.ndarray
+        ``(N, 2)`` vertices.
+    arc_heights : numpy.ndarray, optional
+        ``(N,)`` arc heights. ``0`` is a straight segment.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N + number of arcs, 2)`` points.
+    """
+    if arc_heights is None:
+        return xy
+    is_arc = arc_heights != 0
+    if not is_arc.any():
+        return xy
+    # Row of vertex i: i plus the number of arc points inserted before it. The closing arc is not one of them.
+    inserted = np.cumsum(is_arc)
+    inserted -= is_arc[0]
+    vertex_rows = np.arange(len(xy)) + inserted
+    flat = np.empty((len(xy) + int(is_arc.sum()), 2))
+    flat[vertex_rows] = xy
+    arc_rows = vertex_rows[1:][is_arc[1:]] - 1
+    flat[arc_rows, 0] = arc_heights[1:][is_arc[1:]]
+    flat[arc_rows, 1] = ARC_SENTINEL
+    if is_arc[0]:
+        flat[-1] = (arc_heights[0], ARC_SENTINEL)
+    return flat
+
+
+def split_flat_points(flat) -> tuple:
+    """Separate the vertices and arc heights of a flat EDB point list.
+
+    This is the inverse of :func:`flat_point_array`.
+
+    Parameters
+    ----------
+    flat : array_like
+        ``(M, 2)`` points where arc-height points have ``ARC_SENTINEL`` as Y value.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        ``(N, 2)`` vertices and ``(N,)`` heights of the arcs ending at each vertex.
+    """
+    flat = np.asarray(flat, dtype=np.float64).reshape(-1, 2)
+    is_arc = flat[:, 1] == ARC_SENTINEL
+    xy = flat[~is_arc]
+    heights = np.zeros(len(xy))
+    if len(xy) and is_arc.any():
+        # An arc point precedes the vertex it ends at. The one after the last vertex closes the polygon.
+        ending_vertex = np.cumsum(~is_arc)[is_arc] % len(xy)
+        heights[ending_vertex] = flat[is_arc, 0]
+    return xy, heights
+
+
+def segment_lengths(xy, arc_heights=None, closed: bool = False) -> np.ndarray:
+    """Return the lengths of the segments of a polyline whose segments can be arcs.
+
+    Parameters
+    ----------
+    xy : numpy.ndarray
+        ``(N, 2)`` vertices.
+    arc_heights : numpy.ndarray, optional
+        ``(N,)`` heights of the arcs ending at each vertex. ``0`` is a straight segment.
+    closed : bool, optional
+        Whether the segment from the last vertex back to the first one is included. The default is ``False``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(N - 1,)`` lengths, or ``(N,)`` lengths when ``closed`` is ``True``.
+    """
+    xy = np.asarray(xy, dtype=np.float64)
+    if len(xy) < 2:
+        return np.zeros(0)
+    heights = np.zeros(len(xy)) if arc_heights is None else np.abs(np.asarray(arc_heights, dtype=np.float64))
+    ends = np.roll(xy, -1, axis=0) if closed else xy[1:]
+    segment_heights = np.roll(heights, -1) if closed else heights[1:]
+    chords = np.hypot(*(ends - xy[: len(ends)]).T)
+    lengths = chords.copy()
+    is_arc = (segment_heights > 0) & (chords > 0)
+    # Arc of chord c and height h spans 4 * atan(2h / c) and has a radius of c / (2 sin(angle / 2)).
+    angles = 4 * np.arctan(2 * segment_heights[is_arc] / chords[is_arc])
+    lengths[is_arc] = chords[is_arc] * angles / (2 * np.sin(angles / 2))
+    return lengths
+
+
+def polyline_length(xy, arc_heights=None, closed: bool = False) -> float:
+    """Return the length of a polyline whose segments can be arcs.
+
+    Parameters
+    ----------
+    xy : numpy.ndarray
+        ``(N, 2)`` vertices.
+    arc_heights : numpy.ndarray, optional
+        ``(N,)`` heights of the arcs ending at each vertex. ``0`` is a straight segment.
+    closed : bool, optional
+        Whether the segment from the last vertex back to the first one is included. The default is ``False``.
+
+    Returns
+    -------
+    float
+    """
+    return float(segment_lengths(xy, arc_heights, closed).sum())
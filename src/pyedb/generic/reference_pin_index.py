@@ -0,0 +1,182 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Spatial index of reference pins used to find the pins nearest to a positive pin."""
+
+import numpy as np
+
+
+class ReferencePinIndex:
+    """KD-tree over reference pin positions answering radius and nearest-pin queries.
+
+    The pin positions are read once when the index is built, so a single index can serve the positive pins of a
+    whole component. ``scipy`` is used when it is installed, otherwise distances are computed with NumPy.
+
+    Parameters
+    ----------
+    pins : list
+        Reference padstack instances.
+    positions : array_like, optional
+        ``(N, 2)`` pin positions in meters. When omitted, positions are read from the ``position`` of each pin.
+
+    Examples
+    --------
+    >>> from pyedb.generic.reference_pin_index import ReferencePinIndex
+    >>> index = ReferencePinIndex(["a", "b", "c"], [[0, 0], [1e-3, 0], [5e-3, 0]])
+    >>> index.query_radius([0.9e-3, 0], 2e-3)
+    ['b', 'a']
+    >>> index.nearest([[4e-3, 0], [0, 0]])
+    [['c'], ['a']]
+    """
+
+    def __init__(self, pins, positions=None):
+        self.pins = list(pins)
+        if positions is None:
+            positions = [[float(coordinate) for coordinate in pin.position[:2]] for pin in self.pins]
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        if len(self.positions) != len(self.pins):
+            raise ValueError("One position is required per reference pin.")
+        self._tree = None
+        if self.pins:
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                pass
+            else:
+                self._tree = cKDTree(self.positions)
+
+    @classmethod
+    def from_pin_positions(cls, pin_positions):
+        """Build an index from a ``{pin: position}`` dictionary.
+
+        Parameters
+        ----------
+        pin_positions : dict
+            Reference pins mapped to their ``[x, y]`` position.
+
+        Returns
+        -------
+        :class:`ReferencePinIndex`
+        """
+        return cls(list(pin_positions), [[float(i) for i in pos[:2]] for pos in pin_positions.values()])
+
+    def __len__(self):
+        return len(self.pins)
+
+    def _distances(self, points, indices=None):
+        positions = self.positions if indices is None else self.positions[indices]
+        return np.hypot(points[:, None, 0] - positions[None, :, 0], points[:, None, 1] - positions[None, :, 1])
+
+    def query_radius_many(self, points, radius, max_limit=0, predicate=None):
+        """Find the reference pins within a radius of each point.
+
+        Parameters
+        ----------
+        points : array_like
+            ``(M, 2)`` query points in meters.
+        radius : float
+            Search radius in meters. Pins at exactly this distance are included.
+        max_limit : int, optional
+            Maximum number of pins returned per point. The default is ``0``, in which case no limit is applied.
+        predicate : callable, optional
+            Function called on the candidate pins, nearest first. Pins for which it returns ``False`` are skipped.
+
+        Returns
+        -------
+        list[list]
+            For each point, the matching pins sorted by increasing distance.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        if not self.pins:
+            return [[] for _ in range(len(points))]
+        if self._tree is not None:
+            candidates = self._tree.query_ball_point(points, radius)
+        else:
+            candidates = [np.flatnonzero(row <= radius) for row in self._distances(points)]
+        results = []
+        for point, indices in zip(points, candidates):
+            indices = np.asarray(indices, dtype=int)
+            distances = self._distances(point[None, :], indices)[0]
+            pins = [self.pins[i] for i in indices[np.argsort(distances, kind="stable")]]
+            if predicate is not None:
+                pins = [pin for pin in pins if predicate(pin)]
+            if max_limit:
+                pins = pins[:max_limit]
+            results.append(pins)
+        return results
+
+    def query_radius(self, point, radius, max_limit=0, predicate=None):
+        """Find the reference pins within a radius of a point.
+
+        Parameters
+        ----------
+        point : array_like
+            ``[x, y]`` query point in meters.
+        radius : float
+            Search radius in meters. Pins at exactly this distance are included.
+        max_limit : int, optional
+            Maximum number of pins returned. The default is ``0``, in which case no limit is applied.
+        predicate : callable, optional
+            Function called on the candidate pins, nearest first. Pins for which it returns ``False`` are skipped.
+
+        Returns
+        -------
+        list
+            Matching pins sorted by increasing distance.
+        """
+        point = [float(coordinate) for coordinate in point[:2]]
+        return self.query_radius_many([point], radius, max_limit, predicate)[0]
+
+    def nearest(self, points, k=1, max_distance=np.inf):
+        """Find the ``k`` nearest reference pins of each point.
+
+        Parameters
+        ----------
+        points : array_like
+            ``(M, 2)`` query points in meters.
+        k : int, optional
+            Number of pins returned per point. The default is ``1``.
+        max_distance : float, optional
+            Pins farther than this distance are not returned. The default is no limit.
+
+        Returns
+        -------
+        list[list]
+            For each point, up to ``k`` pins sorted by increasing distance.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        k = min(k, len(self.pins))
+        if not k:
+            return [[] for _ in range(len(points))]
+        if self._tree is not None:
+            distances, indices = self._tree.query(points, k=k)
+            distances = distances.reshape(len(points), k)
+            indices = indices.reshape(len(points), k)
+        else:
+            all_distances = self._distances(points)
+            indices = np.argsort(all_distances, axis=1, kind="stable")[:, :k]
+            distances = np.take_along_axis(all_distances, indices, axis=1)
+        return [
+            [self.pins[i] for i, distance in zip(row_indices, row_distances) if distance <= max_distance]
+            for row_indices, row_distances in zip(indices, distances)
+        ]
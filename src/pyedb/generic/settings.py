@@ -65,6 +65,7 @@ class Settings(object):
         self._disable_bounding_box_sat = False
         self._force_error_on_missing_project = False
         self._enable_pandas_output = False
+        self._enable_local_value_evaluation = True
         self.time_tick = time.time()
         self.retry_n_times_time_interval = 0.1
         self._global_log_file_name = "pyedb_{}.log".format(os.path.split(os.path.expanduser("~"))[-1])
@@ -281,6 +282,15 @@ class Settings(object):
     def enable_screen_logs(self, val):
         self._enable_screen_logs = val
 
+    @property
+    def enable_local_value_evaluation(self):
+        """Flag for evaluating plain numeric-with-unit expressions locally instead of on the EDB server."""
+        return self._enable_local_value_evaluation
+
+    @enable_local_value_evaluation.setter
+    def enable_local_value_evaluation(self, val):
+        self._enable_local_value_evaluation = val
+
     @property
     def edb_dll_path(self):
         """Optional path for the EDB DLL file."""
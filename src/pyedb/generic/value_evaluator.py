@@ -0,0 +1,170 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Local evaluation of plain numeric-with-unit expressions.
+
+EDB evaluates every expression such as ``"4mil"`` or ``"0.1mm"`` on the server. For plain numbers followed by an
+optional unit this round trip is unnecessary, so this module converts them locally to SI values. Anything that is not
+a plain number with a known unit (design or project variables, arithmetic, functions) is reported as unresolved so
+that the caller can fall back to the server.
+"""
+
+from functools import lru_cache
+import re
+from typing import Iterable, Optional
+
+import numpy as np
+
+LOCAL_UNITS = {
+    # Length
+    "fm": 1e-15,
+    "pm": 1e-12,
+    "nm": 1e-9,
+    "um": 1e-6,
+    "mm": 1e-3,
+    "cm": 1e-2,
+    "dm": 1e-1,
+    "meter": 1.0,
+    "meters": 1.0,
+    "km": 1e3,
+    "uin": 2.54e-8,
+    "mil": 2.54e-5,
+    "in": 2.54e-2,
+    # Frequency
+    "Hz": 1.0,
+    "kHz": 1e3,
+    "MHz": 1e6,
+    "GHz": 1e9,
+    "THz": 1e12,
+    # Time
+    "fs": 1e-15,
+    "ps": 1e-12,
+    "ns": 1e-9,
+    "us": 1e-6,
+    "ms": 1e-3,
+    "s": 1.0,
+    # Resistance
+    "uOhm": 1e-6,
+    "mOhm": 1e-3,
+    "ohm": 1.0,
+    "kOhm": 1e3,
+    "GOhm": 1e9,
+    # Capacitance
+    "fF": 1e-15,
+    "pF": 1e-12,
+    "nF": 1e-9,
+    "uF": 1e-6,
+    "mF": 1e-3,
+    "F": 1.0,
+    # Inductance
+    "fH": 1e-15,
+    "pH": 1e-12,
+    "nH": 1e-9,
+    "uH": 1e-6,
+    "mH": 1e-3,
+    "H": 1.0,
+}
+"""Case-sensitive unit scale factors to SI handled locally. Unknown units are always delegated to EDB."""
+
+_NUMBER_WITH_UNIT = re.compile(
+    r"^\s*(?P<number>[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)\s*(?P<unit>[A-Za-z]*)\s*$"
+)
+
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def evaluate_expression(expression: str) -> Optional[float]:
+    """Evaluate a plain numeric-with-unit expression locally.
+
+    Parameters
+    ----------
+    expression : str
+        Expression to evaluate. For example, ``"4mil"``, ``"0.1mm"`` or ``"1e9"``.
+
+    Returns
+    -------
+    float or None
+        Value converted to SI units, or ``None`` when the expression cannot be resolved without EDB, for example
+        because it refers to a design or project variable or uses an unknown unit.
+
+    Examples
+    --------
+    >>> from pyedb.generic.value_evaluator import evaluate_expression
+    >>> evaluate_expression("2mm")
+    0.002
+    >>> evaluate_expression("$thickness") is None
+    True
+    """
+    match = _NUMBER_WITH_UNIT.match(expression)
+    if not match:
+        return None
+    unit = match.group("unit")
+    if not unit:
+        return float(match.group("number"))
+    scale = LOCAL_UNITS.get(unit)
+    if scale is None:
+        return None
+    return float(match.group("number")) * scale
+
+
+def evaluate_expressions(expressions: Iterable, fallback=None) -> np.ndarray:
+    """Evaluate an array of expressions at once.
+
+    Each distinct expression is evaluated only once and the results are broadcast back to the input shape.
+
+    Parameters
+    ----------
+    expressions : iterable of str or float
+        Expressions or numbers to evaluate. Multi-dimensional arrays are supported.
+    fallback : callable, optional
+        Function called with each distinct expression that cannot be evaluated locally. It must return a float.
+        When ``None``, unresolved entries are set to ``nan``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of ``float64`` values in SI units with the same shape as the input.
+
+    Examples
+    --------
+    >>> from pyedb.generic.value_evaluator import evaluate_expressions
+    >>> evaluate_expressions(["1mm", "2mm", "1mm"])
+    array([0.001, 0.002, 0.001])
+    """
+    array = np.asarray(expressions)
+    if array.dtype.kind in "iufb":
+        return array.astype(np.float64)
+    uniques, inverse = np.unique(array.astype(str), return_inverse=True)
+    resolved = np.empty(len(uniques), dtype=np.float64)
+    for index, expression in enumerate(uniques.tolist()):
+        value = evaluate_expression(expression)
+        if value is None:
+            value = float(fallback(expression)) if fallback is not None else np.nan
+        resolved[index] = value
+    return resolved[inverse].reshape(array.shape)
+
+
+def clear_cache():
+    """Clear the memo cache of :func:`evaluate_expression`."""
+    evaluate_expression.cache_clear()
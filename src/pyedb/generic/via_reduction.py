@@ -0,0 +1,329 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Via reduction planned on a single snapshot of the padstack instance positions.
+
+The positions of the candidate vias are read once from the layout. Sampling vias on a regular grid and keeping one via
+per density cell are then computed with NumPy, nearest-via queries use a ``scipy`` KD-tree when it is installed.
+The result is a :class:`ViaReductionPlan` listing the vias kept and removed, which can be inspected before the removed
+vias are deleted in one batch.
+
+Examples
+--------
+>>> from pyedb.generic.via_reduction import ViaSnapshot, plan_cell_reduction
+>>> snapshot = ViaSnapshot.from_instances(edb.layout.padstack_instances, nets=["GND"])
+>>> plan = plan_cell_reduction(snapshot, 2e-3, 2e-3)
+>>> plan.summary()
+{'vias': 1250, 'kept': 180, 'removed': 1070}
+>>> edb.padstacks.apply_via_reduction(plan)
+1070
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+_CHUNK_SIZE = 1024
+
+
+@dataclass
+class ViaSnapshot:
+    """Identifiers, positions and net names of padstack instances read in one pass."""
+
+    ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    """``(N,)`` database IDs."""
+    positions: np.ndarray = field(default_factory=lambda: np.zeros((0, 2)))
+    """``(N, 2)`` positions in meters."""
+    nets: List[str] = field(default_factory=list)
+    instances: list = field(default_factory=list, repr=False)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_instances(
+        cls, instances: Iterable, nets: Optional[Sequence[str]] = None, ids: Optional[Sequence[int]] = None
+    ) -> "ViaSnapshot":
+        """Read the padstack instances once.
+
+        Parameters
+        ----------
+        instances : iterable
+            Padstack instances of the layout.
+        nets : str or list[str], optional
+            Only keep the instances on these nets. The default is ``None``, in which case all nets are kept.
+        ids : list[int], optional
+            Only keep the instances with these IDs, in this order. The default is ``None``, in which case the layout
+            order is kept.
+
+        Returns
+        -------
+        :class:`ViaSnapshot`
+
+        Raises
+        ------
+        KeyError
+            If one of the requested ``ids`` is not a padstack instance of the layout.
+        """
+        if isinstance(nets, str):
+            nets = [nets]
+        nets = set(nets) if nets else None
+        wanted = set(ids) if ids is not None else None
+        selected = {}
+        net_names = {}
+        for instance in instances:
+            instance_id = instance.id
+            if wanted is not None and instance_id not in wanted:
+                continue
+            net_name = instance.net_name
+            if nets is not None and net_name not in nets:
+                continue
+            selected[instance_id] = instance
+            net_names[instance_id] = net_name
+        if ids is None:
+            order = list(selected)
+        else:
+            order = [i for i in ids if nets is None or i in selected]
+            missing = [i for i in order if i not in selected]
+            if missing:
+                raise KeyError(missing[0])
+        snapshot_instances = [selected[i] for i in order]
+        positions = [[float(c) for c in instance.position[:2]] for instance in snapshot_instances]
+        return cls(
+            ids=np.asarray(order, dtype=np.int64),
+            positions=np.asarray(positions, dtype=float).reshape(-1, 2),
+            nets=[net_names[i] for i in order],
+            instances=snapshot_instances,
+        )
+
+    def subset(self, mask: np.ndarray) -> "ViaSnapshot":
+        """Return the instances selected by a boolean mask or an index array."""
+        indices = np.flatnonzero(mask) if np.asarray(mask).dtype == bool else np.asarray(mask, dtype=np.int64)
+        return ViaSnapshot(
+            ids=self.ids[indices],
+            positions=self.positions[indices],
+            nets=[self.nets[i] for i in indices],
+            instances=[self.instances[i] for i in indices],
+        )
+
+    def in_bounding_box(self, bounding_box: Sequence[float]) -> "ViaSnapshot":
+        """Return the instances inside a bounding box, boundary included.
+
+        Instances are selected by their position, the pad extent is not considered.
+
+        Parameters
+        ----------
+        bounding_box : list[float]
+            Bounding box as ``[x1, y1, x2, y2]``.
+
+        Returns
+        -------
+        :class:`ViaSnapshot`
+        """
+        if not bounding_box:
+            raise Exception("No bounding box was provided")
+        if not len(bounding_box) == 4:
+            raise Exception("The bounding box length must be equal to 4")
+        x1, y1, x2, y2 = (float(i) for i in bounding_box)
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        mask = (x >= min(x1, x2)) & (x <= max(x1, x2)) & (y >= min(y1, y2)) & (y <= max(y1, y2))
+        return self.subset(mask)
+
+
+@dataclass
+class ViaReductionPlan:
+    """Vias kept and removed by a reduction, computed before anything is deleted."""
+
+    snapshot: ViaSnapshot
+    keep: np.ndarray
+    """``(N,)`` boolean mask of the kept vias, aligned with the snapshot."""
+    grid: list = field(default_factory=list)
+    """Outlines ``[[x0, x1, x2, x3, x0], [y0, y1, y2, y3, y0]]`` of the occupied cells, for plotting."""
+    applied: bool = False
+
+    def __len__(self):
+        return len(self.snapshot)
+
+    @property
+    def kept_ids(self) -> List[int]:
+        """IDs of the vias kept."""
+        return self.snapshot.ids[self.keep].tolist()
+
+    @property
+    def removed_ids(self) -> List[int]:
+        """IDs of the vias removed."""
+        return self.snapshot.ids[~self.keep].tolist()
+
+    @property
+    def kept_positions(self) -> np.ndarray:
+        """``(K, 2)`` positions of the vias kept."""
+        return self.snapshot.positions[self.keep]
+
+    @property
+    def removed_positions(self) -> np.ndarray:
+        """``(R, 2)`` positions of the vias removed."""
+        return self.snapshot.positions[~self.keep]
+
+    @property
+    def removed_instances(self) -> list:
+        """Padstack instances removed."""
+        return [self.snapshot.instances[i] for i in np.flatnonzero(~self.keep)]
+
+    def summary(self) -> dict:
+        """Count the vias considered, kept and removed.
+
+        Returns
+        -------
+        dict
+        """
+        kept = int(np.count_nonzero(self.keep))
+        return {"vias": len(self), "kept": kept, "removed": len(self) - kept}
+
+    def apply(self, delete) -> int:
+        """Delete the removed vias in one batch.
+
+        Parameters
+        ----------
+        delete : callable
+            Function called once with the list of padstack instances to delete.
+
+        Returns
+        -------
+        int
+            Number of vias deleted. ``0`` when the plan was already applied.
+        """
+        if self.applied:
+            return 0
+        instances = self.removed_instances
+        if instances:
+            delete(instances)
+        self.applied = True
+        return len(instances)
+
+
+def nearest_indices(positions: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Return the index of the position nearest to each point.
+
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        ``(N, 2)`` candidate positions. Must not be empty.
+    points : numpy.ndarray
+        ``(M, 2)`` query points.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(M,)`` indices into ``positions``.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        result = np.empty(len(points), dtype=np.int64)
+        for start in range(0, len(points), _CHUNK_SIZE):
+            chunk = points[start : start + _CHUNK_SIZE]
+            distances = np.square(chunk[:, None, 0] - positions[None, :, 0]) + np.square(
+                chunk[:, None, 1] - positions[None, :, 1]
+            )
+            result[start : start + len(chunk)] = np.argmin(distances, axis=1)
+        return result
+    return np.asarray(cKDTree(positions).query(points, k=1)[1], dtype=np.int64)
+
+
+def plan_grid_sampling(snapshot: ViaSnapshot, x_samples: int, y_samples: int) -> ViaReductionPlan:
+    """Keep the via nearest to each node of a regular grid.
+
+    The grid spans the extent of the vias with ``x_samples`` by ``y_samples`` nodes.
+
+    Parameters
+    ----------
+    snapshot : :class:`ViaSnapshot`
+        Candidate vias.
+    x_samples : int
+        Number of grid nodes along X.
+    y_samples : int
+        Number of grid nodes along Y.
+
+    Returns
+    -------
+    :class:`ViaReductionPlan`
+    """
+    keep = np.zeros(len(snapshot), dtype=bool)
+    if len(snapshot):
+        x, y = snapshot.positions[:, 0], snapshot.positions[:, 1]
+        x_grid, y_grid = np.meshgrid(np.linspace(x.min(), x.max(), x_samples), np.linspace(y.min(), y.max(), y_samples))
+        nodes = np.column_stack((x_grid.ravel(), y_grid.ravel()))
+        keep[nearest_indices(snapshot.positions, nodes)] = True
+    return ViaReductionPlan(snapshot, keep)
+
+
+def plan_cell_reduction(
+    snapshot: ViaSnapshot, cell_size_x: float = 1e-3, cell_size_y: float = 1e-3
+) -> ViaReductionPlan:
+    """Keep the via closest to the center of each occupied grid cell.
+
+    Cells of ``cell_size_x`` by ``cell_size_y`` start at the lower left corner of the extent of the vias.
+
+    Parameters
+    ----------
+    snapshot : :class:`ViaSnapshot`
+        Candidate vias.
+    cell_size_x : float, optional
+        Cell width in meters. The default is ``1e-3``.
+    cell_size_y : float, optional
+        Cell height in meters. The default is ``1e-3``.
+
+    Returns
+    -------
+    :class:`ViaReductionPlan`
+        Plan whose ``grid`` lists the occupied cells in the order the vias first reach them.
+    """
+    keep = np.zeros(len(snapshot), dtype=bool)
+    if not len(snapshot):
+        return ViaReductionPlan(snapshot, keep)
+    x, y = snapshot.positions[:, 0], snapshot.positions[:, 1]
+    x_min, y_min = x.min(), y.min()
+    i = np.floor_divide(x - x_min, cell_size_x).astype(np.int64)
+    j = np.floor_divide(y - y_min, cell_size_y).astype(np.int64)
+    cell = i * (int(j.max()) + 1) + j
+    distance = np.hypot(x - (x_min + (i + 0.5) * cell_size_x), y - (y_min + (j + 0.5) * cell_size_y))
+
+    order = np.lexsort((np.arange(len(cell)), distance, cell))
+    sorted_cells = cell[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_cells[1:] != sorted_cells[:-1]
+    keep[order[first]] = True
+
+    _, first_seen = np.unique(cell, return_index=True)
+    first_seen.sort()
+    x0 = x_min + i[first_seen] * cell_size_x
+    y0 = y_min + j[first_seen] * cell_size_y
+    x1, y1 = x0 + cell_size_x, y0 + cell_size_y
+    xs = np.column_stack((x0, x1, x1, x0, x0)).tolist()
+    ys = np.column_stack((y0, y0, y1, y1, y0)).tolist()
+    return ViaReductionPlan(snapshot, keep, grid=[[cx, cy] for cx, cy in zip(xs, ys)])
@@ -19,3 +19,30 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+
+"""gRPC database managers.
+
+Managers are loaded on first access so that importing a single manager does not load the whole database layer.
+"""
+
+from pyedb.misc.lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "Components": ".components",
+        "Definitions": ".definitions",
+        "EdbDesignOptions": ".design_options",
+        "Hfss": ".hfss",
+        "LayoutValidation": ".layout_validation",
+        "Modeler": ".modeler",
+        "NetClasses": ".nets",
+        "Nets": ".nets",
+        "Padstacks": ".padstacks",
+        "SimulationSetups": ".simulation_setups",
+        "Siwave": ".siwave",
+        "SourceExcitation": ".source_excitations",
+        "Stackup": ".stackup",
+        "Variable": ".variables",
+    },
+)
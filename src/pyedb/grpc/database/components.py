@@ -65,11 +65,12 @@ from pyedb.generic.general_methods import generate_unique_name
 from pyedb.generic.geometry_operators import GeometryOperators
 from pyedb.grpc.database.definition.component_def import ComponentDef
 from pyedb.grpc.database.definition.component_pin import ComponentPin
-from pyedb.grpc.database.hierarchy.component import Component
+from pyedb.grpc.database.hierarchy.component import Component, component_type_mapping
 from pyedb.grpc.database.hierarchy.pin_pair_model import PinPairModel
 from pyedb.grpc.database.hierarchy.pingroup import PinGroup
 from pyedb.grpc.database.hierarchy.structure_3d import Structure3D
 from pyedb.grpc.database.padstacks import Padstacks
+from pyedb.grpc.database.utility.component_table import ComponentTable
 from pyedb.grpc.database.utility.value import Value
 from pyedb.misc.decorators import deprecate_argument_name, deprecated
 
@@ -162,6 +163,7 @@ class Components(object):
         self._structures_3d = {}
         self._pins = {}
         self._comps_by_part = {}
+        self._table: Optional[ComponentTable] = None
         self._padstack = Padstacks(self._pedb)
         # Populate maps based on current layout
         self.refresh_components()
@@ -363,6 +365,32 @@ class Components(object):
             json.dump(data, f, ensure_ascii=False, indent=4)
         return True
 
+    @property
+    def table(self) -> ComponentTable:
+        """Components with their pin to net connectivity, read in one traversal of the layout.
+
+        The table is cached and discarded when components, nets or pin nets are edited through this API.
+
+        Returns
+        -------
+        :class:`ComponentTable <pyedb.grpc.database.utility.component_table.ComponentTable>`
+
+        Examples
+        --------
+        >>> table = edbapp.components.table
+        >>> table.pin_nets["U1"]["A1"]
+        >>> df = table.to_dataframe("pins")
+        """
+        if self._table is None:
+            self._table = ComponentTable.from_groups(
+                [component.core for component in self.instances.values()], component_type_mapping
+            )
+        return self._table
+
+    def clear_table_cache(self):
+        """Discard the cached component table."""
+        self._table = None
+
     def refresh_components(self) -> bool:
         """Refresh the component dictionary.
 
@@ -376,6 +404,7 @@ class Components(object):
         >>> edbapp.components.refresh_components()
         """
         self._logger.info("Refreshing the Components dictionary.")
+        self._table = None
         self._cmp = {}
         self._res = {}
         self._ind = {}
@@ -1021,6 +1050,7 @@ class Components(object):
             new_cmp.transform = hosting_component_location
         new_edb_comp = Component(self._pedb, new_cmp)
         self._cmp[new_cmp.name] = new_edb_comp
+        self._table = None
         return new_edb_comp
 
     def set_component_model(
@@ -1227,6 +1257,7 @@ class Components(object):
             edb_cmp.delete()
             if component_name in self.instances:
                 del self.instances[component_name]
+            self._table = None
             return True
         return False
 
@@ -1882,14 +1913,19 @@ class Components(object):
         >>> info = edbapp.components.get_component_net_connection_info("U1")
         """
         data = {"refdes": [], "pin_name": [], "net_name": []}
-        for _, pin_obj in self.instances[refdes].pins.items():
-            pin_name = pin_obj.name
-            if not pin_obj.net.is_null:
-                net_name = pin_obj.net.name
-                if pin_name:
-                    data["refdes"].append(refdes)
-                    data["pin_name"].append(pin_name)
-                    data["net_name"].append(net_name)
+        table = self.table
+        if refdes in table.pin_nets:
+            pin_nets = table.pin_nets[refdes].items()
+        else:
+            pin_nets = [
+                (pin_obj.name, "" if pin_obj.net.is_null else pin_obj.net.name)
+                for pin_obj in self.instances[refdes].pins.values()
+            ]
+        for pin_name, net_name in pin_nets:
+            if net_name and pin_name:
+                data["refdes"].append(refdes)
+                data["pin_name"].append(pin_name)
+                data["net_name"].append(net_name)
         return data
 
     def get_rats(self) -> List[Dict[str, List[str]]]:
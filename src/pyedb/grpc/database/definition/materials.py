@@ -24,6 +24,7 @@ from __future__ import absolute_import  # noreorder
 
 import difflib
 from enum import Enum
+from functools import wraps
 import logging
 import os
 import re
@@ -55,6 +56,7 @@ from pydantic import BaseModel, confloat
 
 from pyedb import Edb
 from pyedb.exceptions import MaterialModelException
+from pyedb.generic.amat_index import AmatIndex, load_amat_index
 from pyedb.grpc.database.utility.value import Value
 from pyedb.misc.decorators import deprecated, deprecated_property
 
@@ -147,6 +149,82 @@ _DEPRECATED_FIELD_TO_PROPERTY: dict[str, str] = {
 }
 
 
+# Maps MaterialProperties fields read from the dielectric model → dielectric model attribute names.
+_DIELECTRIC_MODEL_FIELDS: dict[str, str] = {
+    "dc_conductivity": "dc_conductivity",
+    "dc_permittivity": "dc_relative_permittivity",
+    "dielectric_model_frequency": "frequency",
+    "loss_tangent_at_frequency": "loss_tangent_at_frequency",
+    "permittivity_at_frequency": "relative_permittivity_at_frequency",
+}
+
+
+def _wrap_dielectric_model(model):
+    """Return the typed dielectric model matching ``model``, or ``None`` when the type is not supported."""
+    model_type = model.type.name.lower()
+    if model_type == "debye":
+        return CoreDebyeModel(model.msg)
+    elif model_type == "multipole_debye":
+        return CoreMultipoleDebyeModel(model.msg)
+    elif model_type == "djordjecvic_sarkar":
+        return CoreDjordjecvicSarkarModel(model.msg)
+    return None
+
+
+def _read_material_properties(material_def) -> dict:
+    """Read all properties of a material definition in a single pass.
+
+    The property list and the dielectric model are each fetched once and only the
+    properties defined on the material are queried. Absent values use the same defaults
+    as the corresponding :class:`Material` properties.
+
+    Parameters
+    ----------
+    material_def : :class:`MaterialDef <ansys.edb.core.definition.material_def.MaterialDef>`
+        Material definition.
+
+    Returns
+    -------
+    dict
+        Material properties keyed by :class:`MaterialProperties` field name.
+    """
+    defined = set()
+    try:
+        for prop in material_def.all_properties:
+            try:
+                defined.add(CoreMaterialProperty(prop).name)
+            except (ValueError, TypeError):
+                continue
+    except Exception as e:
+        logger.warning(f"Could not retrieve material properties: {e}")
+
+    res = {}
+    for prop_id in MaterialPropertyId:
+        if prop_id.value in defined:
+            res[prop_id.name] = Value(material_def.get_property(CoreMaterialProperty[prop_id.value]))
+        else:
+            res[prop_id.name] = 1.0 if prop_id is MaterialPropertyId.permittivity else 0.0
+
+    model = material_def.dielectric_material_model
+    model = None if model.is_null else _wrap_dielectric_model(model)
+    for field_name, attribute in _DIELECTRIC_MODEL_FIELDS.items():
+        res[field_name] = getattr(model, attribute, None) if model is not None else None
+    return res
+
+
+def _invalidates_snapshot(method):
+    """Discard the material property snapshot once ``method`` has run."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_snapshot()
+
+    return wrapper
+
+
 class Material:
     """Manage EDB methods for material property management."""
 
@@ -157,6 +235,14 @@ class Material:
         self.__material_def = core
         self.__dielectric_model = None
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if isinstance(getattr(type(self), name, None), property):
+            self._invalidate_snapshot()
+
+    def _invalidate_snapshot(self):
+        self.__edb.materials._invalidate_snapshot()
+
     @property
     def name(self) -> str:
         """Material name.
@@ -219,14 +305,12 @@ class Material:
 
         """
         # Todo missing wrapper classes for dielctric model classes.
-        if self.core.dielectric_material_model.is_null:
+        model = self.core.dielectric_material_model
+        if model.is_null:
             return 0.0
-        elif self.core.dielectric_material_model.type.name.lower() == "debye":
-            self.__dielectric_model = CoreDebyeModel(self.core.dielectric_material_model.msg)
-        elif self.core.dielectric_material_model.type.name.lower() == "multipole_debye":
-            self.__dielectric_model = CoreMultipoleDebyeModel(self.core.dielectric_material_model.msg)
-        elif self.core.dielectric_material_model.type.name.lower() == "djordjecvic_sarkar":
-            self.__dielectric_model = CoreDjordjecvicSarkarModel(self.core.dielectric_material_model.msg)
+        wrapped = _wrap_dielectric_model(model)
+        if wrapped is not None:
+            self.__dielectric_model = wrapped
         return self.__dielectric_model
 
     @property
@@ -600,14 +684,17 @@ class Material:
         """Set material thermal coefficient."""
         self.core.set_property(CoreMaterialProperty.THERMAL_EXPANSION_COEFFICIENT, self.__edb._value_setter(value))
 
+    @_invalidates_snapshot
     def set_debye_model(self):
         """Set Debye model on current material."""
         self.core.dielectric_material_model.__set__(self, CoreDebyeModel.create())
 
+    @_invalidates_snapshot
     def set_multipole_debye_model(self):
         """Set multi-pole debeye model on current material."""
         self.core.dielectric_material_model.__set__(self, CoreMultipoleDebyeModel.create())
 
+    @_invalidates_snapshot
     def set_djordjecvic_sarkar_model(self):
         """Set Djordjecvic-Sarkar model on current material."""
         self.core.dielectric_material_model = CoreDjordjecvicSarkarModel.create()
@@ -616,13 +703,16 @@ class Material:
         self.dielectric_material_model.frequency = 1e9
 
     def to_dict(self):
-        """Convert material into dictionary."""
-        properties = self.__load_all_properties()
+        """Convert material into dictionary.
 
+        Values are served from the material property snapshot of
+        :meth:`Materials.snapshot`, so repeated exports do not query the server again.
+        """
         res = {"name": self.name}
-        res.update(properties.model_dump())
+        res.update(self.__edb.materials._material_properties(self.core))
         return res
 
+    @_invalidates_snapshot
     def update(self, input_dict: dict):
         if input_dict:
             # Update attributes
@@ -753,6 +843,8 @@ class Materials(object):
     def __init__(self, edb: Edb):
         self.__edb = edb
         self.__syslib = os.path.join(self.__edb.base_path, "syslib")
+        self._snapshot: dict[str, dict] = {}
+        self._snapshot_complete = False
 
     def __contains__(self, item):
         if isinstance(item, Material):
@@ -774,6 +866,19 @@ class Materials(object):
         """
         return self.__syslib
 
+    @property
+    def syslib_index(self) -> AmatIndex:
+        """Parsed index of the syslib ``Materials.amat`` file.
+
+        The file is parsed once and cached in memory and on disk until it changes.
+
+        Returns
+        -------
+        :class:`AmatIndex <pyedb.generic.amat_index.AmatIndex>`
+            Materials of the syslib with case-insensitive lookup.
+        """
+        return load_amat_index(os.path.join(self.__syslib, "Materials.amat"))
+
     @property
     def materials(self) -> dict[str, Material]:
         """Get materials.
@@ -788,6 +893,59 @@ class Materials(object):
         }
         return materials
 
+    def _invalidate_snapshot(self):
+        self._snapshot = {}
+        self._snapshot_complete = False
+
+    def _material_properties(self, material_def) -> dict:
+        """Cached properties of a single material definition."""
+        name = material_def.name
+        if name not in self._snapshot:
+            self._snapshot[name] = _read_material_properties(material_def)
+        return dict(self._snapshot[name])
+
+    def _properties_by_name(self, name: str) -> dict | None:
+        """Cached properties of the material ``name``, or ``None`` if the material does not exist."""
+        if name not in self._snapshot:
+            if self._snapshot_complete:
+                return None
+            material_def = CoreMaterialDef.find_by_name(self.__edb.active_db, name)
+            if material_def.is_null:
+                return None
+            self._snapshot[name] = _read_material_properties(material_def)
+        return dict(self._snapshot[name])
+
+    def snapshot(self, refresh: bool = False) -> dict[str, dict]:
+        """Properties of all materials, read in one traversal of the database.
+
+        The snapshot is cached and discarded whenever a material is added, deleted,
+        duplicated or edited through this API.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Whether to discard the cached snapshot and read the database again, for example after
+            material definitions were edited directly through ``ansys.edb.core``. The default is ``False``.
+
+        Returns
+        -------
+        dict[str, dict]
+            Material properties keyed by material name. Each value holds the fields of
+            :class:`MaterialProperties`.
+        """
+        if refresh:
+            self._invalidate_snapshot()
+        if not self._snapshot_complete:
+            snapshot = {}
+            for material_def in self.__edb.active_db.material_defs:
+                name = material_def.name
+                properties = self._snapshot.get(name)
+                snapshot[name] = _read_material_properties(material_def) if properties is None else properties
+            self._snapshot = snapshot
+            self._snapshot_complete = True
+        return {name: dict(properties) for name, properties in self._snapshot.items()}
+
+    @_invalidates_snapshot
     def add_material(self, name: str, **kwargs) -> Material:
         """Add a new material.
 
@@ -1061,6 +1219,7 @@ class Materials(object):
         except MaterialModelException:
             raise ValueError("Use realistic values to define Multipole Debye model.")
 
+    @_invalidates_snapshot
     def __add_dielectric_material_model(self, name, material_model):
         """Add a dielectric material model.
 
@@ -1081,6 +1240,7 @@ class Materials(object):
         material = Material(self.__edb, material_def)
         return material
 
+    @_invalidates_snapshot
     def duplicate(self, material_name, new_material_name) -> Material:
         """Duplicate a material from the database.
 
@@ -1123,6 +1283,7 @@ class Materials(object):
         """
         self.delete(material_name)
 
+    @_invalidates_snapshot
     def delete(self, material_name) -> bool:
         """Remove a material from the database.
 
@@ -1137,6 +1298,7 @@ class Materials(object):
         material_def.delete()
         return True
 
+    @_invalidates_snapshot
     def update_material(self, material_name, input_dict):
         """Update material attributes."""
         if material_name not in self.materials:
@@ -1265,65 +1427,7 @@ class Materials(object):
         """
         if amat_file is None:
             amat_file = os.path.join(self.__edb.base_path, "syslib", "Materials.amat")
-
-        begin_regex = re.compile(r"^\$begin '(.+)'")
-        end_regex = re.compile(r"^\$end '(.+)'")
-        material_properties = ATTRIBUTES.copy()
-        # Remove cases manually handled
-        material_properties.remove("conductivity")
-
-        with open(amat_file, "r") as amat_fh:
-            in_material_def = False
-            material_description = {}
-            for line in amat_fh:
-                if in_material_def:
-                    # Yield material definition
-                    if end_regex.search(line):
-                        in_material_def = False
-                        yield material_description
-                        material_description = {}
-                    # Extend material definition if possible
-                    else:
-                        for material_property in material_properties:
-                            if material_property in line:
-                                value = get_line_float_value(line)
-                                if value is not None:
-                                    material_description[material_property] = value
-                                break
-                        # Extra case to cover bug in syslib AMAT file (see #364)
-                        if "thermal_expansion_coeffcient" in line:
-                            value = get_line_float_value(line)
-                            if value is not None:
-                                material_description["thermal_expansion_coefficient"] = value
-                        # Extra case to avoid confusion ("conductivity" is included in "thermal_conductivity")
-                        if "conductivity" in line and "thermal_conductivity" not in line:
-                            value = get_line_float_value(line)
-                            if value is not None:
-                                material_description["conductivity"] = value
-                        # Extra case to avoid confusion ("conductivity" is included in "thermal_conductivity")
-                        if (
-                            "loss_tangent" in line
-                            and "dielectric_loss_tangent" not in line
-                            and "magnetic_loss_tangent" not in line
-                        ):
-                            warnings.warn(
-                                "This key is deprecated in versions >0.7.0 and will soon be removed. "
-                                "Use key dielectric_loss_tangent instead.",
-                                DeprecationWarning,
-                            )
-                            value = get_line_float_value(line)
-                            if value is not None:
-                                material_description["dielectric_loss_tangent"] = value
-                # Check if we reach the beginning of a material description
-                else:
-                    match = begin_regex.search(line)
-                    if match:
-                        material_name = match.group(1)
-                        # Skip unwanted data
-                        if material_name in ("$index$", "$base_index$"):
-                            continue
-                        material_description["name"] = match.group(1)
-                        in_material_def = True
+        yield from load_amat_index(amat_file).iter_descriptions()
 
     def read_materials(self, amat_file) -> dict[str, Material]:
         """Read materials from an AMAT file.
@@ -1338,15 +1442,7 @@ class Materials(object):
         dict
             {material name: dict of material properties}.
         """
-        res = {}
-        for material in self.iterate_materials_in_amat(amat_file):
-            material_name = material["name"]
-            res[material_name] = {}
-            for material_property, value in material.items():
-                if material_property != "name":
-                    res[material_name][material_property] = value
-
-        return res
+        return load_amat_index(amat_file).to_dict()
 
     def read_syslib_material(self, material_name) -> dict[str, Material]:
         """Read a specific material from syslib AMAT file.
@@ -1361,23 +1457,15 @@ class Materials(object):
         dict
             {material name: dict of material properties}.
         """
-        res = {}
-        amat_file = os.path.join(self.__edb.base_path, "syslib", "Materials.amat")
-        for material in self.iterate_materials_in_amat(amat_file):
-            iter_material_name = material["name"]
-            if iter_material_name == material_name or iter_material_name.lower() == material_name.lower():
-                for material_property, value in material.items():
-                    if material_property != "name":
-                        res[material_property] = value
-                return res
-
-        self.__edb.logger.error(f"Material {material_name} does not exist in syslib AMAT file.")
-        return res
+        properties = self.syslib_index.get(material_name)
+        if properties is None:
+            self.__edb.logger.error(f"Material {material_name} does not exist in syslib AMAT file.")
+            return {}
+        return properties
 
     def update_materials_from_sys_library(self, update_all: bool = True, material_name: Union[str, list] = None):
         """Update material properties from syslib AMAT file."""
-        amat_file = os.path.join(self.__edb.base_path, "syslib", "Materials.amat")
-        materials_dict = self.read_materials(amat_file)
+        materials_dict = self.syslib_index.to_dict()
         if update_all:
             for name, obj in self.materials.items():
                 if name in materials_dict:
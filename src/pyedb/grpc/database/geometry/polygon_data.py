@@ -29,6 +29,7 @@ from ansys.edb.core.geometry.polygon_data import PolygonData as CorePolygonData
 
 if TYPE_CHECKING:
     from ansys.edb.core.geometry.polygon_data import PolygonSenseType as CorePolygonSenseType
+from pyedb.generic.polygon_arrays import ARC_SENTINEL, as_vertex_array, flat_point_array
 from pyedb.grpc.database.geometry.arc_data import ArcData
 from pyedb.grpc.database.geometry.point_data import PointData
 from pyedb.grpc.database.utility.value import Value
@@ -71,6 +72,42 @@ class PolygonData:
         core = CorePolygonData(points=list_of_point_data, closed=closed)
         return cls(pedb, core)
 
+    @classmethod
+    def create_from_array(cls, pedb, points, arc_heights=None, voids=None, closed: bool = True) -> PolygonData:
+        """Create a polygon from NumPy vertex arrays.
+
+        Coordinates are converted in bulk and sent to the server as plain doubles, without evaluating each
+        vertex as an EDB value.
+
+        Parameters
+        ----------
+        pedb : :class:`Edb <pyedb.grpc.edb.Edb>`
+            EDB object.
+        points : numpy.ndarray
+            ``(N, 2)`` vertices in meters, or ``(N, 3)`` vertices whose third column is the height of the arc
+            ending at each vertex.
+        arc_heights : numpy.ndarray, optional
+            ``(N,)`` heights of the arcs ending at each vertex. ``0`` is a straight segment.
+        voids : list[numpy.ndarray], optional
+            Vertex arrays of the voids, with the same format as ``points``.
+        closed : bool, optional
+            Whether the polygon is closed. The default is ``True``.
+
+        Returns
+        -------
+        :class:`PolygonData <pyedb.grpc.database.geometry.polygon_data.PolygonData>`
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> square = np.array([[0, 0], [1e-3, 0], [1e-3, 1e-3], [0, 1e-3]])
+        >>> polygon_data = PolygonData.create_from_array(edb, square, voids=[square * 0.5 + 0.25e-3])
+        """
+        core = _core_polygon_from_array(points, arc_heights, closed)
+        for void in voids or []:
+            core.holes.append(_core_polygon_from_array(void, None, True))
+        return cls(pedb, core)
+
     @property
     def bounding_box(self) -> tuple[tuple[float, float], tuple[float, float]]:
         """Bounding box.
@@ -300,3 +337,16 @@ class PolygonData:
         """
         new_poly = self.core.without_arcs()
         return PolygonData(self._pedb, new_poly)
+
+
+def _core_polygon_from_array(points, arc_heights, closed) -> CorePolygonData:
+    vertices = as_vertex_array(points, arc_heights)
+    if vertices is None:
+        raise TypeError("Polygon vertices must be a numeric (N, 2) or (N, 3) array.")
+    coordinates = flat_point_array(*vertices).tolist()
+    from_floats = getattr(CorePointData, "_from_floats", None)
+    if from_floats is not None:
+        points = [from_floats(x, y) for x, y in coordinates]
+    else:  # pragma: no cover
+        points = [CorePointData(x) if y == ARC_SENTINEL else CorePointData(x, y) for x, y in coordinates]
+    return CorePolygonData(points=points, closed=closed)
@@ -38,6 +38,7 @@ from ansys.edb.core.hierarchy.sparameter_model import (
     SParameterModel as CoreSParameterModel,
 )
 from ansys.edb.core.hierarchy.spice_model import SPICEModel as CoreSPICEModel
+from ansys.edb.core.primitive.padstack_instance import PadstackInstance as CorePadstackInstance
 from ansys.edb.core.utility.rlc import Rlc as CoreRlc
 import numpy as np
 
@@ -48,6 +49,7 @@ from pyedb.grpc.database.hierarchy.s_parameter_model import SparamModel
 from pyedb.grpc.database.hierarchy.spice_model import SpiceModel
 from pyedb.grpc.database.layers.stackup_layer import StackupLayer
 from pyedb.grpc.database.primitive.padstack_instance import PadstackInstance
+from pyedb.grpc.database.utility.component_table import invalidate_component_table
 from pyedb.grpc.database.utility.value import Value
 from pyedb.misc.decorators import deprecated_property
 
@@ -137,6 +139,11 @@ class Component(Group):
         self._logger = pedb.logger
         self._package_def = None
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if isinstance(getattr(type(self), name, None), property):
+            invalidate_component_table(self._pedb)
+
     @property
     def pin_pairs(self) -> List[tuple[str, str]] | None:
         """Pinpairs of the model."""
@@ -1054,11 +1061,10 @@ class Component(Group):
         list[str]
             Component nets names.
         """
-        nets = []
-        for pin in list(self.pins.values()):
-            if not pin.net.is_null:
-                nets.append(pin.net.name)
-        return list(set(nets))
+        table = self._pedb.components.table
+        if self.name in table.pin_nets:
+            return table.nets(self.name)
+        return list({pin.net_name for pin in self.pins.values() if pin.net_name})
 
     @property
     def pins(self) -> dict[str, PadstackInstance]:
@@ -1072,7 +1078,7 @@ class Component(Group):
         return {
             connectable.name: PadstackInstance(self._pedb, connectable)
             for connectable in self.core.members
-            if "name" in dir(connectable) and "Terminal" not in str(connectable)
+            if isinstance(connectable, CorePadstackInstance)
         }
 
     @property
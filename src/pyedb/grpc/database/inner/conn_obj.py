@@ -20,25 +20,31 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from typing import TYPE_CHECKING
+
 from ansys.edb.core.database import ProductIdType as CoreProductIdType
 
-from pyedb.generic.product_property import EMProperties
 from pyedb.grpc.database.inner.layout_obj import LayoutObj
 
+if TYPE_CHECKING:
+    from pyedb.generic.product_property import EMProperties
+
 
 class ConnObj(LayoutObj):
     def __init__(self, pedb, core):
         super().__init__(pedb, core)
 
-    def get_em_properties(self) -> EMProperties:
+    def get_em_properties(self) -> "EMProperties":
         """Get EM properties."""
+        from pyedb.generic.product_property import EMProperties
+
         em_string = self.core.get_product_property(CoreProductIdType.DESIGNER, 18)
         if em_string:
             return EMProperties.from_em_string(em_string)
         else:
             return EMProperties()
 
-    def set_em_properties(self, em_properties: EMProperties):
+    def set_em_properties(self, em_properties: "EMProperties"):
         em_string = em_properties.to_em_string()
         self.core.set_product_property(CoreProductIdType.DESIGNER, 18, em_string)
 
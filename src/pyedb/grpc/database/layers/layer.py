@@ -48,18 +48,31 @@ layer_type_mapping = {
 class Layer:
     """Manages Layer."""
 
+    _stackup = None
+    _collection = None
+
     def __init__(self, core: CoreLayerType = None, name="", layer_type="undefined", **kwargs):
         self.core = core
         self._name = name
         self._color = ()
         self._type = ""
-        if core:
-            self._cloned_layer = self.core.clone()
-        else:
+        self._clone = None
+        if not core:
             if layer_type in layer_type_mapping:
                 self.core.create(name=name, lyr_type=layer_type_mapping[layer_type])
                 self.update(**kwargs)
 
+    @property
+    def core(self):
+        """EDB layer object, routed to the working copy inside :meth:`Stackup.transaction`."""
+        if self._stackup is None:
+            return self._core
+        return self._stackup._working_layer(self)
+
+    @core.setter
+    def core(self, value):
+        self._core = value
+
     @classmethod
     def create(cls, name, layer_type: str = "solder_mask") -> Layer:
         """
@@ -77,6 +90,13 @@ class Layer:
         layer = GrpcLayer.create(name=name, lyr_type=layer_type_mapping[layer_type])
         return cls(core=layer)
 
+    @property
+    def _cloned_layer(self):
+        """Detached copy of the layer, created on first access."""
+        if self._clone is None:
+            self._clone = self.core.clone()
+        return self._clone
+
     @property
     def id(self):
         """Get the layer ID."""
@@ -97,6 +117,8 @@ class Layer:
     @name.setter
     def name(self, value: str):
         self.core.name = value
+        if self._stackup is not None:
+            self._stackup._invalidate_layer_cache()
 
     @property
     def properties(self) -> dict[str, str]:
@@ -55,10 +55,24 @@ _mapping_etch_net_class = {
 
 
 class StackupLayer:
+    _stackup = None
+    _collection = None
+
     def __init__(self, pedb, core=None):
         self.core = core
         self._pedb = pedb
 
+    @property
+    def core(self):
+        """EDB layer object, routed to the working copy inside :meth:`Stackup.transaction`."""
+        if self._stackup is None:
+            return self._core
+        return self._stackup._working_layer(self)
+
+    @core.setter
+    def core(self, value):
+        self._core = value
+
     @property
     def _stackup_layer_mapping(self):
         return {
@@ -117,6 +131,8 @@ class StackupLayer:
     def type(self, value):
         if value in self._stackup_layer_mapping:
             self.core.type = value
+            if self._stackup is not None:
+                self._stackup._invalidate_layer_cache()
 
     def update(self, **kwargs):
         # Normalise layer_type (Python field name) to type (property name on this object)
@@ -273,6 +289,8 @@ class StackupLayer:
     @name.setter
     def name(self, value):
         self.core.name = value
+        if self._stackup is not None:
+            self._stackup._invalidate_layer_cache()
 
     @is_negative.setter
     def is_negative(self, value):
@@ -357,9 +375,9 @@ class StackupLayer:
         float
             Material conductivity value.
         """
-        if self.material in self._pedb.materials.materials:
-            condcutivity = self._pedb.materials[self.material].conductivity
-            return condcutivity if condcutivity else 0.0
+        properties = self._pedb.materials._properties_by_name(self.material)
+        if properties:
+            return properties["conductivity"] or 0.0
         return 0.0
 
     @property
@@ -371,9 +389,9 @@ class StackupLayer:
         float
             Material permittivity value.
         """
-        if self.material in self._pedb.materials.materials:
-            permittivity = self._pedb.materials[self.material].permittivity
-            return permittivity if permittivity else 1.0
+        properties = self._pedb.materials._properties_by_name(self.material)
+        if properties:
+            return properties["permittivity"] or 1.0
         return 1.0
 
     @property
@@ -385,9 +403,9 @@ class StackupLayer:
         float
             Material loss tangent value.
         """
-        if self.material in self._pedb.materials.materials:
-            loss_tangent = self._pedb.materials[self.material].dielectric_loss_tangent
-            return loss_tangent if loss_tangent else 0.0
+        properties = self._pedb.materials._properties_by_name(self.material)
+        if properties:
+            return properties["dielectric_loss_tangent"] or 0.0
         return 0.0
 
     @property
@@ -32,7 +32,9 @@ from ansys.edb.core.geometry.point_data import PointData as CorePointData
 from ansys.edb.core.geometry.polygon_data import (
     PolygonData as CorePolygonData,
 )
+import numpy as np
 
+from pyedb.generic.polygon_arrays import as_vertex_array, polyline_length, split_flat_points
 from pyedb.grpc.database.geometry.point_data import PointData
 from pyedb.grpc.database.geometry.polygon_data import PolygonData
 from pyedb.grpc.database.hierarchy.group import Group
@@ -48,6 +50,47 @@ from pyedb.grpc.database.utility.layout_statistics import LayoutStatistics
 from pyedb.misc.decorators import deprecate_argument_name, deprecated, deprecated_property
 
 
+def _path_length(path) -> float:
+    """Return the length of a core path computed from its center line, including the extension of its end caps."""
+    center_line = path.center_line
+    xy, arc_heights = split_flat_points([(point.x.value, point.y.value) for point in center_line.points])
+    length = polyline_length(xy, arc_heights, closed=center_line.is_closed)
+    end_cap_style = path.get_end_cap_style()
+    if end_cap_style:
+        width = path.width.value
+        for end_cap in end_cap_style[:2]:
+            if not end_cap.value == 1:
+                length += width / 2
+    return length
+
+
+def _layer_copper(primitives) -> tuple[float, float]:
+    """Return the copper area and the trace length of the core paths and polygons of one layer.
+
+    The area of a path is approximated by its length times its width. The voids of polygons are subtracted.
+    """
+    surface = 0.0
+    trace_length = 0.0
+    for primitive in primitives:
+        if type(primitive).__name__ == "Path":
+            length = _path_length(primitive)
+            trace_length += length
+            surface += length * primitive.width.value
+        else:
+            surface += primitive.polygon_data.area()
+            for void in primitive.voids:
+                surface -= void.polygon_data.area()
+    return surface, trace_length
+
+
+def _bound_layer_copper(server, primitives) -> tuple[float, float]:
+    """Run :func:`_layer_copper` with the calling thread routed to a pooled RPC server, if any."""
+    if server is None:
+        return _layer_copper(primitives)
+    with server.bind():
+        return _layer_copper(primitives)
+
+
 def normalize_pairs(points: Iterable[float]) -> List[List[float]]:
     """
     Convert any reasonable point description into [[x1, y1], [x2, y2], …]
@@ -560,12 +603,13 @@ class Modeler(object):
 
         Parameters
         ----------
-        points : list or :class:`ansys.edb.core.geometry.polygon_data.PolygonData`
-            Polygon points or PolygonData object.
+        points : list, numpy.ndarray or :class:`ansys.edb.core.geometry.polygon_data.PolygonData`
+            Polygon points or PolygonData object. A ``(N, 2)`` array, or a ``(N, 3)`` array whose third
+            column holds arc heights, is converted in bulk with :meth:`PolygonData.create_from_array`.
         layer_name : str
             Layer name.
         voids : list, optional
-            List of void shapes or points.
+            List of void shapes, points or vertex arrays.
         net_name : str, optional
             Associated net name.
 
@@ -575,7 +619,13 @@ class Modeler(object):
             Polygon object if created, False otherwise.
         """
         net = self._pedb.nets.find_or_create_net(net_name)
-        if isinstance(points, list):
+        vertices = as_vertex_array(points) if isinstance(points, list) else None
+        if isinstance(points, np.ndarray):
+            polygon_data = PolygonData.create_from_array(self._pedb, points).core
+        elif vertices is not None and not vertices[1].any():
+            # Plain numeric points: no per-vertex value evaluation is needed.
+            polygon_data = PolygonData.create_from_array(self._pedb, vertices[0]).core
+        elif isinstance(points, list):
             new_points = []
             for idx, i in enumerate(points):
                 new_points.append(CorePointData([self._pedb.value(i[0]), self._pedb.value(i[1])]))
@@ -588,7 +638,9 @@ class Modeler(object):
         if not polygon_data.points:
             raise RuntimeError("Failed to create main shape polygon data")
         for void in voids:
-            if isinstance(void, list):
+            if isinstance(void, np.ndarray):
+                void_polygon_data = PolygonData.create_from_array(self._pedb, void).core
+            elif isinstance(void, list):
                 void_polygon_data = CorePolygonData(points=void)
             elif isinstance(void, CorePolygonData):
                 void_polygon_data = void
@@ -1040,56 +1092,87 @@ class Modeler(object):
         return True
 
     def get_layout_statistics(
-        self, evaluate_area: bool = False, net_list: Optional[List[str]] = None
+        self, evaluate_area: bool = False, net_list: Optional[List[str]] = None, num_threads: int = 1
     ) -> LayoutStatistics:
         """Get layout statistics.
 
+        Counts are read from the layout object lists in a single traversal, without wrapping each object. Copper
+        areas and trace lengths are then reduced per signal layer.
+
         Parameters
         ----------
         evaluate_area : bool, optional
-            Whether to compute metal area statistics.
+            Whether to compute metal area and trace length statistics.
         net_list : list, optional
-            Net list for area computation.
+            Nets included in the area computation. The default is ``None``, in which case all nets are included.
+        num_threads : int, optional
+            Number of threads reducing the layers in parallel. The default is ``1``. The threads use the pooled
+            RPC server bound to the calling thread, if any.
 
         Returns
         -------
         :class:`LayoutStatistics`
             Layout statistics object.
+
+        Examples
+        --------
+        >>> stats = edb.modeler.get_layout_statistics(evaluate_area=True, num_threads=4)
+        >>> stats.occupying_ratio["TOP"], stats.trace_length["TOP"]
         """
         stat_model = LayoutStatistics()
-        stat_model.num_layers = len(list(self._pedb.stackup.layers.values()))
-        stat_model.num_capacitors = len(self._pedb.components.capacitors)
-        stat_model.num_resistors = len(self._pedb.components.resistors)
-        stat_model.num_inductors = len(self._pedb.components.inductors)
+        stackup = self._pedb.stackup
+        components = self._pedb.components
+        layout = self._pedb.layout.core
+        stat_model.num_layers = len(stackup.layers)
+        stat_model.num_capacitors = len(components.capacitors)
+        stat_model.num_resistors = len(components.resistors)
+        stat_model.num_inductors = len(components.inductors)
+        stat_model.num_discrete_components = len(components.Others) + len(components.ICs) + len(components.IOs)
         bbox = self._pedb._hfss.get_layout_bounding_box(self._pedb.active_layout)
         stat_model._layout_size = round(bbox[2] - bbox[0], 6), round(bbox[3] - bbox[1], 6)
-        stat_model.num_discrete_components = (
-            len(self._pedb.components.Others) + len(self._pedb.components.ICs) + len(self._pedb.components.IOs)
-        )
-        stat_model.num_inductors = len(self._pedb.components.inductors)
-        stat_model.num_resistors = len(self._pedb.components.resistors)
-        stat_model.num_capacitors = len(self._pedb.components.capacitors)
-        stat_model.num_nets = len(self._pedb.nets.nets)
-        stat_model.num_traces = len(self._pedb.layout.paths)
-        stat_model.num_polygons = len(self._pedb.layout.polygons)
-        stat_model.num_vias = len(self._pedb.padstacks.instances)
-        stat_model.stackup_thickness = round(self._pedb.stackup.get_layout_thickness(), 6)
+        stat_model.num_nets = len(layout.nets)
+        stat_model.num_vias = len(layout.padstack_instances)
+        stat_model.stackup_thickness = round(stackup.get_layout_thickness(), 6)
+
+        signal_layers = set(stackup.signal_layers) if evaluate_area else set()
+        nets = set(net_list) if net_list else None
+        primitives_by_layer = {}
+        num_traces = num_polygons = 0
+        for primitive in layout.primitives:
+            kind = type(primitive).__name__
+            if kind == "Path":
+                num_traces += 1
+            elif kind == "Polygon":
+                num_polygons += 1
+            else:
+                continue
+            if not signal_layers or primitive.is_void:
+                continue
+            layer_name = primitive.layer.name
+            if layer_name in signal_layers and (nets is None or primitive.net.name in nets):
+                primitives_by_layer.setdefault(layer_name, []).append(primitive)
+        stat_model.num_traces = num_traces
+        stat_model.num_polygons = num_polygons
+
         if evaluate_area:
-            outline_surface = stat_model.layout_size[0] * stat_model.layout_size[1]
-            if net_list:
-                netlist = list(self._pedb.nets.nets.keys())
-                _poly = self._pedb.get_conformal_polygon_from_netlist(netlist)
+            layers = list(primitives_by_layer)
+            if num_threads > 1 and len(layers) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                from functools import partial
+
+                from pyedb.grpc.rpc_session_pool import current_server
+
+                # Workers do not inherit the thread binding of a pooled server, route them to the caller's one.
+                layer_copper = partial(_bound_layer_copper, current_server())
+                with ThreadPoolExecutor(max_workers=num_threads) as pool:
+                    results = list(pool.map(layer_copper, primitives_by_layer.values()))
             else:
-                for layer in list(self._pedb.stackup.signal_layers.keys()):
-                    surface = 0.0
-                    primitives = self._pedb.layout.primitives_by_layer[layer]
-                    for prim in primitives:
-                        if prim.primitive_type.name == "PATH":
-                            surface += Path(self._pedb, prim).length * self._pedb.value(prim.cast().width)
-                        if prim.primitive_type.name == "POLYGON":
-                            surface += prim.polygon_data.area()
-                            stat_model.occupying_surface[layer] = round(surface, 6)
-                            stat_model.occupying_ratio[layer] = round(surface / outline_surface, 6)
+                results = [_layer_copper(primitives) for primitives in primitives_by_layer.values()]
+            outline_surface = stat_model.layout_size[0] * stat_model.layout_size[1]
+            for layer_name, (surface, trace_length) in zip(layers, results):
+                stat_model.occupying_surface[layer_name] = round(surface, 6)
+                stat_model.occupying_ratio[layer_name] = round(surface / outline_surface, 6) if outline_surface else 0.0
+                stat_model.trace_length[layer_name] = round(trace_length, 9)
         return stat_model
 
     def create_bondwire(
@@ -26,8 +26,6 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyedb.grpc.database.net.net import Net
-import re
-
 from ansys.edb.core.net.differential_pair import (
     DifferentialPair as CoreDifferentialPair,
 )
@@ -95,30 +93,16 @@ class DifferentialPairs:
         >>> edbapp = Edb("myaedbfolder", edbversion="2026.1")
         >>> edb_nets = edbapp.differential_pairs.auto_identify()
         """
-        nets = self._pedb.nets.nets
-        pos_net = []
-        neg_net = []
-        for name, _ in nets.items():
-            if name.endswith(positive_differentiator):
-                pos_net.append(name)
-            elif name.endswith(negative_differentiator):
-                neg_net.append(name)
-            else:
-                pass
-
+        index = self._pedb.nets.name_index
         temp = []
-        for p in pos_net:
-            pattern_p = r"^(.+){}$".format(positive_differentiator)
-            match_p = re.findall(pattern_p, p)[0]
-
-            for n in neg_net:
-                pattern_n = r"^(.+){}$".format(negative_differentiator)
-                match_n = re.findall(pattern_n, n)[0]
-
-                if match_p == match_n:
-                    diff_name = "DIFF_{}".format(match_p)
-                    self.create(diff_name, p, n)
-                    temp.append(diff_name)
+        for p in index.suffix(positive_differentiator):
+            base = p[: len(p) - len(positive_differentiator)]
+            n = base + negative_differentiator
+            if not base or n not in index or n.endswith(positive_differentiator):
+                continue
+            diff_name = "DIFF_{}".format(base)
+            self.create(diff_name, p, n)
+            temp.append(diff_name)
         return temp
 
 
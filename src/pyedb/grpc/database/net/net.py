@@ -35,6 +35,14 @@ from pyedb.grpc.database.primitive.circle import Circle
 from pyedb.grpc.database.primitive.path import Path
 from pyedb.grpc.database.primitive.polygon import Polygon
 from pyedb.grpc.database.primitive.rectangle import Rectangle
+from pyedb.grpc.database.utility.component_table import invalidate_component_table
+
+
+def _notify_nets(pedb, event: str, *args) -> None:
+    """Forward a net edit to the nets interface of ``pedb``, if it was already created, to keep its caches current."""
+    handler = getattr(getattr(pedb, "_nets", None), event, None)
+    if handler is not None:
+        handler(*args)
 
 
 class Net:
@@ -86,7 +94,10 @@ class Net:
         value : str
             New name for the net.
         """
+        old_name = self.name
         self.core.name = value
+        _notify_nets(self._pedb, "_net_renamed", old_name, self)
+        invalidate_component_table(self._pedb)
 
     @property
     def is_null(self) -> bool:
@@ -125,6 +136,7 @@ class Net:
             ``True`` to set the net as a power or ground net, ``False`` otherwise.
         """
         self.core.is_power_ground = value
+        _notify_nets(self._pedb, "_net_classified", self)
 
     @property
     def primitives(self) -> list[Path | Polygon | Circle | Rectangle | Bondwire]:
@@ -207,7 +219,9 @@ class Net:
         :class:`Net <pyedb.grpc.database.net.net.Net>`
             Newly created net object.
         """
-        return cls(layout._pedb, CoreNet.create(layout=layout.core, name=name))
+        net = cls(layout._pedb, CoreNet.create(layout=layout.core, name=name))
+        _notify_nets(layout._pedb, "_net_created", net)
+        return net
 
     def find_dc_short(self, fix=False) -> list[list[str]]:
         """Find DC-shorted nets connected to this net.
@@ -297,7 +311,9 @@ class Net:
 
     def delete(self):
         """Delete the net from the EDB database."""
+        name = self.name
         self.core.delete()
+        _notify_nets(self._pedb, "_net_deleted", name)
 
     @classmethod
     def find_by_name(cls, layout, name):
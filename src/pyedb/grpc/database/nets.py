@@ -22,17 +22,22 @@
 
 from __future__ import absolute_import  # noreorder
 
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 import warnings
 
 from ansys.edb.core.net.net_class import NetClass as CoreNetClass
 
 from pyedb.common.nets import CommonNets
+from pyedb.generic.net_name_index import NetNameIndex
 from pyedb.grpc.database.net.net import Net
 from pyedb.grpc.database.net.net_class import NetClass
 from pyedb.grpc.database.primitive.bondwire import Bondwire
 from pyedb.grpc.database.primitive.path import Path
 from pyedb.grpc.database.primitive.polygon import Polygon
+from pyedb.grpc.database.utility.component_table import invalidate_component_table
+from pyedb.grpc.database.utility.net_table import NetRecord, NetTable
 from pyedb.misc.decorators import deprecated
 from pyedb.misc.utilities import compute_arc_points
 
@@ -182,13 +187,143 @@ class Nets(CommonNets):
         >>> if "PCIe_RX" in edb.nets:
         >>>     print("Net exists")
         """
-        return name in self.nets
+        return name in self._net_registry
 
     def __init__(self, p_edb: Any) -> None:
         """Initialize the Nets class."""
         CommonNets.__init__(self, p_edb)
         self._nets_by_comp_dict: Dict[str, List[str]] = {}
         self._comps_by_nets_dict: Dict[str, List[str]] = {}
+        self._registry: Optional[Dict[str, Net]] = None
+        self._name_index: Optional[NetNameIndex] = None
+        self._table: Optional[NetTable] = None
+        self._table_components = None
+
+    @property
+    def _net_registry(self) -> Dict[str, Net]:
+        """Net wrappers by name, read from the layout on first access and then kept current."""
+        if self._registry is None:
+            self._registry = {i.name: i for i in self._pedb.layout.nets if not i.is_null}
+        return self._registry
+
+    @property
+    def name_index(self) -> NetNameIndex:
+        """Sorted index of the net names of the layout.
+
+        The index is built on first access and is then kept current when nets are created, deleted or renamed
+        through PyEDB. Call :meth:`clear_cache` after editing nets by other means.
+
+        Returns
+        -------
+        :class:`NetNameIndex <pyedb.generic.net_name_index.NetNameIndex>`
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edb = Edb("my_design.edb")
+        >>> ddr_nets = edb.nets.name_index.prefix("DDR4_")
+        """
+        if self._name_index is None:
+            self._name_index = NetNameIndex(self._net_registry)
+        return self._name_index
+
+    @property
+    def table(self) -> NetTable:
+        """Nets with their power/ground classification, primitive count and component count.
+
+        The attributes of all nets are read in one traversal and cached. The table follows nets created, deleted,
+        renamed or classified through PyEDB and is read again after the component table changes. Call
+        :meth:`clear_table_cache` after adding or removing primitives.
+
+        Returns
+        -------
+        :class:`NetTable <pyedb.grpc.database.utility.net_table.NetTable>`
+
+        Examples
+        --------
+        >>> table = edbapp.nets.table
+        >>> table.nets["GND"].primitive_count
+        >>> df = table.to_dataframe()
+        """
+        component_table = self._pedb.components.table
+        if self._table is None or self._table_components is not component_table:
+            self._table = NetTable.from_nets(
+                [net.core for net in self._net_registry.values()], component_table.net_pins
+            )
+            self._table_components = component_table
+        return self._table
+
+    def clear_table_cache(self) -> None:
+        """Discard the cached net table."""
+        self._table = None
+
+    def clear_cache(self) -> None:
+        """Discard the net registry, the net-name index and the net table so that they are read again."""
+        self._registry = None
+        self._name_index = None
+        self._table = None
+
+    def clear_name_index(self) -> None:
+        """Discard the cached net data so that it is read again.
+
+        Alias of :meth:`clear_cache`, kept for compatibility.
+        """
+        self.clear_cache()
+
+    def _net_created(self, net: Net) -> None:
+        name = net.name
+        if self._registry is not None:
+            self._registry[name] = net
+        if self._name_index is not None:
+            self._name_index.add(name)
+        if self._table is not None:
+            self._table.nets[name] = NetRecord(name=name)
+
+    def _net_deleted(self, name: str) -> None:
+        if self._registry is not None:
+            self._registry.pop(name, None)
+        if self._name_index is not None:
+            self._name_index.discard(name)
+        if self._table is not None:
+            self._table.nets.pop(name, None)
+
+    def _net_renamed(self, old_name: str, net: Net) -> None:
+        record = self._table.nets.get(old_name) if self._table is not None else None
+        self._net_deleted(old_name)
+        self._net_created(net)
+        if record is not None:
+            record.name = net.name
+            self._table.nets[net.name] = record
+
+    def _net_classified(self, net: Net) -> None:
+        if self._table is not None and net.name in self._table.nets:
+            self._table.nets[net.name].is_power_ground = net.is_power_ground
+
+    def select(self, selectors: Union[str, re.Pattern, List[Union[str, re.Pattern]]], case_sensitive: bool = True):
+        """Return the names of the nets matched by one or more selectors.
+
+        Parameters
+        ----------
+        selectors : str | re.Pattern | list
+            Net names, wildcard patterns where ``*`` matches any run of characters and ``?`` a single
+            character, or compiled regular expressions matched from the start of the name.
+        case_sensitive : bool, optional
+            Whether net names and wildcard patterns are case sensitive. The default is ``True``.
+
+        Returns
+        -------
+        list[str]
+            Sorted names of the matching nets.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edb = Edb("my_design.edb")
+        >>> edb.nets.select(["DDR4_DQ*", "GND"])
+        """
+        if isinstance(selectors, (str, re.Pattern)):
+            selectors = [selectors]
+        return self.name_index.select(*selectors, case_sensitive=case_sensitive)
 
     @property
     def _edb(self):
@@ -221,13 +356,17 @@ class Nets(CommonNets):
         return self._pedb.logger
 
     @property
-    def nets(self) -> Dict[str, Net]:
+    def nets(self) -> Mapping[str, Net]:
         """All nets in the layout.
 
+        The nets are read from the layout once and kept current when nets are created, deleted or renamed through
+        PyEDB, so this property returns a read-only view of the registry without querying the server or copying
+        it. Call :meth:`clear_cache` after editing nets by other means.
+
         Returns
         -------
-        dict[str, :class:`Net <pyedb.grpc.database.net.net.Net>`]
-            Dictionary of net names to Net objects.
+        Mapping[str, :class:`Net <pyedb.grpc.database.net.net.Net>`]
+            Read-only mapping of net names to Net objects.
 
         Examples
         --------
@@ -237,7 +376,7 @@ class Nets(CommonNets):
         >>> for net_name, net_obj in all_nets.items():
         ...     print(net_name, net_obj.is_power_ground)
         """
-        return {i.name: i for i in self._pedb.layout.nets if not i.is_null}
+        return MappingProxyType(self._net_registry)
 
     @property
     def netlist(self) -> List[str]:
@@ -255,7 +394,7 @@ class Nets(CommonNets):
         >>> net_names = edb.nets.netlist
         >>> print("Total nets:", len(net_names))
         """
-        return list(self.nets.keys())
+        return list(self._net_registry)
 
     @property
     def signal(self) -> Dict[str, Net]:
@@ -273,11 +412,7 @@ class Nets(CommonNets):
         >>> signal_nets = edb.nets.signal
         >>> print("Signal nets:", list(signal_nets.keys()))
         """
-        nets = {}
-        for net, value in self.nets.items():
-            if not value.is_power_ground:
-                nets[net] = value
-        return nets
+        return {name: net for name, net in self._net_registry.items() if not net.is_power_ground}
 
     @property
     def power(self) -> Dict[str, Net]:
@@ -295,11 +430,7 @@ class Nets(CommonNets):
         >>> power_nets = edb.nets.power
         >>> print("Power nets:", list(power_nets.keys()))
         """
-        nets = {}
-        for net, value in self.nets.items():
-            if value.is_power_ground:
-                nets[net] = value
-        return nets
+        return {name: net for name, net in self._net_registry.items() if net.is_power_ground}
 
     def eligible_power_nets(self, threshold: float = 0.3) -> List[Net]:
         """Identify nets eligible for power/ground classification based on area ratio.
@@ -476,9 +607,9 @@ class Nets(CommonNets):
         Parameters
         ----------
         power_nets : str | list[str], optional
-            Nets to classify as power/ground.
+            Nets to classify as power/ground. Wildcard patterns such as ``"VDD*"`` are accepted.
         signal_nets : str | list[str], optional
-            Nets to classify as signal.
+            Nets to classify as signal. Wildcard patterns such as ``"PCIe_*"`` are accepted.
 
         Returns
         -------
@@ -492,19 +623,18 @@ class Nets(CommonNets):
         >>> edb.nets.classify_nets(power_nets=["VDD_CPU", "VDD_MEM"], signal_nets=["PCIe_TX", "ETH_RX"])
         """
         if isinstance(power_nets, str):
-            power_nets = []
+            power_nets = [power_nets]
         elif not power_nets:
             power_nets = []
         if isinstance(signal_nets, str):
-            signal_nets = []
+            signal_nets = [signal_nets]
         elif not signal_nets:
             signal_nets = []
-        for net in power_nets:
-            if net in self.nets:
-                self.nets[net].is_power_ground = True
-        for net in signal_nets:
-            if net in self.nets:
-                self.nets[net].is_power_ground = False
+        nets = self._net_registry
+        for net in self.name_index.select(*power_nets):
+            nets[net].is_power_ground = True
+        for net in self.name_index.select(*signal_nets):
+            nets[net].is_power_ground = False
         return True
 
     def is_power_gound_net(self, netname_list: Union[str, List[str]]) -> bool:
@@ -642,17 +772,13 @@ class Nets(CommonNets):
                             component_list.append(df)
                         i += 1
 
-        component_type = []
+        table = self._pedb.components.table
         for el in component_list:
             refdes = el[0]
-            comp_type = self._pedb.components._cmp[refdes].type
-            component_type.append(comp_type)
-            el.append(comp_type)
-
-            comp_partname = self._pedb.components._cmp[refdes].partname
-            el.append(comp_partname)
-            pins = self._pedb.components.get_pin_from_component(component=refdes, net_name=el[2])
-            el.append("-".join([i.name for i in pins]))
+            record = table.components[refdes]
+            el.append(record.type)
+            el.append(record.part_name)
+            el.append("-".join([pin for _, pin in table.pins_on_net(el[2], refdes)]))
 
         component_list_columns = [
             "refdes",
@@ -711,16 +837,17 @@ class Nets(CommonNets):
         if isinstance(netlist, str):
             netlist = [netlist]
 
-        requested_names = set(netlist)
-        if not requested_names:
+        if not netlist:
             return []
 
         target_nets: List[Net] = []
         primitives_to_delete: List[Any] = []
         padstacks_to_delete: List[Any] = []
 
-        for net in self._pedb.layout.nets:
-            if net.name in requested_names:
+        registry = self._net_registry
+        for name in dict.fromkeys(netlist):
+            net = registry.get(name)
+            if net is not None:
                 target_nets.append(net)
                 primitives_to_delete.extend(list(net.core.primitives))
                 padstacks_to_delete.extend(list(net.core.padstack_instances))
@@ -737,6 +864,7 @@ class Nets(CommonNets):
             net_name = net.name
             net.delete()
             nets_deleted.append(net_name)
+        invalidate_component_table(self._pedb)
         return nets_deleted
 
     def find_or_create_net(
@@ -789,41 +917,43 @@ class Nets(CommonNets):
                     net = Net.create(self._active_layout, net_name)
                 return net
             elif start_with:
-                nets_found = [self.nets[net] for net in list(self.nets.keys()) if net.lower().startswith(start_with)]
+                nets_found = [net for name, net in self._net_registry.items() if name.lower().startswith(start_with)]
                 return nets_found
             elif start_with and end_with:
                 nets_found = [
-                    self.nets[net]
-                    for net in list(self.nets.keys())
-                    if net.lower().startswith(start_with) and net.lower().endswith(end_with)
+                    net
+                    for name, net in self._net_registry.items()
+                    if name.lower().startswith(start_with) and name.lower().endswith(end_with)
                 ]
                 return nets_found
             elif start_with and contain and end_with:
                 nets_found = [
-                    self.nets[net]
-                    for net in list(self.nets.keys())
-                    if net.lower().startswith(start_with) and net.lower().endswith(end_with) and contain in net.lower()
+                    net
+                    for name, net in self._net_registry.items()
+                    if name.lower().startswith(start_with)
+                    and name.lower().endswith(end_with)
+                    and contain in name.lower()
                 ]
                 return nets_found
             elif start_with and contain:
                 nets_found = [
-                    self.nets[net]
-                    for net in list(self.nets.keys())
-                    if net.lower().startswith(start_with) and contain in net.lower()
+                    net
+                    for name, net in self._net_registry.items()
+                    if name.lower().startswith(start_with) and contain in name.lower()
                 ]
                 return nets_found
             elif contain and end_with:
                 nets_found = [
-                    self.nets[net]
-                    for net in list(self.nets.keys())
-                    if net.lower().endswith(end_with) and contain in net.lower()
+                    net
+                    for name, net in self._net_registry.items()
+                    if name.lower().endswith(end_with) and contain in name.lower()
                 ]
                 return nets_found
             elif end_with and not start_with and not contain:
-                nets_found = [self.nets[net] for net in list(self.nets.keys()) if net.lower().endswith(end_with)]
+                nets_found = [net for name, net in self._net_registry.items() if name.lower().endswith(end_with)]
                 return nets_found
             elif contain and not start_with and not end_with:
-                nets_found = [self.nets[net] for net in list(self.nets.keys()) if contain in net.lower()]
+                nets_found = [net for name, net in self._net_registry.items() if contain in name.lower()]
                 return nets_found
 
     def is_net_in_component(self, component_name: str, net_name: str) -> bool:
@@ -43,8 +43,11 @@ import numpy as np
 
 from pyedb.generic.general_methods import generate_unique_name
 from pyedb.generic.geometry_operators import GeometryOperators
+from pyedb.generic.reference_pin_index import ReferencePinIndex
+from pyedb.generic.via_reduction import ViaReductionPlan, ViaSnapshot, plan_cell_reduction, plan_grid_sampling
 from pyedb.grpc.database.definition.padstack_def import PadstackDef
 from pyedb.grpc.database.primitive.padstack_instance import PadstackInstance
+from pyedb.grpc.database.utility.component_table import invalidate_component_table
 from pyedb.grpc.database.utility.value import Value
 from pyedb.misc.decorators import deprecate_argument_name, deprecated, deprecated_property
 
@@ -112,11 +115,14 @@ class Padstacks(object):
         self.__definitions: Dict[str, Any] = {}
         self._instances_by_name = {}
         self._instances_by_net = {}
+        self._reference_pin_indexes = {}
 
     def clear_instances_cache(self):
-        """Clear the cached padstack instances."""
+        """Clear the cached padstack instances, reference pin indexes and component table."""
         self._instances_by_name = {}
         self._instances_by_net = {}
+        self._reference_pin_indexes = {}
+        invalidate_component_table(self._pedb)
 
     @property
     def _active_layout(self) -> Any:
@@ -664,6 +670,7 @@ class Padstacks(object):
         for inst in instances_to_delete:
             inst.core.delete()
         self._instances = None
+        self.clear_instances_cache()
 
     def delete_padstack_instances(self, net_names: Union[str, List[str]]) -> bool:
         """Delete padstack instances by net names.
@@ -690,6 +697,7 @@ class Padstacks(object):
         for p_id, p in self.instances.items():
             if p.net_name in net_names:
                 p.delete()
+        self.clear_instances_cache()
         return True
 
     @deprecate_argument_name(
@@ -1429,6 +1437,7 @@ class Padstacks(object):
                 layer_map=layer_map,
             )
             padstack_instance.is_pin = is_pin
+            self.clear_instances_cache()
             return padstack_instance
         else:
             raise RuntimeError("Place padstack failed")
@@ -1653,41 +1662,81 @@ class Padstacks(object):
             Maximum number of pins to return. Default is ``0`` (no limit).
         component_only : bool, optional
             Whether to search only in component pins. Default is ``True``.
+        pinlist_position : dict, optional
+            Candidate reference pins mapped to their position. When provided, the search is limited to these pins.
 
         Returns
         -------
         list[:class:`pyedb.grpc.database.primitive.padstack_instance.PadstackInstance`]
-            List of reference pins.
+            List of reference pins sorted by increasing distance.
+
+        Notes
+        -----
+        The reference pins are looked up in the index returned by :meth:`reference_pin_index`, which is built once
+        per reference net and component.
         """
-        if not pinlist_position:
-            pinlist = []
+        if isinstance(search_radius, str):
+            search_radius = float(self._pedb.value(search_radius))
+        predicate = None
+        if pinlist_position:
+            index = ReferencePinIndex.from_pin_positions(pinlist_position)
+        else:
             if not positive_pin:
                 search_radius = 10e-2
                 component_only = True
             if component_only:
-                references_pins = [
+                index = self.reference_pin_index(reference_net, positive_pin.component)
+                predicate = lambda pin: not pin.terminal  # noqa: E731
+            else:
+                index = self.reference_pin_index(reference_net)
+        return index.query_radius(positive_pin.position, search_radius, max_limit, predicate)
+
+    def reference_pin_index(self, reference_net: str, component: Optional[Any] = None) -> ReferencePinIndex:
+        """Spatial index of the pins of a reference net.
+
+        The index is built once per reference net and component, and shared by the port, source and
+        configuration terminal methods that search for the nearest reference pins. It is cleared by
+        :meth:`clear_instances_cache` and when padstack instances are added or deleted through this class.
+
+        Parameters
+        ----------
+        reference_net : str
+            Reference net name.
+        component : str or :class:`pyedb.grpc.database.hierarchy.component.Component`, optional
+            Reference designator or component to restrict the index to. The default is ``None``, in which case
+            all padstack instances of the net are indexed.
+
+        Returns
+        -------
+        :class:`pyedb.generic.reference_pin_index.ReferencePinIndex`
+            Index answering radius and nearest-pin queries.
+
+        Examples
+        --------
+        >>> index = edb.padstacks.reference_pin_index("GND", "U1")
+        >>> signal_pins = [pin for pin in edb.components["U1"].pins.values() if pin.net_name == "DDR_DQ0"]
+        >>> nearest = index.nearest([pin.position for pin in signal_pins])
+        """
+        if component is None or isinstance(component, str):
+            refdes = component
+        else:
+            refdes = component.refdes
+        key = (reference_net, refdes)
+        index = self._reference_pin_indexes.get(key)
+        if index is None:
+            if refdes is None:
+                pins = self.instances_by_net.get(reference_net, [])
+            else:
+                if isinstance(component, str):
+                    component = self._pedb.components.instances[refdes]
+                pins = [
                     pin
-                    for pin in list(positive_pin.component.pins.values())
+                    for pin in component.pins.values()
                     if pin.net_name == reference_net and isinstance(pin, PadstackInstance)
                 ]
-                references_pins = [pin for pin in references_pins if not pin.terminal]
-                if not references_pins:
-                    return pinlist
-            else:
-                references_pins = self.get_instances(net_name=reference_net)
-                if not references_pins:
-                    return pinlist
-            pinlist_position = {p: p.position for p in references_pins}
-        pos_position = positive_pin.position
-        pinlist = [
-            p
-            for p, pos in pinlist_position.items()
-            if GeometryOperators.points_distance(pos_position, pos) <= search_radius
-        ]
-        if max_limit and len(pinlist) > max_limit:
-            pin_dict = {GeometryOperators.points_distance(pos_position, p.position): p for p in pinlist}
-            pinlist = [pin[1] for pin in sorted(pin_dict.items())[:max_limit]]
-        return pinlist
+            index = ReferencePinIndex(pins)
+            self._reference_pin_indexes[key] = index
+        return index
 
     def get_padstack_instances_rtree_index(self, nets: Optional[Union[str, List[str]]] = None) -> "rtree.index.Index":
         """Returns padstack instances Rtree index.
@@ -2011,7 +2060,7 @@ class Padstacks(object):
         self, bounding_box: List[float], x_samples: int, y_samples: int, nets: Optional[Union[str, List[str]]] = None
     ) -> bool:
         """
-        Reduce the number of vias intersecting bounding box and nets by x and y samples.
+        Reduce the number of vias located in a bounding box and nets by x and y samples.
 
         Parameters
         ----------
@@ -2028,37 +2077,42 @@ class Padstacks(object):
         bool
             ``True`` when succeeded ``False`` when failed.
         """
-        padstacks_inbox = self.get_padstack_instances_intersecting_bounding_box(bounding_box, nets)
-        if not padstacks_inbox:
+        plan = self.plan_via_reduction_in_bounding_box(bounding_box, x_samples, y_samples, nets)
+        if not len(plan):
             return False
-        else:
-            if len(padstacks_inbox) <= (x_samples * y_samples):
-                self._pedb.logger.error(f"more samples {x_samples * y_samples} than existing {len(padstacks_inbox)}")
-                return False
-            else:
-                # extract ids and positions
-                vias = {item: self.instances[item].position for item in padstacks_inbox}
-                ids, positions = zip(*vias.items())
-                pt_x, pt_y = zip(*positions)
+        if len(plan) <= (x_samples * y_samples):
+            self._pedb.logger.error(f"more samples {x_samples * y_samples} than existing {len(plan)}")
+            return False
+        self.apply_via_reduction(plan)
+        return True
 
-                # meshgrid
-                _x_min, _x_max = min(pt_x), max(pt_x)
-                _y_min, _y_max = min(pt_y), max(pt_y)
+    def plan_via_reduction_in_bounding_box(
+        self, bounding_box: List[float], x_samples: int, y_samples: int, nets: Optional[Union[str, List[str]]] = None
+    ) -> ViaReductionPlan:
+        """Plan the reduction of the vias in a bounding box to the ones nearest to a grid of samples.
 
-                x_grid, y_grid = np.meshgrid(
-                    np.linspace(_x_min, _x_max, x_samples), np.linspace(_y_min, _y_max, y_samples)
-                )
+        Nothing is deleted, pass the plan to :meth:`apply_via_reduction` to delete the removed vias.
 
-                # mapping to meshgrid
-                to_keep = {
-                    ids[np.argmin(np.square(_x - pt_x) + np.square(_y - pt_y))]
-                    for _x, _y in zip(x_grid.ravel(), y_grid.ravel())
-                }
+        Vias are selected by their position, boundary included, as with the position index of
+        :meth:`get_padstack_instances_intersecting_bounding_box`. A via located outside the box is not selected even
+        when its pads overlap the box edge.
+
+        Parameters
+        ----------
+        bounding_box : tuple or list.
+            bounding box, [x1, y1, x2, y2]
+        x_samples : int
+        y_samples : int
+        nets : str or list, optional
+            Net name or list of net names of the vias. If ``None`` is provided all instances are included.
+            Default value is ``None``.
 
-                for item in padstacks_inbox:
-                    if item not in to_keep:
-                        self.instances[item].delete()
-                return True
+        Returns
+        -------
+        :class:`ViaReductionPlan <pyedb.generic.via_reduction.ViaReductionPlan>`
+        """
+        snapshot = ViaSnapshot.from_instances(self._pedb.layout.padstack_instances, nets=nets)
+        return plan_grid_sampling(snapshot.in_bounding_box(bounding_box), x_samples, y_samples)
 
     @staticmethod
     def dbscan(
@@ -2155,58 +2209,56 @@ class Padstacks(object):
             boundaries for plotting.
 
         """
-        to_keep = set()
-
-        all_instances = self.instances
-        positions = np.array([all_instances[_id].position for _id in padstacks])
-
-        x_coords, y_coords = positions[:, 0], positions[:, 1]
-        x_min, x_max = np.min(x_coords), np.max(x_coords)
-        y_min, y_max = np.min(y_coords), np.max(y_coords)
-
-        padstacks_array = np.array(padstacks)
-        cell_map = {}  # {(cell_x, cell_y): [(id1, [x1, y1]), (id2, [x2, y2), ...]}
-        grid = []
-
-        for idx, pos in enumerate(positions):
-            i = int((pos[0] - x_min) // cell_size_x)
-            j = int((pos[1] - y_min) // cell_size_y)
-            cell_key = (i, j)
-            cell_map.setdefault(cell_key, []).append((padstacks_array[idx], pos))
-
-        for (i, j), items in cell_map.items():
-            # cell center
-            cell_x_min = x_min + i * cell_size_x
-            cell_y_min = y_min + j * cell_size_y
-            cell_x_mid = cell_x_min + 0.5 * cell_size_x
-            cell_y_mid = cell_y_min + 0.5 * cell_size_y
-
-            grid.append(
-                [
-                    [
-                        cell_x_min,
-                        cell_x_min + cell_size_x,
-                        cell_x_min + cell_size_x,
-                        cell_x_min,
-                        cell_x_min,
-                    ],
-                    [
-                        cell_y_min,
-                        cell_y_min,
-                        cell_y_min + cell_size_y,
-                        cell_y_min + cell_size_y,
-                        cell_y_min,
-                    ],
-                ]
-            )
+        plan = self.plan_via_reduction_by_density(padstacks, cell_size_x, cell_size_y)
+        if delete:
+            self.apply_via_reduction(plan)
+        return plan.kept_ids, plan.grid
 
-            # Find closest via to cell center
-            distances = [np.linalg.norm(pos - [cell_x_mid, cell_y_mid]) for _, pos in items]
-            closest_idx = np.argmin(distances)
-            to_keep.add(items[closest_idx][0])
+    def plan_via_reduction_by_density(
+        self, padstacks: List[int], cell_size_x: float = 1e-3, cell_size_y: float = 1e-3
+    ) -> ViaReductionPlan:
+        """Plan the reduction of vias to the one closest to the center of each grid cell.
 
-        if delete:
-            to_delete = set(padstacks) - to_keep
-            for _id in to_delete:
-                all_instances[_id].delete()
-        return list(to_keep), grid
+        Nothing is deleted, pass the plan to :meth:`apply_via_reduction` to delete the removed vias.
+
+        Parameters
+        ----------
+        padstacks : list[int]
+            List of padstack IDs to be reduced.
+        cell_size_x : float, optional
+            Width of each grid cell in meters. The default is ``1e-3``.
+        cell_size_y : float, optional
+            Height of each grid cell in meters. The default is ``1e-3``.
+
+        Returns
+        -------
+        :class:`ViaReductionPlan <pyedb.generic.via_reduction.ViaReductionPlan>`
+        """
+        snapshot = ViaSnapshot.from_instances(self._pedb.layout.padstack_instances, ids=padstacks)
+        return plan_cell_reduction(snapshot, cell_size_x, cell_size_y)
+
+    def apply_via_reduction(self, plan: ViaReductionPlan) -> int:
+        """Delete the vias removed by a reduction plan.
+
+        Parameters
+        ----------
+        plan : :class:`ViaReductionPlan <pyedb.generic.via_reduction.ViaReductionPlan>`
+            Plan returned by :meth:`plan_via_reduction_in_bounding_box` or :meth:`plan_via_reduction_by_density`.
+
+        Returns
+        -------
+        int
+            Number of deleted vias.
+
+        Examples
+        --------
+        >>> plan = edb.padstacks.plan_via_reduction_by_density(gnd_via_ids, 2e-3, 2e-3)
+        >>> plan.summary()
+        >>> edb.padstacks.apply_via_reduction(plan)
+        """
+        return plan.apply(self._delete_instances)
+
+    def _delete_instances(self, instances: List[PadstackInstance]) -> None:
+        for instance in instances:
+            instance.core.delete()
+        self.clear_instances_cache()
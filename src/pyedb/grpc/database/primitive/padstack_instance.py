@@ -49,6 +49,7 @@ from pyedb.grpc.database.net.net import Net
 from pyedb.grpc.database.terminal.padstack_instance_terminal import (
     PadstackInstanceTerminal,
 )
+from pyedb.grpc.database.utility.component_table import invalidate_component_table
 from pyedb.grpc.database.utility.layer_map import LayerMap
 from pyedb.grpc.database.utility.value import Value
 from pyedb.misc.decorators import deprecated
@@ -282,6 +283,7 @@ class PadstackInstance(conn_obj.ConnObj):
         """
         if isinstance(value, Net):
             self.core.net = value.core
+            invalidate_component_table(self._pedb)
 
     @property
     def layout(self):
@@ -33,6 +33,16 @@ from ansys.edb.core.simulation_setup.simulation_setup import (
     FrequencyData as CoreFrequencyData,
     SweepData as CoreSweepData,
 )
+import numpy as np
+
+from pyedb.generic.frequency_sweep import (
+    SweepEstimate,
+    estimate_cost,
+    expand,
+    format_frequency,
+    optimize_distribution,
+    parse_distribution,
+)
 
 # Extend CoreDistribution with full-name aliases used by AEDT internal tools
 # (e.g. pintopinsetup) that write human-readable distribution names into the
@@ -412,6 +422,61 @@ class SweepData:
         """
         return self.core.frequency_string.strip().split("\t\n")
 
+    @property
+    def frequencies(self) -> np.ndarray:
+        """Frequency points of the sweep, expanded locally from its distributions.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted unique frequencies in Hz.
+        """
+        return expand(self.frequency_string)
+
+    def estimate_cost(self, seconds_per_point: float = 1.0) -> SweepEstimate:
+        """Estimate the number of solved frequencies and the solve cost of the sweep.
+
+        Parameters
+        ----------
+        seconds_per_point : float, optional
+            Cost of one solved frequency. The default is ``1.0``.
+
+        Returns
+        -------
+        :class:`SweepEstimate <pyedb.generic.frequency_sweep.SweepEstimate>`
+            Number of points, number of solved points and cost. Interpolating and broadband sweeps solve at most
+            the maximum number of solutions of the sweep.
+        """
+        return estimate_cost(
+            self.frequency_string, self.type, seconds_per_point, self.core.interpolation_data.max_solutions
+        )
+
+    def optimize_frequency_data(self) -> bool:
+        """Replace the frequency data with the shortest list of distributions giving the same frequencies.
+
+        Overlapping and adjacent distributions are merged.
+
+        Returns
+        -------
+        bool
+            ``True`` when the frequency data was rewritten, ``False`` when it was already minimal.
+        """
+        minimal = optimize_distribution(self.frequency_string)
+        if minimal is None:
+            return False
+        self.core.frequency_data = [
+            CoreFrequencyData(
+                distribution=_mapping_distribution[segment.distribution],
+                start_f=format_frequency(segment.start),
+                end_f=format_frequency(segment.stop),
+                step=segment.step,
+            )
+            for segment in parse_distribution(minimal)
+        ]
+        if self.simsetup is not None:
+            self._update_sweep()
+        return True
+
     @property
     def enforce_causality(self) -> bool:
         """Get the flag indicating if causality is enforced.
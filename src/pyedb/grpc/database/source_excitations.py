@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import time
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ansys.edb.core.database import ProductIdType as CoreProductIdType
@@ -28,10 +29,13 @@ from ansys.edb.core.geometry.polygon_data import PolygonData as CorePolygonData
 from ansys.edb.core.terminal.edge_terminal import PrimitiveEdge as CorePrimitiveEdge
 from ansys.edb.core.terminal.terminal import BoundaryType as CoreBoundaryType
 from ansys.edb.core.utility.rlc import Rlc as CoreRlc
+import numpy as np
 
 from pyedb.generic.general_methods import generate_unique_name
 from pyedb.generic.geometry_operators import GeometryOperators
+from pyedb.generic.reference_pin_index import ReferencePinIndex
 from pyedb.grpc.database.components import Component
+from pyedb.grpc.database.hierarchy.pingroup import PinGroup
 from pyedb.grpc.database.layers.stackup_layer import StackupLayer
 from pyedb.grpc.database.net.net import Net
 from pyedb.grpc.database.ports.ports import BundleWavePort, CircuitPort, CoaxPort, GapPort, WavePort
@@ -45,6 +49,7 @@ from pyedb.grpc.database.terminal.padstack_instance_terminal import (
 from pyedb.grpc.database.terminal.pingroup_terminal import PinGroupTerminal
 from pyedb.grpc.database.terminal.point_terminal import PointTerminal
 from pyedb.grpc.database.terminal.terminal import Terminal
+from pyedb.grpc.database.utility.port_batch import PortBatchReport, PortBatchSpec
 from pyedb.grpc.database.utility.sources import Source, SourceType
 from pyedb.misc.decorators import deprecated_property
 
@@ -841,7 +846,13 @@ class SourceExcitation(SourceExcitationInternal):
         for ref_net in reference_net:
             if ref_net in net_list:
                 net_list.remove(ref_net)
-        cmp_pins = [p for p in list(component.pins.values()) if p.net_name in net_list]
+        # Read each pin net once and group the pins by net for all the lookups below.
+        pin_nets = [(p, p.net_name) for p in component.pins.values()]
+        pins_by_net = {}
+        for p, net in pin_nets:
+            pins_by_net.setdefault(net, []).append(p)
+        cmp_pins = [p for p, net in pin_nets if net in net_list]
+        ref_pins = [p for p, net in pin_nets if net in reference_net]
         for p in cmp_pins:  # pragma no cover
             p.is_layout_pin = True
         if len(cmp_pins) == 0:
@@ -855,7 +866,6 @@ class SourceExcitation(SourceExcitationInternal):
                 solder_balls_size = self._pedb.components.instances[component.name].solder_ball_diameter[0]
             if not solder_balls_mid_size:
                 solder_balls_mid_size = self._pedb.components.instances[component.name].solder_ball_diameter[1]
-            ref_pins = [p for p in list(component.pins.values()) if p.net_name in reference_net]
             if not ref_pins and reference_net:
                 self._logger.warning(
                     "No reference pins found on component for coax port. "
@@ -903,7 +913,6 @@ class SourceExcitation(SourceExcitationInternal):
                 self._pedb.excitation_manager.create_coax_port(padstackinstance=pin, name=port_name)
 
         elif port_type == "circuit_port":  # pragma no cover
-            ref_pins = [p for p in list(component.pins.values()) if p.net_name in reference_net]
             for p in ref_pins:
                 p.is_layout_pin = True
             if not ref_pins:
@@ -933,7 +942,7 @@ class SourceExcitation(SourceExcitationInternal):
                         )
                         return False
                 for net in net_list:
-                    pins = [pin for pin in list(component.pins.values()) if pin.net_name == net]
+                    pins = pins_by_net.get(net, [])
                     if pins:
                         if len(pins) == 1:
                             pin_term = self._create_terminal(pins[0])
@@ -952,27 +961,186 @@ class SourceExcitation(SourceExcitationInternal):
                     else:
                         self._logger.info("No pins found on component {} for the net {}".format(component, net))
             else:
+                reference_index = None
+                if not ref_pins and extend_reference_pins_outside_component:
+                    reference_index = self._pedb.padstacks.reference_pin_index(reference_net[0])
                 for net in net_list:
-                    pins = [pin for pin in list(component.pins.values()) if pin.net_name == net]
-                    for pin in pins:
-                        if ref_pins:
+                    pins = pins_by_net.get(net, [])
+                    if ref_pins:
+                        for pin in pins:
                             self.create_port_on_pins(component, pin, ref_pins)
-                        else:
-                            if extend_reference_pins_outside_component:
-                                ref_pin = pin.get_reference_pins(
-                                    reference_net=reference_net[0],
-                                    max_limit=1,
-                                    component_only=False,
-                                    search_radius=3e-3,
-                                )
-                                if ref_pin:
-                                    if not isinstance(ref_pin, list):
-                                        ref_pin = [ref_pin]
-                                    self.create_port_on_pins(component, [pin.name], ref_pin[0])
-                            else:
-                                self._logger.error("Skipping port creation no reference pin found.")
+                    elif reference_index is not None:
+                        nearest_pins = reference_index.query_radius_many(
+                            [[float(i) for i in pin.position] for pin in pins], 3e-3, max_limit=1
+                        )
+                        for pin, ref_pin in zip(pins, nearest_pins):
+                            if ref_pin:
+                                self.create_port_on_pins(component, [pin.name], ref_pin[0])
+                    elif pins:
+                        self._logger.error("Skipping port creation no reference pin found.")
         return True
 
+    def create_port_batch(self, spec: Optional[PortBatchSpec] = None, **kwargs) -> PortBatchReport:
+        """Create the circuit ports of a component in one batch.
+
+        The component pins are read and grouped by net in a single pass. Terminal and pin group names are checked
+        against one snapshot of the layout, net handles are shared by the pins of a net and reference terminals are
+        shared by the ports using the same reference pins.
+
+        Parameters
+        ----------
+        spec : :class:`PortBatchSpec <pyedb.grpc.database.utility.port_batch.PortBatchSpec>`, optional
+            Port specification. When omitted, it is built from the keyword arguments.
+        **kwargs
+            Fields of :class:`PortBatchSpec <pyedb.grpc.database.utility.port_batch.PortBatchSpec>`.
+
+        Returns
+        -------
+        :class:`PortBatchReport <pyedb.grpc.database.utility.port_batch.PortBatchReport>`
+            Created ports and reference terminals, skipped pins and nets, and the duration of each stage.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> report = edbapp.excitation_manager.create_port_batch(
+        ...     component="U1", nets=["PCIE_TX0_P", "PCIE_TX0_N"], reference_nets=["GND"], reference="nearest"
+        ... )
+        >>> report.to_dict()["timings"]
+        """
+        if spec is None:
+            spec = PortBatchSpec(**kwargs)
+        report = PortBatchReport()
+        layout = self._pedb.layout
+
+        start = time.perf_counter()
+        component = self._pedb.components.instances[spec.component]
+        signal_nets = set(spec.nets)
+        reference_nets = set(spec.reference_nets)
+        wanted_pins = set(spec.pins)
+        pins_by_net = {}
+        reference_pins = []
+        for pin_name, pin in component.pins.items():
+            net_name = pin.net_name
+            if net_name in reference_nets:
+                reference_pins.append(pin)
+            elif net_name in signal_nets and (not wanted_pins or pin_name in wanted_pins):
+                pins_by_net.setdefault(net_name, []).append((pin_name, pin))
+        for net_name in spec.nets:
+            if net_name not in pins_by_net:
+                report.skipped.append((net_name, f"no pin on component {spec.component}"))
+        taken_names = {terminal.name for terminal in layout.terminals}
+        taken_groups = {pin_group.name for pin_group in layout.pin_groups}
+
+        def unique(name, taken):
+            candidate, counter = name, 1
+            while candidate in taken:
+                candidate = f"{name}_{counter}"
+                counter += 1
+            taken.add(candidate)
+            return candidate
+
+        units = []
+        for net_name in spec.nets:
+            pins = pins_by_net.get(net_name)
+            if not pins:
+                continue
+            if spec.group_by_net and len(pins) > 1:
+                units.append((net_name, pins))
+            else:
+                units.extend((net_name, [pin]) for pin in pins)
+        report.timings["collect"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        references = [None] * len(units)
+        if spec.reference == "pin_group":
+            if not reference_pins:
+                for net_name, pins in units:
+                    report.skipped.append((pins[0][0], f"no reference pin on component {spec.component}"))
+                units = []
+            else:
+                reference_name = unique(f"{spec.component}_{spec.reference_nets[0]}_ref", taken_names)
+                if len(reference_pins) == 1:
+                    from_layer, _ = reference_pins[0].get_layer_range()
+                    reference_terminal = PadstackInstanceTerminal.create(
+                        layout, reference_name, reference_pins[0], from_layer
+                    )
+                else:
+                    pin_group = PinGroup.create(layout, unique(reference_name, taken_groups), reference_pins)
+                    reference_terminal = PinGroupTerminal.create(
+                        layout, reference_name, pin_group, net=reference_pins[0].net
+                    )
+                    reference_terminal.is_circuit_port = True
+                report.reference_terminals[reference_name] = reference_terminal
+                references = [reference_terminal] * len(units)
+        else:
+            scope = component if spec.reference == "nearest" else None
+            indexes = [self._pedb.padstacks.reference_pin_index(net_name, scope) for net_name in spec.reference_nets]
+            if len(indexes) == 1:
+                index = indexes[0]
+            else:
+                index = ReferencePinIndex(
+                    [pin for i in indexes for pin in i.pins], np.concatenate([i.positions for i in indexes])
+                )
+            centers = [np.mean([[float(i) for i in pin.position] for _, pin in pins], axis=0) for _, pins in units]
+            nearest = index.query_radius_many(centers, spec.search_radius, max_limit=1) if units else []
+            reference_by_pin = {}
+            for position, ((net_name, pins), ref_pins) in enumerate(zip(units, nearest)):
+                if not ref_pins:
+                    report.skipped.append((pins[0][0], f"no reference pin within {spec.search_radius} m"))
+                    continue
+                ref_pin = ref_pins[0]
+                if ref_pin.id not in reference_by_pin:
+                    if ref_pin.terminal:
+                        reference_terminal = ref_pin.terminal
+                    else:
+                        reference_name = unique(
+                            f"{ref_pin.component.name if ref_pin.component else 'via'}_{ref_pin.name}_ref",
+                            taken_names,
+                        )
+                        from_layer, _ = ref_pin.get_layer_range()
+                        reference_terminal = PadstackInstanceTerminal.create(
+                            layout, reference_name, ref_pin, from_layer
+                        )
+                        report.reference_terminals[reference_name] = reference_terminal
+                    reference_by_pin[ref_pin.id] = reference_terminal
+                references[position] = reference_by_pin[ref_pin.id]
+        report.timings["reference"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        nets = {}
+        for (net_name, pins), reference_terminal in zip(units, references):
+            if reference_terminal is None:
+                continue
+            first_pin_name, first_pin = pins[0]
+            if net_name not in nets:
+                nets[net_name] = first_pin.net
+            name = unique(
+                spec.name_format.format(component=spec.component, net=net_name, pin=first_pin_name), taken_names
+            )
+            try:
+                if len(pins) == 1:
+                    from_layer, _ = first_pin.get_layer_range()
+                    terminal = PadstackInstanceTerminal.create(layout, name, first_pin, from_layer, net=nets[net_name])
+                else:
+                    pin_group = PinGroup.create(
+                        layout, unique(f"{spec.component}_{net_name}", taken_groups), [pin for _, pin in pins]
+                    )
+                    terminal = PinGroupTerminal.create(layout, name, pin_group, net=nets[net_name])
+                terminal.is_circuit_port = True
+                terminal.impedance = spec.impedance
+                terminal.reference_terminal = reference_terminal
+            except Exception as e:
+                report.skipped.append((first_pin_name, f"{type(e).__name__}: {e}"))
+                continue
+            report.ports[name] = terminal
+        report.timings["terminals"] = time.perf_counter() - start
+        self._logger.info(
+            f"Created {len(report.ports)} ports on {spec.component} in {report.elapsed:.2f}s, "
+            f"{len(report.skipped)} skipped."
+        )
+        return report
+
     def add_port_on_rlc_component(
         self, component: Optional[Union[str, Component]] = None, circuit_ports: bool = True, pec_boundary: bool = False
     ) -> bool:
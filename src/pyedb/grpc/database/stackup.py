@@ -28,6 +28,8 @@ This module contains the `EdbStackup` class.
 from __future__ import absolute_import, annotations
 
 from collections import OrderedDict
+from contextlib import contextmanager
+import functools
 import json
 import logging
 import math
@@ -88,6 +90,20 @@ from pyedb.misc.decorators import deprecate_argument_name
 logger = logging.getLogger(__name__)
 
 
+def _invalidates_layer_cache(method):
+    """Drop the cached layer views around a method that changes the layer collection."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._invalidate_layer_cache()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_layer_cache()
+
+    return wrapper
+
+
 class Stackup:
     """Manages EDB methods for stackup operations.
 
@@ -100,9 +116,115 @@ class Stackup:
     """
 
     def __init__(self, pedb, core=None):
+        self._layer_cache = {}
+        self._working_layers = {}
+        self._transaction_depth = 0
         self.core = core
         self._pedb = pedb
 
+    @property
+    def core(self):
+        """EDB layer collection object.
+
+        Inside :meth:`transaction` this is a detached working copy of the layout layer collection.
+        """
+        return self._core
+
+    @core.setter
+    def core(self, value):
+        self._core = value
+        self._working_layers = {}
+        self._invalidate_layer_cache()
+
+    def _invalidate_layer_cache(self):
+        """Forget the cached layer views so they are rebuilt from the layer collection on next access."""
+        self._layer_cache = {}
+
+    def _cached_layers(self, layer_type_set, wrap):
+        """Return the layers of a type set as ``{name: wrapper}``, building the wrappers once.
+
+        The returned dictionary is a copy, the wrappers are shared until the layer collection changes.
+        """
+        layers = self._layer_cache.get(layer_type_set)
+        if layers is None:
+            layers = {}
+            for core_layer in self._get_layers(layer_type_set):
+                layer = wrap(core_layer)
+                layer._stackup = self
+                layer._collection = self.core
+                layers[core_layer.name] = layer
+            self._layer_cache[layer_type_set] = layers
+        return dict(layers)
+
+    def _working_layer(self, layer):
+        """Return the core layer that reads and edits through a layer wrapper should target.
+
+        Wrappers built before :meth:`transaction` hold layers of the layout layer collection. Inside the block
+        they are routed to the layer of the same name in the working copy, so their edits are committed with it
+        instead of being overwritten.
+        """
+        if not self._transaction_depth or layer._collection is self.core:
+            return layer._core
+        name = layer._core.name
+        working = self._working_layers.get(name)
+        if working is None:
+            working = self.core.find_by_name(name)
+            if working.is_null:
+                raise RuntimeError(f"Layer {name} is not in the stackup transaction.")
+            self._working_layers[name] = working
+        return working
+
+    def _apply_layer_collection(self, layer_collection):
+        """Set a rebuilt layer collection on the layout, or on the working copy inside :meth:`transaction`."""
+        if self._transaction_depth:
+            self.core = layer_collection
+        else:
+            self._pedb.layout.core.layer_collection = layer_collection
+            self._invalidate_layer_cache()
+
+    @contextmanager
+    def transaction(self):
+        """Batch layer edits into a single layer collection commit.
+
+        Inside the block, layers are read and edited on a detached copy of the layout layer collection, so
+        the layout is not updated after every edit. The copy is committed to the layout in one call when the
+        block exits normally, and discarded when it raises. Nested blocks join the outermost one.
+
+        Yields
+        ------
+        :class:`Stackup`
+            This ``Stackup`` instance.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edb = Edb("board.aedb")
+        >>> with edb.stackup.transaction():
+        ...     for layer in edb.stackup.dielectric_layers.values():
+        ...         layer.thickness = "100um"
+        ...     edb.stackup.add_layer("new_signal", method="add_on_bottom")
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+        live_core = self.core
+        self.core = live_core.clone()
+        self._transaction_depth = 1
+        committed = False
+        try:
+            yield self
+            committed = True
+        finally:
+            working_core = self.core
+            self._transaction_depth = 0
+            self.core = live_core
+            if committed:
+                self._pedb.layout.core.layer_collection = working_core
+
     @property
     def layer_collection(self) -> "Stackup":
         """Return self for backward compatibility.
@@ -163,12 +285,10 @@ class Stackup:
         return layers
 
     def __getitem__(self, item):
-        if item in self.non_stackup_layers:
-            return Layer(core=self.core.find_by_name(item))
-        elif item in self.layers:
-            return StackupLayer(self._pedb, core=self.core.find_by_name(item))
-        else:
-            return None
+        non_stackup_layers = self.non_stackup_layers
+        if item in non_stackup_layers:
+            return non_stackup_layers[item]
+        return self.layers.get(item)
 
     @property
     def _logger(self):
@@ -189,9 +309,7 @@ class Stackup:
         >>> edb = Edb()
         >>> signal_layers = edb.stackup.signal_layers
         """
-        return {
-            layer.name: StackupLayer(self._pedb, layer) for layer in self._get_layers(CoreLayerTypeSet.SIGNAL_LAYER_SET)
-        }
+        return self._cached_layers(CoreLayerTypeSet.SIGNAL_LAYER_SET, lambda layer: StackupLayer(self._pedb, layer))
 
     @property
     def dielectric_layers(self):
@@ -202,10 +320,7 @@ class Stackup:
         dict[str, :class:`pyedb.grpc.database.layers.stackup_layer.StackupLayer`]
             Dictionary of dielectric layers.
         """
-        return {
-            layer.name: StackupLayer(self._pedb, layer)
-            for layer in self._get_layers(CoreLayerTypeSet.DIELECTRIC_LAYER_SET)
-        }
+        return self._cached_layers(CoreLayerTypeSet.DIELECTRIC_LAYER_SET, lambda layer: StackupLayer(self._pedb, layer))
 
     @property
     def layers(self):
@@ -222,7 +337,7 @@ class Stackup:
         >>> edb = Edb()
         >>> layers = edb.stackup.layers
         """
-        return {obj.name: StackupLayer(self._pedb, obj) for obj in self._get_layers(CoreLayerTypeSet.STACKUP_LAYER_SET)}
+        return self._cached_layers(CoreLayerTypeSet.STACKUP_LAYER_SET, lambda layer: StackupLayer(self._pedb, layer))
 
     @property
     def via_layers(self) -> Dict[str, ViaLayer]:
@@ -250,6 +365,7 @@ class Stackup:
                 result[layer.name] = ViaLayer(self._pedb, CoreViaLayer(layer.msg))
         return result
 
+    @_invalidates_layer_cache
     def add_via_layer(
         self,
         name: str,
@@ -341,7 +457,7 @@ class Stackup:
         >>> edb = Edb()
         >>> non_stackup = edb.stackup.non_stackup_layers
         """
-        return {layer.name: Layer(core=layer) for layer in self._get_layers(CoreLayerTypeSet.NON_STACKUP_LAYER_SET)}
+        return self._cached_layers(CoreLayerTypeSet.NON_STACKUP_LAYER_SET, lambda layer: Layer(core=layer))
 
     @property
     def all_layers(self):
@@ -395,6 +511,7 @@ class Stackup:
         """
         return len(self.layers)
 
+    @_invalidates_layer_cache
     def create_symmetric_stackup(
         self,
         layer_count: int,
@@ -542,6 +659,7 @@ class Stackup:
         return self.core.mode.name.lower()
 
     @mode.setter
+    @_invalidates_layer_cache
     def mode(self, value):
         if value == 0 or value == CoreLayerCollectionMode.LAMINATE or value == "laminate" or value == "Laminate":
             self.core.mode = CoreLayerCollectionMode.LAMINATE
@@ -555,6 +673,7 @@ class Stackup:
         elif value == 2 or value == CoreLayerCollectionMode.MULTIZONE or value == "multizone" or value == "MultiZone":
             self.core.mode = CoreLayerCollectionMode.MULTIZONE
 
+    @_invalidates_layer_cache
     def _set_layout_stackup(
         self, layer_clone: CoreStackupLayer, operation: str, base_layer: Optional[str] = None, method: int = 1
     ) -> bool:
@@ -630,6 +749,7 @@ class Stackup:
         )
         return layer
 
+    @_invalidates_layer_cache
     def _create_nonstackup_layer(self, layer_name: str, layer_type: str):
         layer = Layer.create(layer_name, layer_type)
         self.core.add_layer_top(layer.core)
@@ -677,6 +797,7 @@ class Stackup:
         self._create_nonstackup_layer(name, layer_type)
         return self.non_stackup_layers.get(name)
 
+    @_invalidates_layer_cache
     @deprecate_argument_name({"fillMaterial": "filling_material"})
     def add_layer(
         self,
@@ -819,6 +940,7 @@ class Stackup:
             return False
         return False
 
+    @_invalidates_layer_cache
     def add_layer_top(self, name: str, layer_type: str = "signal", **kwargs) -> Union["Layer", None]:
         """Add a layer on top of the stackup.
 
@@ -865,6 +987,7 @@ class Stackup:
             layer.core.set_fill_material(kwargs["fill_material"])
         return self.core.add_layer_top(layer.core)
 
+    @_invalidates_layer_cache
     def add_layer_bottom(self, name: str, layer_type: str = "signal", **kwargs) -> Union["Layer", None]:
         """Add a layer at the bottom of the stackup.
 
@@ -916,6 +1039,7 @@ class Stackup:
             layer.core.set_fill_material(kwargs["fill_material"])
         return self.core.add_layer_bottom(layer.core)
 
+    @_invalidates_layer_cache
     def add_layer_below(
         self, name: str, base_layer_name: str, layer_type: str = "signal", **kwargs
     ) -> Union["Layer", None]:
@@ -967,6 +1091,7 @@ class Stackup:
             layer.core.set_fill_material(kwargs["fill_material"])
         return self.core.add_layer_below(layer.core, base_layer_name)
 
+    @_invalidates_layer_cache
     def add_layer_above(
         self, name: str, base_layer_name: str, layer_type: str = "signal", **kwargs
     ) -> Union["Layer", None]:
@@ -1027,6 +1152,7 @@ class Stackup:
         """
         return [[layer.id, layer.name] for layer in self._get_layers(CoreLayerTypeSet.ALL_LAYER_SET)]
 
+    @_invalidates_layer_cache
     def remove_layer(self, name: str) -> bool:
         """Remove a layer from stackup.
 
@@ -1045,7 +1171,7 @@ class Stackup:
             if not (layer_name == name):
                 new_layer_collection.add_layer_bottom(lyr.core)
 
-        self._pedb.layout.core.layer_collection = new_layer_collection
+        self._apply_layer_collection(new_layer_collection)
         return True
 
     def export(self, fpath: str, file_format: str = "xml", include_material_with_layer: bool = False) -> bool:
@@ -1127,24 +1253,23 @@ class Stackup:
     def _export_layer_stackup_to_json(
         self, output_file: Optional[str] = None, include_material_with_layer: bool = False
     ) -> bool:
+        materials = {name: {"name": name, **properties} for name, properties in self._pedb.materials.snapshot().items()}
         if not include_material_with_layer:
-            material_out = {}
-            for material_name, material in self._pedb.materials.materials.items():
-                material_out[material_name] = material.to_dict()
+            material_out = materials
         layers_out = {}
         for k, v in self.layers.items():
             data = v._json_format()
             layers_out[k] = data
-            if v.material in self._pedb.materials.materials:
-                layer_material = self._pedb.materials.materials[v.material]
+            if v.material in materials:
+                layer_material = materials[v.material]
                 if not v.dielectric_fill:
                     dielectric_fill = False
                 else:
-                    dielectric_fill = self._pedb.materials.materials[v.dielectric_fill]
+                    dielectric_fill = materials[v.dielectric_fill]
                 if include_material_with_layer:
-                    layers_out[k]["material"] = layer_material.to_dict()
+                    layers_out[k]["material"] = dict(layer_material)
                     if dielectric_fill:
-                        layers_out[k]["dielectric_fill"] = dielectric_fill.to_dict()
+                        layers_out[k]["dielectric_fill"] = dict(dielectric_fill)
         if not include_material_with_layer:
             stackup_out = {"materials": material_out, "layers": layers_out}
         else:
@@ -1186,6 +1311,7 @@ class Stackup:
         lower_layer_lower_elevation = res[3]
         return upper_layer.name, upper_layer_top_elevationm, lower_layer.name, lower_layer_lower_elevation
 
+    @_invalidates_layer_cache
     def flip_design(self) -> bool:
         """Flip the current design of a layout.
 
@@ -1241,7 +1367,7 @@ class Stackup:
                 cloned_via_layer.lower_elevation = via_layer_lower_elevation
                 new_lc.add_stackup_layer_at_elevation(cloned_via_layer)
             new_lc.add_layers(non_stackup_layers)
-            self._pedb.layout.core.layer_collection = new_lc
+            self._apply_layer_collection(new_lc)
 
             for pyaedt_cmp in list(self._pedb.components.instances.values()):
                 cmp = pyaedt_cmp
@@ -1323,6 +1449,7 @@ class Stackup:
                 comp_prop.port_property = port_property
                 val.component_property = comp_prop
 
+    @_invalidates_layer_cache
     def adjust_solder_dielectrics(self) -> bool:
         """Adjust the stack-up by adding or modifying dielectric layers that contain solder balls.
 
@@ -1361,6 +1488,7 @@ class Stackup:
                     list(self.layers.values())[0].thickness = val.solder_ball_height
         return True
 
+    @_invalidates_layer_cache
     def place_in_layout(
         self,
         edb: "Edb",
@@ -1455,6 +1583,7 @@ class Stackup:
             cell_inst2.placement_layer = stackup_target.get_layers(CoreLayerTypeSet.SIGNAL_LAYER_SET)[-1]
         return True
 
+    @_invalidates_layer_cache
     def place_in_layout_3d_placement(
         self,
         edb: "Edb",
@@ -1600,6 +1729,7 @@ class Stackup:
         # TODO check is position is correct.
         return True
 
+    @_invalidates_layer_cache
     def place_instance(
         self,
         component_edb: "Edb",
@@ -1732,6 +1862,7 @@ class Stackup:
         # TODO check is position is correct.
         return cell_inst2
 
+    @_invalidates_layer_cache
     def place_a3dcomp_3d_placement(
         self,
         a3dcomp_path: str,
@@ -1842,6 +1973,7 @@ class Stackup:
         temp_data = {name: area / outline_area * 100 for name, area in temp_data.items()}
         return temp_data
 
+    @_invalidates_layer_cache
     def _import_dict(self, json_dict: Dict[str, Any], rename: bool = False) -> bool:
         """Import stackup from a dictionary.
 
@@ -2015,6 +2147,7 @@ class Stackup:
             return self._import_dict(json_dict, rename)
         return False
 
+    @_invalidates_layer_cache
     def _import_csv(self, file_path: str) -> bool:
         """Import stackup definition from a CSV file.
 
@@ -2073,6 +2206,7 @@ class Stackup:
         self._pedb.layout.layer_collection = lc_new
         return True
 
+    @_invalidates_layer_cache
     def _set(
         self,
         layers: Optional[Dict] = None,
@@ -2277,14 +2411,14 @@ class Stackup:
             non_stackup_layers[name] = layer
 
         materials = {}
-        for name, val in self._pedb.materials.materials.items():
+        for name, val in self._pedb.materials.snapshot().items():
             material = {}
-            if val.conductivity:
-                if val.conductivity > 4e7:
-                    material["Conductivity"] = val.conductivity
+            if val["conductivity"]:
+                if val["conductivity"] > 4e7:
+                    material["Conductivity"] = val["conductivity"]
             else:
-                material["Permittivity"] = val.permittivity
-                material["DielectricLossTangent"] = val.dielectric_loss_tangent
+                material["Permittivity"] = val["permittivity"]
+                material["DielectricLossTangent"] = val["dielectric_loss_tangent"]
             materials[name] = material
 
         return layers, materials, roughness_models, non_stackup_layers
@@ -2302,6 +2436,7 @@ class Stackup:
                 )
         return True
 
+    @_invalidates_layer_cache
     def _import_xml(self, file_path: str | Path, rename: bool = False):
         """Load stackup from a XML file.
 
@@ -2383,6 +2518,7 @@ class Stackup:
         write_pretty_xml(root, file_path)
         return True
 
+    @_invalidates_layer_cache
     def load(self, file_path: Union[str, Dict], rename: bool = False) -> bool:
         """Import stackup from a file.
 
@@ -2419,6 +2555,7 @@ class Stackup:
         else:
             return False
 
+    @_invalidates_layer_cache
     def load_from_xml(self, file_path: str) -> bool:
         """Load stackup from an XML file.
 
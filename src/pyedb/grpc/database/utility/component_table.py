@@ -0,0 +1,264 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Bulk component, pin and net table of a layout."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ansys.edb.core.hierarchy.pin_pair_model import PinPairModel as CorePinPairModel
+from ansys.edb.core.primitive.padstack_instance import PadstackInstance as CorePadstackInstance
+import numpy as np
+
+_RLC_VALUE_ATTRIBUTE = {"resistor": "r", "inductor": "l", "capacitor": "c"}
+
+
+@dataclass
+class ComponentRecord:
+    """Component row of a :class:`ComponentTable`.
+
+    Attributes
+    ----------
+    refdes : str
+        Reference designator.
+    type : str
+        Component type. Options are ``"resistor"``, ``"inductor"``, ``"capacitor"``, ``"ic"``, ``"io"``
+        and ``"other"``.
+    part_name : str
+        Part name, empty when the component has no definition.
+    placement_layer : str
+        Placement layer name.
+    location : tuple[float, float]
+        Component center in meters.
+    value : float, optional
+        Value of the first pin pair of RLC components, ``None`` for other components.
+    """
+
+    refdes: str
+    type: str = "other"
+    part_name: str = ""
+    placement_layer: str = ""
+    location: Tuple[float, float] = (0.0, 0.0)
+    value: Optional[float] = None
+
+
+def _safe(read, default=None):
+    try:
+        return read()
+    except Exception:
+        return default
+
+
+def _rlc_value(group, component_type: str) -> Optional[float]:
+    attribute = _RLC_VALUE_ATTRIBUTE.get(component_type)
+    if attribute is None:
+        return None
+    model = group.component_property.model
+    if not isinstance(model, CorePinPairModel):
+        return None
+    pin_pairs = model.pin_pairs()
+    if not pin_pairs:
+        return None
+    return getattr(model.rlc(pin_pairs[0]), attribute).value
+
+
+@dataclass
+class ComponentTable:
+    """Components of a layout with their pin to net connectivity.
+
+    The table is built in one traversal of the layout groups by :meth:`from_groups` and holds plain
+    Python data only, so lookups do not query the server.
+
+    Attributes
+    ----------
+    components : dict[str, ComponentRecord]
+        Component rows by reference designator.
+    pin_nets : dict[str, dict[str, str]]
+        Net name of each pin by reference designator and pin name. Unconnected pins map to ``""``.
+    net_pins : dict[str, list[tuple[str, str]]]
+        ``(refdes, pin)`` pairs by net name.
+    """
+
+    components: Dict[str, ComponentRecord] = field(default_factory=dict)
+    pin_nets: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    net_pins: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_groups(cls, groups: Iterable, type_mapping: Dict) -> "ComponentTable":
+        """Build the table from core component groups.
+
+        Parameters
+        ----------
+        groups : list[:class:`ComponentGroup <ansys.edb.core.hierarchy.component_group.ComponentGroup>`]
+            Core component groups of the layout.
+        type_mapping : dict
+            Core component type to component type name mapping.
+
+        Returns
+        -------
+        ComponentTable
+        """
+        table = cls()
+        for group in groups:
+            refdes = group.name
+            component_type = _safe(lambda: type_mapping.get(group.component_type, "other"), "other")
+            location = _safe(lambda: tuple(i.value for i in group.location), (0.0, 0.0))
+            table.components[refdes] = ComponentRecord(
+                refdes=refdes,
+                type=component_type,
+                part_name=_safe(lambda: group.component_def.name, ""),
+                placement_layer=_safe(lambda: group.placement_layer.name, ""),
+                location=location,
+                value=_safe(lambda: _rlc_value(group, component_type)),
+            )
+            pins = table.pin_nets.setdefault(refdes, {})
+            for member in group.members:
+                if not isinstance(member, CorePadstackInstance):
+                    continue
+                net = member.net
+                net_name = "" if net.is_null else net.name
+                pins[member.name] = net_name
+                if net_name:
+                    table.net_pins.setdefault(net_name, []).append((refdes, member.name))
+        return table
+
+    def nets(self, refdes: str) -> List[str]:
+        """Names of the nets connected to a component.
+
+        Parameters
+        ----------
+        refdes : str
+            Reference designator.
+
+        Returns
+        -------
+        list[str]
+        """
+        return list({net for net in self.pin_nets.get(refdes, {}).values() if net})
+
+    def pins_on_net(self, net: str, refdes: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Component pins connected to a net.
+
+        Parameters
+        ----------
+        net : str
+            Net name.
+        refdes : str, optional
+            Reference designator to restrict the pins to. The default is all components.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            ``(refdes, pin)`` pairs.
+        """
+        pins = self.net_pins.get(net, [])
+        if refdes is None:
+            return list(pins)
+        return [pin for pin in pins if pin[0] == refdes]
+
+    def components_on_nets(self, nets: Iterable[str]) -> List[str]:
+        """Reference designators of the components connected to any of the nets, in table order.
+
+        Parameters
+        ----------
+        nets : list[str]
+            Net names.
+
+        Returns
+        -------
+        list[str]
+        """
+        found = {refdes for net in nets for refdes, _ in self.net_pins.get(net, [])}
+        return [refdes for refdes in self.components if refdes in found]
+
+    def _columns(self, kind: str) -> Dict[str, list]:
+        if kind == "components":
+            records = list(self.components.values())
+            return {
+                "refdes": [r.refdes for r in records],
+                "type": [r.type for r in records],
+                "part_name": [r.part_name for r in records],
+                "placement_layer": [r.placement_layer for r in records],
+                "x": [r.location[0] for r in records],
+                "y": [r.location[1] for r in records],
+                "value": [np.nan if r.value is None else r.value for r in records],
+            }
+        elif kind == "pins":
+            rows = [(refdes, pin, net) for refdes, pins in self.pin_nets.items() for pin, net in pins.items()]
+            return {
+                "refdes": [row[0] for row in rows],
+                "pin_name": [row[1] for row in rows],
+                "net_name": [row[2] for row in rows],
+            }
+        raise ValueError(f"Unknown table kind '{kind}'. Options are 'components' and 'pins'.")
+
+    def to_numpy(self, kind: str = "components") -> Dict[str, np.ndarray]:
+        """Export the table as NumPy column arrays.
+
+        Parameters
+        ----------
+        kind : str, optional
+            ``"components"`` for one row per component or ``"pins"`` for one row per pin with its net.
+            The default is ``"components"``.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            Arrays by column name. Numeric columns are ``float64``, other columns are strings.
+        """
+        arrays = {}
+        for name, column in self._columns(kind).items():
+            if name in ("x", "y", "value"):
+                arrays[name] = np.asarray(column, dtype=float)
+            else:
+                arrays[name] = np.asarray(column, dtype=str)
+        return arrays
+
+    def to_dataframe(self, kind: str = "components"):
+        """Export the table as a pandas DataFrame.
+
+        Parameters
+        ----------
+        kind : str, optional
+            ``"components"`` for one row per component or ``"pins"`` for one row per pin with its net.
+            The default is ``"components"``.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "Pandas library is required to export the component table. "
+                "Please install it using 'pip install pyedb[analysis]' or 'pip install pandas'."
+            )
+        return pd.DataFrame(self._columns(kind))
+
+
+def invalidate_component_table(pedb) -> None:
+    """Discard the cached component table of ``pedb`` if the components interface was already created."""
+    components = getattr(pedb, "_components", None)
+    if components is not None and hasattr(components, "clear_table_cache"):
+        components.clear_table_cache()
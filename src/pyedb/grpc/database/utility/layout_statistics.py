@@ -41,6 +41,7 @@ class LayoutStatistics(object):
     >>> stat_model.stackup_thickness
     >>> stat_model.occupying_surface
     >>> stat_model.occupying_ratio
+    >>> stat_model.trace_length
     """
 
     def __init__(self):
@@ -49,6 +50,7 @@ class LayoutStatistics(object):
         self._nb_vias = 0
         self._occupying_ratio = {}
         self._occupying_surface = {}
+        self._trace_length = {}
         self._layout_size = [0.0, 0.0, 0.0, 0.0]
         self._nb_polygons = 0
         self._nb_traces = 0
@@ -144,6 +146,23 @@ class LayoutStatistics(object):
         if isinstance(value, float):
             self._occupying_surface = value
 
+    @property
+    def trace_length(self) -> dict[str, float]:
+        """Trace length.
+
+        Returns
+        -------
+        dict[str, float]
+            Total length of the traces with layer name as key and length in meters as value.
+
+        """
+        return self._trace_length
+
+    @trace_length.setter
+    def trace_length(self, value):
+        if isinstance(value, dict):
+            self._trace_length = value
+
     @property
     def layout_size(self) -> list[float]:
         """Layout size.
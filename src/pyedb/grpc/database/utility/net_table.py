@@ -0,0 +1,145 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Bulk attribute table of the nets of a layout."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class NetRecord:
+    """Net row of a :class:`NetTable`.
+
+    Attributes
+    ----------
+    name : str
+        Net name.
+    is_power_ground : bool
+        Whether the net is classified as power or ground.
+    primitive_count : int
+        Number of primitives on the net.
+    component_count : int
+        Number of components with at least one pin on the net.
+    """
+
+    name: str
+    is_power_ground: bool = False
+    primitive_count: int = 0
+    component_count: int = 0
+
+
+@dataclass
+class NetTable:
+    """Nets of a layout with their classification and connectivity counts.
+
+    The table is built in one traversal of the nets by :meth:`from_nets` and holds plain Python data only,
+    so lookups do not query the server.
+
+    Attributes
+    ----------
+    nets : dict[str, NetRecord]
+        Net rows by net name.
+    """
+
+    nets: Dict[str, NetRecord] = field(default_factory=dict)
+
+    @classmethod
+    def from_nets(cls, nets: Iterable, net_pins: Dict[str, List[Tuple[str, str]]]) -> "NetTable":
+        """Build the table from core nets.
+
+        Parameters
+        ----------
+        nets : list[:class:`Net <ansys.edb.core.net.net.Net>`]
+            Core nets of the layout.
+        net_pins : dict[str, list[tuple[str, str]]]
+            ``(refdes, pin)`` pairs by net name, as held by
+            :class:`ComponentTable <pyedb.grpc.database.utility.component_table.ComponentTable>`.
+
+        Returns
+        -------
+        NetTable
+        """
+        table = cls()
+        for net in nets:
+            name = net.name
+            table.nets[name] = NetRecord(
+                name=name,
+                is_power_ground=net.is_power_ground,
+                primitive_count=len(net.primitives),
+                component_count=len({refdes for refdes, _ in net_pins.get(name, [])}),
+            )
+        return table
+
+    @property
+    def power_ground(self) -> List[str]:
+        """Names of the power and ground nets."""
+        return [name for name, record in self.nets.items() if record.is_power_ground]
+
+    @property
+    def signal(self) -> List[str]:
+        """Names of the signal nets."""
+        return [name for name, record in self.nets.items() if not record.is_power_ground]
+
+    def _columns(self) -> Dict[str, list]:
+        records = list(self.nets.values())
+        return {
+            "name": [r.name for r in records],
+            "is_power_ground": [r.is_power_ground for r in records],
+            "primitive_count": [r.primitive_count for r in records],
+            "component_count": [r.component_count for r in records],
+        }
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """Export the table as NumPy column arrays.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            Arrays by column name. Counts are ``int64``, ``is_power_ground`` is boolean and names are strings.
+        """
+        columns = self._columns()
+        return {
+            "name": np.asarray(columns["name"], dtype=str),
+            "is_power_ground": np.asarray(columns["is_power_ground"], dtype=bool),
+            "primitive_count": np.asarray(columns["primitive_count"], dtype=np.int64),
+            "component_count": np.asarray(columns["component_count"], dtype=np.int64),
+        }
+
+    def to_dataframe(self):
+        """Export the table as a pandas DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "Pandas library is required to export the net table. "
+                "Please install it using 'pip install pyedb[analysis]' or 'pip install pandas'."
+            )
+        return pd.DataFrame(self._columns())
@@ -0,0 +1,134 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Specification and report of a batched port creation on a component."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple, Union
+
+REFERENCE_STRATEGIES = ("pin_group", "nearest", "nearest_outside")
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+@dataclass
+class PortBatchSpec:
+    """Describe the circuit ports to create on a component.
+
+    Attributes
+    ----------
+    component : str
+        Reference designator of the component.
+    nets : list[str]
+        Signal nets to create ports on. Nets that are also in ``reference_nets`` are ignored.
+    reference_nets : list[str]
+        Reference nets.
+    pins : list[str], optional
+        Component pin names to restrict the ports to. The default is all the pins of ``nets``.
+    reference : str, optional
+        Reference strategy. Options are:
+
+        - ``"pin_group"``: all reference pins of the component in one pin group, shared by every port.
+        - ``"nearest"``: nearest reference pin of the component.
+        - ``"nearest_outside"``: nearest reference pin in the whole layout.
+
+        The default is ``"pin_group"``.
+    group_by_net : bool, optional
+        Whether to create one pin group port per net instead of one port per pin. The default is ``False``.
+    name_format : str, optional
+        Port name pattern formatted with ``component``, ``net`` and ``pin``. For grouped ports, ``pin`` is the
+        first pin of the group. Names already used in the layout get a numeric suffix. The default is
+        ``"{component}_{net}_{pin}"``.
+    impedance : float or str, optional
+        Port impedance. The default is ``50``.
+    search_radius : float, optional
+        Search radius in meters of the nearest reference strategies. The default is ``3e-3``.
+    """
+
+    component: str
+    nets: List[str] = field(default_factory=list)
+    reference_nets: List[str] = field(default_factory=list)
+    pins: List[str] = field(default_factory=list)
+    reference: str = "pin_group"
+    group_by_net: bool = False
+    name_format: str = "{component}_{net}_{pin}"
+    impedance: Union[float, str] = 50
+    search_radius: float = 3e-3
+
+    def __post_init__(self):
+        self.nets = _as_list(self.nets)
+        self.reference_nets = _as_list(self.reference_nets)
+        self.pins = _as_list(self.pins)
+        if self.reference not in REFERENCE_STRATEGIES:
+            raise ValueError(f"Reference strategy must be one of {REFERENCE_STRATEGIES}, got '{self.reference}'.")
+        if not self.reference_nets:
+            raise ValueError("At least one reference net is required.")
+        self.nets = [net for net in self.nets if net not in self.reference_nets]
+
+
+@dataclass
+class PortBatchReport:
+    """Outcome of a batched port creation.
+
+    Attributes
+    ----------
+    ports : dict[str, Any]
+        Created port terminals by name.
+    reference_terminals : dict[str, Any]
+        Created reference terminals by name.
+    skipped : list[tuple[str, str]]
+        Pins or nets without a port, with the reason.
+    timings : dict[str, float]
+        Duration in seconds of each stage: ``"collect"``, ``"reference"`` and ``"terminals"``.
+    """
+
+    ports: Dict[str, Any] = field(default_factory=dict)
+    reference_terminals: Dict[str, Any] = field(default_factory=dict)
+    skipped: List[Tuple[str, str]] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        """Total duration in seconds."""
+        return sum(self.timings.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable summary of the report.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "ports": list(self.ports),
+            "reference_terminals": list(self.reference_terminals),
+            "skipped": [{"item": item, "reason": reason} for item, reason in self.skipped],
+            "timings": dict(self.timings),
+            "elapsed": self.elapsed,
+        }
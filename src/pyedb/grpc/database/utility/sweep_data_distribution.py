@@ -22,6 +22,16 @@
 
 from ansys.edb.core.utility.value import Value as CoreValue
 
+from pyedb.generic.frequency_sweep import to_hz
+
+
+def _to_float(value) -> float:
+    """Evaluate a value locally, and with EDB only when it refers to variables."""
+    try:
+        return to_hz(value)
+    except ValueError:
+        return CoreValue(value).value
+
 
 class SweepDataDistribution:
     @staticmethod
@@ -58,26 +68,26 @@ class SweepDataDistribution:
             if isinstance(start, str) and isinstance(stop, str) and isinstance(step, str):
                 return f"LIN {start} {stop} {step}"
             else:
-                return f"LIN {CoreValue(start).value} {CoreValue(stop).value} {CoreValue(step).value}"
+                return f"LIN {_to_float(start)} {_to_float(stop)} {_to_float(step)}"
         elif sweep_type.lower() == "linear_count":
             if isinstance(start, str) and isinstance(stop, str) and isinstance(count, int):
                 return f"LINC {start} {stop} {count}"
             else:
-                return f"LINC {CoreValue(start).value} {CoreValue(stop).value} {int(CoreValue(count).value)}"
+                return f"LINC {_to_float(start)} {_to_float(stop)} {int(_to_float(count))}"
         elif sweep_type.lower() == "exponential":
             if isinstance(start, str) and isinstance(stop, str) and isinstance(count, int):
                 return f"ESTP {start} {stop} {count}"
             else:
-                return f"ESTP {CoreValue(start).value} {CoreValue(stop).value} {int(CoreValue(count).value)}"
+                return f"ESTP {_to_float(start)} {_to_float(stop)} {int(_to_float(count))}"
         elif sweep_type.lower() == "decade_count":
             if isinstance(start, str) and isinstance(stop, str) and isinstance(decade_number, int):
                 return f"DEC {start} {stop} {decade_number}"
             else:
-                return f"DEC {CoreValue(start).value} {CoreValue(stop).value} {int(CoreValue(decade_number).value)}"
+                return f"DEC {_to_float(start)} {_to_float(stop)} {int(_to_float(decade_number))}"
         elif sweep_type.lower() == "octave_count":
             if isinstance(start, str) and isinstance(stop, str) and isinstance(octave_number, int):
                 return f"OCT {start} {stop} {octave_number}"
             else:
-                return f"OCT {CoreValue(start).value} {CoreValue(stop).value} {int(CoreValue(octave_number).value)}"
+                return f"OCT {_to_float(start)} {_to_float(stop)} {int(_to_float(octave_number))}"
         else:
             return ""
@@ -85,8 +85,8 @@ from pyedb.misc.decorators import deprecated as runtime_deprecated, deprecated_p
 
 if TYPE_CHECKING:
     from pyedb import Edb
+    from pyedb.configuration.configuration import Configuration
     from pyedb.grpc.database.layout.voltage_regulator import VoltageRegulator
-    from pyedb.grpc.database.simulation_setup.siwave_dcir_simulation_setup import SIWaveDCIRSimulationSetup
     from pyedb.grpc.database.utility.layout_statistics import LayoutStatistics
 from zipfile import ZipFile as Zpf
 
@@ -96,10 +96,9 @@ from ansys.edb.core.hierarchy.layout_component import (
 )
 import ansys.edb.core.layout.cell
 from ansys.edb.core.layout.cell import DesignMode as CoreDesignMode
+import numpy as np
 
-from pyedb.configuration.configuration import Configuration
 from pyedb.generic.constants import unit_converter
-from pyedb.generic.control_file import ControlFile
 from pyedb.generic.general_methods import (
     generate_unique_name,
     get_string_version,
@@ -107,8 +106,8 @@ from pyedb.generic.general_methods import (
     is_windows,
 )
 from pyedb.generic.geometry_operators import GeometryOperators
-from pyedb.generic.process import SiwaveSolve
 from pyedb.generic.settings import settings
+from pyedb.generic.value_evaluator import evaluate_expression, evaluate_expressions
 from pyedb.grpc.database.components import Components
 from pyedb.grpc.database.definition.materials import Materials
 from pyedb.grpc.database.hfss import Hfss
@@ -124,18 +123,10 @@ from pyedb.grpc.database.primitive.padstack_instance import PadstackInstance
 from pyedb.grpc.database.primitive.path import Path
 from pyedb.grpc.database.primitive.polygon import Polygon
 from pyedb.grpc.database.primitive.rectangle import Rectangle
-from pyedb.grpc.database.simulation_setup.hfss_simulation_setup import (
-    HfssSimulationSetup,
-)
-from pyedb.grpc.database.simulation_setup.raptor_x_simulation_setup import (
-    RaptorXSimulationSetup,
-)
-from pyedb.grpc.database.simulation_setup.siwave_dcir_simulation_setup import (
-    SIWaveDCIRSimulationSetup,
-)
-from pyedb.grpc.database.simulation_setup.siwave_simulation_setup import (
-    SiwaveSimulationSetup,
-)
+from pyedb.grpc.database.simulation_setup.hfss_simulation_setup import HfssSimulationSetup
+from pyedb.grpc.database.simulation_setup.raptor_x_simulation_setup import RaptorXSimulationSetup
+from pyedb.grpc.database.simulation_setup.siwave_dcir_simulation_setup import SIWaveDCIRSimulationSetup
+from pyedb.grpc.database.simulation_setup.siwave_simulation_setup import SiwaveSimulationSetup
 from pyedb.grpc.database.simulation_setups import SimulationSetups
 from pyedb.grpc.database.siwave import Siwave
 from pyedb.grpc.database.source_excitations import SourceExcitation
@@ -147,7 +138,6 @@ from pyedb.grpc.database.terminal.terminal import Terminal
 from pyedb.grpc.database.utility.value import Value
 from pyedb.grpc.edb_init import EdbInit
 from pyedb.misc.decorators import deprecate_argument_name
-from pyedb.workflows.utilities.cutout import Cutout
 
 os.environ["no_proxy"] = "localhost,127.0.0.1"
 
@@ -205,6 +195,11 @@ class Edb(EdbInit):
         Hostname or IP address of the already-running RPC server referenced by
         ``port``.  Only used when ``port`` is non-zero.  Default is
         ``"localhost"``.
+    database_id : int, optional
+        ID of a database already open on the server referenced by ``port``,
+        for example by the ``pyedb serve`` daemon.  The database is attached
+        instead of opened and closing this object leaves it open.  Only used
+        when ``port`` is non-zero.  Default is ``None``.
 
     Examples
     --------
@@ -247,6 +242,7 @@ class Edb(EdbInit):
         remove_existing_aedt: bool = False,
         port: int = 0,
         ip_address: str = "localhost",
+        database_id: int = None,
     ):
         if isinstance(edbpath, PathLib):
             edbpath = str(edbpath)
@@ -347,7 +343,9 @@ class Edb(EdbInit):
         elif edbpath.endswith("edb.def"):
             self.edbpath = os.path.dirname(edbpath)
             if port:
-                self._open_on_existing_server(self.edbpath, self.isreadonly, port=port, ip_address=ip_address)
+                self._open_on_existing_server(
+                    self.edbpath, self.isreadonly, port=port, ip_address=ip_address, database_id=database_id
+                )
             else:
                 self.open(restart_rpc_server=restart_rpc_server)
         elif not os.path.exists(os.path.join(self.edbpath, "edb.def")):
@@ -356,7 +354,9 @@ class Edb(EdbInit):
         elif ".aedb" in edbpath:
             self.edbpath = edbpath
             if port:
-                self._open_on_existing_server(self.edbpath, self.isreadonly, port=port, ip_address=ip_address)
+                self._open_on_existing_server(
+                    self.edbpath, self.isreadonly, port=port, ip_address=ip_address, database_id=database_id
+                )
             else:
                 self.open(restart_rpc_server=restart_rpc_server)
         if self.active_cell:
@@ -495,10 +495,22 @@ class Edb(EdbInit):
         return None
 
     def value(self, val) -> Value | float | str:
-        """Convert a value into a pyedb value."""
+        """Convert a value into a pyedb value.
+
+        Plain numbers with a unit, such as ``"4mil"``, are evaluated locally when
+        ``settings.enable_local_value_evaluation`` is ``True``. Expressions referring to design or project variables
+        are evaluated by EDB.
+        """
         if isinstance(val, Value):
             return val
         elif isinstance(val, str):
+            if settings.enable_local_value_evaluation:
+                local_value = evaluate_expression(val)
+                if local_value is not None:
+                    value = Value(local_value, self.active_cell)
+                    # Keep the original expression text, as a server-created value does.
+                    value.msg.text = val
+                    return value
             if "$" in val:
                 return Value(val, self.active_db)
             else:
@@ -506,6 +518,31 @@ class Edb(EdbInit):
         else:
             return Value(val, self.active_db)
 
+    def values(self, vals) -> np.ndarray:
+        """Convert an array of values into floats in SI units.
+
+        Each distinct expression is evaluated once. Plain numbers with a unit are evaluated locally and the
+        remaining expressions are evaluated by EDB.
+
+        Parameters
+        ----------
+        vals : list, tuple or numpy.ndarray
+            Expressions or numbers. For example, ``["4mil", "0.1mm", "$via_pad"]``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``float64`` with the same shape as ``vals``.
+
+        Examples
+        --------
+        >>> edb.values(["1mm", "2mm", "1mm"])
+        array([0.001, 0.002, 0.001])
+        """
+        if not settings.enable_local_value_evaluation:
+            return np.vectorize(lambda v: float(self.value(v)), otypes=[np.float64])(np.asarray(vals))
+        return evaluate_expressions(vals, fallback=lambda expression: float(self.value(expression)))
+
     def _value_setter(self, val) -> Value | float | str:
         """Helper for setting variable values with unit handling."""
         if isinstance(val, Value):
@@ -764,7 +801,7 @@ class Edb(EdbInit):
                 self.logger.error("Builder was not initialized.")
             return True
 
-    def _open_on_existing_server(self, db_path, read_only, port, ip_address="localhost") -> bool:
+    def _open_on_existing_server(self, db_path, read_only, port, ip_address="localhost", database_id=None) -> bool:
         """Open an EDB database against an already-running RPC server.
 
         Parameters
@@ -777,6 +814,9 @@ class Edb(EdbInit):
             TCP port the RPC server is listening on.
         ip_address : str, optional
             Hostname or IP address of the RPC server.  Default is ``"localhost"``.
+        database_id : int, optional
+            ID of a database already open on the server, for example by ``pyedb serve``. When provided, the
+            database is attached instead of opened.
 
         Returns
         -------
@@ -790,7 +830,7 @@ class Edb(EdbInit):
         >>> edb = Edb.__new__(Edb)
         >>> edb._open_on_existing_server("my_design.aedb", False, port=50051)
         """
-        super()._open_on_existing_server(db_path, read_only, port=port, ip_address=ip_address)
+        super()._open_on_existing_server(db_path, read_only, port=port, ip_address=ip_address, database_id=database_id)
         if not self.db:
             raise ValueError("Failed to open EDB on existing server.")
         if self.db.is_null:
@@ -1131,6 +1171,8 @@ class Edb(EdbInit):
             Configuration file interface.
         """
         if not self._configuration:
+            from pyedb.configuration.configuration import Configuration
+
             self._configuration = Configuration(self)
         return self._configuration
 
@@ -1272,7 +1314,7 @@ class Edb(EdbInit):
         :class:`Materials <pyedb.grpc.database.definition.materials.Materials>`
             Material definition and management.
         """
-        if self.active_db:
+        if self._materials is None and self.active_db:
             self._materials = Materials(self)
         return self._materials
 
@@ -1697,6 +1739,8 @@ class Edb(EdbInit):
                 self.logger.error("Technology files are supported only in Linux. Use control file instead.")
                 return False
 
+            from pyedb.generic.control_file import ControlFile
+
             ControlFile(xml_input=control_file, technology=tech_file, layer_map=map_file).write_xml(control_file_temp)
             if self.import_layout_file(
                 input_gds,
@@ -1890,6 +1934,8 @@ class Edb(EdbInit):
 
 
         """
+        from pyedb.workflows.utilities.cutout import Cutout
+
         cutout = Cutout(self)
         cutout.expansion_size = expansion_size
         cutout.signals = signal_nets
@@ -1991,6 +2037,8 @@ class Edb(EdbInit):
         >>> edb = Edb()
         >>> edb.export_hfss(r"C:/output", net_list=["SignalNet"])
         """
+        from pyedb.generic.process import SiwaveSolve
+
         siwave_s = SiwaveSolve(self)
         return siwave_s.export_3d_cad("HFSS", path_to_output, net_list, num_cores, aedt_file_name, hidden=hidden)
 
@@ -2028,6 +2076,8 @@ class Edb(EdbInit):
         >>> edb = Edb()
         >>> edb.export_q3d(r"C:/output")
         """
+        from pyedb.generic.process import SiwaveSolve
+
         siwave_s = SiwaveSolve(self)
         return siwave_s.export_3d_cad(
             "Q3D",
@@ -2072,6 +2122,8 @@ class Edb(EdbInit):
         >>> edb = Edb()
         >>> edb.export_maxwell(r"C:/output")
         """
+        from pyedb.generic.process import SiwaveSolve
+
         siwave_s = SiwaveSolve(self)
         return siwave_s.export_3d_cad(
             "Maxwell",
@@ -2096,6 +2148,8 @@ class Edb(EdbInit):
         >>> edb = Edb()
         >>> edb.solve_siwave()
         """
+        from pyedb.generic.process import SiwaveSolve
+
         process = SiwaveSolve(self)
         try:
             self.close()
@@ -2149,6 +2203,8 @@ class Edb(EdbInit):
         list[str]
             Generated report files.
         """
+        from pyedb.generic.process import SiwaveSolve
+
         process = SiwaveSolve(self)
         try:
             self.close()
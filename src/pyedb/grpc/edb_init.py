@@ -57,6 +57,8 @@ class EdbInit(object):
         """
         self.logger = settings.logger
         self._db = None
+        self._attached_db = False
+        self._pooled_server = None
         self.version = version
         self.session = None
         if is_linux:
@@ -88,6 +90,9 @@ class EdbInit(object):
 
     @staticmethod
     def _signal_handler(signum=None, frame=None):
+        if RpcSession.rpc_session is not None and not RpcSession._owns_session:
+            # Attached to a server owned by another process (for example ``pyedb serve``), leave it running.
+            return
         RpcSession.kill_all_instances()
 
     @property
@@ -113,6 +118,8 @@ class EdbInit(object):
         -------
         Database
         """
+        if self._open_on_pooled_server(database.Database.create, db_path):
+            return self._db
         RpcSession.start(
             edb_version=self.version,
             port=port,
@@ -145,6 +152,8 @@ class EdbInit(object):
         Database or None
             The opened Database object, or None if not found.
         """
+        if self._open_on_pooled_server(database.Database.open, db_path, read_only):
+            return self._db
         RpcSession.start(
             edb_version=self.version,
             port=port,
@@ -171,6 +180,34 @@ class EdbInit(object):
             RpcSession.acquire()
         return self._db
 
+    def _open_on_pooled_server(self, func, *args):
+        """Create or open a database on the pooled RPC server bound to the current thread, if any.
+
+        Parameters
+        ----------
+        func : callable
+            ``database.Database.create`` or ``database.Database.open``.
+        *args :
+            Positional arguments forwarded to ``func``.
+
+        Returns
+        -------
+        bool
+            ``False`` when the thread is not bound to a pooled server and the process-wide
+            :class:`~pyedb.grpc.rpc_session.RpcSession` must be used instead.
+        """
+        from pyedb.grpc.rpc_session_pool import current_server
+
+        server = current_server()
+        if server is None:
+            return False
+        server.ensure_alive()
+        self._db = self._grpc_retry(func, *args)
+        if self._db:
+            server.acquire()
+            self._pooled_server = server
+        return True
+
     def _grpc_retry(self, func, *args, max_attempts=3, delay=1.0):
         """
         Call a gRPC database function with retries on transient failures.
@@ -219,7 +256,7 @@ class EdbInit(object):
                     self.logger.error(f"gRPC call {func.__name__} failed after {max_attempts} attempts: {e}")
         return None
 
-    def _open_on_existing_server(self, db_path, read_only, port, ip_address="localhost"):
+    def _open_on_existing_server(self, db_path, read_only, port, ip_address="localhost", database_id=None):
         """Open a database against an already-running RPC server (no server launch).
 
         Parameters
@@ -232,6 +269,9 @@ class EdbInit(object):
             TCP port of the already-running RPC server.
         ip_address : str, optional
             Hostname or IP of the server. Defaults to ``"localhost"``.
+        database_id : int, optional
+            ID of a database already open on the server. When provided, the database is attached instead of
+            opened, and :meth:`close` leaves it open for its owner.
 
         Returns
         -------
@@ -240,6 +280,15 @@ class EdbInit(object):
         if not RpcSession.connect_to_existing_server(port=port, ip_address=ip_address):
             self.logger.error(f"Could not connect to RPC server at {ip_address}:{port}.")
             return None
+        if database_id is not None:
+            self._db = self.find_by_id(database_id)
+            if self._db is None or self._db.is_null:
+                self._db = None
+                self.logger.error(f"Database {database_id} is not open on RPC server at {ip_address}:{port}.")
+                return None
+            self._attached_db = True
+            RpcSession.acquire()
+            return self._db
         self._db = self._grpc_retry(database.Database.open, db_path, read_only)
         if self._db:
             RpcSession.acquire()
@@ -302,12 +351,18 @@ class EdbInit(object):
         other databases are still open will break those connections immediately.
         """
         if self._db is not None:
-            try:
-                self._db.close()
-            except Exception as e:
-                self.logger.debug(f"Database close() raised: {e}")
+            if not getattr(self, "_attached_db", False):
+                try:
+                    self._db.close()
+                except Exception as e:
+                    self.logger.debug(f"Database close() raised: {e}")
             self._db = None
-        if terminate_rpc_session is True:
+            self._attached_db = False
+        if getattr(self, "_pooled_server", None) is not None:
+            # The server belongs to a RpcSessionPool, which owns its lifecycle.
+            self._pooled_server.release()
+            self._pooled_server = None
+        elif terminate_rpc_session is True:
             # Force-kill regardless of ref count
             RpcSession.close()
         elif terminate_rpc_session is False:
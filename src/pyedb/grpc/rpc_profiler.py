@@ -0,0 +1,374 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Opt-in instrumentation of the RPC calls made in gRPC mode.
+
+While a :class:`RpcProfiler` is active, every ``ansys.edb.core`` stub call is counted and timed, together with
+its request and response payload sizes and the pyedb call stack that issued it. The result shows which pyedb
+APIs issue many small RPCs, for example one call per primitive or per padstack instance.
+
+Examples
+--------
+>>> from pyedb.grpc.rpc_profiler import RpcProfiler
+>>> with RpcProfiler() as profiler:
+...     positions = [via.position for via in edb.padstacks.instances.values()]
+>>> print(profiler.summary())
+>>> profiler.write_json("rpc_profile.json")
+>>> profiler.write_flamegraph("rpc_profile.folded")  # flamegraph.pl / speedscope input
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import json
+from pathlib import Path
+import sys
+import threading
+import time
+
+from ansys.edb.core.session import _Session
+
+_install_lock = threading.Lock()
+_active_profilers = []
+_original_stub = _Session.stub
+
+_STACK_MODULE_PREFIXES = ("pyedb.", "__main__")
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def _calling_stack(frame):
+    """Return the pyedb and script frames of the current call stack, outermost first."""
+    labels = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != __name__ and (module == "__main__" or module.startswith(_STACK_MODULE_PREFIXES)):
+            labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+def _api_frame(stack):
+    """Return the outermost pyedb frame, i.e. the pyedb API the user called."""
+    for label in stack:
+        if label.startswith("pyedb."):
+            return label
+    return stack[0] if stack else "<unknown>"
+
+
+def _byte_size(message):
+    try:
+        return message.ByteSize()
+    except Exception:
+        return 0
+
+
+def _record(method, stack, elapsed, request_bytes, response_bytes):
+    for profiler in list(_active_profilers):
+        profiler._record(method, stack, elapsed, request_bytes, response_bytes)
+
+
+class _ProfiledStub:
+    """Proxy of a gRPC stub recording every method call."""
+
+    __slots__ = ("_service", "_stub")
+
+    def __init__(self, service, stub):
+        self._service = service
+        self._stub = stub
+
+    def __getattr__(self, name):
+        attribute = getattr(self._stub, name)
+        if not callable(attribute):
+            return attribute
+        method = f"{self._service}.{name}"
+
+        def call(*args, **kwargs):
+            stack = _calling_stack(sys._getframe(1))
+            request_bytes = _byte_size(args[0]) if args else 0
+            start = time.perf_counter()
+            response = attribute(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if hasattr(response, "ByteSize") or not hasattr(response, "__next__"):
+                _record(method, stack, elapsed, request_bytes, _byte_size(response))
+                return response
+            return _profiled_stream(response, method, stack, elapsed, request_bytes)
+
+        return call
+
+
+def _profiled_stream(responses, method, stack, elapsed, request_bytes):
+    response_bytes = 0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                response = next(responses)
+            except StopIteration:
+                elapsed += time.perf_counter() - start
+                return
+            elapsed += time.perf_counter() - start
+            response_bytes += _byte_size(response)
+            yield response
+    finally:
+        _record(method, stack, elapsed, request_bytes, response_bytes)
+
+
+def _profiled_stub(self, name):
+    stub = _original_stub(self, name)
+    if stub is None or not _active_profilers:
+        return stub
+    return _ProfiledStub(name, stub)
+
+
+class _MethodStats:
+    __slots__ = ("calls", "time", "max_time", "request_bytes", "response_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.max_time = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def add(self, elapsed, request_bytes, response_bytes):
+        self.calls += 1
+        self.time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+
+
+class RpcProfiler:
+    """Count, size and time the RPC calls issued while the profiler is active.
+
+    The profiler hooks the stub lookup of every ``ansys.edb.core`` session, including sessions started after
+    :meth:`start` and the servers of a :class:`~pyedb.grpc.rpc_session_pool.RpcSessionPool`. Nested and
+    concurrent profilers each record all calls. Nothing is hooked when no profiler is active.
+
+    Examples
+    --------
+    >>> with RpcProfiler() as profiler:
+    ...     primitives = edb.layout.primitives
+    >>> profiler.report()["total"]["calls"]
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, ex_type, ex_value, ex_traceback):
+        self.stop()
+
+    @property
+    def is_active(self):
+        """Whether the profiler is currently recording."""
+        return self in _active_profilers
+
+    def start(self):
+        """Start recording RPC calls.
+
+        Returns
+        -------
+        RpcProfiler
+            The profiler itself.
+        """
+        with _install_lock:
+            if self not in _active_profilers:
+                _active_profilers.append(self)
+                _Session.stub = _profiled_stub
+            self._start_time = self._start_time or time.perf_counter()
+        return self
+
+    def stop(self):
+        """Stop recording RPC calls. Collected statistics are kept."""
+        with _install_lock:
+            if self in _active_profilers:
+                _active_profilers.remove(self)
+                self._wall_time += time.perf_counter() - self._start_time
+                self._start_time = None
+            if not _active_profilers:
+                _Session.stub = _original_stub
+
+    def reset(self):
+        """Discard all collected statistics."""
+        with self._lock:
+            self._methods = defaultdict(_MethodStats)
+            self._api_methods = defaultdict(_MethodStats)
+            self._stacks = defaultdict(_MethodStats)
+            self._wall_time = 0.0
+            self._start_time = time.perf_counter() if self.is_active else None
+
+    def _record(self, method, stack, elapsed, request_bytes, response_bytes):
+        with self._lock:
+            self._methods[method].add(elapsed, request_bytes, response_bytes)
+            self._api_methods[(_api_frame(stack), method)].add(elapsed, request_bytes, response_bytes)
+            self._stacks[stack + (method,)].add(elapsed, request_bytes, response_bytes)
+
+    @property
+    def total_calls(self):
+        """Number of RPC calls recorded."""
+        with self._lock:
+            return sum(stats.calls for stats in self._methods.values())
+
+    def report(self):
+        """Build a JSON-serializable report of the recorded calls.
+
+        Returns
+        -------
+        dict
+            ``"total"`` aggregates, ``"methods"`` statistics per RPC method and ``"api"`` statistics per calling
+            pyedb API and RPC method. Lists are sorted by decreasing RPC time.
+        """
+        with self._lock:
+            methods = [
+                {
+                    "method": method,
+                    "calls": stats.calls,
+                    "time_s": stats.time,
+                    "mean_ms": 1e3 * stats.time / stats.calls,
+                    "max_ms": 1e3 * stats.max_time,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                }
+                for method, stats in self._methods.items()
+            ]
+            api = [
+                {
+                    "api": api_frame,
+                    "method": method,
+                    "calls": stats.calls,
+                    "time_s": stats.time,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                }
+                for (api_frame, method), stats in self._api_methods.items()
+            ]
+            wall_time = self._wall_time
+            if self._start_time is not None:
+                wall_time += time.perf_counter() - self._start_time
+        methods.sort(key=lambda entry: entry["time_s"], reverse=True)
+        api.sort(key=lambda entry: entry["time_s"], reverse=True)
+        return {
+            "total": {
+                "calls": sum(entry["calls"] for entry in methods),
+                "time_s": sum(entry["time_s"] for entry in methods),
+                "wall_time_s": wall_time,
+                "request_bytes": sum(entry["request_bytes"] for entry in methods),
+                "response_bytes": sum(entry["response_bytes"] for entry in methods),
+            },
+            "methods": methods,
+            "api": api,
+        }
+
+    def summary(self, top=20):
+        """Format the most expensive RPC methods and calling APIs as a text table.
+
+        Parameters
+        ----------
+        top : int, optional
+            Number of rows per table. The default is ``20``.
+
+        Returns
+        -------
+        str
+        """
+        report = self.report()
+        total = report["total"]
+        lines = [
+            f"{total['calls']} RPC calls, {total['time_s']:.3f} s in RPCs "
+            f"({total['wall_time_s']:.3f} s profiled), "
+            f"{total['request_bytes']} B sent, {total['response_bytes']} B received",
+            "",
+            f"{'calls':>8} {'time [s]':>10} {'mean [ms]':>10}  method",
+        ]
+        for entry in report["methods"][:top]:
+            lines.append(f"{entry['calls']:>8} {entry['time_s']:>10.4f} {entry['mean_ms']:>10.3f}  {entry['method']}")
+        lines += ["", f"{'calls':>8} {'time [s]':>10}  api -> method"]
+        for entry in report["api"][:top]:
+            lines.append(f"{entry['calls']:>8} {entry['time_s']:>10.4f}  {entry['api']} -> {entry['method']}")
+        return "\n".join(lines)
+
+    def collapsed_stacks(self, weight="time"):
+        """Return the recorded call stacks in the collapsed format used by flame-graph tools.
+
+        Parameters
+        ----------
+        weight : str, optional
+            ``"time"`` to weight stacks by RPC time in microseconds, ``"calls"`` by number of calls, or
+            ``"bytes"`` by transferred payload bytes. The default is ``"time"``.
+
+        Returns
+        -------
+        list of str
+            One ``frame;frame;...;rpc_method value`` line per distinct stack.
+        """
+        weights = {
+            "time": lambda stats: int(round(stats.time * 1e6)),
+            "calls": lambda stats: stats.calls,
+            "bytes": lambda stats: stats.request_bytes + stats.response_bytes,
+        }
+        if weight not in weights:
+            raise ValueError(f"weight must be one of {sorted(weights)}, not {weight!r}.")
+        with self._lock:
+            stacks = list(self._stacks.items())
+        return [f"{';'.join(stack)} {weights[weight](stats)}" for stack, stats in sorted(stacks)]
+
+    def write_json(self, path):
+        """Write :meth:`report` to a JSON file.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+
+        Returns
+        -------
+        pathlib.Path
+        """
+        path = Path(path)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        return path
+
+    def write_flamegraph(self, path, weight="time"):
+        """Write :meth:`collapsed_stacks` to a file readable by ``flamegraph.pl``, speedscope or inferno.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+        weight : str, optional
+            See :meth:`collapsed_stacks`. The default is ``"time"``.
+
+        Returns
+        -------
+        pathlib.Path
+        """
+        path = Path(path)
+        path.write_text("\n".join(self.collapsed_stacks(weight)) + "\n", encoding="utf-8")
+        return path
@@ -45,7 +45,11 @@ _IS_WINDOWS = platform.system() == "Windows"
 
 
 class RpcSession:
-    """Static Class managing RPC server."""
+    """Static Class managing RPC server.
+
+    A process uses a single server through this class. To run several databases concurrently on independent
+    servers, use :class:`pyedb.grpc.rpc_session_pool.RpcSessionPool`.
+    """
 
     pid = 0
     rpc_session = None
@@ -0,0 +1,524 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Pool of EDB RPC servers for processing several databases concurrently in one process.
+
+:class:`~pyedb.grpc.rpc_session.RpcSession` manages a single, process-wide server. The underlying
+``ansys.edb.core`` client keeps its session and IO manager in module globals, so every thread of a
+process talks to that one server. :class:`RpcSessionPool` launches ``N`` independent servers and
+binds each worker thread to one of them for the duration of a :meth:`RpcSessionPool.session` block,
+so a single orchestrator can open one board per server and keep all cores busy.
+
+Examples
+--------
+>>> from pyedb.grpc.rpc_session_pool import RpcSessionPool
+>>> def count_nets(edb):
+...     return len(edb.nets.nets)
+>>> with RpcSessionPool(size=4, edb_version="2026.1") as pool:
+...     counts = pool.map(count_nets, ["a.aedb", "b.aedb", "c.aedb", "d.aedb"])
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import os
+import socket
+import sys
+import threading
+import time
+
+from ansys.edb.core import session as _core_session
+from ansys.edb.core.utility import io_manager as _core_io_manager
+from ansys.edb.core.utility.io_manager import IOMangementType
+import psutil
+
+from pyedb.generic.general_methods import env_path, env_value, get_string_version, is_linux
+from pyedb.generic.settings import settings
+from pyedb.grpc.rpc_session import RpcSession
+from pyedb.misc.misc import list_installed_ansysem
+
+_thread_state = threading.local()
+_routing_lock = threading.Lock()
+
+
+def _bindings():
+    bindings = getattr(_thread_state, "bindings", None)
+    if bindings is None:
+        bindings = _thread_state.bindings = {}
+    return bindings
+
+
+def _route_per_thread(module, attribute):
+    """Make ``module.<attribute>`` resolve to the calling thread's binding when one is active.
+
+    Threads without a binding keep reading and writing the module-level value, so code that does not use the
+    pool, including :class:`~pyedb.grpc.rpc_session.RpcSession`, is unaffected.
+    """
+    with _routing_lock:
+        if attribute in getattr(type(module), "_pyedb_routed_attributes", ()):
+            return
+        global_key = f"_pyedb_global_{attribute}"
+        module.__dict__[global_key] = module.__dict__.pop(attribute, None)
+
+        def fget(mod):
+            bindings = _bindings()
+            if attribute in bindings:
+                return bindings[attribute]
+            return mod.__dict__[global_key]
+
+        def fset(mod, value):
+            bindings = _bindings()
+            if attribute in bindings:
+                bindings[attribute] = value
+            else:
+                mod.__dict__[global_key] = value
+
+        routed = getattr(type(module), "_pyedb_routed_attributes", frozenset()) | {attribute}
+        module.__class__ = type(
+            type(module).__name__,
+            (type(module),),
+            {attribute: property(fget, fset), "_pyedb_routed_attributes": routed},
+        )
+
+
+def _install_thread_routing():
+    _route_per_thread(_core_session.MOD, "current_session")
+    _route_per_thread(_core_io_manager.MOD, "io_manager")
+
+
+def current_server():
+    """Return the pooled server bound to the calling thread.
+
+    Returns
+    -------
+    PooledRpcServer or None
+        Server bound by :meth:`RpcSessionPool.session`, or ``None`` when the thread uses the process-wide
+        :class:`~pyedb.grpc.rpc_session.RpcSession`.
+    """
+    return _bindings().get("server")
+
+
+def _get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
+def _latest_installed_version():
+    installed = list_installed_ansysem()
+    if not installed:
+        raise RuntimeError("No ANSYSEM_ROOTxxx is found.")
+    return "20{}.{}".format(installed[0][-3:-1], installed[0][-1:])
+
+
+def _resolve_base_path(edb_version):
+    if is_linux and env_value(edb_version) not in os.environ:
+        base_path = os.getenv("PYAEDT_SERVER_AEDT_PATH")
+    else:
+        base_path = env_path(edb_version)
+    if not base_path:
+        raise RuntimeError(f"No ANSYS installation found for EDB version {edb_version}.")
+    if base_path not in sys.path:
+        sys.path.append(base_path)
+    os.environ.setdefault("ECAD_TRANSLATORS_INSTALL_DIR", base_path)
+    os.environ.setdefault("ANSYS_OADIR", os.path.join(base_path, "common", "oa"))
+    if base_path not in os.environ["PATH"].split(os.pathsep):
+        os.environ["PATH"] = os.pathsep.join([os.environ["PATH"], base_path])
+    return base_path
+
+
+class PooledRpcServer:
+    """One EDB RPC server owned by a :class:`RpcSessionPool`.
+
+    Each server has its own port, gRPC session and IO manager. Use :meth:`bind` (or
+    :meth:`RpcSessionPool.session`) to route the ``ansys.edb.core`` calls of the current thread to it.
+
+    Parameters
+    ----------
+    index : int
+        Position of the server in its pool.
+    base_path : str
+        ANSYS installation folder containing ``EDB_RPC_Server``.
+    session_factory : callable, optional
+        Factory with the ``ansys.edb.core.session._Session`` signature. The default launches a real server.
+    """
+
+    def __init__(self, index, base_path, session_factory=None):
+        self.index = index
+        self.base_path = base_path
+        self.port = 0
+        self.session = None
+        self.io_manager = None
+        self.restarts = 0
+        self.open_db_count = 0
+        self._session_factory = session_factory or _core_session._Session
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f"PooledRpcServer(index={self.index}, port={self.port}, alive={self.is_alive()})"
+
+    @property
+    def pid(self):
+        """Process ID of the server, or ``0`` when it is not running."""
+        proc = getattr(self.session, "local_server_proc", None)
+        return getattr(proc, "pid", 0) or 0
+
+    def is_alive(self):
+        """Check whether the server process is still running.
+
+        Returns
+        -------
+        bool
+        """
+        proc = getattr(self.session, "local_server_proc", None)
+        if proc is None:
+            return False
+        try:
+            return psutil.pid_exists(proc.pid) and proc.poll() is None
+        except Exception:
+            return False
+
+    @contextmanager
+    def bind(self):
+        """Route ``ansys.edb.core`` calls made by the current thread to this server."""
+        _install_thread_routing()
+        bindings = _bindings()
+        previous = dict(bindings)
+        bindings.update(server=self, current_session=self.session, io_manager=self.io_manager)
+        try:
+            yield self
+        finally:
+            bindings.clear()
+            bindings.update(previous)
+
+    def start(self):
+        """Launch the server process on a free port and connect to it."""
+        _install_thread_routing()
+        with self._lock:
+            if self.session is not None:
+                return
+            self.port = _get_free_port()
+            bindings = _bindings()
+            previous = dict(bindings)
+            # Shared-memory IPC is keyed on the client process id, so it cannot be used by several servers of
+            # one process: every pooled server uses plain gRPC.
+            bindings.update(server=self, current_session=None, io_manager=_core_io_manager._IOManager())
+            try:
+                session = self._session_factory(None, self.port, self.base_path, False)
+                bindings["current_session"] = session
+                session.connect()
+                bindings["io_manager"].start_managing(IOMangementType.READ_AND_WRITE)
+                self.session = session
+                self.io_manager = bindings["io_manager"]
+            finally:
+                bindings.clear()
+                bindings.update(previous)
+                if previous.get("server") is self and self.session is not None:
+                    # Restarted while the thread is bound to this server: route it to the new process.
+                    bindings.update(current_session=self.session, io_manager=self.io_manager)
+            self.open_db_count = 0
+            settings.logger.info(f"Pooled RPC server {self.index} started: port={self.port}, pid={self.pid}")
+
+    def stop(self):
+        """Disconnect from the server and wait for its process to exit."""
+        with self._lock:
+            if self.session is None:
+                return
+            proc = getattr(self.session, "local_server_proc", None)
+            with self.bind():
+                try:
+                    self.io_manager.end_managing()
+                except Exception as e:
+                    settings.logger.debug(f"end_managing() raised while stopping pooled server {self.index}: {e}")
+                try:
+                    self.session.disconnect()
+                except Exception as e:
+                    settings.logger.debug(f"disconnect() raised while stopping pooled server {self.index}: {e}")
+            RpcSession._wait_for_process_exit(proc, timeout=10.0)
+            self.session = None
+            self.io_manager = None
+            self.open_db_count = 0
+
+    def restart(self):
+        """Stop the server if needed and launch a fresh one.
+
+        Databases that were open on the previous process are lost.
+        """
+        with self._lock:
+            settings.logger.warning(f"Restarting pooled RPC server {self.index} (port {self.port}).")
+            self.stop()
+            self.start()
+            self.restarts += 1
+
+    def ensure_alive(self):
+        """Restart the server when its process has died.
+
+        Returns
+        -------
+        bool
+            ``True`` when a restart was needed.
+        """
+        with self._lock:
+            if self.session is not None and self.is_alive():
+                return False
+            self.restart()
+            return True
+
+    def acquire(self):
+        """Increment the count of databases open on this server."""
+        self.open_db_count += 1
+
+    def release(self):
+        """Decrement the count of databases open on this server."""
+        self.open_db_count = max(0, self.open_db_count - 1)
+
+
+class RpcSessionPool:
+    """Launch and manage several EDB RPC servers for concurrent database sessions.
+
+    Each call to :meth:`session` hands out an idle server and binds the calling thread to it, so ``Edb``
+    objects created and used inside the block run against that server only. Dead servers are restarted on
+    checkout and by :meth:`health_check`.
+
+    Parameters
+    ----------
+    size : int, optional
+        Number of servers. The default is the number of CPU cores.
+    edb_version : str, optional
+        ANSYS version used to locate ``EDB_RPC_Server``. The default is the latest installed version.
+    session_factory : callable, optional
+        Factory with the ``ansys.edb.core.session._Session`` signature. Mainly useful for testing.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> from pyedb.grpc.rpc_session_pool import RpcSessionPool
+    >>> pool = RpcSessionPool(size=2, edb_version="2026.1").start()
+    >>> with pool.session():
+    ...     edb = Edb("board.aedb", version="2026.1")
+    ...     edb.close()
+    >>> pool.close()
+    """
+
+    def __init__(self, size=None, edb_version=None, session_factory=None):
+        self.size = max(1, int(size or os.cpu_count() or 1))
+        self.edb_version = get_string_version(edb_version) if edb_version else _latest_installed_version()
+        self._session_factory = session_factory
+        self._servers = []
+        self._busy = set()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, ex_type, ex_value, ex_traceback):
+        self.close()
+
+    @property
+    def servers(self):
+        """Servers managed by the pool.
+
+        Returns
+        -------
+        list of PooledRpcServer
+        """
+        return list(self._servers)
+
+    def start(self):
+        """Launch all servers concurrently.
+
+        Returns
+        -------
+        RpcSessionPool
+            The pool itself, to allow chaining.
+        """
+        with self._condition:
+            if self._servers:
+                return self
+            self._closed = False
+            base_path = _resolve_base_path(self.edb_version)
+            self._servers = [PooledRpcServer(i, base_path, self._session_factory) for i in range(self.size)]
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            list(executor.map(lambda server: server.start(), self._servers))
+        return self
+
+    def acquire(self, timeout=None):
+        """Check out an idle server, restarting it first when its process has died.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for an idle server. The default waits forever.
+
+        Returns
+        -------
+        PooledRpcServer
+
+        Raises
+        ------
+        TimeoutError
+            When no server became idle within ``timeout``.
+        """
+        if self._closed:
+            raise RuntimeError("The RPC session pool is closed.")
+        if not self._servers:
+            self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The RPC session pool is closed.")
+                idle = [server for server in self._servers if server.index not in self._busy]
+                if idle:
+                    server = idle[0]
+                    self._busy.add(server.index)
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No idle RPC server after {timeout} s.")
+                self._condition.wait(remaining)
+        try:
+            server.ensure_alive()
+        except Exception:
+            self.release(server)
+            raise
+        return server
+
+    def release(self, server):
+        """Return a server obtained with :meth:`acquire` to the pool.
+
+        Parameters
+        ----------
+        server : PooledRpcServer
+        """
+        with self._condition:
+            self._busy.discard(server.index)
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Check out a server and bind the current thread to it for the duration of the block.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for an idle server. The default waits forever.
+
+        Yields
+        ------
+        PooledRpcServer
+        """
+        server = self.acquire(timeout=timeout)
+        try:
+            with server.bind():
+                yield server
+        finally:
+            self.release(server)
+
+    def map(self, func, edb_paths, cellname=None, isreadonly=True):
+        """Open each database on its own pooled server and apply ``func`` to it concurrently.
+
+        Parameters
+        ----------
+        func : callable
+            Function called with the opened :class:`pyedb.grpc.edb.Edb`. Its return value is collected.
+        edb_paths : iterable of str
+            Paths to ``.aedb`` folders.
+        cellname : str, optional
+            Cell to open in every database. The default is the first circuit cell.
+        isreadonly : bool, optional
+            Open the databases read-only. The default is ``True``.
+
+        Returns
+        -------
+        list
+            Results of ``func`` in the order of ``edb_paths``.
+        """
+        from pyedb.grpc.edb import Edb
+
+        def run(edb_path):
+            with self.session():
+                edb = Edb(str(edb_path), cellname=cellname, isreadonly=isreadonly, version=self.edb_version)
+                try:
+                    return func(edb)
+                finally:
+                    edb.close()
+
+        edb_paths = list(edb_paths)
+        if not self._servers:
+            self.start()
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, edb_paths))
+
+    def health_check(self):
+        """Restart every idle server whose process has died.
+
+        Returns
+        -------
+        dict
+            Server index mapped to ``True`` when the server is alive after the check.
+        """
+        with self._condition:
+            idle = [server for server in self._servers if server.index not in self._busy]
+        for server in idle:
+            try:
+                server.ensure_alive()
+            except Exception as e:
+                settings.logger.error(f"Failed to restart pooled RPC server {server.index}: {e}")
+        return {server.index: server.is_alive() for server in self._servers}
+
+    def status(self):
+        """Describe the servers of the pool.
+
+        Returns
+        -------
+        list of dict
+            One entry per server with its index, port, pid, liveness, busy state, open database count and number
+            of restarts.
+        """
+        with self._condition:
+            busy = set(self._busy)
+        return [
+            {
+                "index": server.index,
+                "port": server.port,
+                "pid": server.pid,
+                "alive": server.is_alive(),
+                "busy": server.index in busy,
+                "open_databases": server.open_db_count,
+                "restarts": server.restarts,
+            }
+            for server in self._servers
+        ]
+
+    def close(self):
+        """Stop all servers of the pool."""
+        with self._condition:
+            self._closed = True
+            servers, self._servers = self._servers, []
+            self._busy.clear()
+            self._condition.notify_all()
+        for server in servers:
+            server.stop()
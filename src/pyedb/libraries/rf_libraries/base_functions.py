@@ -25,12 +25,39 @@ from __future__ import annotations
 import math
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
+import numpy as np
+
 if TYPE_CHECKING:
     from pyedb import Edb
 
 from pyedb.libraries.common import Substrate
 
 
+def _polygon_area(points: np.ndarray) -> float:
+    """Return the area of a polygon with the shoelace formula."""
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))))
+
+
+def _clip_to_box(points: np.ndarray, xmin: float, ymin: float, xmax: float, ymax: float) -> np.ndarray:
+    """Clip a convex polygon to a rectangle with the Sutherland-Hodgman algorithm."""
+    for axis, bound, keep_below in ((0, xmin, False), (0, xmax, True), (1, ymin, False), (1, ymax, True)):
+        if not len(points):
+            break
+        side = points[:, axis] - bound
+        inside = side <= 0 if keep_below else side >= 0
+        clipped = []
+        for i in range(len(points)):
+            j = (i + 1) % len(points)
+            if inside[i]:
+                clipped.append(points[i])
+            if inside[i] != inside[j]:
+                t = side[i] / (side[i] - side[j])
+                clipped.append(points[i] + t * (points[j] - points[i]))
+        points = np.array(clipped).reshape(-1, 2)
+    return points
+
+
 class HatchGround:
     """
     Create a rectangular demo board whose ground layer is filled with an
@@ -106,76 +133,75 @@ class HatchGround:
         """
         Return the **actual** copper fill ratio in percent.
 
+        The ratio is computed from the hatch geometry, so it is exact and
+        does not require querying the layout.
+
         Returns
         -------
         float
             Percentage of the board area that is copper after the hatch
             has been generated.
         """
-        cu_area = self._edb.modeler.polygons[0].area()
-        return 100.0 * cu_area / (self.ground_length * self.ground_width)
-
-    def _generate_hatch(self) -> None:
-        """Draw orthogonal stripes, then punch gaps for the requested fill."""
-        # ---------- horizontal bars ----------
-        y = 0.0
+        board_area = self.ground_length * self.ground_width
+        voids = self._hatch_voids()
+        void_area = sum(_polygon_area(void) for void in voids)
+        return 100.0 * (board_area - void_area) / board_area
+
+    def _hatch_voids(self) -> List[np.ndarray]:
+        """Return the hatch cells clipped to the board as ``(N, 2)`` vertex arrays.
+
+        The hatch is a grid of orthogonal bars of width ``width`` repeated every
+        ``pitch``. Its voids are the square cells between consecutive bars. The
+        grid covers a square large enough to fill the board once rotated by
+        ``angle`` around its centre.
+        """
         self.board_size = max(self.ground_width, self.ground_length)
-        rectified_size = self.board_size + self.board_size * (math.sin(self.angle * math.pi / 180))
-        while y < rectified_size:
-            self._add_stripe(0.0, y, rectified_size, y + self.width)
-            y += self.pitch
-
-        # ---------- vertical bars ------------
-        x = 0.0
-        while x < rectified_size:
-            self._add_stripe(x, 0.0, x + self.width, rectified_size)
-            x += self.pitch
-
-        # ---------- punch square gaps --------
-        gaps: List[List[Tuple[float, float]]] = []
-        x = 0.0
-        while x < rectified_size:
-            y = 0.0
-            while y < rectified_size:
-                gaps.append(
-                    [
-                        (x, y),
-                        (x + self.width, y),
-                        (x + self.width, y + self.width),
-                        (x, y + self.width),
-                        (x, y),
-                    ]
-                )
-                y += self.pitch
-            x += self.pitch
-        polygons = self._edb.modeler.polygons
-        grid = polygons[0].unite(polygons[1:])[0]
+        rectified_size = self.board_size + self.board_size * abs(math.sin(math.radians(self.angle)))
+        bars = np.arange(math.ceil(rectified_size / self.pitch)) * self.pitch
+        if len(bars) < 2 or self.pitch <= self.width:
+            return []
+        starts = bars[:-1] + self.width
+        ends = bars[1:]
+        x0, y0 = (grid.ravel() for grid in np.meshgrid(starts, starts, indexing="ij"))
+        x1, y1 = (grid.ravel() for grid in np.meshgrid(ends, ends, indexing="ij"))
+        cells = np.stack(
+            [np.stack([x0, y0], -1), np.stack([x1, y0], -1), np.stack([x1, y1], -1), np.stack([x0, y1], -1)], axis=1
+        )
+        center = rectified_size / 2
         if self.angle:
-            grid.rotate(self.angle, center=[rectified_size / 2, rectified_size / 2])
-            grid.move(vector=[-(rectified_size - self.board_size) / 2, -(rectified_size - self.board_size) / 2])
-            for void in grid.voids:
-                void.rotate(self.angle, center=[rectified_size / 2, rectified_size / 2])
-                void.move(vector=[-(rectified_size - self.board_size) / 2, -(rectified_size - self.board_size) / 2])
-        board_outline = [
-            [0, 0],
-            [self.ground_width, 0],
-            [self.ground_width, self.ground_length],
-            [0, self.ground_length],
-        ]
-        hatched_plan = self._edb.modeler.create_polygon(board_outline, layer_name=self.layer_gnd, net_name="GND")
-        hatch_polygon_data = hatched_plan.polygon_data
-        for void in grid.voids:
-            if hatch_polygon_data.is_inside(void.center):
-                hatched_plan.add_void(void)
-        grid.delete()
+            cos, sin = math.cos(math.radians(self.angle)), math.sin(math.radians(self.angle))
+            cells = (cells - center) @ np.array([[cos, sin], [-sin, cos]]) + center
+        cells -= (rectified_size - self.board_size) / 2
+
+        # Cells inside the board are kept as they are, the ones across its edges are clipped.
+        lower = cells.min(axis=1)
+        upper = cells.max(axis=1)
+        board = np.array([self.ground_width, self.ground_length])
+        inside = np.all((lower >= 0) & (upper <= board), axis=1)
+        crossing = ~inside & np.all((upper > 0) & (lower < board), axis=1)
+        voids = list(cells[inside])
+        for cell in cells[crossing]:
+            clipped = _clip_to_box(cell, 0.0, 0.0, self.ground_width, self.ground_length)
+            if len(clipped) >= 3 and _polygon_area(clipped) > 0:
+                voids.append(clipped)
+        return voids
+
+    def _generate_hatch(self) -> None:
+        """Create the board outline with all hatch cells as voids in a single polygon."""
+        board_outline = np.array(
+            [
+                [0.0, 0.0],
+                [self.ground_width, 0.0],
+                [self.ground_width, self.ground_length],
+                [0.0, self.ground_length],
+            ]
+        )
+        self._edb.modeler.create_polygon(
+            board_outline, layer_name=self.layer_gnd, voids=self._hatch_voids(), net_name="GND"
+        )
         if self._edb.grpc:
             self._edb.modeler.clear_cache()  # ->caching will be removed soon
 
-    def _add_stripe(self, x0: float, y0: float, x1: float, y1: float) -> None:
-        """Create one rectangular copper bar on the GND layer."""
-        points = [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
-        self._edb.modeler.create_polygon(points, layer_name=self.layer_gnd, net_name="GND")
-
     def create(self) -> bool:
         """
         Generate the stack-up, board outline and hatch pattern.
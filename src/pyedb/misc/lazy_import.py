@@ -0,0 +1,77 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Lazy attribute loading for PyEDB packages.
+
+Packages use :func:`attach` to expose public names without importing the modules that define them. The defining
+module is imported on first attribute access, following `PEP 562 <https://peps.python.org/pep-0562/>`_.
+"""
+
+import importlib
+
+
+def attach(package_name: str, attributes: dict[str, str] | None = None, submodules: list[str] | tuple = ()):
+    """Build the module-level ``__getattr__``, ``__dir__`` and ``__all__`` of a lazily loaded package.
+
+    Parameters
+    ----------
+    package_name : str
+        Name of the package, usually ``__name__``.
+    attributes : dict, optional
+        Mapping of the public attribute name to the module defining it. A module may be given relative to the
+        package, for example ``".cfg_data"``. The attribute is looked up with the same name in that module unless
+        the module is written ``"module:attribute"``.
+    submodules : list or tuple, optional
+        Names of subpackages or modules that are imported on attribute access.
+
+    Returns
+    -------
+    tuple
+        ``(__getattr__, __dir__, __all__)`` to assign in the package namespace.
+
+    Examples
+    --------
+    >>> from pyedb.misc.lazy_import import attach
+    >>> __getattr__, __dir__, __all__ = attach(__name__, {"CfgData": ".cfg_data"})
+    """
+    attributes = dict(attributes or {})
+    submodules = set(submodules)
+    package = importlib.import_module(package_name)
+
+    def _getattr(name):
+        if name in submodules:
+            value = importlib.import_module(f"{package_name}.{name}")
+        elif name in attributes:
+            module_name, _, attribute = attributes[name].partition(":")
+            module = importlib.import_module(module_name, package_name)
+            value = getattr(module, attribute or name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        # Cache the attribute so that the next access does not go through this hook.
+        setattr(package, name, value)
+        return value
+
+    def _dir():
+        return sorted(set(vars(package)) | set(attributes) | submodules)
+
+    return _getattr, _dir, sorted(set(attributes) | submodules)
@@ -19,3 +19,22 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+
+"""PyEDB workflows.
+
+Workflows are loaded on first access so that importing PyEDB does not pay for them.
+"""
+
+from pyedb.misc.lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "Drc": ".drc.drc",
+        "HFSSAutoConfiguration": ".sipi.hfss_auto_configuration",
+        "Cutout": ".utilities.cutout",
+        "HFSSLogParser": ".utilities.hfss_log_parser",
+        "SiwaveLogParser": ".utilities.siwave_log_parser",
+    },
+    submodules=["drc", "sipi", "utilities"],
+)
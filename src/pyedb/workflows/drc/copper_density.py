@@ -0,0 +1,298 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Windowed copper density maps for copper balance checks.
+
+The copper of each layer is rasterized into a boolean coverage grid, sampled at the pixel centres. Each primitive is
+filled with the even-odd rule, so its voids are subtracted, and primitives are merged with a logical OR, so overlaps
+are counted once. Densities are then computed over sliding windows with a summed-area table.
+
+Examples
+--------
+>>> import numpy as np
+>>> board = np.array([[0, 0], [10e-3, 0], [10e-3, 10e-3], [0, 10e-3]])
+>>> plane = (board * 0.5, [board * 0.1 + 1e-3])
+>>> maps = copper_density({"TOP": [plane]}, board, resolution=50e-6, window=2e-3)
+>>> maps["TOP"].min_density, maps["TOP"].max_density
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Polygon = Tuple[np.ndarray, Sequence[np.ndarray]]
+"""Outline of a primitive and the outlines of its voids, as ``(N, 2)`` vertex arrays in meters."""
+
+
+@dataclass
+class DensityMap:
+    """Copper density of one layer."""
+
+    layer: str
+    density: float
+    """Copper fraction of the board area."""
+    heatmap: np.ndarray
+    """Copper fraction of each window, ``NaN`` where the window is mostly outside the board."""
+    window_x: np.ndarray
+    """Lower-left X coordinate of the window columns."""
+    window_y: np.ndarray
+    """Lower-left Y coordinate of the window rows."""
+    window: float
+    """Window size in meters."""
+    zones: Dict[str, Tuple[float, float, float]] = field(default_factory=dict)
+    """Copper fraction, minimum and maximum window densities of each zone."""
+
+    @property
+    def min_density(self) -> float:
+        """Minimum window density."""
+        return float(np.nanmin(self.heatmap)) if np.isfinite(self.heatmap).any() else float("nan")
+
+    @property
+    def max_density(self) -> float:
+        """Maximum window density."""
+        return float(np.nanmax(self.heatmap)) if np.isfinite(self.heatmap).any() else float("nan")
+
+    def windows_outside(
+        self, minimum: float = 0.0, maximum: float = 1.0
+    ) -> List[Tuple[float, float, float, float, float]]:
+        """Return the windows whose density is outside ``[minimum, maximum]``.
+
+        Parameters
+        ----------
+        minimum : float, optional
+            Minimum copper fraction. The default is ``0``.
+        maximum : float, optional
+            Maximum copper fraction. The default is ``1``.
+
+        Returns
+        -------
+        list[tuple[float, float, float, float, float]]
+            ``(x_min, y_min, x_max, y_max, density)`` of each window.
+        """
+        with np.errstate(invalid="ignore"):
+            rows, columns = np.nonzero((self.heatmap < minimum) | (self.heatmap > maximum))
+        return [
+            (
+                float(self.window_x[column]),
+                float(self.window_y[row]),
+                float(self.window_x[column] + self.window),
+                float(self.window_y[row] + self.window),
+                float(self.heatmap[row, column]),
+            )
+            for row, column in zip(rows, columns)
+        ]
+
+
+def _grid_shape(bounds, resolution):
+    x_min, y_min, x_max, y_max = bounds
+    return max(1, int(np.ceil((y_max - y_min) / resolution))), max(1, int(np.ceil((x_max - x_min) / resolution)))
+
+
+def _signed_area(ring: np.ndarray, next_ring: np.ndarray) -> float:
+    return 0.5 * float(np.dot(ring[:, 0], next_ring[:, 1]) - np.dot(ring[:, 1], next_ring[:, 0]))
+
+
+def rasterize(polygons: Sequence[Polygon], bounds, resolution: float) -> np.ndarray:
+    """Rasterize polygons with voids into a boolean coverage grid.
+
+    Outlines are oriented to wind once around their inside and voids to wind the opposite way, so that the winding
+    number of a pixel centre is the number of primitives covering it. Each edge adds its winding to the pixels right
+    of where it crosses a row of pixel centres, and a cumulative sum along the rows gives the winding numbers of all
+    primitives at once.
+
+    Parameters
+    ----------
+    polygons : sequence of tuple
+        ``(outline, voids)`` of each primitive, as ``(N, 2)`` vertex arrays in meters.
+    bounds : sequence of float
+        ``(x_min, y_min, x_max, y_max)`` of the grid.
+    resolution : float
+        Pixel size in meters.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(rows, columns)`` grid, ``True`` where the pixel centre is covered. Row ``0`` is at ``y_min``.
+    """
+    rows, columns = _grid_shape(bounds, resolution)
+    starts, ends = [], []
+    for outline, voids in polygons:
+        for index, ring in enumerate([outline, *voids]):
+            ring = np.asarray(ring, dtype=np.float64).reshape(-1, 2)
+            if len(ring) < 3:
+                continue
+            next_ring = np.concatenate((ring[1:], ring[:1]))
+            # Outlines wind clockwise and voids counterclockwise.
+            if (_signed_area(ring, next_ring) > 0) == (index == 0):
+                ring, next_ring = next_ring, ring
+            starts.append(ring)
+            ends.append(next_ring)
+    if not starts:
+        return np.zeros((rows, columns), dtype=bool)
+    starts = np.concatenate(starts)
+    ends = np.concatenate(ends)
+    # Pixel centre coordinates, in pixel units.
+    y_start = (starts[:, 1] - bounds[1]) / resolution - 0.5
+    y_end = (ends[:, 1] - bounds[1]) / resolution - 0.5
+    first_row = np.clip(np.ceil(np.minimum(y_start, y_end)), 0, rows).astype(np.int64)
+    counts = np.clip(np.ceil(np.maximum(y_start, y_end)), 0, rows).astype(np.int64) - first_row
+    crossing = counts > 0
+    counts = counts[crossing]
+    edge = np.repeat(np.nonzero(crossing)[0], counts)
+    row = (
+        np.repeat(first_row[crossing], counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    )
+    t = (row - y_start[edge]) / (y_end[edge] - y_start[edge])
+    x = (starts[edge, 0] + t * (ends[edge, 0] - starts[edge, 0]) - bounds[0]) / resolution - 0.5
+    column = np.clip(np.ceil(x), 0, columns).astype(np.int64)
+    winding = np.where(y_end[edge] > y_start[edge], 1.0, -1.0)
+    toggles = np.bincount(row * (columns + 1) + column, weights=winding, minlength=rows * (columns + 1))
+    toggles = toggles.astype(np.int32).reshape(rows, columns + 1)[:, :-1]
+    return np.cumsum(toggles, axis=1, dtype=np.int32) > 0
+
+
+def window_density(
+    coverage: np.ndarray, board: np.ndarray, window: int, step: int, min_board_fraction: float = 0.5
+) -> np.ndarray:
+    """Return the copper fraction of the board pixels in each window.
+
+    Parameters
+    ----------
+    coverage : numpy.ndarray
+        Boolean copper coverage grid.
+    board : numpy.ndarray
+        Boolean board coverage grid of the same shape.
+    window : int
+        Window size in pixels.
+    step : int
+        Distance between windows in pixels.
+    min_board_fraction : float, optional
+        Windows with a smaller fraction of board pixels are set to ``NaN``. The default is ``0.5``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(window rows, window columns)`` densities.
+    """
+    window = max(1, min(window, *coverage.shape))
+
+    def window_sums(grid):
+        table = np.zeros((grid.shape[0] + 1, grid.shape[1] + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(grid, axis=0, dtype=np.int32), axis=1, out=table[1:, 1:])
+        rows = np.arange(0, grid.shape[0] - window + 1, step)
+        columns = np.arange(0, grid.shape[1] - window + 1, step)
+        r0, c0 = np.meshgrid(rows, columns, indexing="ij")
+        return table[r0 + window, c0 + window] - table[r0, c0 + window] - table[r0 + window, c0] + table[r0, c0]
+
+    copper = window_sums(coverage & board)
+    board_pixels = window_sums(board)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        density = copper / board_pixels
+    density[board_pixels < min_board_fraction * window * window] = np.nan
+    return density
+
+
+def copper_density(
+    layers: Dict[str, Sequence[Polygon]],
+    outline: np.ndarray,
+    resolution: float,
+    window: float,
+    step: Optional[float] = None,
+    zones: Optional[Dict[str, np.ndarray]] = None,
+    num_threads: int = 1,
+) -> Dict[str, DensityMap]:
+    """Compute the windowed copper density of several layers.
+
+    Parameters
+    ----------
+    layers : dict
+        Layer names with the ``(outline, voids)`` polygons of their copper primitives.
+    outline : numpy.ndarray
+        ``(N, 2)`` board outline in meters.
+    resolution : float
+        Pixel size in meters.
+    window : float
+        Window size in meters.
+    step : float, optional
+        Distance between windows in meters. The default is half the window.
+    zones : dict, optional
+        Zone names with their ``(N, 2)`` outlines. Window densities are reported for the windows whose centre is in
+        the zone.
+    num_threads : int, optional
+        Number of layers processed in parallel. The default is ``1``.
+
+    Returns
+    -------
+    dict[str, DensityMap]
+    """
+    outline = np.asarray(outline, dtype=np.float64)
+    bounds = (*outline.min(axis=0), *outline.max(axis=0))
+    board = rasterize([(outline, [])], bounds, resolution)
+    window_pixels = max(1, int(round(window / resolution)))
+    step_pixels = max(1, int(round((step if step else window / 2) / resolution)))
+    rows = np.arange(0, board.shape[0] - min(window_pixels, *board.shape) + 1, step_pixels)
+    columns = np.arange(0, board.shape[1] - min(window_pixels, *board.shape) + 1, step_pixels)
+    window_x = bounds[0] + columns * resolution
+    window_y = bounds[1] + rows * resolution
+    # Zone membership of the window centres.
+    zone_masks = {}
+    for name, zone in (zones or {}).items():
+        zone_grid = rasterize([(zone, [])], bounds, resolution)
+        centre = min(window_pixels, *board.shape) // 2
+        zone_masks[name] = (zone_grid, zone_grid[np.ix_(rows + centre, columns + centre)])
+    board_pixels = int(board.sum())
+
+    def density_map(item):
+        name, polygons = item
+        coverage = rasterize(polygons, bounds, resolution) & board
+        heatmap = window_density(coverage, board, window_pixels, step_pixels)
+        zone_densities = {}
+        for zone_name, (zone_grid, zone_windows) in zone_masks.items():
+            zone_board = zone_grid & board
+            zone_heatmap = heatmap[zone_windows]
+            finite = zone_heatmap[np.isfinite(zone_heatmap)]
+            zone_densities[zone_name] = (
+                float((coverage & zone_board).sum() / max(1, zone_board.sum())),
+                float(finite.min()) if len(finite) else float("nan"),
+                float(finite.max()) if len(finite) else float("nan"),
+            )
+        return DensityMap(
+            layer=name,
+            density=float(coverage.sum() / max(1, board_pixels)),
+            heatmap=heatmap,
+            window_x=window_x,
+            window_y=window_y,
+            window=window_pixels * resolution,
+            zones=zone_densities,
+        )
+
+    if num_threads > 1 and len(layers) > 1:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            maps = list(executor.map(density_map, layers.items()))
+    else:
+        maps = [density_map(item) for item in layers.items()]
+    return {density.layer: density for density in maps}
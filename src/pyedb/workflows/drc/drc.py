@@ -31,7 +31,7 @@ The DRC engine features:
 - Multi-threaded rule checking using ThreadPoolExecutor
 - R-tree spatial indexing for fast geometry queries
 - Impedance checks via analytical formulas (Wheeler, Cohn, Hammerstad-Jensen)
-- Copper balance verification by layer or zone polygons
+- Copper balance verification by layer, zone polygons or sliding windows
 - Back-drill stub and depth verification
 - IPC-D-356A netlist export with DRC annotations
 
@@ -68,13 +68,13 @@ from __future__ import annotations
 from collections import defaultdict
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
-import datetime
 import itertools
 import os
 from queue import Queue
 from typing import Any, Set
 import warnings
 
+import numpy as np
 from pydantic import BaseModel
 
 try:
@@ -88,6 +88,11 @@ except ImportError:
 
 import pyedb
 from pyedb.generic.geometry_operators import GeometryOperators
+from pyedb.generic.net_name_index import NetNameIndex
+from pyedb.workflows.drc.copper_density import DensityMap, copper_density
+from pyedb.workflows.drc.ipc356 import extract_test_points, write_ipc356a
+from pyedb.workflows.drc.net_length import NetLengthEngine
+from pyedb.workflows.drc.violations import ViolationStore
 
 
 class MinLineWidth(BaseModel):
@@ -247,7 +252,9 @@ class CopperBalance(BaseModel):
     """Copper density balance constraint.
 
     This rule validates that copper distribution across layers stays within
-    acceptable balance limits to prevent warping during fabrication.
+    acceptable balance limits to prevent warping during fabrication. The
+    imbalance is the deviation of the copper density from 50 %. When a window
+    is given, the density is also checked locally in sliding windows.
 
     Attributes
     ----------
@@ -256,11 +263,21 @@ class CopperBalance(BaseModel):
     max_percent : int
         Maximum allowed imbalance percentage (e.g., ``15`` for 15%).
     layers : list of str
-        Layer names to check for balance.
+        Layer names to check for balance. An empty list checks every layer,
+        names without primitives in the layout are skipped with a warning.
+    window : str or None
+        Size of the sliding windows with unit (e.g., ``"5mm"``). The default
+        is ``None``, in which case only whole layers and zones are checked.
+    resolution : str
+        Pixel size of the copper density maps with unit. The default is
+        ``"0.1mm"``.
+    zones : dict of str to list of list of float
+        Zone names with their outline points in meters. Each zone is checked
+        separately.
 
     Examples
     --------
-    >>> rule = CopperBalance(name="top_balance", max_percent=10, layers=["TOP"])
+    >>> rule = CopperBalance(name="top_balance", max_percent=10, layers=["TOP"], window="5mm")
     >>> rule.max_percent
     10
     """
@@ -268,6 +285,9 @@ class CopperBalance(BaseModel):
     name: str
     max_percent: int
     layers: list[str]
+    window: str | None = None
+    resolution: str = "0.1mm"
+    zones: dict[str, list[list[float]]] = {}
 
 
 class Rules(BaseModel):
@@ -519,6 +539,9 @@ class Rules(BaseModel):
         name: str,
         max_percent: int,
         layers: list[str],
+        window: str | None = None,
+        resolution: str = "0.1mm",
+        zones: dict[str, list[list[float]]] | None = None,
     ) -> "Rules":
         """Append a copper density balance rule.
 
@@ -530,6 +553,15 @@ class Rules(BaseModel):
             Maximum allowed imbalance percentage (e.g., ``15`` for 15%).
         layers : list of str
             Layer names to check for balance.
+        window : str or None, optional
+            Size of the sliding windows with unit. The default is ``None``,
+            in which case the density is not checked locally.
+        resolution : str, optional
+            Pixel size of the copper density maps with unit. The default is
+            ``"0.1mm"``.
+        zones : dict or None, optional
+            Zone names with their outline points in meters. The default is
+            ``None``.
 
         Returns
         -------
@@ -542,7 +574,16 @@ class Rules(BaseModel):
         >>> rules.copper_balance[0].max_percent
         10
         """
-        self.copper_balance.append(CopperBalance(name=name, max_percent=max_percent, layers=layers))
+        self.copper_balance.append(
+            CopperBalance(
+                name=name,
+                max_percent=max_percent,
+                layers=layers,
+                window=window,
+                resolution=resolution,
+                zones=zones or {},
+            )
+        )
         return self
 
 
@@ -562,14 +603,18 @@ class Drc:
     ----------
     edb : pyedb.Edb
         Reference to the EDB instance.
-    violations : list of dict
-        List of violation dictionaries populated by ``check()``.
+    violations : ViolationStore
+        Violations populated by ``check()``, read back as dictionaries.
     idx_primitives : rtree.index.Index
         R-tree spatial index for primitive geometries.
     idx_vias : rtree.index.Index
         R-tree spatial index for via locations.
     idx_components : rtree.index.Index
         R-tree spatial index for component bounding boxes.
+    copper_density_maps : dict of str to DensityMap
+        Copper density maps of the layers checked by copper balance rules.
+    net_lengths : NetLengthEngine
+        Routed net lengths, cached across the rules of a check.
 
     Examples
     --------
@@ -597,7 +642,9 @@ class Drc:
             Active EDB session that must already be open.
         """
         self.edb = edb
-        self.violations: list[dict[str, Any]] = []
+        self.violations = ViolationStore()
+        self.copper_density_maps: dict[str, DensityMap] = {}
+        self.net_lengths = NetLengthEngine(edb)
         self._build_spatial_index()
 
     # Spatial index (R-tree)
@@ -619,8 +666,8 @@ class Drc:
         for i, comp in enumerate(self.edb.components.instances.values()):
             self.idx_components.insert(i, comp.bounding_box)
 
-    def check(self, rules: Rules) -> list[dict[str, Any]]:
-        """Run all rules and return a list of violations.
+    def check(self, rules: Rules) -> ViolationStore:
+        """Run all rules and return the violations.
 
         This method dispatches each rule to its appropriate handler and
         collects all violations. Successive calls overwrite previous results.
@@ -632,11 +679,12 @@ class Drc:
 
         Returns
         -------
-        list of dict
-            Each dictionary describes a single violation with keys:
+        ViolationStore
+            Violations, read back as dictionaries with keys:
 
             - ``rule`` : Rule type (e.g., ``"minLineWidth"``)
-            - ``limit_um`` : Limit value in micrometers
+            - ``limit_um`` : Limit value in meters
+            - ``bbox`` : Location of the violation, when known
             - Additional rule-specific keys (``layer``, ``net1``, ``primitive``, etc.)
 
         Examples
@@ -648,6 +696,8 @@ class Drc:
         ...     print(f"{v['rule']}: {v}")
         """
         self.violations.clear()
+        self.copper_density_maps.clear()
+        self.net_lengths.clear_cache()
 
         # Iterate through each rule in the Rules object
         for rule_group in rules.model_fields:
@@ -701,7 +751,9 @@ class Drc:
             if lyr in primitives:
                 for prim in primitives[lyr]:
                     if prim.primitive_type == "path":
-                        path_data.append({"layer": lyr, "id": prim.id, "width": prim.width})
+                        width = prim.width
+                        bbox = prim.bbox if width < lim else None
+                        path_data.append({"layer": lyr, "id": prim.id, "width": width, "bbox": bbox})
 
         # === STEP 2: Worker function ===
         def check_path(path_entry):
@@ -710,8 +762,9 @@ class Drc:
                     "rule": "minLineWidth",
                     "layer": path_entry["layer"],
                     "primitive": path_entry["id"],
-                    "value_um": path_entry["width"] * 1e-6,
-                    "limit_um": rule.value,
+                    "value_um": path_entry["width"],
+                    "limit_um": lim,
+                    "bbox": path_entry["bbox"],
                 }
             return None
 
@@ -727,6 +780,11 @@ class Drc:
         # === STEP 4: Store results ===
         self.violations.extend(violations)
 
+    def _net_name_index(self) -> NetNameIndex:
+        """Return the net-name index used to expand the net names and wildcard patterns of the rules."""
+        index = getattr(self.edb.nets, "name_index", None)
+        return index if index is not None else NetNameIndex(self.edb.nets.nets)
+
     def _rule_min_clearance(
         self, rule: MinClearance, max_workers: int = None, chunked_precompute: bool = False, chunk_size: int = 5000
     ):
@@ -763,8 +821,9 @@ class Drc:
 
         gap = self.edb.value(rule.value)
         net1, net2 = rule.net1, rule.net2
-        nets1 = [net1] if net1 != "*" else list(self.edb.nets.nets.keys())
-        nets2 = [net2] if net2 != "*" else list(self.edb.nets.nets.keys())
+        net_names = self._net_name_index()
+        nets1 = net_names.select(net1)
+        nets2 = net_names.select(net2)
         all_nets = sorted(set(nets1 + nets2))
 
         # === LAYER 1: single-threaded EDB extraction ===
@@ -849,15 +908,23 @@ class Drc:
                         # GeometryOperators.smallest_distance_between_polygons is CPU-bound and thread-safe
                         d = GeometryOperators.smallest_distance_between_polygons(polygon1=p1, polygon2=p2)
                         if 0 < d < gap:
+                            b1, b2 = prim_bboxes[pid], prim_bboxes[id_]
                             results_q.put(
                                 {
                                     "rule": "minClearance",
                                     "net1": n1,
                                     "net2": n2,
+                                    "layer": layer,
                                     "primitive1": pid,
                                     "primitive2": id_,
                                     "distance_um": d,
                                     "limit_um": gap,
+                                    "bbox": (
+                                        min(b1[0], b2[0]),
+                                        min(b1[1], b2[1]),
+                                        max(b1[2], b2[2]),
+                                        max(b1[3], b2[3]),
+                                    ),
                                 }
                             )
 
@@ -871,26 +938,62 @@ class Drc:
                 f.result()  # re-raise exceptions if any
 
         # Collect results
-        violations = []
         while not results_q.empty():
-            violations.append(results_q.get())
+            self.violations.append(results_q.get())
 
-        self.violations = violations
+    def _padstack_instance_table(self) -> dict[str, np.ndarray]:
+        """Read the padstack instances once and number their definition and layer range combinations.
+
+        Returns
+        -------
+        dict of str to numpy.ndarray
+            ``instances`` and their ``names``, ``group`` index of each instance, and ``definitions``,
+            ``start_layers`` and ``stop_layers`` of each group.
+        """
+        instances, names, group, groups = [], [], [], {}
+        for via in self.edb.layout.padstack_instances:
+            instances.append(via)
+            names.append(via.name)
+            key = (via.padstack_definition, via.start_layer, via.stop_layer)
+            group.append(groups.setdefault(key, len(groups)))
+        keys = np.array(list(groups), dtype=object).reshape(-1, 3)
+        return {
+            "instances": instances,
+            "names": np.array(names, dtype=object),
+            "group": np.array(group, dtype=np.int64),
+            "definitions": keys[:, 0],
+            "start_layers": keys[:, 1],
+            "stop_layers": keys[:, 2],
+        }
+
+    def _layer_span(self, start: str, stop: str) -> list[str]:
+        """Return the signal layers from ``start`` to ``stop``, both included, in stackup order."""
+        order = list(self.edb.stackup.signal_layers)
+        if start not in order or stop not in order:
+            return [layer for layer in (start, stop) if layer in order]
+        first, last = sorted((order.index(start), order.index(stop)))
+        return order[first : last + 1]
+
+    @staticmethod
+    def _pad_size(pad) -> float | None:
+        """Return the smallest width of a circle, square, rectangle, oval or bullet pad."""
+        geometry_type = int(pad.geometry_type)
+        params = pad.parameters_values
+        if not params or geometry_type not in (1, 2, 3, 4, 5):
+            return None
+        return float(min(params[: 1 if geometry_type in (1, 2) else 2]))
 
-    def _rule_min_annular_ring(self, rule: MinAnnularRing, max_workers: int = None):
+    def _rule_min_annular_ring(self, rule: MinAnnularRing):
         """Check minimum annular ring for drilled padstacks.
 
-        This thread-safe check validates that copper rings around drilled holes
-        meet minimum width requirements. Automatically skips padstacks without
-        holes (non-drilled).
+        Rings only depend on the padstack definition and on the layer range of an instance, so they are computed
+        once per definition and layer range, on every layer of the range, and broadcast to the instances. Padstacks
+        without holes (non-drilled) and pads without a simple shape are skipped.
 
         Parameters
         ----------
         rule : MinAnnularRing
             Rule configuration with minimum ring width constraint.
-        max_workers : int or None, optional
-            Number of worker threads. If ``None``, uses CPU count minus 1.
-            The default is ``None``.
 
         Examples
         --------
@@ -899,112 +1002,162 @@ class Drc:
         >>> len(drc.violations)
         2
         """
-        # === Determine optimal worker count ===
-        if max_workers is None:
-            total_cores = os.cpu_count() or 4
-            max_workers = max(1, total_cores - 1)
-
         lim = self.edb.value(rule.value)
-
-        # === STEP 1: Extract all EDB data in single-thread ===
-        padstacks_definitions = self.edb.padstacks.definitions
-        via_data = []
-        for via in self.edb.layout.padstack_instances:
-            if not via.padstack_definition in padstacks_definitions:
+        table = self._padstack_instance_table()
+        definitions = self.edb.padstacks.definitions
+
+        group_rings = np.full(len(table["definitions"]), np.inf)
+        group_layers = [[] for _ in table["definitions"]]
+        for i, (name, start, stop) in enumerate(zip(table["definitions"], table["start_layers"], table["stop_layers"])):
+            definition = definitions.get(name)
+            if definition is None:
                 continue
-            via_def = padstacks_definitions[via.padstack_definition]
-
-            # Skip if no hole properties (non-drilled padstack)
-            if self.edb.grpc:
-                if not via_def.hole_diameter:
-                    continue
-            else:
-                if not via_def.hole_properties:
-                    continue
-
-            # Some padstacks may not have pad shapes either
-            if not via_def.pad_by_layer:
+            hole = definition.hole_diameter
+            if not hole:
                 continue
+            hole = float(hole)
+            pads = definition.pad_by_layer or {}
+            rings = {}
+            for layer in self._layer_span(start, stop):
+                size = self._pad_size(pads[layer]) if layer in pads else None
+                if size is not None:
+                    rings[layer] = (size - hole) / 2
+            if rings:
+                group_rings[i] = min(rings.values())
+                group_layers[i] = [layer for layer, ring in rings.items() if ring < lim]
+
+        rings = group_rings[table["group"]]
+        for i in np.flatnonzero(rings < lim):
+            layers = group_layers[table["group"][i]]
+            self.violations.append(
+                {
+                    "rule": "minAnnularRing",
+                    "via": table["names"][i],
+                    "layers": layers,
+                    "ring_um": float(rings[i]),
+                    "limit_um": lim,
+                    "bbox": tuple(table["instances"][i].position),
+                }
+            )
 
-            first_pad = next(iter(via_def.pad_by_layer.values()))
-            od = first_pad.parameters_values[0]
-            if self.edb.grpc:
-                id_ = via_def.id
-            else:
-                id_ = via_def.hole_properties[0]
-            via_data.append({"via_name": via.name, "od": od, "id": id_})
-
-        # === STEP 2: Multi-threaded computation ===
-        results_queue = Queue()
-
-        def check_via(via_entry):
-            ring = (via_entry["od"] - via_entry["id"]) / 2
-            if ring < lim:
-                results_queue.put(
-                    {"rule": "minAnnularRing", "via": via_entry["via_name"], "ring_um": ring, "limit_um": lim}
-                )
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(check_via, v) for v in via_data]
-            for f in concurrent.futures.as_completed(futures):
-                f.result()  # propagate exceptions
-
-        # === STEP 3: Store results ===
-        self.violations = list(results_queue.queue)
-
-    def _rule_copper_balance(self, rule: CopperBalance):
+    def _rule_copper_balance(self, rule: CopperBalance, max_workers: int = None):
         """Check copper density balance across layers.
 
         This rule validates that copper distribution stays within acceptable
-        balance limits to prevent board warping during fabrication.
+        balance limits to prevent board warping during fabrication. The copper
+        of each layer is rasterized with its voids, so overlaps are counted
+        once, and the density maps are stored in ``copper_density_maps``.
 
         Parameters
         ----------
         rule : CopperBalance
             Rule configuration with balance limits and target layers.
+        max_workers : int or None, optional
+            Number of layers processed in parallel. If ``None``, uses CPU count
+            minus 1. The default is ``None``.
 
         Examples
         --------
-        >>> rule = CopperBalance(name="top_bal", max_percent=10, layers=["TOP"])
+        >>> rule = CopperBalance(name="top_bal", max_percent=10, layers=["TOP"], window="5mm")
         >>> drc._rule_copper_balance(rule)
-        >>> len(drc.violations)
-        1
+        >>> drc.copper_density_maps["TOP"].heatmap
         """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
         max_imbalance = self.edb.value(rule.max_percent)
 
         # Snapshot data
         primitives_by_layer = dict(self.edb.modeler.primitives_by_layer)
         layout_outline = [prim for prim in self.edb.layout.primitives if prim.layer.name.lower() == "outline"]
-        if layout_outline:
-            if self.edb.grpc:
-                area_board = layout_outline[0].polygon_data.area()
-            else:
-                area_board = layout_outline[0].polygon_data.area
-
-            for layer, prim_list in primitives_by_layer.items():
-                if self.edb.grpc:
-                    area_copper = sum(prim.polygon_data.area() for prim in prim_list)
+        if not layout_outline:
+            self.edb.logger.warning("No outline primitive found in the layout.")
+            return
+        board = np.array(self._polygon_points(layout_outline[0].polygon_data))
+        if rule.layers:
+            layers = []
+            for layer in rule.layers:
+                if layer in primitives_by_layer:
+                    layers.append(layer)
                 else:
-                    area_copper = sum(prim.polygon_data.area for prim in prim_list)
-                imbalance = abs(area_copper - area_board / 2) / (area_board / 2) * 100
-                if imbalance > max_imbalance:
+                    self.edb.logger.warning(f"Layer {layer} of rule {rule.name} has no primitive, it is skipped.")
+            if not layers:
+                return
+        else:
+            layers = [layer for layer in primitives_by_layer if layer.lower() != "outline"]
+        copper = {
+            layer: [
+                (
+                    self._polygon_points(prim.polygon_data),
+                    [self._polygon_points(void.polygon_data) for void in prim.voids],
+                )
+                for prim in primitives_by_layer[layer]
+                if not prim.is_void
+            ]
+            for layer in layers
+        }
+        board_size = float(np.max(board.max(axis=0) - board.min(axis=0)))
+        window = self.edb.value(rule.window) if rule.window else board_size
+        density_maps = copper_density(
+            copper,
+            board,
+            resolution=self.edb.value(rule.resolution),
+            window=window,
+            zones={name: np.array(points) for name, points in rule.zones.items()},
+            num_threads=max_workers,
+        )
+        self.copper_density_maps.update(density_maps)
+
+        def imbalance(density):
+            return abs(density - 0.5) / 0.5 * 100
+
+        for layer, density_map in density_maps.items():
+            if imbalance(density_map.density) > max_imbalance:
+                self.violations.append(
+                    {
+                        "rule": "copper_balance",
+                        "layer": layer,
+                        "imbalance_pct": imbalance(density_map.density),
+                        "limit_pct": max_imbalance,
+                    }
+                )
+            for zone, (density, _, _) in density_map.zones.items():
+                if imbalance(density) > max_imbalance:
                     self.violations.append(
                         {
                             "rule": "copper_balance",
                             "layer": layer,
-                            "imbalance_pct": imbalance,
+                            "zone": zone,
+                            "imbalance_pct": imbalance(density),
                             "limit_pct": max_imbalance,
                         }
                     )
-        else:
-            self.edb.logger.warning("No outline primitive found in the layout.")
+            if rule.window:
+                windows = density_map.windows_outside(0.5 - max_imbalance / 200, 0.5 + max_imbalance / 200)
+                if windows:
+                    self.violations.append(
+                        {
+                            "rule": "copper_balance_window",
+                            "layer": layer,
+                            "min_density_pct": density_map.min_density * 100,
+                            "max_density_pct": density_map.max_density * 100,
+                            "limit_pct": max_imbalance,
+                            "windows": windows,
+                            "bbox": tuple(np.r_[np.min(windows, axis=0)[:2], np.max(windows, axis=0)[2:4]]),
+                        }
+                    )
+
+    def _polygon_points(self, polygon_data) -> list[tuple[float, float]]:
+        """Return the points of polygon data with arcs discretized."""
+        if self.edb.grpc:
+            return polygon_data.without_arcs().points
+        return polygon_data.points_without_arcs
 
     # High-speed rules
     def _rule_diff_pair_length_match(self, rule: DiffPairLengthMatch):
         """Check differential pair length matching constraints.
 
-        This multi-threaded check validates that positive and negative traces
-        in differential pairs have matched lengths within tolerance.
+        The routed lengths of the positive and negative nets, via barrels included, must match within tolerance.
+        Lengths come from :attr:`net_lengths` and all the pairs of the rule are compared at once.
 
         Parameters
         ----------
@@ -1020,34 +1173,20 @@ class Drc:
         0
         """
         tol = self.edb.value(rule.tolerance)
-
-        # Snapshot nets for thread safety
-        nets = dict(self.edb.nets.nets)
-
-        def check_pair(pair):
-            if pair.positive in nets and pair.negative in nets:
-                np = nets[pair.positive]
-                nn = nets[pair.negative]
-                len_p = sum(p.length for p in np.primitives if hasattr(p, "length"))
-                len_n = sum(p.length for p in nn.primitives if hasattr(p, "length"))
-                delta = abs(len_p - len_n)
-                if delta > tol:
-                    return {
+        nets = self.edb.nets.nets
+        pairs = [pair for pair in rule.pairs if pair.positive in nets and pair.negative in nets]
+        matches = self.net_lengths.match_groups({i: [pair.positive, pair.negative] for i, pair in enumerate(pairs)})
+        for i, pair in enumerate(pairs):
+            if matches[i].delta > tol:
+                self.violations.append(
+                    {
                         "rule": "diff_pair_length_match",
                         "positive": pair.positive,
                         "negative": pair.negative,
-                        "delta_um": delta,
+                        "delta_um": matches[i].delta,
                         "limit_um": tol,
                     }
-            return None
-
-        workers = max(1, (os.cpu_count() or 2) - 1)
-
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            results = list(executor.map(check_pair, rule.pairs))
-
-        # Merge results in main thread (lock-free)
-        self.violations.extend(r for r in results if r is not None)
+                )
 
     # Back-drill / stub rules
     def _rule_back_drill_stub_length(self, rule: BackDrillStubLength):
@@ -1055,7 +1194,9 @@ class Drc:
 
         This rule validates that remaining stub lengths after back-drilling
         stay below maximum values to minimize signal reflections in high-speed
-        designs.
+        designs. The stub is the plated barrel left between the drill-to layer
+        and the end of the drill, limited to the layer range of the via. Stubs
+        are computed once per layer range and back-drill setting.
 
         Parameters
         ----------
@@ -1070,52 +1211,68 @@ class Drc:
         3
         """
         max_stub = self.edb.value(rule.value)
+        elevations = {
+            name: (float(layer.lower_elevation), float(layer.upper_elevation))
+            for name, layer in self.edb.stackup.layers.items()
+        }
 
-        # Snapshot data for safety
-        padstack_instances = list(self.edb.padstacks.instances.values())
-        layers = dict(self.edb.stackup.layers)
-
-        for via in padstack_instances:
-            layer_range = via.layer_range_names
-            if layer_range:
-                start = layer_range[0]
-                stop = layer_range[-1]
-
-            is_backdrilled = False
-            if self.edb.grpc:
-                if via.backdrill_diameter:
-                    is_backdrilled = True
-            else:
-                if via.backdrill_parameters:
-                    is_backdrilled = True
-
-            if is_backdrilled:
-                via_length = abs(layers[start].upper_elevation - layers[stop].lower_elevation)
-                if via.backdrill_type == "layer_drill":
-                    if via.backdrill_bottom:
-                        stub = abs(via_length - layers[via.backdrill_parameters[0]].lower_elevation)
-                    else:
-                        stub = abs(via_length - layers[via.backdrill_parameters[0]].upper_elevation)
+        vias, keys = [], []
+        for via in self.edb.layout.padstack_instances:
+            parameters = via.backdrill_parameters
+            if not parameters:
+                continue
+            drills = tuple(
+                (side, parameters[side]["drill_to_layer"], self.edb.value(parameters[side]["stub_length"]))
+                for side in ("from_top", "from_bottom")
+                if side in parameters
+            )
+            vias.append(via)
+            keys.append((via.start_layer, via.stop_layer, drills))
+        if not keys:
+            return
+
+        def stub_length(start, stop, drills):
+            top = max(elevations[start][1], elevations[stop][1])
+            bottom = min(elevations[start][0], elevations[stop][0])
+            stub = 0.0
+            for side, layer, offset in drills:
+                if layer not in elevations:
+                    continue
+                if side == "from_bottom":
+                    stub = max(stub, min(offset, elevations[layer][0] - bottom))
                 else:
-                    stub = 0  # other drill types can be handled here
-
-                if stub > max_stub:
-                    self.violations.append(
-                        {"rule": "back_drill_stub_length", "via": via.name, "stub_um": stub, "limit_um": max_stub}
-                    )
+                    stub = max(stub, min(offset, top - elevations[layer][1]))
+            return max(stub, 0.0)
+
+        groups = {}
+        group = np.fromiter((groups.setdefault(key, len(groups)) for key in keys), dtype=np.int64, count=len(keys))
+        stubs = np.array([stub_length(*key) for key in groups])[group]
+        for i in np.flatnonzero(stubs > max_stub):
+            self.violations.append(
+                {
+                    "rule": "back_drill_stub_length",
+                    "via": vias[i].name,
+                    "stub_um": float(stubs[i]),
+                    "limit_um": max_stub,
+                    "bbox": tuple(vias[i].position),
+                }
+            )
 
     # Export utilities
-    def to_ipc356a(self, file_path: str) -> None:
-        """Write a complete IPC-D-356A netlist with DRC annotations.
+    def to_ipc356a(self, file_path: str, num_threads: int = 1) -> None:
+        """Write an IPC-D-356A test point netlist with DRC annotations.
 
-        This method exports the full netlist in IPC-D-356A format with all
-        detected violations appended as comment lines. The file can be imported
-        by CAM tools (Valor, Genesis, etc.) for fabrication review.
+        This method exports the pins and vias of all nets as IPC-D-356A test
+        point records with all detected violations appended as comment lines.
+        The file can be imported by CAM tools (Valor, Genesis, etc.) for
+        fabrication review.
 
         Parameters
         ----------
         file_path : str
             Output file path. Overwrites existing files without warning.
+        num_threads : int, optional
+            Number of threads formatting the records. The default is ``1``.
 
         Examples
         --------
@@ -1132,42 +1289,19 @@ class Drc:
 
         Notes
         -----
-        - File format follows IPC-D-356A specification
+        - Records follow the fixed 80 column IPC-D-356A layout in metric units
+        - Net names longer than 14 characters are written through ``NNAME`` aliases
         - Violations are appended as comment lines starting with ``C``
-        - Includes netlist information (nets, primitives, padstack instances)
-        - Compatible with major CAM software packages
+        - Padstack instances are read once and records are written in large buffers
         """
-        with open(file_path, "w") as f:
-            f.write("IPC-D-356A\n")
-            f.write(f"DATE {datetime.date.today():%Y%m%d}\n")
-            f.write("SOURCE PYEDB_DRC_FULL\n\n")
-            # Netlist section
-            padstack_instances = {}
-            padstacks = self.edb.padstacks.instances
-
-            for inst in padstacks.values():
-                net_name = getattr(inst, "net", None)
-                if net_name:
-                    padstack_instances.setdefault(net_name, []).append(inst)
-
-            for net_name, net in self.edb.nets.nets.items():
-                f.write(f"NET {net_name}\n")
-                for prim in net.primitives:
-                    if hasattr(prim, "polygon_data"):
-                        if self.edb.grpc:
-                            points = prim.polygon_data.without_arcs().points
-                        else:
-                            points = prim.polygon_data.points_without_arcs
-                        if points:
-                            coords = " ".join(f"x:{x}, y:{y}" for x, y in points)
-                            f.write(f"  P {coords}\n")
-                for inst in padstack_instances.get(net_name, []):
-                    x, y = inst.position
-                    f.write(f" Padstack instance position: {x} {y}\n")
-            # DRC section
-            for v in self.violations:
-                f.write(
-                    f"C RULE={v['rule']} OBJ={v.get('primitive', '')} "
-                    f"NET={v.get('net1', '')} LIMIT={v.get('limit_um', '')}\n"
-                )
-            f.write("999\n")
+        comments = (
+            f"C RULE={rule} OBJ={object1 or ''} NET={net1 or ''} LIMIT={'' if limit is None else limit}"
+            for rule, object1, _, net1, _, _, _, limit, *_ in self.violations.records()
+        )
+        write_ipc356a(
+            file_path,
+            extract_test_points(self.edb),
+            job=os.path.splitext(os.path.basename(file_path))[0],
+            comments=comments,
+            num_threads=num_threads,
+        )
@@ -0,0 +1,313 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Streaming IPC-D-356A test point netlist export.
+
+Padstack instances are read once into arrays. Coordinates and sizes are scaled and rounded for all records at once,
+records are formatted in chunks of nets, and the chunks are written as large buffers. Records use the fixed 80 column
+layout of IPC-D-356A with metric units (``UNITS CUST 1``): coordinates and sizes in micrometers.
+
+Examples
+--------
+>>> points = extract_test_points(edb)
+>>> write_ipc356a("board.ipc", points, job="board")
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+NET_FIELD = 14
+"""Width of the net name field. Longer net names are written through ``NNAME`` aliases."""
+
+_MAX_COORDINATE = 999999
+_MAX_SIZE = 9999
+
+
+@dataclass
+class Ipc356Points:
+    """Test points of a layout, one row per padstack instance, sorted by net."""
+
+    net: np.ndarray
+    refdes: np.ndarray
+    """Reference designator, ``"VIA"`` for vias."""
+    pin: np.ndarray
+    """Pin name, empty for vias."""
+    x: np.ndarray
+    y: np.ndarray
+    hole: np.ndarray
+    """Hole diameter, ``0`` for surface mount pads."""
+    width: np.ndarray
+    height: np.ndarray
+    access: np.ndarray
+    """Access side: ``0`` for both sides, ``1`` for the top side, else the number of the first signal layer."""
+
+    def __len__(self) -> int:
+        return len(self.net)
+
+
+def _pad_extent(pad) -> tuple:
+    """Return the width and height of a circle, square, rectangle or oval pad."""
+    params = pad.parameters_values if pad is not None else None
+    geometry_type = int(pad.geometry_type) if params else 0
+    if geometry_type in (1, 2):
+        return float(params[0]), float(params[0])
+    if geometry_type in (3, 4, 5):
+        return float(params[0]), float(params[1])
+    return 0.0, 0.0
+
+
+def extract_test_points(edb) -> Ipc356Points:
+    """Read the padstack instances of a layout into test point arrays.
+
+    Instances are read in a single pass. Hole diameters and pad sizes are read once per padstack definition and
+    layer. Instances without net are skipped.
+
+    Parameters
+    ----------
+    edb : pyedb.Edb
+        Active EDB session.
+
+    Returns
+    -------
+    Ipc356Points
+    """
+    signal_layers = list(edb.stackup.signal_layers)
+    layer_numbers = {name: i + 1 for i, name in enumerate(signal_layers)}
+    definitions = edb.padstacks.definitions
+    features = {}
+    columns = {name: [] for name in ("net", "refdes", "pin", "x", "y", "definition", "start", "stop")}
+    for instance in edb.layout.padstack_instances:
+        net = instance.net_name
+        if not net:
+            continue
+        if instance.is_pin:
+            pin = instance.name
+            aedt_name = instance.aedt_name
+            refdes = aedt_name[: -len(pin) - 1] if aedt_name.endswith(f"-{pin}") else aedt_name.split("-")[0]
+        else:
+            refdes, pin = "VIA", ""
+        x, y = instance.position
+        columns["net"].append(net)
+        columns["refdes"].append(refdes)
+        columns["pin"].append(pin)
+        columns["x"].append(float(x))
+        columns["y"].append(float(y))
+        columns["definition"].append(instance.padstack_definition)
+        columns["start"].append(instance.start_layer)
+        columns["stop"].append(instance.stop_layer)
+
+    for key in set(zip(columns["definition"], columns["start"])):
+        definition = definitions.get(key[0])
+        if definition is None:
+            features[key] = (0.0, 0.0, 0.0)
+            continue
+        hole = definition.hole_diameter
+        pads = definition.pad_by_layer or {}
+        features[key] = (float(hole or 0.0),) + _pad_extent(pads.get(key[1]))
+
+    last = len(signal_layers)
+    access = []
+    for start, stop in zip(columns["start"], columns["stop"]):
+        low, high = sorted((layer_numbers.get(start, 1), layer_numbers.get(stop, 1)))
+        if low == 1 and high == last > 1:
+            access.append(0)
+        elif low == 1 or high == last:
+            access.append(low if low == 1 else last)
+        else:
+            access.append(low)
+    feature = np.array([features[key] for key in zip(columns["definition"], columns["start"])]).reshape(-1, 3)
+    net = np.array(columns["net"], dtype=object)
+    order = np.argsort(net.astype(str), kind="stable")
+    return Ipc356Points(
+        net=net[order],
+        refdes=np.array(columns["refdes"], dtype=object)[order],
+        pin=np.array(columns["pin"], dtype=object)[order],
+        x=np.array(columns["x"])[order],
+        y=np.array(columns["y"])[order],
+        hole=feature[order, 0],
+        width=feature[order, 1],
+        height=feature[order, 2],
+        access=np.array(access, dtype=np.int64)[order],
+    )
+
+
+def net_aliases(nets: Iterable[str]) -> Dict[str, str]:
+    """Return ``NNAME`` aliases of the net names that do not fit in the net field.
+
+    Parameters
+    ----------
+    nets : iterable of str
+        Net names.
+
+    Returns
+    -------
+    dict[str, str]
+        Alias of each long net name, numbered in order of appearance.
+    """
+    aliases = {}
+    for net in nets:
+        if len(net) > NET_FIELD and net not in aliases:
+            aliases[net] = f"NNAME{len(aliases) + 1}"
+    return aliases
+
+
+def _text_field(values: List[str], width: int) -> np.ndarray:
+    """Return strings as a ``(N, width)`` array of ASCII codes, truncated and padded with spaces."""
+    try:
+        codes = np.array(values, dtype=f"S{width}")
+    except UnicodeEncodeError:
+        codes = np.array([value.encode("ascii", "replace") for value in values], dtype=f"S{width}")
+    codes = codes.view(np.uint8).reshape(len(values), width)
+    return np.where(codes == 0, ord(" "), codes)
+
+
+def _digit_field(values: np.ndarray, width: int) -> np.ndarray:
+    """Return non-negative integers as a ``(N, width)`` array of zero-padded ASCII digits."""
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (values[:, None] // powers % 10 + ord("0")).astype(np.uint8)
+
+
+def format_records(points: Ipc356Points, aliases: Dict[str, str], start: int = 0, stop: Optional[int] = None) -> str:
+    """Format test point records.
+
+    Records are assembled as a character array, one column block per field, so that no record is formatted on its
+    own.
+
+    Parameters
+    ----------
+    points : Ipc356Points
+        Test points.
+    aliases : dict[str, str]
+        Aliases of the long net names.
+    start, stop : int, optional
+        Rows to format. The default is all rows.
+
+    Returns
+    -------
+    str
+        One 80 column record per row, each followed by a new line.
+    """
+    rows = slice(start, stop)
+    nets = [aliases.get(net, net) for net in points.net[rows].tolist()]
+    count = len(nets)
+    if not count:
+        return ""
+    x = np.clip(np.rint(points.x[rows] * 1e6), -_MAX_COORDINATE, _MAX_COORDINATE).astype(np.int64)
+    y = np.clip(np.rint(points.y[rows] * 1e6), -_MAX_COORDINATE, _MAX_COORDINATE).astype(np.int64)
+    hole = np.clip(np.rint(points.hole[rows] * 1e6), 0, _MAX_SIZE).astype(np.int64)
+    width = np.clip(np.rint(points.width[rows] * 1e6), 0, _MAX_SIZE).astype(np.int64)
+    height = np.clip(np.rint(points.height[rows] * 1e6), 0, _MAX_SIZE).astype(np.int64)
+    pins = points.pin[rows].tolist()
+    drilled = hole > 0
+
+    record = np.full((count, 81), ord(" "), dtype=np.uint8)
+    record[:, 80] = ord("\n")
+    record[:, 0:3] = np.where(drilled[:, None], np.frombuffer(b"317", np.uint8), np.frombuffer(b"327", np.uint8))
+    record[:, 3:17] = _text_field(nets, NET_FIELD)
+    record[:, 20:26] = _text_field(points.refdes[rows].tolist(), 6)
+    record[:, 26] = np.where(np.array([bool(pin) for pin in pins]), ord("-"), ord(" "))
+    record[:, 27:31] = _text_field(pins, 4)
+    record[:, 31] = np.where(points.refdes[rows] == "VIA", ord("M"), ord(" "))
+    record[drilled, 32] = ord("D")
+    record[drilled, 33:37] = _digit_field(hole[drilled], 4)
+    record[drilled, 37] = ord("P")
+    record[:, 38] = ord("A")
+    record[:, 39:41] = _digit_field(np.minimum(points.access[rows], 99), 2)
+    for column, axis, values in ((41, "X", x), (49, "Y", y)):
+        record[:, column] = ord(axis)
+        record[:, column + 1] = np.where(values < 0, ord("-"), ord("+"))
+        record[:, column + 2 : column + 8] = _digit_field(np.abs(values), 6)
+    for column, axis, values in ((57, "X", width), (62, "Y", height)):
+        record[:, column] = ord(axis)
+        record[:, column + 1 : column + 5] = _digit_field(values, 4)
+    record[:, 67:71] = np.frombuffer(b"R000", np.uint8)
+    record[:, 72:74] = np.frombuffer(b"S0", np.uint8)
+    return record.tobytes().decode("ascii")
+
+
+def _net_chunks(points: Ipc356Points, chunk_size: int) -> List[tuple]:
+    """Split the rows in chunks of about ``chunk_size`` rows that do not split nets."""
+    if not len(points):
+        return []
+    net_starts = np.flatnonzero(np.r_[True, points.net[1:] != points.net[:-1]])
+    bounds = [0]
+    for start in net_starts[1:]:
+        if start - bounds[-1] >= chunk_size:
+            bounds.append(int(start))
+    bounds.append(len(points))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def write_ipc356a(
+    file_path: str,
+    points: Ipc356Points,
+    job: str = "",
+    comments: Iterable[str] = (),
+    chunk_size: int = 50000,
+    num_threads: int = 1,
+) -> None:
+    """Write an IPC-D-356A test point netlist.
+
+    Parameters
+    ----------
+    file_path : str
+        Output file. Existing files are overwritten.
+    points : Ipc356Points
+        Test points, sorted by net.
+    job : str, optional
+        Job name written in the header.
+    comments : iterable of str, optional
+        Comment lines written before the end of file record. They are streamed, not collected.
+    chunk_size : int, optional
+        Approximate number of records formatted and written at once. The default is ``50000``.
+    num_threads : int, optional
+        Number of threads formatting the chunks of nets. The default is ``1``.
+    """
+    aliases = net_aliases(points.net.tolist())
+    header = [
+        f"C  IPC-D-356A netlist generated by PyEDB on {datetime.date.today():%Y-%m-%d}",
+        f"P  JOB   {job}",
+        "P  UNITS CUST 1",
+        "P  VER   IPC-D-356A",
+        "P  IMAGE PRIMARY",
+    ]
+    header += [f"P  {alias:<10} {net}" for net, alias in aliases.items()]
+    chunks = _net_chunks(points, chunk_size)
+    with open(file_path, "w", buffering=1 << 20) as f:
+        f.write("\n".join(header) + "\n")
+        if num_threads > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=num_threads) as pool:
+                for buffer in pool.map(lambda chunk: format_records(points, aliases, *chunk), chunks):
+                    f.write(buffer)
+        else:
+            for start, stop in chunks:
+                f.write(format_records(points, aliases, start, stop))
+        for comment in comments:
+            f.write(f"{comment}\n")
+        f.write("999\n")
@@ -0,0 +1,441 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Routed net lengths shared by length-matching checks.
+
+The center lines of the paths and the layer spans of the padstack instances of the requested nets are read in a single
+pass over the layout and cached per net. Trace lengths account for arcs, and via barrels contribute the height of the
+layers they span, read from the stackup. Pin-to-pin lengths follow the routed topology: path vertices, vias and pins
+form a graph whose shortest path between two pins is the routed length between them.
+
+Examples
+--------
+>>> from pyedb.workflows.drc.net_length import NetLengthEngine
+>>> engine = NetLengthEngine(edb)
+>>> engine.total_length("DDR_DQ0")
+>>> engine.pin_to_pin_length("DDR_DQ0", "U1-A3", "U2-B7")
+>>> lanes = {"byte0": [f"DDR_DQ{i}" for i in range(8)]}
+>>> engine.match_groups(lanes)["byte0"].delta
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+import heapq
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from pyedb.generic.polygon_arrays import segment_lengths, split_flat_points
+
+
+def _as_float(value) -> float:
+    return float(getattr(value, "value", value))
+
+
+class Terminal(NamedTuple):
+    """Padstack instance connected to a net."""
+
+    name: str
+    x: float
+    y: float
+    layers: Tuple[str, ...]
+    """Signal layers spanned by the instance, from top to bottom."""
+    barrel_length: float
+    """Height between the middles of the first and the last layers."""
+    is_pin: bool
+
+
+@dataclass
+class NetRouting:
+    """Routed geometry of one net."""
+
+    net: str
+    segments: np.ndarray = field(default_factory=lambda: np.zeros((0, 4)))
+    """``(N, 4)`` start and end points ``x0, y0, x1, y1`` of the center line segments, in meters."""
+    segment_lengths: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    """``(N,)`` segment lengths, arcs included."""
+    segment_layers: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=object))
+    """``(N,)`` layer name of each segment."""
+    terminals: List[Terminal] = field(default_factory=list)
+    """Vias and pins of the net."""
+
+    @property
+    def trace_length(self) -> float:
+        """Length of the path center lines."""
+        return float(self.segment_lengths.sum())
+
+    @property
+    def via_length(self) -> float:
+        """Length of the via barrels, pins excluded."""
+        return float(sum(terminal.barrel_length for terminal in self.terminals if not terminal.is_pin))
+
+    @property
+    def total_length(self) -> float:
+        """Trace length plus via length."""
+        return self.trace_length + self.via_length
+
+    @property
+    def layer_lengths(self) -> Dict[str, float]:
+        """Trace length on each layer."""
+        layers, inverse = np.unique(self.segment_layers.astype(str), return_inverse=True)
+        return dict(zip(layers.tolist(), np.bincount(inverse, self.segment_lengths, len(layers)).tolist()))
+
+    @property
+    def pins(self) -> List[str]:
+        """Names of the pins of the net."""
+        return [terminal.name for terminal in self.terminals if terminal.is_pin]
+
+
+class LengthMatch(NamedTuple):
+    """Lengths of the nets of a match group."""
+
+    nets: List[str]
+    lengths: np.ndarray
+    longest: str
+    shortest: str
+    delta: float
+    """Difference between the longest and the shortest net."""
+
+
+class NetLengthEngine:
+    """Compute and cache routed net lengths.
+
+    Parameters
+    ----------
+    edb : pyedb.Edb
+        Active EDB session.
+    tolerance : float, optional
+        Distance in meters under which center line vertices, vias and pins are connected. The default is ``1e-6``.
+    """
+
+    def __init__(self, edb, tolerance: float = 1e-6):
+        self.edb = edb
+        self.tolerance = tolerance
+        self._routings: Dict[str, NetRouting] = {}
+        self._graphs: Dict[str, tuple] = {}
+        self._elevations: Optional[Dict[str, Tuple[float, float]]] = None
+
+    def clear_cache(self, nets: Optional[Iterable[str]] = None) -> None:
+        """Forget the cached routings.
+
+        Parameters
+        ----------
+        nets : iterable of str, optional
+            Nets to forget. The default is all nets, together with the stackup elevations.
+        """
+        if nets is None:
+            self._routings.clear()
+            self._graphs.clear()
+            self._elevations = None
+            return
+        for net in nets:
+            self._routings.pop(net, None)
+            self._graphs.pop(net, None)
+
+    @property
+    def elevations(self) -> Dict[str, Tuple[float, float]]:
+        """Lower and upper elevation of each stackup layer."""
+        if self._elevations is None:
+            self._elevations = {
+                name: (_as_float(layer.lower_elevation), _as_float(layer.upper_elevation))
+                for name, layer in self.edb.stackup.layers.items()
+            }
+        return self._elevations
+
+    def _mid_elevation(self, layer: str) -> float:
+        lower, upper = self.elevations.get(layer, (0.0, 0.0))
+        return (lower + upper) / 2
+
+    def _barrel_length(self, layers: Tuple[str, ...]) -> float:
+        if len(layers) < 2:
+            return 0.0
+        return abs(self._mid_elevation(layers[0]) - self._mid_elevation(layers[-1]))
+
+    def load(self, nets: Optional[Iterable[str]] = None) -> None:
+        """Read the routing of nets that are not cached yet.
+
+        Paths and padstack instances are read in a single pass over the layout for all the nets.
+
+        Parameters
+        ----------
+        nets : iterable of str, optional
+            Nets to read. The default is all nets of the layout.
+        """
+        if nets is None:
+            wanted = None
+        else:
+            wanted = {net for net in nets if net not in self._routings}
+            if not wanted:
+                return
+        xy_parts = defaultdict(list)
+        length_parts = defaultdict(list)
+        layer_parts = defaultdict(list)
+        terminals = defaultdict(list)
+        for path in self.edb.layout.paths:
+            net = path.net_name
+            if not net or (wanted is not None and net not in wanted) or (wanted is None and net in self._routings):
+                continue
+            xy, arc_heights = split_flat_points([(_as_float(x), _as_float(y)) for x, y in path.center_line])
+            if len(xy) < 2:
+                continue
+            xy_parts[net].append(np.hstack((xy[:-1], xy[1:])))
+            length_parts[net].append(segment_lengths(xy, arc_heights))
+            layer_parts[net].append(np.full(len(xy) - 1, path.layer_name, dtype=object))
+        for instance in self.edb.layout.padstack_instances:
+            net = instance.net_name
+            if not net or (wanted is not None and net not in wanted) or (wanted is None and net in self._routings):
+                continue
+            is_pin = bool(instance.is_pin)
+            layers = tuple(instance.layer_range_names)
+            x, y = (_as_float(value) for value in instance.position)
+            name = instance.aedt_name if is_pin else str(instance.id)
+            terminals[net].append(Terminal(name, x, y, layers, self._barrel_length(layers), is_pin))
+        names = wanted if wanted is not None else set(xy_parts) | set(terminals)
+        for net in names:
+            routing = NetRouting(net, terminals=terminals.get(net, []))
+            if net in xy_parts:
+                routing.segments = np.concatenate(xy_parts[net])
+                routing.segment_lengths = np.concatenate(length_parts[net])
+                routing.segment_layers = np.concatenate(layer_parts[net])
+            self._routings[net] = routing
+            self._graphs.pop(net, None)
+
+    def routing(self, net: str) -> NetRouting:
+        """Return the routed geometry of a net.
+
+        Parameters
+        ----------
+        net : str
+            Net name.
+
+        Returns
+        -------
+        NetRouting
+        """
+        self.load([net])
+        return self._routings[net]
+
+    def total_length(self, net: str) -> float:
+        """Return the trace length plus via length of a net.
+
+        Parameters
+        ----------
+        net : str
+            Net name.
+
+        Returns
+        -------
+        float
+            Length in meters.
+        """
+        return self.routing(net).total_length
+
+    def layer_lengths(self, net: str) -> Dict[str, float]:
+        """Return the trace length of a net on each layer.
+
+        Parameters
+        ----------
+        net : str
+            Net name.
+
+        Returns
+        -------
+        dict[str, float]
+            Length in meters of each layer.
+        """
+        return self.routing(net).layer_lengths
+
+    def lengths(self, nets: Iterable[str]) -> np.ndarray:
+        """Return the total lengths of several nets.
+
+        Parameters
+        ----------
+        nets : iterable of str
+            Net names.
+
+        Returns
+        -------
+        numpy.ndarray
+            Length in meters of each net.
+        """
+        nets = list(nets)
+        self.load(nets)
+        return np.array([self._routings[net].total_length for net in nets], dtype=np.float64)
+
+    def _graph(self, net: str) -> tuple:
+        """Build the routing graph of a net.
+
+        Nodes are the distinct center line vertices of each layer and one node per terminal and layer. Segments link
+        their vertices, terminals link their layers through the stackup and connect to the vertices and terminals of
+        each layer within the tolerance.
+        """
+        if net in self._graphs:
+            return self._graphs[net]
+        routing = self.routing(net)
+        adjacency = defaultdict(list)
+
+        def link(a, b, weight):
+            adjacency[a].append((b, weight))
+            adjacency[b].append((a, weight))
+
+        vertices = {}
+        layer_vertices = defaultdict(dict)
+        grid = np.round(routing.segments / self.tolerance).astype(np.int64) if len(routing.segments) else []
+        for segment, key, layer, length in zip(routing.segments, grid, routing.segment_layers, routing.segment_lengths):
+            ends = []
+            for point, point_key in ((segment[:2], tuple(key[:2])), (segment[2:], tuple(key[2:]))):
+                node = vertices.setdefault((layer, point_key), len(vertices))
+                layer_vertices[layer][node] = point
+                ends.append(node)
+            link(ends[0], ends[1], float(length))
+
+        layer_points = {
+            layer: (np.array(list(nodes)), np.array(list(nodes.values()))) for layer, nodes in layer_vertices.items()
+        }
+        terminal_nodes = []
+        layer_terminals = defaultdict(list)
+        for terminal in routing.terminals:
+            nodes = []
+            for layer in terminal.layers:
+                node = ("terminal", len(terminal_nodes), layer)
+                nodes.append(node)
+                layer_terminals[layer].append((node, terminal))
+                if layer in layer_points:
+                    ids, points = layer_points[layer]
+                    near = np.hypot(points[:, 0] - terminal.x, points[:, 1] - terminal.y) <= self.tolerance
+                    for vertex in ids[near]:
+                        link(node, int(vertex), 0.0)
+            for upper, lower in zip(nodes[:-1], nodes[1:]):
+                link(upper, lower, abs(self._mid_elevation(upper[2]) - self._mid_elevation(lower[2])))
+            terminal_nodes.append(nodes)
+        for items in layer_terminals.values():
+            if len(items) < 2:
+                continue
+            points = np.array([(terminal.x, terminal.y) for _, terminal in items])
+            distances = np.hypot(*(points[:, None, :] - points[None, :, :]).transpose(2, 0, 1))
+            for i, j in zip(*np.nonzero(np.triu(distances <= self.tolerance, 1))):
+                link(items[i][0], items[j][0], 0.0)
+        self._graphs[net] = (adjacency, terminal_nodes)
+        return self._graphs[net]
+
+    def pin_to_pin_length(self, net: str, start: str, end: str) -> Optional[float]:
+        """Return the routed length between two pins of a net.
+
+        The length is the shortest route along the center lines and via barrels from one pin to the other.
+
+        Parameters
+        ----------
+        net : str
+            Net name.
+        start : str
+            AEDT name of the first pin, for example ``"U1-A3"``.
+        end : str
+            AEDT name of the second pin.
+
+        Returns
+        -------
+        float or None
+            Length in meters, ``None`` if the pins are not connected by the routing.
+
+        Raises
+        ------
+        KeyError
+            If one of the pins is not on the net.
+        """
+        adjacency, terminal_nodes = self._graph(net)
+        terminals = self._routings[net].terminals
+        sources = [
+            node for terminal, nodes in zip(terminals, terminal_nodes) if terminal.name == start for node in nodes
+        ]
+        targets = {node for terminal, nodes in zip(terminals, terminal_nodes) if terminal.name == end for node in nodes}
+        if not sources or not targets:
+            raise KeyError(f"Pins {start} and {end} are not both on net {net}.")
+        distances = dict.fromkeys(sources, 0.0)
+        # Nodes of different kinds are not comparable, the counter breaks ties between equal distances.
+        queue = [(0.0, i, node) for i, node in enumerate(sources)]
+        counter = len(queue)
+        visited = set()
+        while queue:
+            distance, _, node = heapq.heappop(queue)
+            if node in visited:
+                continue
+            if node in targets:
+                return distance
+            visited.add(node)
+            for neighbour, weight in adjacency[node]:
+                candidate = distance + weight
+                if neighbour not in visited and candidate < distances.get(neighbour, np.inf):
+                    distances[neighbour] = candidate
+                    heapq.heappush(queue, (candidate, counter, neighbour))
+                    counter += 1
+        return None
+
+    def match_groups(self, groups: Dict[str, Iterable[str]]) -> Dict[str, LengthMatch]:
+        """Compare the total lengths of the nets of match groups.
+
+        The nets of all the groups are read in a single pass and the groups are reduced together.
+
+        Parameters
+        ----------
+        groups : dict[str, iterable of str]
+            Nets of each group, for example the nets of a DDR byte lane or the two nets of a differential pair.
+
+        Returns
+        -------
+        dict[str, LengthMatch]
+            Lengths of each group that has at least one net.
+
+        Examples
+        --------
+        >>> engine = NetLengthEngine(edb)
+        >>> matches = engine.match_groups({"usb": ["USB_DP", "USB_DN"], "byte0": ["DQ0", "DQ1", "DQ2", "DQS0_P"]})
+        >>> [name for name, match in matches.items() if match.delta > 0.1e-3]
+        """
+        members = {name: list(nets) for name, nets in groups.items()}
+        members = {name: nets for name, nets in members.items() if nets}
+        if not members:
+            return {}
+        flat = [net for nets in members.values() for net in nets]
+        lengths = self.lengths(flat)
+        counts = np.array([len(nets) for nets in members.values()])
+        group_index = np.repeat(np.arange(len(counts)), counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        # Sorting by group then length puts the shortest net of each group first and the longest last.
+        order = np.lexsort((lengths, group_index))
+        shortest = order[starts]
+        longest = order[starts + counts - 1]
+        deltas = lengths[longest] - lengths[shortest]
+        return {
+            name: LengthMatch(
+                nets,
+                lengths[start : start + count],
+                flat[long_index],
+                flat[short_index],
+                float(delta),
+            )
+            for name, nets, start, count, long_index, short_index, delta in zip(
+                members, members.values(), starts, counts, longest, shortest, deltas
+            )
+        }
@@ -0,0 +1,495 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Columnar storage of DRC violations.
+
+Violations are stored column by column in typed buffers: rule, net and layer names as integer codes into a shared
+string table, values, limits and bounding boxes as floats. Rows are read back as dictionaries with the keys they were
+added with, so rules keep appending plain dictionaries while queries, summaries and exports work on whole columns.
+
+Examples
+--------
+>>> store = ViolationStore()
+>>> store.append({"rule": "minLineWidth", "layer": "TOP", "primitive": 12, "value_um": 80e-6, "limit_um": 90e-6})
+>>> store.add("minClearance", net1="CLK", net2="DATA", layer="TOP", value=50e-6, limit=100e-6, bbox=(0, 0, 1e-3, 1e-3))
+>>> store.summary()["minClearance"]["count"]
+1
+>>> len(store.query((0, 0, 2e-3, 2e-3)))
+1
+"""
+
+from __future__ import annotations
+
+from array import array
+import itertools
+import json
+import math
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+COLUMNS = ("rule", "object1", "object2", "net1", "net2", "layer", "value", "limit", "x_min", "y_min", "x_max", "y_max")
+"""Columns of the store, in export order."""
+
+LEGACY_KEYS = {
+    "rule": "rule",
+    "primitive": "object1",
+    "primitive1": "object1",
+    "via": "object1",
+    "object1": "object1",
+    "primitive2": "object2",
+    "object2": "object2",
+    "net": "net1",
+    "net1": "net1",
+    "positive": "net1",
+    "net2": "net2",
+    "negative": "net2",
+    "layer": "layer",
+    "value": "value",
+    "value_um": "value",
+    "distance_um": "value",
+    "ring_um": "value",
+    "stub_um": "value",
+    "delta_um": "value",
+    "imbalance_pct": "value",
+    "limit": "limit",
+    "limit_um": "limit",
+    "limit_pct": "limit",
+}
+"""Columns in which the keys of violation dictionaries are stored. Other keys are kept as row details."""
+
+_TEXT_COLUMNS = ("rule", "net1", "net2", "layer")
+_FLOAT_COLUMNS = ("value", "limit")
+_LOCATION_COLUMNS = ("x_min", "y_min", "x_max", "y_max")
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+
+
+def _key_number(value) -> Optional[float]:
+    # NaN never compares equal to itself, so missing values are keyed as ``None``.
+    return None if math.isnan(value) else float(value)
+
+
+class ViolationStore:
+    """Typed, columnar store of DRC violations.
+
+    The store behaves like a list of dictionaries: ``len(store)``, ``store[i]`` and iteration return the rows as
+    dictionaries. It is not thread-safe, rules must add their violations from the calling thread.
+    """
+
+    def __init__(self):
+        self._strings: List[str] = [""]
+        self._string_codes: Dict[str, int] = {"": 0}
+        self._codes = {column: array("i") for column in _TEXT_COLUMNS}
+        self._floats = {column: array("d") for column in _FLOAT_COLUMNS + _LOCATION_COLUMNS}
+        self._objects: Dict[str, list] = {"object1": [], "object2": []}
+        self._templates: List[Tuple[Tuple[str, str], ...]] = []
+        self._template_codes: Dict[Tuple[Tuple[str, str], ...], int] = {}
+        self._row_templates = array("i")
+        self._details: Dict[int, Dict[str, Any]] = {}
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self._row_templates)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.rows()
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("violation index out of range")
+        return self._row(row)
+
+    def __repr__(self) -> str:
+        return f"ViolationStore({len(self)} violations)"
+
+    def _code(self, text) -> int:
+        text = "" if text is None else str(text)
+        code = self._string_codes.get(text)
+        if code is None:
+            code = self._string_codes[text] = len(self._strings)
+            self._strings.append(text)
+        return code
+
+    def _push(self, columns: Dict[str, Any], template: Tuple[Tuple[str, str], ...], details) -> None:
+        for column in _TEXT_COLUMNS:
+            self._codes[column].append(self._code(columns.get(column)))
+        for column in _FLOAT_COLUMNS:
+            value = columns.get(column)
+            self._floats[column].append(math.nan if value is None else float(value))
+        bbox = columns.get("bbox")
+        if bbox is None:
+            bbox = (math.nan,) * 4
+        elif len(bbox) == 2:
+            bbox = (bbox[0], bbox[1], bbox[0], bbox[1])
+        for column, coordinate in zip(_LOCATION_COLUMNS, bbox):
+            self._floats[column].append(float(coordinate))
+        self._objects["object1"].append(columns.get("object1"))
+        self._objects["object2"].append(columns.get("object2"))
+        code = self._template_codes.get(template)
+        if code is None:
+            code = self._template_codes[template] = len(self._templates)
+            self._templates.append(template)
+        if details:
+            self._details[len(self._row_templates)] = details
+        self._row_templates.append(code)
+        self._index = None
+
+    def add(
+        self,
+        rule: str,
+        value: Optional[float] = None,
+        limit: Optional[float] = None,
+        object1=None,
+        object2=None,
+        net1: Optional[str] = None,
+        net2: Optional[str] = None,
+        layer: Optional[str] = None,
+        bbox: Optional[Sequence[float]] = None,
+        **details,
+    ) -> None:
+        """Add a violation.
+
+        Parameters
+        ----------
+        rule : str
+            Rule type, for example ``"minClearance"``.
+        value : float, optional
+            Measured value.
+        limit : float, optional
+            Limit of the rule.
+        object1, object2 : optional
+            Identifiers of the offending objects, such as primitive IDs or padstack instance names.
+        net1, net2 : str, optional
+            Nets of the offending objects.
+        layer : str, optional
+            Layer of the violation.
+        bbox : sequence of float, optional
+            Location ``(x_min, y_min, x_max, y_max)`` or ``(x, y)`` of the violation.
+        **details
+            Rule-specific information kept with the row.
+        """
+        columns = {
+            "rule": rule,
+            "value": value,
+            "limit": limit,
+            "object1": object1,
+            "object2": object2,
+            "net1": net1,
+            "net2": net2,
+            "layer": layer,
+            "bbox": bbox,
+        }
+        template = tuple((key, key) for key, item in columns.items() if item is not None)
+        self._push(columns, template, details)
+
+    def append(self, violation: Dict[str, Any]) -> None:
+        """Add a violation described by a dictionary.
+
+        Keys listed in :data:`LEGACY_KEYS` are stored in their column, ``bbox`` in the location columns, and other
+        keys as row details. The row is read back with the same keys.
+
+        Parameters
+        ----------
+        violation : dict
+            Violation, for example ``{"rule": "minAnnularRing", "via": "V1", "ring_um": 1e-5, "limit_um": 5e-5}``.
+        """
+        columns, template, details = {}, [], {}
+        for key, item in violation.items():
+            column = "bbox" if key == "bbox" else LEGACY_KEYS.get(key)
+            if column is None or column in columns or (column in _FLOAT_COLUMNS and not _is_number(item)):
+                details[key] = item
+            else:
+                columns[column] = item
+                template.append((key, column))
+        self._push(columns, tuple(template), details)
+
+    def extend(self, violations: Iterable[Dict[str, Any]]) -> None:
+        """Add several violations described by dictionaries."""
+        for violation in violations:
+            self.append(violation)
+
+    def clear(self) -> None:
+        """Remove all the violations."""
+        self.__init__()
+
+    def _row(self, row: int) -> Dict[str, Any]:
+        result = {}
+        for key, column in self._templates[self._row_templates[row]]:
+            if column in _TEXT_COLUMNS:
+                result[key] = self._strings[self._codes[column][row]]
+            elif column in _FLOAT_COLUMNS:
+                result[key] = self._floats[column][row]
+            elif column == "bbox":
+                result[key] = tuple(self._floats[name][row] for name in _LOCATION_COLUMNS)
+            else:
+                result[key] = self._objects[column][row]
+        result.update(self._details.get(row, {}))
+        return result
+
+    def rows(self, indices: Optional[Iterable[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield violations as dictionaries without building a list.
+
+        Parameters
+        ----------
+        indices : iterable of int, optional
+            Rows to yield. The default is all rows.
+        """
+        for row in range(len(self)) if indices is None else indices:
+            yield self._row(int(row))
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a column as an array.
+
+        Parameters
+        ----------
+        name : str
+            One of :data:`COLUMNS`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Strings for the rule, net and layer columns, floats for values, limits and locations, objects for the
+            object identifiers.
+        """
+        if name in self._codes:
+            return np.array(self._strings, dtype=object)[np.frombuffer(self._codes[name], dtype=np.int32)]
+        if name in self._floats:
+            return np.frombuffer(self._floats[name], dtype=np.float64).copy()
+        if name in self._objects:
+            return np.array(self._objects[name] + [None], dtype=object)[:-1]
+        raise KeyError(f"Unknown violation column {name}.")
+
+    def _select(self, rows: np.ndarray) -> ViolationStore:
+        subset = ViolationStore()
+        for row in rows:
+            row = int(row)
+            columns = {name: self._strings[self._codes[name][row]] or None for name in _TEXT_COLUMNS}
+            columns.update({name: self._floats[name][row] for name in _FLOAT_COLUMNS})
+            columns.update({name: self._objects[name][row] for name in self._objects})
+            columns["bbox"] = tuple(self._floats[name][row] for name in _LOCATION_COLUMNS)
+            subset._push(columns, self._templates[self._row_templates[row]], self._details.get(row))
+        return subset
+
+    def filter(
+        self, rule: Optional[str] = None, net: Optional[str] = None, layer: Optional[str] = None
+    ) -> ViolationStore:
+        """Return the violations of a rule, a net or a layer.
+
+        Parameters
+        ----------
+        rule : str, optional
+            Rule type.
+        net : str, optional
+            Net that is either the first or the second net of the violation.
+        layer : str, optional
+            Layer name.
+
+        Returns
+        -------
+        ViolationStore
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, text in (("rule", rule), ("layer", layer)):
+            if text is not None:
+                mask &= np.frombuffer(self._codes[column], dtype=np.int32) == self._string_codes.get(text, -1)
+        if net is not None:
+            code = self._string_codes.get(net, -1)
+            mask &= (np.frombuffer(self._codes["net1"], dtype=np.int32) == code) | (
+                np.frombuffer(self._codes["net2"], dtype=np.int32) == code
+            )
+        return self._select(np.flatnonzero(mask))
+
+    def _spatial_index(self):
+        if self._index is None:
+            try:
+                from rtree import index as rtree_index
+            except ImportError:
+                raise ImportError(
+                    "Rtree library is required for spatial queries. "
+                    "Please install it using 'pip install pyedb[geometry]' or 'pip install rtree'."
+                )
+            bounds = np.column_stack([self.column(name) for name in _LOCATION_COLUMNS])
+            rows = np.flatnonzero(np.isfinite(bounds).all(axis=1))
+            if not len(rows):
+                self._index = rtree_index.Index()
+            else:
+                try:
+                    self._index = rtree_index.Index((rows, bounds[rows, :2], bounds[rows, 2:]))
+                except NotImplementedError:
+                    # Bulk loading from arrays needs libspatialindex 2.1.
+                    self._index = rtree_index.Index((int(row), tuple(bounds[row]), None) for row in rows)
+        return self._index
+
+    def query(self, bbox: Sequence[float]) -> ViolationStore:
+        """Return the violations whose location intersects a region.
+
+        Parameters
+        ----------
+        bbox : sequence of float
+            ``(x_min, y_min, x_max, y_max)`` of the region.
+
+        Returns
+        -------
+        ViolationStore
+            Violations located in the region. Violations without location are never returned.
+        """
+        return self._select(np.sort(np.fromiter(self._spatial_index().intersection(tuple(bbox)), dtype=np.int64)))
+
+    def deduplicate(self) -> int:
+        """Remove repeated violations.
+
+        Two violations are repeated when they have the same rule, layer, value and limit and involve the same objects
+        and nets, in any order.
+
+        Returns
+        -------
+        int
+            Number of removed violations.
+        """
+        seen = {}
+        for row in range(len(self)):
+            objects = tuple(sorted((repr(self._objects["object1"][row]), repr(self._objects["object2"][row]))))
+            nets = tuple(sorted((self._codes["net1"][row], self._codes["net2"][row])))
+            key = (
+                self._codes["rule"][row],
+                self._codes["layer"][row],
+                objects,
+                nets,
+                _key_number(self._floats["value"][row]),
+                _key_number(self._floats["limit"][row]),
+            )
+            seen.setdefault(key, row)
+        removed = len(self) - len(seen)
+        if removed:
+            kept = self._select(np.array(sorted(seen.values()), dtype=np.int64))
+            self.__dict__.update(kept.__dict__)
+        return removed
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Summarize the violations of each rule.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            ``count``, ``min_value`` and ``max_value`` of each rule.
+        """
+        codes = np.frombuffer(self._codes["rule"], dtype=np.int32)
+        values = np.frombuffer(self._floats["value"], dtype=np.float64)
+        rules, inverse, counts = np.unique(codes, return_inverse=True, return_counts=True)
+        minima = np.full(len(rules), np.inf)
+        maxima = np.full(len(rules), -np.inf)
+        finite = np.isfinite(values)
+        np.minimum.at(minima, inverse.ravel()[finite], values[finite])
+        np.maximum.at(maxima, inverse.ravel()[finite], values[finite])
+        return {
+            self._strings[code]: {
+                "count": int(count),
+                "min_value": float(low) if np.isfinite(low) else math.nan,
+                "max_value": float(high) if np.isfinite(high) else math.nan,
+            }
+            for code, count, low, high in zip(rules, counts, minima, maxima)
+        }
+
+    def records(self) -> Iterator[tuple]:
+        """Yield violations as flat records.
+
+        Object identifiers are converted to text and missing values to ``None``.
+
+        Returns
+        -------
+        iterator of tuple
+            Values of :data:`COLUMNS` followed by the row details as JSON text.
+        """
+        for row in range(len(self)):
+            record = [self._strings[self._codes["rule"][row]]]
+            for name in ("object1", "object2"):
+                item = self._objects[name][row]
+                record.append(None if item is None else str(item))
+            record += [self._strings[self._codes[name][row]] or None for name in ("net1", "net2", "layer")]
+            for name in _FLOAT_COLUMNS + _LOCATION_COLUMNS:
+                item = self._floats[name][row]
+                record.append(None if math.isnan(item) else item)
+            details = self._details.get(row)
+            record.append(json.dumps(details, default=str) if details else None)
+            yield tuple(record)
+
+    def to_sqlite(self, file_path: str, table: str = "violations") -> None:
+        """Write the violations to an SQLite database.
+
+        Rows are streamed to the database, the table is replaced if it exists.
+
+        Parameters
+        ----------
+        file_path : str
+            Database file.
+        table : str, optional
+            Table name. The default is ``"violations"``.
+        """
+        types = ["TEXT"] * 6 + ["REAL"] * 6 + ["TEXT"]
+        definition = ", ".join(f'"{name}" {kind}' for name, kind in zip(COLUMNS + ("details",), types))
+        with sqlite3.connect(file_path) as connection:
+            connection.execute(f'DROP TABLE IF EXISTS "{table}"')
+            connection.execute(f'CREATE TABLE "{table}" ({definition})')
+            connection.executemany(
+                f'INSERT INTO "{table}" VALUES ({", ".join("?" * (len(COLUMNS) + 1))})', self.records()
+            )
+        connection.close()
+
+    def to_parquet(self, file_path: str, batch_size: int = 65536) -> None:
+        """Write the violations to a Parquet file.
+
+        Rows are written in batches, so that the whole table is never held in memory.
+
+        Parameters
+        ----------
+        file_path : str
+            Parquet file.
+        batch_size : int, optional
+            Number of rows per batch. The default is ``65536``.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "PyArrow library is required to export Parquet files. Please install it using 'pip install pyarrow'."
+            )
+        names = COLUMNS + ("details",)
+        schema = pa.schema(
+            [(name, pa.float64() if name in _LOCATION_COLUMNS + _FLOAT_COLUMNS else pa.string()) for name in names]
+        )
+        records = self.records()
+        with pq.ParquetWriter(file_path, schema) as writer:
+            while True:
+                batch = list(itertools.islice(records, batch_size))
+                if batch:
+                    columns = {name: list(values) for name, values in zip(names, zip(*batch))}
+                    writer.write_table(pa.table(columns, schema=schema))
+                if len(batch) < batch_size:
+                    break
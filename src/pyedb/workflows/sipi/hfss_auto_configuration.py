@@ -59,6 +59,7 @@ import shutil
 import stat
 
 from pyedb import Edb
+from pyedb.generic.net_name_index import NetNameIndex
 
 # patterns used for Regex matching of ground/reference nets
 ref_patterns = [
@@ -666,15 +667,17 @@ class HFSSAutoConfiguration:
         else:
             patterns = [p if p.endswith(".*") else p + ".*" for p in prefix_patterns]
 
-        compiled = [re.compile(p, re.I) for p in patterns]
-
         # ---------- 2.  bucket clusters ------------------------------------
+        # Each pattern only scans the bases sharing its literal prefix; the first matching pattern wins.
+        members_by_base = dict(clusters)
+        index = NetNameIndex(members_by_base)
+        assigned: set[str] = set()
         buckets: Dict[str, List[Tuple[str, List[str]]]] = defaultdict(list)
-        for base, members in clusters:
-            for pat, orig in zip(compiled, patterns):
-                if pat.match(base):
-                    buckets[orig].append((base, members))
-                    break
+        for pat in patterns:
+            for base in index.regex(pat, re.I):
+                if base not in assigned:
+                    assigned.add(base)
+                    buckets[pat].append((base, members_by_base[base]))
 
         # ---------- 3.  flatten --------------------------------------------
         flat: Dict[str, List[str]] = {}
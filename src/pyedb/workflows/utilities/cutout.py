@@ -27,6 +27,7 @@ import shutil
 import time
 
 from ansys.edb.core.geometry.polygon_data import ExtentType as GrpcExtentType, PolygonData as CorePolygonData
+import numpy as np
 
 
 def _get_convert_py_list_to_net_list():
@@ -36,6 +37,13 @@ def _get_convert_py_list_to_net_list():
     return convert_py_list_to_net_list
 
 
+def _core_polygon_to_array(polygon_data) -> np.ndarray:
+    """Return the ``(N, 2)`` vertices of gRPC polygon data, with arcs discretized."""
+    if polygon_data.has_arcs:
+        polygon_data = polygon_data.without_arcs()
+    return np.array([(point.x.value, point.y.value) for point in polygon_data.points], dtype=np.float64).reshape(-1, 2)
+
+
 class Cutout:
     """Factory class for creating cutout instances based on EDB mode.
 
@@ -288,6 +296,13 @@ class GrpcCutout:
         GrpcPolygonData
             Conformal polygon data representing the extent.
         """
+        try:
+            extent = self._create_conformal_local(tolerance)
+        except ImportError:
+            self.logger.info("Shapely is not installed. Computing the conformal extent with EDB.")
+            extent = None
+        if extent is not None:
+            return extent
         _polys = []
         _pins_to_preserve, _ = self.pins_to_preserve()
         if _pins_to_preserve:
@@ -375,6 +390,67 @@ class GrpcCutout:
             areas = [i.area() for i in _poly_unite]
             return _poly_unite[areas.index(max(areas))]
 
+    def _create_conformal_local(self, tolerance: float = 1e-12) -> CorePolygonData | None:
+        """Compute the conformal extent locally and send only the resulting polygon to EDB.
+
+        The signal primitives are expanded and united with Shapely. When they do not merge into a single polygon,
+        the expansion is increased once by the smallest amount that connects them all.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Extra expansion in meters that makes the bridged pieces overlap instead of touching. The default is
+            ``1e-12``.
+
+        Returns
+        -------
+        GrpcPolygonData or None
+            Conformal polygon data, or ``None`` when there is no signal geometry.
+        """
+        from pyedb.generic.conformal_extent import conformal_extent
+        from pyedb.grpc.database.geometry.polygon_data import PolygonData
+
+        shells = []
+        voids = []
+        _pins_to_preserve, _ = self.pins_to_preserve()
+        for padstack_instance in _pins_to_preserve:
+            x, y = padstack_instance.position[:2]
+            shells.append(
+                np.array(
+                    [[x - 75e-6, y - 75e-6], [x + 75e-6, y - 75e-6], [x + 75e-6, y + 75e-6], [x - 75e-6, y + 75e-6]]
+                )
+            )
+            voids.append([])
+        for prim in self._edb.layout.primitives:
+            if prim is None or prim.net_name not in self.signals:
+                continue
+            polygon_data = prim.polygon_data
+            if polygon_data is None:
+                continue
+            shells.append(_core_polygon_to_array(polygon_data.core))
+            if self.include_voids_in_extents and prim.has_voids:
+                voids.append([_core_polygon_to_array(void.polygon_data.core) for void in prim.voids])
+            else:
+                voids.append([])
+        if self.smart_cutout:
+            for polygon_data in self._smart_cut():
+                shells.append(_core_polygon_to_array(polygon_data))
+                voids.append([])
+        expansion_size = float(self._edb.value(self.expansion_size))
+        extent = conformal_extent(
+            shells,
+            expansion_size,
+            voids=voids,
+            defeature=float(self._edb.value(self.extent_defeature)),
+            round_corner=self.use_round_corner,
+            tolerance=tolerance,
+        )
+        if extent is None:
+            return None
+        if extent.expansion_size > expansion_size:
+            self.logger.info(f"Expansion increased to {extent.expansion_size:e} to compute a single extent polygon.")
+        return PolygonData.create_from_array(self._edb, extent.points, voids=extent.voids).core
+
     def _smart_cut(self) -> list[CorePolygonData]:
         """Generate additional polygons around reference terminals for smart cutout.
 
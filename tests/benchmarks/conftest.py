@@ -0,0 +1,95 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Fixtures of the benchmark suite.
+
+The benchmarks run on synthetic boards of the sizes listed in the ``PYEDB_BENCHMARK_SIZES`` environment variable,
+``1000,10000`` by default::
+
+    PYEDB_BENCHMARK_SIZES=1000,10000,100000,1000000 pytest tests/benchmarks --benchmark-json=benchmarks.json
+
+They need ``pytest-benchmark`` and are not collected when it is not installed.
+"""
+
+import os
+
+import pytest
+
+from tests.benchmarks.scaling import scaling_report
+from tests.benchmarks.synthetic_board import generate_board
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:  # pragma: no cover
+    collect_ignore_glob = ["test_*.py"]
+
+SIZES = tuple(int(size) for size in os.getenv("PYEDB_BENCHMARK_SIZES", "1000,10000").split(",") if size.strip())
+
+# Up to 10 rounds on small boards, a single round from 100k objects.
+ROUND_BUDGET = 100_000
+
+_results = []
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda size: f"{size}obj")
+def board_size(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def board(board_size):
+    return generate_board(board_size)
+
+
+@pytest.fixture
+def measure(benchmark, board_size):
+    """Time a function with ``benchmark.pedantic`` and record its mean time for the scaling report.
+
+    ``setup``, when given, is called before each round and returns the ``(args, kwargs)`` of the function, so
+    state consumed by a round, such as caches or violations, can be reset outside of the timing.
+    """
+
+    def run(group, function, *args, setup=None, **kwargs):
+        benchmark.group = group
+        benchmark.extra_info["objects"] = board_size
+        rounds = max(1, min(10, ROUND_BUDGET // board_size))
+        # A warmup round keeps lazy imports out of the timings of the small boards.
+        warmup_rounds = int(rounds > 1)
+        if setup is None:
+            result = benchmark.pedantic(function, args=args, kwargs=kwargs, rounds=rounds, warmup_rounds=warmup_rounds)
+        else:
+            result = benchmark.pedantic(function, setup=setup, rounds=rounds, warmup_rounds=warmup_rounds)
+        stats = getattr(benchmark.stats, "stats", None)
+        if stats is not None:
+            _results.append((group, board_size, stats.mean))
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    lines = scaling_report(_results)
+    if lines:
+        terminalreporter.section("scaling")
+        for line in lines:
+            terminalreporter.write_line(line)
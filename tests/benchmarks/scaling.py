@@ -0,0 +1,97 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Scaling curves of the benchmarks.
+
+Each benchmark is run on boards of several sizes. For every benchmark group, the mean time is reported per size
+together with the exponent ``k`` of the ``time ~ objects ** k`` power law fitted on the measurements, so a linear path
+reads ``k ~ 1`` and a quadratic regression stands out as ``k ~ 2``.
+
+The report is printed at the end of a benchmark session. It can also be built from a saved pytest-benchmark JSON file::
+
+    python -m tests.benchmarks.scaling .benchmarks/Linux-CPython-3.11-64bit/0001_baseline.json
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import json
+from pathlib import Path
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+def fit_exponent(objects: Iterable[int], seconds: Iterable[float]) -> Optional[float]:
+    """Return the exponent of the power law fitted on the timings, or ``None`` with fewer than two sizes."""
+    objects = np.asarray(list(objects), dtype=float)
+    seconds = np.asarray(list(seconds), dtype=float)
+    valid = (objects > 0) & (seconds > 0)
+    if len(np.unique(objects[valid])) < 2:
+        return None
+    return float(np.polyfit(np.log(objects[valid]), np.log(seconds[valid]), 1)[0])
+
+
+def scaling_report(results: Iterable[Tuple[str, int, float]]) -> List[str]:
+    """Format the scaling table of benchmark results.
+
+    Parameters
+    ----------
+    results : iterable of tuple
+        ``(group, objects, mean_seconds)`` of each benchmark run.
+
+    Returns
+    -------
+    list[str]
+        Lines of the report.
+    """
+    curves: Dict[str, Dict[int, float]] = defaultdict(dict)
+    for group, objects, seconds in results:
+        curves[group][int(objects)] = float(seconds)
+    if not curves:
+        return []
+    sizes = sorted({size for curve in curves.values() for size in curve})
+    width = max(len("benchmark (ms)"), *(len(group) for group in curves))
+    lines = [f"{'benchmark (ms)':<{width}}  " + "  ".join(f"{size:>10}" for size in sizes) + "  exponent"]
+    for group in sorted(curves):
+        curve = curves[group]
+        cells = "  ".join(f"{curve[size] * 1e3:>10.3f}" if size in curve else f"{'-':>10}" for size in sizes)
+        exponent = fit_exponent(curve.keys(), curve.values())
+        lines.append(f"{group:<{width}}  {cells}  {'-' if exponent is None else f'{exponent:8.2f}':>8}")
+    return lines
+
+
+def results_from_json(file_path) -> List[Tuple[str, int, float]]:
+    """Read ``(group, objects, mean_seconds)`` results from a pytest-benchmark JSON file."""
+    data = json.loads(Path(file_path).read_text(encoding="utf-8"))
+    return [
+        (entry["group"], entry["extra_info"]["objects"], entry["stats"]["mean"])
+        for entry in data.get("benchmarks", [])
+        if "objects" in entry.get("extra_info", {})
+    ]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    for path in sys.argv[1:]:
+        print("\n".join(scaling_report(results_from_json(path))))
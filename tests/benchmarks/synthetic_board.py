@@ -0,0 +1,518 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Parametric synthetic boards held in an in-memory stand-in of the EDB layout API.
+
+The stand-in implements the attributes that the benchmarked workflows read from an ``Edb`` object: the stackup, the
+nets, the padstack definitions and instances, the path and polygon primitives and the components. Geometry is
+generated with a seeded random generator, so a board of a given size is identical from one run to the next.
+
+Examples
+--------
+>>> from tests.benchmarks.synthetic_board import generate_board
+>>> edb = generate_board(10_000)
+>>> edb.summary()
+{'layers': 6, 'nets': 102, 'paths': 3000, 'polygons': 2000, 'vias': 3500, 'pins': 1500, 'components': 375}
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from pyedb.generic.value_evaluator import evaluate_expression
+
+MIL = 25.4e-6
+COPPER_THICKNESS = 35e-6
+DIELECTRIC_THICKNESS = 100e-6
+
+
+class Layer:
+    """Stackup layer."""
+
+    __slots__ = ("name", "type", "lower_elevation", "upper_elevation", "thickness")
+
+    def __init__(self, name: str, layer_type: str, lower_elevation: float, thickness: float):
+        self.name = name
+        self.type = layer_type
+        self.lower_elevation = lower_elevation
+        self.thickness = thickness
+        self.upper_elevation = lower_elevation + thickness
+
+
+class Stackup:
+    """Layers ordered from top to bottom."""
+
+    def __init__(self, layers: List[Layer]):
+        self.layers = {layer.name: layer for layer in layers}
+        self.signal_layers = {layer.name: layer for layer in layers if layer.type == "signal"}
+
+
+class PolygonData:
+    """Polygon outline without arcs."""
+
+    __slots__ = ("points",)
+
+    def __init__(self, points):
+        self.points = points
+
+    @property
+    def points_without_arcs(self):
+        return self.points
+
+    def without_arcs(self) -> "PolygonData":
+        return self
+
+
+class Primitive:
+    """Path or polygon primitive."""
+
+    __slots__ = (
+        "id",
+        "primitive_type",
+        "net_name",
+        "layer",
+        "polygon_data",
+        "bbox",
+        "voids",
+        "is_void",
+        "width",
+        "center_line",
+    )
+
+    def __init__(self, prim_id, primitive_type, net_name, layer, points, voids=(), is_void=False, width=0.0):
+        self.id = prim_id
+        self.primitive_type = primitive_type
+        self.net_name = net_name
+        self.layer = layer
+        self.polygon_data = PolygonData(points)
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        self.bbox = [min(xs), min(ys), max(xs), max(ys)]
+        self.voids = list(voids)
+        self.is_void = is_void
+        self.width = width
+        self.center_line = None
+
+    @property
+    def layer_name(self) -> str:
+        return self.layer.name
+
+    @property
+    def has_voids(self) -> bool:
+        return bool(self.voids)
+
+
+class Pad:
+    """Pad of a padstack definition on one layer."""
+
+    __slots__ = ("geometry_type", "parameters_values")
+
+    def __init__(self, geometry_type: int, parameters_values: List[float]):
+        self.geometry_type = geometry_type
+        self.parameters_values = parameters_values
+
+
+class PadstackDefinition:
+    """Padstack definition."""
+
+    def __init__(self, name: str, hole_diameter: float, pad_by_layer: Dict[str, Pad]):
+        self.name = name
+        self.hole_diameter = hole_diameter
+        self.pad_by_layer = pad_by_layer
+
+
+class PadstackInstance:
+    """Via or component pin."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "aedt_name",
+        "net_name",
+        "position",
+        "padstack_definition",
+        "start_layer",
+        "stop_layer",
+        "layer_range_names",
+        "is_pin",
+        "backdrill_parameters",
+        "component_name",
+    )
+
+    def __init__(self, inst_id, name, net_name, position, definition, layer_range, is_pin=False, component_name=""):
+        self.id = inst_id
+        self.name = name
+        self.aedt_name = f"{component_name}-{name}" if is_pin else name
+        self.net_name = net_name
+        self.position = position
+        self.padstack_definition = definition
+        self.start_layer = layer_range[0]
+        self.stop_layer = layer_range[-1]
+        self.layer_range_names = layer_range
+        self.is_pin = is_pin
+        self.backdrill_parameters = {}
+        self.component_name = component_name
+
+
+class Component:
+    """Component with its pins."""
+
+    def __init__(self, refdes: str, part_type: str, pins: Dict[str, PadstackInstance]):
+        self.refdes = refdes
+        self.name = refdes
+        self.type = part_type
+        self.pins = pins
+        xs = [pin.position[0] for pin in pins.values()]
+        ys = [pin.position[1] for pin in pins.values()]
+        self.bounding_box = [min(xs), min(ys), max(xs), max(ys)]
+
+
+class Net:
+    """Net with the primitives and padstack instances connected to it."""
+
+    def __init__(self, name: str, is_power_ground: bool):
+        self.name = name
+        self.is_power_ground = is_power_ground
+        self.primitives: List[Primitive] = []
+        self.padstack_instances: List[PadstackInstance] = []
+
+
+class Nets:
+    """Nets of the layout."""
+
+    def __init__(self, nets: Dict[str, Net]):
+        self.nets = nets
+
+    def __getitem__(self, name: str) -> Net:
+        return self.nets[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.nets
+
+    @property
+    def signal(self) -> Dict[str, Net]:
+        return {name: net for name, net in self.nets.items() if not net.is_power_ground}
+
+    @property
+    def power(self) -> Dict[str, Net]:
+        return {name: net for name, net in self.nets.items() if net.is_power_ground}
+
+
+class Layout:
+    """Layout objects."""
+
+    def __init__(self, paths, polygons, outline, padstack_instances, nets):
+        self.paths = paths
+        self.polygons = polygons
+        self.primitives = paths + polygons + [outline]
+        self.padstack_instances = padstack_instances
+        self.nets = nets
+
+
+class Modeler:
+    """Primitives grouped by layer."""
+
+    def __init__(self, layout: Layout):
+        self.primitives_by_layer: Dict[str, List[Primitive]] = {}
+        for prim in layout.primitives:
+            self.primitives_by_layer.setdefault(prim.layer.name, []).append(prim)
+        self.paths = layout.paths
+        self.polygons = layout.polygons
+        self.primitives = layout.primitives
+
+
+class Padstacks:
+    """Padstack definitions and instances."""
+
+    def __init__(self, definitions: Dict[str, PadstackDefinition], layout: Layout):
+        self.definitions = definitions
+        self._layout = layout
+
+    @property
+    def instances(self) -> Dict[int, PadstackInstance]:
+        return {instance.id: instance for instance in self._layout.padstack_instances}
+
+
+class Components:
+    """Components of the layout."""
+
+    def __init__(self, components: Dict[str, Component]):
+        self.instances = components
+
+
+class InMemoryEdb:
+    """In-memory stand-in of an ``Edb`` object for the attributes used by the benchmarked workflows."""
+
+    grpc = False
+
+    def __init__(self, stackup, nets, layout, definitions, components):
+        self.stackup = stackup
+        self.nets = nets
+        self.layout = layout
+        self.modeler = Modeler(layout)
+        self.padstacks = Padstacks(definitions, layout)
+        self.components = Components(components)
+        self.logger = logging.getLogger("pyedb.benchmarks")
+
+    @staticmethod
+    def value(value) -> float:
+        if isinstance(value, (int, float)):
+            return float(value)
+        result = evaluate_expression(str(value))
+        if result is None:
+            raise ValueError(f"Cannot evaluate {value!r} without EDB.")
+        return result
+
+    def summary(self) -> Dict[str, int]:
+        """Count the objects of the board."""
+        instances = self.layout.padstack_instances
+        pins = sum(1 for instance in instances if instance.is_pin)
+        return {
+            "layers": len(self.stackup.signal_layers),
+            "nets": len(self.nets.nets),
+            "paths": len(self.layout.paths),
+            "polygons": len(self.layout.polygons),
+            "vias": len(instances) - pins,
+            "pins": pins,
+            "components": len(self.components.instances),
+        }
+
+
+def _stackup(signal_layers: int) -> Stackup:
+    names = ["TOP"] + [f"L{i}" for i in range(2, signal_layers)] + ["BOTTOM"]
+    layers = []
+    elevation = 0.0
+    for i, name in enumerate(reversed(names)):
+        if i:
+            layers.append(Layer(f"D{signal_layers - i}", "dielectric", elevation, DIELECTRIC_THICKNESS))
+            elevation += DIELECTRIC_THICKNESS
+        layers.append(Layer(name, "signal", elevation, COPPER_THICKNESS))
+        elevation += COPPER_THICKNESS
+    return Stackup(layers[::-1])
+
+
+def _rectangle(x0, y0, x1, y1):
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+
+def generate_board(
+    objects: int,
+    signal_layers: int = 6,
+    signal_nets: Optional[int] = None,
+    via_fraction: float = 0.35,
+    pin_fraction: float = 0.15,
+    polygon_fraction: float = 0.2,
+    seed: int = 0,
+) -> InMemoryEdb:
+    """Generate a synthetic board.
+
+    Parameters
+    ----------
+    objects : int
+        Approximate number of primitives and padstack instances of the board.
+    signal_layers : int, optional
+        Number of signal layers. The default is ``6``.
+    signal_nets : int, optional
+        Number of signal nets, generated as ``_P`` and ``_N`` pairs. The default is ``None``, in which case there
+        is one net per 100 objects, with at least 4.
+    via_fraction : float, optional
+        Share of the objects that are vias. 70 % of them stitch ``GND``, one signal via in five is back-drilled.
+        The default is ``0.35``.
+    pin_fraction : float, optional
+        Share of the objects that are component pins, grouped by four per component. The default is ``0.15``.
+    polygon_fraction : float, optional
+        Share of the objects that are rectangular polygons, one in ten with a void. The default is ``0.2``.
+        The remaining objects are four-vertex paths on the signal nets, one in ten narrower than 3.5 mil.
+    seed : int, optional
+        Seed of the random generator. The default is ``0``.
+
+    Returns
+    -------
+    :class:`InMemoryEdb`
+    """
+    # Millions of small objects are created: collecting them while the board is built only costs time.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _generate_board(objects, signal_layers, signal_nets, via_fraction, pin_fraction, polygon_fraction, seed)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _generate_board(objects, signal_layers, signal_nets, via_fraction, pin_fraction, polygon_fraction, seed):
+    rng = np.random.default_rng(seed)
+    stackup = _stackup(signal_layers)
+    layer_names = list(stackup.signal_layers)
+    layers = [stackup.layers[name] for name in layer_names]
+    size = max(10e-3, float(np.sqrt(objects)) * 0.6e-3)
+
+    pair_count = max(2, (signal_nets or max(4, objects // 100)) // 2)
+    signal_names = [f"SIG{i}_{side}" for i in range(pair_count) for side in "PN"]
+    nets = {name: Net(name, False) for name in signal_names}
+    nets["GND"] = Net("GND", True)
+    nets["VCC"] = Net("VCC", True)
+    signal_array = np.array(signal_names, dtype=object)
+
+    n_vias = int(objects * via_fraction)
+    n_components = int(objects * pin_fraction) // 4
+    n_polygons = int(objects * polygon_fraction)
+    n_paths = max(0, objects - n_vias - 4 * n_components - n_polygons)
+
+    definitions = {
+        "VIA8": PadstackDefinition(
+            "VIA8", 8 * MIL, {name: Pad(1, [(12 if name == layer_names[2] else 18) * MIL]) for name in layer_names}
+        ),
+        "VIA_BLIND": PadstackDefinition("VIA_BLIND", 4 * MIL, {name: Pad(1, [12 * MIL]) for name in layer_names[:2]}),
+        "SMD": PadstackDefinition("SMD", 0.0, {"TOP": Pad(3, [24 * MIL, 12 * MIL])}),
+    }
+
+    next_id = 1
+    paths = []
+    if n_paths:
+        starts = rng.uniform(0, size, (n_paths, 2))
+        steps = rng.uniform(-1.5e-3, 1.5e-3, (n_paths, 2))
+        path_layers = rng.integers(0, signal_layers, n_paths)
+        path_nets = signal_array[rng.integers(0, len(signal_names), n_paths)]
+        widths = np.where(rng.random(n_paths) < 0.1, 3 * MIL, 4 * MIL)
+        for (x, y), (dx, dy), layer, net, width in zip(
+            starts.tolist(), steps.tolist(), path_layers.tolist(), path_nets.tolist(), widths.tolist()
+        ):
+            center_line = [[x, y], [x + dx, y], [x + dx, y + dy], [x + 2 * dx, y + dy]]
+            half = width / 2
+            x0, x1 = min(x, x + 2 * dx) - half, max(x, x + 2 * dx) + half
+            y0, y1 = min(y, y + dy) - half, max(y, y + dy) + half
+            path = Primitive(next_id, "path", net, layers[layer], _rectangle(x0, y0, x1, y1), width=width)
+            path.center_line = center_line
+            paths.append(path)
+            nets[net].primitives.append(path)
+            next_id += 1
+
+    polygons = []
+    if n_polygons:
+        corners = rng.uniform(0, size, (n_polygons, 2))
+        sizes = rng.uniform(0.2e-3, 1e-3, (n_polygons, 2))
+        polygon_layers = rng.integers(0, signal_layers, n_polygons)
+        draw = rng.random(n_polygons)
+        polygon_nets = np.where(draw < 0.6, "GND", np.where(draw < 0.9, "VCC", "")).astype(object)
+        is_signal = polygon_nets == ""
+        polygon_nets[is_signal] = signal_array[rng.integers(0, len(signal_names), int(is_signal.sum()))]
+        for i, ((x, y), (w, h), layer, net) in enumerate(
+            zip(corners.tolist(), sizes.tolist(), polygon_layers.tolist(), polygon_nets.tolist())
+        ):
+            voids = []
+            if i % 10 == 9:
+                voids.append(
+                    Primitive(
+                        next_id,
+                        "polygon",
+                        net,
+                        layers[layer],
+                        _rectangle(x + w / 4, y + h / 4, x + w / 2, y + h / 2),
+                        is_void=True,
+                    )
+                )
+                next_id += 1
+            polygon = Primitive(next_id, "polygon", net, layers[layer], _rectangle(x, y, x + w, y + h), voids=voids)
+            polygons.append(polygon)
+            nets[net].primitives.append(polygon)
+            next_id += 1
+    outline = Primitive(next_id, "polygon", "", Layer("Outline", "outline", 0.0, 0.0), _rectangle(0, 0, size, size))
+    next_id += 1
+
+    instances = []
+    if n_vias:
+        positions = rng.uniform(0, size, (n_vias, 2))
+        draw = rng.random(n_vias)
+        via_nets = signal_array[rng.integers(0, len(signal_names), n_vias)]
+        for i, (position, gnd, net) in enumerate(zip(positions.tolist(), (draw < 0.7).tolist(), via_nets.tolist())):
+            net = "GND" if gnd else net
+            blind = not gnd and i % 7 == 0
+            via = PadstackInstance(
+                next_id,
+                f"Via{next_id}",
+                net,
+                position,
+                "VIA_BLIND" if blind else "VIA8",
+                layer_names[:2] if blind else layer_names,
+            )
+            if not gnd and not blind and i % 5 == 0:
+                via.backdrill_parameters = {
+                    "from_bottom": {"drill_to_layer": layer_names[-2], "diameter": "12mil", "stub_length": "8mil"}
+                }
+            instances.append(via)
+            nets[net].padstack_instances.append(via)
+            next_id += 1
+
+    components = {}
+    if n_components:
+        centers = rng.uniform(1e-3, size - 1e-3, (n_components, 2))
+        component_nets = signal_array[rng.integers(0, len(signal_names), (n_components, 2))]
+        offsets = ((-0.5e-3, -0.25e-3), (0.5e-3, -0.25e-3), (-0.5e-3, 0.25e-3), (0.5e-3, 0.25e-3))
+        for i, ((x, y), (net1, net2)) in enumerate(zip(centers.tolist(), component_nets.tolist())):
+            refdes = f"U{i + 1}"
+            pins = {}
+            for number, (dx, dy), net in zip("1234", offsets, (net1, net2, "GND", "VCC")):
+                pin = PadstackInstance(next_id, number, net, [x + dx, y + dy], "SMD", ["TOP"], True, refdes)
+                pins[number] = pin
+                instances.append(pin)
+                nets[net].padstack_instances.append(pin)
+                next_id += 1
+            components[refdes] = Component(refdes, "ic", pins)
+
+    layout = Layout(paths, polygons, outline, instances, list(nets.values()))
+    return InMemoryEdb(stackup, Nets(nets), layout, definitions, components)
+
+
+def configuration_payload(edb: InMemoryEdb) -> dict:
+    """Build a configuration dictionary classifying the nets and modeling the components of a board.
+
+    Parameters
+    ----------
+    edb : :class:`InMemoryEdb`
+        Synthetic board.
+
+    Returns
+    -------
+    dict
+        ``nets`` and ``components`` sections of a configuration file.
+    """
+    return {
+        "nets": {
+            "signal_nets": list(edb.nets.signal),
+            "power_ground_nets": list(edb.nets.power),
+        },
+        "components": [
+            {
+                "reference_designator": refdes,
+                "part_type": "capacitor",
+                "enabled": True,
+                "rlc_model": [{"type": "series", "capacitance": "100nF", "p1": "1", "p2": "2"}],
+            }
+            for refdes in edb.components.instances
+        ],
+    }
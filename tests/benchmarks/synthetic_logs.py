@@ -0,0 +1,122 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Synthetic HFSS and SIwave batch logs of a given number of lines."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def write_hfss_log(file_path: Path, lines: int) -> Path:
+    """Write an HFSS log with adaptive passes and a frequency sweep filling about ``lines`` lines.
+
+    Parameters
+    ----------
+    file_path : pathlib.Path
+        Log file to write.
+    lines : int
+        Approximate number of lines.
+
+    Returns
+    -------
+    pathlib.Path
+    """
+    text = [
+        "Project: board, Design: HFSSDesign1",
+        "Running as user : engineer",
+        'Using command line: "ansysedt.exe -batchsolve board.aedt"',
+        "Batch Solve/Save: /work/board.aedt",
+        "[PROFILE] Initial Meshing",
+        "Tetrahedra: 28358",
+        "Memory 512.5 MB",
+        "Real Time 01:12",
+        "CPU Time 01:05",
+    ]
+    passes = max(2, lines // 20)
+    for n in range(1, passes + 1):
+        text += [
+            f"Adaptive Pass {n} at Frequency: 10 GHz",
+            f"Tetrahedra: {28358 + 1500 * n}",
+            f"Matrix size: {120000 + 6000 * n}",
+            f"Memory {512.5 + 10 * n:.1f} MB",
+            f"Max Mag. Delta S: {1 / n:.5f}",
+            f"Elapsed time : 00:{n % 60:02d}",
+        ]
+        text += [f"  Solver status line {i} of pass {n}" for i in range(7)]
+        text.append(f"[CONVERGE] Solution has {'' if n == passes else 'not '}converged at pass number {n}")
+    text.append("Adaptive Passes converged")
+    frequencies = max(1, lines - len(text) - 2)
+    text.append("Interpolating Sweep")
+    text.append(f"{frequencies} Frequencies")
+    text += [f"Frequency - {0.01 * (i + 1):.2f} GHz" for i in range(frequencies)]
+    text.append("Elapsed time : 00:12:30")
+    file_path.write_text("\n".join(text) + "\n", encoding="utf-8")
+    return file_path
+
+
+def write_siwave_log(file_path: Path, lines: int) -> Path:
+    """Write a SIwave log with short warnings and profile entries filling about ``lines`` lines.
+
+    Parameters
+    ----------
+    file_path : pathlib.Path
+        Log file to write.
+    lines : int
+        Approximate number of lines.
+
+    Returns
+    -------
+    pathlib.Path
+    """
+    stamp = "11/10/2025 05:46:09 PM"
+    text = [
+        "ANSYS Electromagnetics Suite Version 2026.1 Build: 12345",
+        "Location: /opt/AnsysEM/v261/Linux64",
+        "Batch Solve/Save: /work/board.siw",
+        f"Starting Batch Run: {stamp}",
+        "Running as user : engineer",
+        "Temp directory: /tmp",
+        "Project directory: /work",
+        "Design type: SIwave",
+        "Allow off core: True",
+        "Using manual settings",
+        "Two level: Enabled",
+        "Distribution types: Variations, Frequencies",
+        "localhost RAM: 64 GB",
+    ]
+    for i in range(max(1, lines - len(text) - 2)):
+        if i % 2:
+            text.append(
+                f'[warning] {stamp} Geometry on nets SIG{i}_P and GND on layer "L{i % 6 + 1}" '
+                f"are electrically shorted at approximately ({i * 0.01:.3f}, {i * 0.02:.3f})mm"
+            )
+        else:
+            text.append(
+                f"[info] {stamp} [PROFILE] Task {i} : Real Time 00:00:{i % 60:02d} : CPU Time 00:00:{i % 60:02d} : "
+                f"Memory 120 MB : Number of elements: {i * 10}"
+            )
+    text.append(f"[info] {stamp} [PROFILE] Simulation : Real Time 00:10:00 : Status: Normal Completion")
+    text.append(f"Stopping Batch Run: {stamp}")
+    file_path.write_text("\n".join(text) + "\n", encoding="utf-8")
+    return file_path
@@ -0,0 +1,63 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmarks of the configuration loading and apply."""
+
+import pytest
+
+from pyedb.configuration.cfg_data import CfgData
+from pyedb.configuration.cfg_nets import CfgNets
+from tests.benchmarks.synthetic_board import configuration_payload
+
+pytestmark = [pytest.mark.no_licence]
+
+
+def test_load_configuration(board, measure):
+    payload = configuration_payload(board)
+    cfg = measure("configuration.load", lambda: CfgData(**payload))
+    assert len(cfg.components.components) == len(board.components.instances)
+
+
+def test_export_configuration(board, measure):
+    cfg = CfgData(**configuration_payload(board))
+    data = measure("configuration.to_dict", cfg.to_dict)
+    assert len(data["components"]) == len(board.components.instances)
+
+
+def test_apply_net_classification(board, measure):
+    payload = configuration_payload(board)["nets"]
+    # Swap the classification so that every net is written.
+    nets = CfgNets(board, signal_nets=payload["power_ground_nets"], power_nets=payload["signal_nets"])
+
+    def restore():
+        for name in payload["signal_nets"]:
+            board.nets[name].is_power_ground = False
+        for name in payload["power_ground_nets"]:
+            board.nets[name].is_power_ground = True
+        return (), {}
+
+    try:
+        measure("configuration.apply_nets", nets.set_parameters_to_edb, setup=restore)
+        assert all(board.nets[name].is_power_ground for name in payload["signal_nets"])
+    finally:
+        restore()
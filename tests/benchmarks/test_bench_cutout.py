@@ -0,0 +1,44 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmarks of the cutout extent computation."""
+
+import numpy as np
+import pytest
+
+pytestmark = [pytest.mark.no_licence]
+
+
+def test_conformal_extent(board, measure):
+    pytest.importorskip("shapely")
+    from pyedb.generic.conformal_extent import conformal_extent
+
+    signals = set(list(board.nets.signal)[: max(2, len(board.nets.signal) // 4)])
+    shells, voids = [], []
+    for prim in board.layout.primitives:
+        if prim.net_name in signals:
+            shells.append(np.asarray(prim.polygon_data.points))
+            voids.append([np.asarray(void.polygon_data.points) for void in prim.voids])
+
+    extent = measure("cutout.conformal_extent", conformal_extent, shells, 1e-3, voids=voids)
+    assert extent.expansion_size >= 1e-3
@@ -0,0 +1,123 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmarks of the DRC engine and of the IPC-D-356A export."""
+
+import pytest
+
+from pyedb.workflows.drc.drc import (
+    BackDrillStubLength,
+    CopperBalance,
+    DiffPair,
+    DiffPairLengthMatch,
+    Drc,
+    MinAnnularRing,
+    MinClearance,
+    MinLineWidth,
+)
+from pyedb.workflows.drc.ipc356 import extract_test_points, write_ipc356a
+from pyedb.workflows.drc.net_length import NetLengthEngine
+from pyedb.workflows.drc.violations import ViolationStore
+
+pytestmark = [pytest.mark.no_licence]
+
+
+def _drc(board):
+    """DRC engine without the spatial index, for the rules that do not query it."""
+    drc = Drc.__new__(Drc)
+    drc.edb = board
+    drc.violations = ViolationStore()
+    drc.copper_density_maps = {}
+    drc.net_lengths = NetLengthEngine(board)
+    return drc
+
+
+def _run_rule(measure, group, drc, method, rule, **kwargs):
+    def setup():
+        drc.violations.clear()
+        drc.copper_density_maps.clear()
+        return (rule,), kwargs
+
+    measure(group, getattr(drc, method), setup=setup)
+    return drc.violations
+
+
+def test_spatial_index(board, measure):
+    drc = measure("drc.spatial_index", Drc, board)
+    assert drc.idx_primitives.count(drc.idx_primitives.bounds) == len(board.layout.primitives)
+
+
+def test_min_line_width(board, measure):
+    rule = MinLineWidth(name="width", value="3.5mil")
+    violations = _run_rule(measure, "drc.min_line_width", _drc(board), "_rule_min_line_width", rule, max_workers=1)
+    assert len(violations) == sum(path.width < 3.5 * 25.4e-6 for path in board.layout.paths)
+
+
+def test_min_clearance(board, measure):
+    rule = MinClearance(name="power", value="4mil", net1="GND", net2="VCC")
+    violations = _run_rule(measure, "drc.min_clearance", Drc(board), "_rule_min_clearance", rule, max_workers=1)
+    assert all(v["rule"] == "minClearance" for v in violations)
+
+
+def test_min_annular_ring(board, measure):
+    violations = _run_rule(
+        measure, "drc.min_annular_ring", _drc(board), "_rule_min_annular_ring", MinAnnularRing(name="ar", value="3mil")
+    )
+    assert len(violations) == sum(via.padstack_definition == "VIA8" for via in board.layout.padstack_instances)
+
+
+def test_back_drill_stub_length(board, measure):
+    rule = BackDrillStubLength(name="stub", value="4mil")
+    violations = _run_rule(measure, "drc.back_drill_stub_length", _drc(board), "_rule_back_drill_stub_length", rule)
+    assert len(violations) == sum(bool(via.backdrill_parameters) for via in board.layout.padstack_instances)
+
+
+def test_diff_pair_length_match(board, measure):
+    drc = _drc(board)
+    pairs = [DiffPair(positive=net, negative=net[:-1] + "N") for net in board.nets.signal if net.endswith("_P")]
+    rule = DiffPairLengthMatch(name="pairs", tolerance="0.1mm", pairs=pairs)
+
+    def setup():
+        drc.violations.clear()
+        drc.net_lengths.clear_cache()
+        return (rule,), {}
+
+    measure("drc.diff_pair_length_match", drc._rule_diff_pair_length_match, setup=setup)
+    assert len(drc.violations) <= len(pairs)
+
+
+def test_copper_balance(board, measure):
+    rule = CopperBalance(name="balance", max_percent=10, layers=["TOP"], window="5mm", resolution="0.25mm")
+    drc = _drc(board)
+    _run_rule(measure, "drc.copper_balance", drc, "_rule_copper_balance", rule, max_workers=1)
+    assert 0 < drc.copper_density_maps["TOP"].density < 1
+
+
+def test_ipc356a_export(board, measure, tmp_path):
+    def export():
+        points = extract_test_points(board)
+        write_ipc356a(tmp_path / "board.ipc", points)
+        return points
+
+    points = measure("drc.ipc356a_export", export)
+    assert len(points.net) == len(board.layout.padstack_instances)
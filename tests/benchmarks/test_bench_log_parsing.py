@@ -0,0 +1,44 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmarks of the solver log parsers on logs with as many lines as board objects."""
+
+import pytest
+
+from pyedb.workflows.utilities.hfss_log_parser import HFSSLogParser
+from pyedb.workflows.utilities.siwave_log_parser import SiwaveLogParser
+from tests.benchmarks.synthetic_logs import write_hfss_log, write_siwave_log
+
+pytestmark = [pytest.mark.no_licence]
+
+
+def test_hfss_log_parser(board_size, measure, tmp_path):
+    log = write_hfss_log(tmp_path / "hfss.log", board_size)
+    parsed = measure("log_parsing.hfss", lambda: HFSSLogParser(log).parse())
+    assert parsed.is_converged()
+
+
+def test_siwave_log_parser(board_size, measure, tmp_path):
+    log = write_siwave_log(tmp_path / "siwave.log", board_size)
+    parsed = measure("log_parsing.siwave", lambda: SiwaveLogParser(log).parse())
+    assert parsed.is_completed()
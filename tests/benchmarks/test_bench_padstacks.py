@@ -0,0 +1,63 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmarks of the padstack instance operations."""
+
+import pytest
+
+from pyedb.generic.reference_pin_index import ReferencePinIndex
+from pyedb.generic.via_reduction import ViaSnapshot, plan_cell_reduction, plan_grid_sampling
+
+pytestmark = [pytest.mark.no_licence]
+
+
+@pytest.fixture(scope="module")
+def gnd_vias(board):
+    return ViaSnapshot.from_instances(board.layout.padstack_instances, nets="GND")
+
+
+def test_via_snapshot(board, measure):
+    snapshot = measure("padstacks.via_snapshot", ViaSnapshot.from_instances, board.layout.padstack_instances, "GND")
+    assert set(snapshot.nets) == {"GND"}
+
+
+def test_via_reduction_by_density(gnd_vias, measure):
+    plan = measure("padstacks.via_reduction_by_density", plan_cell_reduction, gnd_vias, 2e-3, 2e-3)
+    assert 0 < plan.summary()["kept"] <= len(gnd_vias)
+
+
+def test_via_reduction_in_bounding_box(gnd_vias, measure):
+    plan = measure("padstacks.via_reduction_grid", plan_grid_sampling, gnd_vias, 20, 20)
+    assert 0 < plan.summary()["kept"] <= 400
+
+
+def test_reference_pin_index(board, measure):
+    pins = [pin for pin in board.layout.padstack_instances if pin.is_pin]
+    references = [pin for pin in pins if pin.net_name == "GND"]
+    positives = [pin.position for pin in pins if pin.net_name not in ("GND", "VCC")]
+
+    def nearest():
+        return ReferencePinIndex(references).nearest(positives)
+
+    nearest_pins = measure("padstacks.reference_pin_index", nearest)
+    assert len(nearest_pins) == len(positives)
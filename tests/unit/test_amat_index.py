@@ -0,0 +1,121 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the cached AMAT material index."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+import warnings
+
+import pytest
+
+from pyedb.dotnet.database.materials import Materials
+from pyedb.generic import amat_index
+from pyedb.generic.amat_index import AmatIndex, load_amat_index, parse_amat
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+EXAMPLE_MODELS = Path(__file__).resolve().parents[1] / "example_models"
+SYSLIB_AMAT = EXAMPLE_MODELS / "syslib" / "Materials.amat"
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(amat_index.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    amat_index.clear_cache()
+    yield tmp_path / "cache"
+    amat_index.clear_cache()
+
+
+def test_parse_syslib_example():
+    materials = parse_amat(SYSLIB_AMAT)
+    assert list(materials) == ["FC-78", "Polyflon CuFlon (tm)", "Water(@360K)", "steel_stainless"]
+    assert materials["Polyflon CuFlon (tm)"] == {"permittivity": 2.1, "dielectric_loss_tangent": 0.00045}
+    assert materials["steel_stainless"] == {
+        "conductivity": 1100000.0,
+        "thermal_conductivity": 13.8,
+        "mass_density": 8055.0,
+        "specific_heat": 480.0,
+        "youngs_modulus": 195000000000.0,
+        "thermal_expansion_coefficient": 1.08e-05,
+    }
+
+
+def test_parse_legacy_loss_tangent_without_warning(tmp_path):
+    amat = tmp_path / "legacy.amat"
+    amat.write_text("$begin 'Old'\n  simple('loss_tangent', 0.01)\n$end 'Old'\n", encoding="utf-8")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert parse_amat(amat) == {"Old": {"dielectric_loss_tangent": 0.01}}
+
+
+def test_index_case_insensitive_lookup_returns_copies():
+    index = AmatIndex({"FR4_epoxy": {"permittivity": 4.4}, "Copper": {"conductivity": 5.8e7}})
+    assert "fr4_EPOXY" in index
+    assert index.resolve_name("copper") == "Copper"
+    properties = index.get("COPPER")
+    properties["conductivity"] = 0
+    assert index.get("Copper") == {"conductivity": 5.8e7}
+    assert index.get("unknown", {}) == {}
+    assert [d["name"] for d in index.iter_descriptions()] == ["FR4_epoxy", "Copper"]
+
+
+def test_memory_cache_reparses_when_file_changes(tmp_path):
+    amat = tmp_path / "lib.amat"
+    amat.write_text("$begin 'A'\n  simple('permittivity', 2)\n$end 'A'\n", encoding="utf-8")
+    first = load_amat_index(amat)
+    assert load_amat_index(amat) is first
+    amat.write_text("$begin 'A'\n  simple('permittivity', 3.5)\n$end 'A'\n", encoding="utf-8")
+    stat = amat.stat()
+    os.utime(amat, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_amat_index(amat).get("a") == {"permittivity": 3.5}
+
+
+def test_disk_cache_reused_by_new_process(isolated_cache, monkeypatch):
+    load_amat_index(SYSLIB_AMAT)
+    assert list(isolated_cache.glob("amat_*.json"))
+    amat_index.clear_cache()
+    monkeypatch.setattr(amat_index, "parse_amat", MagicMock(side_effect=AssertionError("must not re-parse")))
+    assert load_amat_index(SYSLIB_AMAT).get("STEEL_STAINLESS")["mass_density"] == 8055.0
+
+
+def test_unwritable_cache_dir_is_ignored(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setenv(amat_index.CACHE_DIR_ENV, str(blocker / "cache"))
+    assert len(load_amat_index(SYSLIB_AMAT)) == 4
+
+
+def test_materials_use_syslib_index():
+    edb = MagicMock()
+    edb.base_path = str(EXAMPLE_MODELS)
+    materials = Materials(edb)
+    assert materials.read_syslib_material("polyflon cuflon (TM)") == {
+        "permittivity": 2.1,
+        "dielectric_loss_tangent": 0.00045,
+    }
+    assert materials.read_syslib_material("unobtainium") == {}
+    edb.logger.error.assert_called_once()
+    assert materials.read_materials(str(SYSLIB_AMAT)) == load_amat_index(SYSLIB_AMAT).to_dict()
+    assert [m["name"] for m in materials.iterate_materials_in_amat()][0] == "FC-78"
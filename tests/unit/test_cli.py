@@ -221,6 +221,7 @@ def cli_test_environment(monkeypatch, tmp_path):
     common.json_mode = False
     monkeypatch.setattr(common, "get_edb_class", lambda: FakeEdb)
     monkeypatch.setattr(common, "get_cfg_data_class", lambda: FakeCfgData)
+    monkeypatch.setattr(common, "find_daemon", lambda: None)
 
 
 @pytest.fixture
@@ -0,0 +1,317 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the ``pyedb serve`` daemon — no license required."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import json
+from pathlib import Path
+import threading
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+from pyedb.cli import app, common
+from pyedb.cli.daemon import DaemonClient, DatabasePool, EdbDaemon, definition_mtime
+from pyedb.generic.settings import settings
+from pyedb.grpc.edb_init import EdbInit
+from pyedb.grpc.rpc_session import RpcSession
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+class FakeEdb:
+    def __init__(self, edb_path, isreadonly=False, version=None):
+        self.edbpath = edb_path
+        self.isreadonly = isreadonly
+        self.version = version or "2026.1"
+        self.db = SimpleNamespace(id=len(edb_path))
+        self.closed = False
+
+    def close(self, terminate_rpc_session=None):
+        assert terminate_rpc_session is False
+        self.closed = True
+        return True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _make_pool(**kwargs):
+    opened = []
+
+    def open_edb(path, isreadonly, version):
+        edb = FakeEdb(path, isreadonly, version)
+        opened.append(edb)
+        return edb
+
+    return DatabasePool(open_edb, **kwargs), opened
+
+
+def test_pool_reuses_open_database():
+    pool, opened = _make_pool()
+    first = pool.acquire("a.aedb")
+    pool.release("a.aedb")
+    assert pool.acquire("a.aedb") is first
+    assert len(opened) == 1
+
+
+def test_pool_evicts_least_recently_used():
+    pool, opened = _make_pool(max_open=2)
+    for path in ["a.aedb", "b.aedb"]:
+        pool.acquire(path)
+        pool.release(path)
+    pool.acquire("a.aedb")
+    pool.release("a.aedb")
+    pool.acquire("c.aedb")
+    assert "b.aedb" not in pool
+    assert opened[1].closed
+    assert [entry["edb_path"] for entry in pool.status()] == ["a.aedb", "c.aedb"]
+
+
+def test_pool_never_evicts_database_in_use():
+    pool, _ = _make_pool(max_open=1)
+    pool.acquire("a.aedb")
+    with pytest.raises(RuntimeError, match="in use"):
+        pool.acquire("b.aedb")
+
+
+def test_pool_idle_eviction():
+    clock = FakeClock()
+    pool, opened = _make_pool(idle_timeout=10.0, clock=clock)
+    pool.acquire("a.aedb")
+    pool.release("a.aedb")
+    pool.acquire("b.aedb")
+    clock.now = 11.0
+    assert pool.evict_idle() == ["a.aedb"]
+    assert opened[0].closed and not opened[1].closed
+
+
+def test_pool_reopens_read_only_database_for_write():
+    pool, opened = _make_pool()
+    pool.acquire("a.aedb", isreadonly=True)
+    pool.release("a.aedb")
+    writable = pool.acquire("a.aedb", isreadonly=False)
+    assert opened[0].closed
+    assert writable is opened[1] and not writable.isreadonly
+
+
+def test_pool_refuses_write_access_to_read_only_database_in_use():
+    pool, opened = _make_pool()
+    pool.acquire("a.aedb", isreadonly=True)
+    with pytest.raises(RuntimeError, match="read-only"):
+        pool.acquire("a.aedb", isreadonly=False)
+    assert not opened[0].closed
+
+
+def test_pool_reopens_database_released_dirty():
+    pool, opened = _make_pool()
+    pool.acquire("a.aedb")
+    pool.release("a.aedb", dirty=True)
+    assert pool.status()[0]["dirty"]
+    reopened = pool.acquire("a.aedb")
+    assert opened[0].closed and reopened is opened[1]
+    pool.release("a.aedb")
+    assert pool.acquire("a.aedb", isreadonly=True) is reopened
+
+
+def test_pool_reopens_database_modified_on_disk():
+    mtimes = {"a.aedb": 1.0}
+    pool, opened = _make_pool(mtime=mtimes.get)
+    pool.acquire("a.aedb")
+    pool.release("a.aedb")
+    assert pool.acquire("a.aedb") is opened[0]
+    pool.release("a.aedb")
+    mtimes["a.aedb"] = 2.0
+    assert pool.acquire("a.aedb") is opened[1]
+    assert opened[0].closed
+
+
+def test_pool_matches_requested_version():
+    pool, opened = _make_pool()
+    pool.acquire("a.aedb", version="2026.1")
+    pool.release("a.aedb")
+    assert pool.acquire("a.aedb", version="26.1") is opened[0]
+    assert pool.acquire("a.aedb") is opened[0]
+    with pytest.raises(RuntimeError, match="version 2026.1"):
+        pool.acquire("a.aedb", version="2025.2")
+    pool.release("a.aedb")
+    pool.release("a.aedb")
+    assert pool.acquire("a.aedb", version="2025.2").version == "2025.2"
+    assert opened[0].closed
+
+
+def test_definition_mtime(tmp_path):
+    edb_path = tmp_path / "board.aedb"
+    assert definition_mtime(str(edb_path)) is None
+    edb_path.mkdir()
+    (edb_path / "edb.def").write_text("", encoding="utf-8")
+    assert definition_mtime(str(edb_path)) == definition_mtime(str(edb_path / "edb.def")) is not None
+
+
+def test_pool_release_discard_closes_database():
+    pool, opened = _make_pool()
+    pool.acquire("a.aedb")
+    pool.release("a.aedb", discard=True)
+    assert "a.aedb" not in pool
+    assert opened[0].closed
+
+
+def test_daemon_handle_commands(monkeypatch):
+    server = EdbDaemon(open_edb=FakeEdb)
+    monkeypatch.setattr(EdbDaemon, "_rpc_port", staticmethod(lambda: 50123))
+    acquired = server.handle({"command": "acquire", "edb_path": "board.aedb"})
+    assert acquired == {
+        "status": "ok",
+        "data": {"edb_path": "board.aedb", "version": "2026.1", "rpc_port": 50123, "database_id": 10},
+    }
+    status = server.handle({"command": "status"})["data"]
+    assert status["databases"][0]["in_use"] == 1
+    assert server.handle({"command": "release", "edb_path": "board.aedb"})["data"] == {"released": True}
+    assert server.handle({"command": "unknown"})["status"] == "error"
+    assert server.handle({"command": "acquire"})["status"] == "error"
+
+
+def test_daemon_socket_round_trip(tmp_path, monkeypatch):
+    state_file = tmp_path / "daemon.json"
+    monkeypatch.setenv("PYEDB_DAEMON_STATE", str(state_file))
+    monkeypatch.setattr(EdbDaemon, "_rpc_port", staticmethod(lambda: 50123))
+    server = EdbDaemon(open_edb=FakeEdb, idle_timeout=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(100):
+        client = DaemonClient.find()
+        if client is not None:
+            break
+        thread.join(0.05)
+    assert client is not None
+    assert json.loads(state_file.read_text())["authkey"]
+    assert client.request("acquire", edb_path="x.aedb")["rpc_port"] == 50123
+    with pytest.raises(RuntimeError, match="Unknown daemon command"):
+        client.request("bogus")
+    client.request("shutdown")
+    thread.join(5)
+    assert not thread.is_alive()
+    assert not state_file.exists()
+    assert DaemonClient.find() is None
+
+
+def test_find_without_state_file(tmp_path):
+    assert DaemonClient.find(tmp_path / "missing.json") is None
+
+
+def test_attached_edb_releases_without_closing_database(monkeypatch):
+    from pyedb.grpc import edb as edb_module
+
+    created = {}
+
+    class FakeGrpcEdb:
+        def __init__(self, edbpath, **kwargs):
+            created.update(kwargs)
+            self.edbpath = edbpath
+            self.closed_with = None
+
+        def close(self, terminate_rpc_session=None):
+            self.closed_with = terminate_rpc_session
+
+    requests = []
+
+    def fake_request(self, command, **kwargs):
+        requests.append((command, kwargs))
+        return {"edb_path": kwargs.get("edb_path"), "version": "2026.1", "rpc_port": 50200, "database_id": 7}
+
+    monkeypatch.setattr(edb_module, "Edb", FakeGrpcEdb)
+    monkeypatch.setattr(DaemonClient, "request", fake_request)
+    client = DaemonClient("127.0.0.1", 1, b"key")
+    with client.attached_edb(str(Path("board.aedb") / "edb.def")) as edb:
+        pass
+    assert created["port"] == 50200 and created["database_id"] == 7
+    assert edb.closed_with is False
+    assert requests[0] == ("acquire", {"edb_path": "board.aedb", "isreadonly": False, "version": None})
+    assert requests[-1] == ("release", {"edb_path": "board.aedb", "discard": False, "dirty": True})
+
+
+def test_managed_edb_uses_running_daemon(monkeypatch, tmp_path):
+    edb_path = tmp_path / "board.aedb"
+    edb_path.mkdir()
+    (edb_path / "edb.def").write_text("", encoding="utf-8")
+    attached = []
+
+    class FakeClient:
+        @contextmanager
+        def attached_edb(self, path, cellname=None, isreadonly=False, version=None):
+            attached.append(path)
+            yield "attached-edb"
+
+    monkeypatch.setattr(common, "find_daemon", lambda: FakeClient())
+    monkeypatch.setattr(common, "get_edb_class", lambda: pytest.fail("Edb must not be opened"))
+    with common.managed_edb(str(edb_path)) as (edb, context):
+        assert edb == "attached-edb"
+    assert attached == [context["edb_path"]]
+
+
+def test_serve_status_without_daemon(monkeypatch):
+    monkeypatch.setattr(common, "find_daemon", lambda: None)
+    common.reset_state()
+    result = CliRunner().invoke(app, ["--json", "serve", "--status"])
+    assert result.exit_code == 1
+    assert json.loads(result.output)["error"] == "No pyedb daemon is running."
+
+
+def test_signal_handler_keeps_foreign_server_alive(monkeypatch):
+    killed = []
+    monkeypatch.setattr(RpcSession, "kill_all_instances", staticmethod(lambda: killed.append(True)))
+    monkeypatch.setattr(RpcSession, "rpc_session", SimpleNamespace())
+    monkeypatch.setattr(RpcSession, "_owns_session", False)
+    EdbInit._signal_handler()
+    assert killed == []
+    monkeypatch.setattr(RpcSession, "_owns_session", True)
+    EdbInit._signal_handler()
+    assert killed == [True]
+
+
+def test_open_on_existing_server_attaches_database(monkeypatch):
+    fake_db = SimpleNamespace(is_null=False, close=lambda: pytest.fail("attached database must stay open"))
+    monkeypatch.setattr(RpcSession, "connect_to_existing_server", staticmethod(lambda port, ip_address: True))
+    monkeypatch.setattr(RpcSession, "_open_db_count", 0)
+    monkeypatch.setattr(RpcSession, "rpc_session", SimpleNamespace())
+    monkeypatch.setattr(RpcSession, "_owns_session", False)
+    edb = EdbInit.__new__(EdbInit)
+    edb.logger = settings.logger
+    edb._db = None
+    edb._attached_db = False
+    monkeypatch.setattr(EdbInit, "find_by_id", lambda self, db_id: fake_db)
+    monkeypatch.setattr(EdbInit, "_clean_variables", lambda self: None)
+    assert EdbInit._open_on_existing_server(edb, "board.aedb", False, port=50200, database_id=3) is fake_db
+    assert RpcSession._open_db_count == 1
+    edb.close(terminate_rpc_session=False)
+    assert edb.db is None
+    assert RpcSession._open_db_count == 0
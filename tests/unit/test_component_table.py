@@ -0,0 +1,118 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from unittest.mock import MagicMock
+
+from ansys.edb.core.hierarchy.component_group import ComponentType as CoreComponentType
+from ansys.edb.core.hierarchy.pin_pair_model import PinPairModel as CorePinPairModel
+from ansys.edb.core.primitive.padstack_instance import PadstackInstance as CorePadstackInstance
+import numpy as np
+import pytest
+
+from pyedb.grpc.database.hierarchy.component import component_type_mapping
+from pyedb.grpc.database.utility.component_table import ComponentTable, invalidate_component_table
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+class _Pin(CorePadstackInstance):
+    name = None
+    net = None
+
+    def __init__(self, name, net):
+        self.name = name
+        self.net = MagicMock(is_null=net is None)
+        self.net.name = net or ""
+
+
+class _PinPairModel(CorePinPairModel):
+    def __init__(self, value):
+        self.value = value
+
+    def pin_pairs(self):
+        return [("1", "2")]
+
+    def rlc(self, pin_pair):
+        return MagicMock(r=MagicMock(value=self.value))
+
+
+def _group(refdes, component_type, pins, value=None):
+    group = MagicMock()
+    group.name = refdes
+    group.component_type = component_type
+    group.component_def.name = f"{refdes}_PART"
+    group.placement_layer.name = "TOP"
+    group.location = [MagicMock(value=1e-3), MagicMock(value=2e-3)]
+    group.members = [_Pin(name, net) for name, net in pins] + [MagicMock()]
+    group.component_property.model = _PinPairModel(value)
+    return group
+
+
+@pytest.fixture
+def table():
+    groups = [
+        _group("U1", CoreComponentType.IC, [("A1", "VDD"), ("A2", "GND"), ("A3", None)]),
+        _group("R1", CoreComponentType.RESISTOR, [("1", "VDD"), ("2", "SIG")], value=10.0),
+    ]
+    return ComponentTable.from_groups(groups, component_type_mapping)
+
+
+def test_records(table):
+    assert table.components["U1"].type == "ic"
+    assert table.components["U1"].value is None
+    assert table.components["R1"].value == 10.0
+    assert table.components["R1"].part_name == "R1_PART"
+    assert table.components["R1"].location == (1e-3, 2e-3)
+
+
+def test_pin_net_mappings(table):
+    assert table.pin_nets["U1"] == {"A1": "VDD", "A2": "GND", "A3": ""}
+    assert sorted(table.nets("U1")) == ["GND", "VDD"]
+    assert table.pins_on_net("VDD") == [("U1", "A1"), ("R1", "1")]
+    assert table.pins_on_net("VDD", "R1") == [("R1", "1")]
+    assert table.components_on_nets(["SIG", "GND"]) == ["U1", "R1"]
+
+
+def test_to_numpy(table):
+    components = table.to_numpy()
+    assert list(components["refdes"]) == ["U1", "R1"]
+    assert np.isnan(components["value"][0])
+    pins = table.to_numpy("pins")
+    assert len(pins["pin_name"]) == 5
+    with pytest.raises(ValueError):
+        table.to_numpy("nets")
+
+
+def test_to_dataframe(table):
+    pytest.importorskip("pandas")
+    df = table.to_dataframe("pins")
+    assert list(df.columns) == ["refdes", "pin_name", "net_name"]
+    assert df[df.net_name == "VDD"].refdes.tolist() == ["U1", "R1"]
+
+
+def test_invalidate_component_table():
+    pedb = MagicMock()
+    invalidate_component_table(pedb)
+    pedb._components.clear_table_cache.assert_called_once()
+    pedb._components = None
+    invalidate_component_table(pedb)
@@ -1127,6 +1127,7 @@ def _make_components(extra_instances: dict | None = None):
     comps._structures_3d = {}
     comps._pins = {}
     comps._comps_by_part = {}
+    comps._table = None
     comps._padstack = MagicMock()
     return comps
 
@@ -0,0 +1,95 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the local conformal extent engine — no license required."""
+
+import numpy as np
+import pytest
+
+from pyedb.generic.conformal_extent import conformal_extent
+
+shapely = pytest.importorskip("shapely")
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+SQUARE = np.array([[0.0, 0.0], [1e-3, 0.0], [1e-3, 1e-3], [0.0, 1e-3]])
+
+
+def _area(points):
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def test_touching_pieces_keep_requested_expansion():
+    extent = conformal_extent([SQUARE, SQUARE + [1.5e-3, 0.0]], expansion_size=0.5e-3)
+
+    assert extent.expansion_size == 0.5e-3
+    assert extent.voids == []
+    assert extent.points.min(axis=0) == pytest.approx([-0.5e-3, -0.5e-3])
+    assert extent.points.max(axis=0) == pytest.approx([3e-3, 1.5e-3])
+
+
+def test_distant_pieces_are_bridged_in_one_step():
+    shells = [SQUARE, SQUARE + [5e-3, 0.0], SQUARE + [5e-3, 9e-3]]
+
+    extent = conformal_extent(shells, expansion_size=0.5e-3)
+
+    # The longest spanning tree edge is the 8 mm vertical gap, already reduced by 1 mm by the expansion.
+    assert extent.expansion_size == pytest.approx(0.5e-3 + 3.5e-3, abs=1e-8)
+    assert extent.points.min(axis=0)[0] < 0.0
+    assert extent.points.max(axis=0)[1] > 10e-3
+
+
+def test_round_corner_pieces_are_bridged_in_one_step():
+    shells = [SQUARE + [3.3e-3 * index, 2.1e-3 * (index % 3)] for index in range(8)]
+
+    extent = conformal_extent(shells, expansion_size=0.1e-3, round_corner=True)
+
+    polygon = shapely.Polygon(extent.points)
+    assert all(polygon.contains(shapely.Polygon(shell)) for shell in shells)
+
+
+def test_large_voids_are_kept_and_shrunk():
+    plane = SQUARE * 10
+    large_void = SQUARE * 4 + [3e-3, 3e-3]
+    small_void = SQUARE * 0.1 + [1e-3, 1e-3]
+
+    extent = conformal_extent([plane], expansion_size=0.5e-3, voids=[[large_void, small_void]])
+
+    assert len(extent.voids) == 1
+    assert _area(extent.voids[0]) == pytest.approx((3e-3) ** 2)
+
+
+def test_round_corner_and_defeature():
+    sharp = conformal_extent([SQUARE], expansion_size=0.5e-3)
+    rounded = conformal_extent([SQUARE], expansion_size=0.5e-3, round_corner=True)
+    defeatured = conformal_extent([SQUARE], expansion_size=0.5e-3, round_corner=True, defeature=0.1e-3)
+
+    assert len(sharp.points) == 4
+    assert _area(rounded.points) < _area(sharp.points)
+    assert len(defeatured.points) < len(rounded.points)
+
+
+def test_no_geometry():
+    assert conformal_extent([], expansion_size=1e-3) is None
+    assert conformal_extent([SQUARE[:2]], expansion_size=1e-3) is None
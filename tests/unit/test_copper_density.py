@@ -0,0 +1,158 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the windowed copper density maps of the DRC engine — no license required."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pyedb.workflows.drc.copper_density import copper_density, rasterize, window_density
+from pyedb.workflows.drc.drc import CopperBalance, Drc
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+SQUARE = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+BOARD = SQUARE * 10e-3
+RESOLUTION = 50e-6
+
+
+def _area(coverage):
+    return coverage.sum() * RESOLUTION**2
+
+
+def test_rasterize_subtracts_voids_in_any_orientation():
+    plane = (SQUARE[::-1] * 5e-3, [SQUARE * 1e-3 + 1e-3, SQUARE[::-1] * 1e-3 + 3e-3])
+
+    coverage = rasterize([plane], (0.0, 0.0, 10e-3, 10e-3), RESOLUTION)
+
+    assert coverage.shape == (200, 200)
+    assert _area(coverage) == pytest.approx(25e-6 - 2e-6)
+
+
+def test_rasterize_counts_overlaps_once():
+    first = (SQUARE * 5e-3, [SQUARE * 1e-3 + 1e-3])
+    second = (SQUARE * 5e-3 + 1e-3, [])
+
+    coverage = rasterize([first, second], (0.0, 0.0, 10e-3, 10e-3), RESOLUTION)
+
+    assert _area(coverage) == pytest.approx(2 * 25e-6 - 16e-6)
+
+
+def test_window_density_ignores_windows_off_board():
+    board = np.zeros((4, 4), dtype=bool)
+    board[:, :2] = True
+    coverage = np.zeros((4, 4), dtype=bool)
+    coverage[:2, :2] = True
+
+    density = window_density(coverage, board, window=2, step=2)
+
+    np.testing.assert_array_equal(density, [[1.0, np.nan], [0.0, np.nan]])
+
+
+def test_copper_density_maps_and_zones():
+    half = (np.array([[0.0, 0.0], [5e-3, 0.0], [5e-3, 10e-3], [0.0, 10e-3]]), [])
+
+    maps = copper_density(
+        {"TOP": [half], "BOT": []},
+        BOARD,
+        resolution=RESOLUTION,
+        window=2e-3,
+        zones={"left": SQUARE * [4e-3, 10e-3]},
+        num_threads=2,
+    )
+
+    top = maps["TOP"]
+    assert top.density == pytest.approx(0.5)
+    assert top.heatmap.shape == (9, 9)
+    assert (top.min_density, top.max_density) == (0.0, 1.0)
+    assert top.zones["left"] == (1.0, 1.0, 1.0)
+    assert maps["BOT"].density == 0.0
+    windows = top.windows_outside(0.4, 0.6)
+    assert len(windows) == 9 * 8
+    assert windows[0][:4] == pytest.approx((0.0, 0.0, 2e-3, 2e-3))
+
+
+def _polygon_data(points):
+    return SimpleNamespace(without_arcs=lambda: SimpleNamespace(points=[tuple(p) for p in points]))
+
+
+def _primitive(layer, points, voids=(), is_void=False):
+    return SimpleNamespace(
+        layer=SimpleNamespace(name=layer),
+        polygon_data=_polygon_data(points),
+        voids=[SimpleNamespace(polygon_data=_polygon_data(void)) for void in voids],
+        is_void=is_void,
+    )
+
+
+def _copper_balance_drc():
+    edb = MagicMock()
+    edb.grpc = True
+    edb.value = lambda value: {"2mm": 2e-3, "0.1mm": 1e-4}.get(value, value)
+    outline = _primitive("Outline", BOARD)
+    top = [
+        _primitive("TOP", SQUARE * [10e-3, 5e-3], voids=[SQUARE * 1e-3 + 1e-3]),
+        _primitive("TOP", SQUARE, is_void=True),
+    ]
+    edb.modeler.primitives_by_layer = {"TOP": top, "BOT": [_primitive("BOT", BOARD)], "Outline": [outline]}
+    edb.layout.primitives = [outline, *top]
+    drc = Drc.__new__(Drc)
+    drc.edb = edb
+    drc.violations = []
+    drc.copper_density_maps = {}
+    return drc
+
+
+def test_drc_copper_balance_rule():
+    drc = _copper_balance_drc()
+
+    drc._rule_copper_balance(CopperBalance(name="cb", max_percent=10, layers=["TOP", "BOT"], window="2mm"))
+
+    by_rule = {(v["rule"], v["layer"]): v for v in drc.violations}
+    assert ("copper_balance", "TOP") not in by_rule
+    assert by_rule[("copper_balance", "BOT")]["imbalance_pct"] == pytest.approx(100.0)
+    assert by_rule[("copper_balance_window", "TOP")]["max_density_pct"] == pytest.approx(100.0)
+    assert drc.copper_density_maps["TOP"].density == pytest.approx(0.49)
+
+
+def test_drc_copper_balance_skips_unknown_layers():
+    drc = _copper_balance_drc()
+
+    drc._rule_copper_balance(CopperBalance(name="cb", max_percent=10, layers=["TOPP", "BOT"], window="2mm"))
+
+    assert {v["layer"] for v in drc.violations} == {"BOT"}
+    assert list(drc.copper_density_maps) == ["BOT"]
+    drc.edb.logger.warning.assert_called_once()
+    assert "TOPP" in drc.edb.logger.warning.call_args[0][0]
+
+
+def test_drc_copper_balance_with_only_unknown_layers_checks_nothing():
+    drc = _copper_balance_drc()
+
+    drc._rule_copper_balance(CopperBalance(name="cb", max_percent=10, layers=["TOPP"], window="2mm"))
+
+    assert drc.violations == []
+    assert drc.copper_density_maps == {}
@@ -213,3 +213,58 @@ class TestGrpcCutoutRun:
 
         # save_as must NOT have been called from within _create_cutout_multithread.
         edb.save_as.assert_not_called()
+
+
+def _fake_polygon_data(points):
+    core = SimpleNamespace(
+        has_arcs=False,
+        points=[SimpleNamespace(x=SimpleNamespace(value=x), y=SimpleNamespace(value=y)) for x, y in points],
+    )
+    return SimpleNamespace(core=core)
+
+
+@pytest.mark.unit
+@pytest.mark.grpc
+class TestGrpcCutoutConformal:
+    """Tests for the local conformal extent of GrpcCutout."""
+
+    _make_cutout = TestGrpcCutoutRun._make_cutout
+
+    def test_local_conformal_extent_sends_single_polygon(self):
+        pytest.importorskip("shapely")
+        edb = _make_edb()
+        cutout = self._make_cutout(edb)
+        cutout.extent_type = "Conforming"
+        square = [(0.0, 0.0), (1e-3, 0.0), (1e-3, 1e-3), (0.0, 1e-3)]
+        edb.layout.primitives = [
+            SimpleNamespace(net_name="NET_A", polygon_data=_fake_polygon_data(square), has_voids=False),
+            SimpleNamespace(
+                net_name="NET_A",
+                polygon_data=_fake_polygon_data([(x + 0.01, y) for x, y in square]),
+                has_voids=False,
+            ),
+            SimpleNamespace(net_name="NET_B", polygon_data=_fake_polygon_data(square), has_voids=False),
+        ]
+
+        with patch("pyedb.grpc.database.geometry.polygon_data.PolygonData.create_from_array") as create:
+            extent = cutout._create_conformal()
+
+        create.assert_called_once()
+        points = create.call_args.args[1]
+        assert points[:, 0].min() < 0.0 and points[:, 0].max() > 0.011
+        assert extent is create.return_value.core
+        edb.modeler.create_rectangle.assert_not_called()
+
+    def test_local_conformal_extent_uses_tolerance(self):
+        edb = _make_edb()
+        cutout = self._make_cutout(edb)
+        cutout.extent_type = "Conforming"
+        square = [(0.0, 0.0), (1e-3, 0.0), (1e-3, 1e-3), (0.0, 1e-3)]
+        edb.layout.primitives = [
+            SimpleNamespace(net_name="NET_A", polygon_data=_fake_polygon_data(square), has_voids=False),
+        ]
+
+        with patch("pyedb.generic.conformal_extent.conformal_extent", return_value=None) as conformal_extent:
+            cutout._create_conformal_local(tolerance=1e-6)
+
+        assert conformal_extent.call_args.kwargs["tolerance"] == 1e-6
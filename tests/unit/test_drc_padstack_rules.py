@@ -0,0 +1,157 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the annular ring and back-drill rules of the DRC engine — no license required."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pyedb.workflows.drc.drc import BackDrillStubLength, Drc, MinAnnularRing
+from pyedb.workflows.drc.violations import ViolationStore
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+MIL = 25.4e-6
+SIGNAL_LAYERS = ["TOP", "L2", "L3", "BOT"]
+
+
+def _pad(geometry_type, *params):
+    return SimpleNamespace(geometry_type=geometry_type, parameters_values=list(params))
+
+
+def _instance(name, definition, start="TOP", stop="BOT", backdrill=None):
+    return SimpleNamespace(
+        name=name,
+        padstack_definition=definition,
+        start_layer=start,
+        stop_layer=stop,
+        backdrill_parameters=backdrill or {},
+        position=[1e-3, 2e-3],
+    )
+
+
+class _Layout:
+    def __init__(self, instances):
+        self._instances = instances
+        self.reads = 0
+
+    @property
+    def padstack_instances(self):
+        self.reads += 1
+        return self._instances
+
+
+class _Definition:
+    def __init__(self, hole, pads):
+        self.hole_diameter = hole
+        self._pads = pads
+        self.reads = 0
+
+    @property
+    def pad_by_layer(self):
+        self.reads += 1
+        return self._pads
+
+
+def _drc(instances, definitions=None):
+    elevations = {"TOP": (1.5e-3, 1.535e-3), "L2": (1.0e-3, 1.035e-3), "L3": (0.5e-3, 0.535e-3), "BOT": (0.0, 35e-6)}
+    layers = {name: SimpleNamespace(lower_elevation=low, upper_elevation=up) for name, (low, up) in elevations.items()}
+    edb = SimpleNamespace(
+        layout=_Layout(instances),
+        padstacks=SimpleNamespace(definitions=definitions or {}),
+        stackup=SimpleNamespace(layers=layers, signal_layers=dict.fromkeys(SIGNAL_LAYERS)),
+        value=lambda value: float(value.replace("mil", "")) * MIL if "mil" in str(value) else float(value),
+    )
+    drc = Drc.__new__(Drc)
+    drc.edb = edb
+    drc.violations = ViolationStore()
+    return drc
+
+
+def test_annular_ring_is_checked_on_every_layer_of_the_range():
+    definitions = {
+        # Ring of 5 mil on the outer layers and 1 mil on L3.
+        "VIA": _Definition(10 * MIL, {"TOP": _pad(1, 20 * MIL), "L3": _pad(1, 12 * MIL), "BOT": _pad(2, 20 * MIL)}),
+        # Rectangle pad: the ring is measured on its narrow side.
+        "SMD": _Definition(4 * MIL, {"TOP": _pad(3, 20 * MIL, 6 * MIL)}),
+        "NPTH": _Definition(0.0, {"TOP": _pad(1, 20 * MIL)}),
+        "POLY": _Definition(10 * MIL, {"TOP": _pad(7, 1 * MIL)}),
+    }
+    instances = [_instance(f"via{i}", "VIA") for i in range(1000)]
+    instances += [
+        _instance("blind", "VIA", "TOP", "L2"),
+        _instance("reversed", "VIA", "BOT", "L3"),
+        _instance("smd", "SMD", "TOP", "TOP"),
+        _instance("npth", "NPTH"),
+        _instance("poly", "POLY"),
+        _instance("unknown", "MISSING"),
+    ]
+    drc = _drc(instances, definitions)
+
+    drc._rule_min_annular_ring(MinAnnularRing(name="ar", value="2mil"))
+
+    by_via = {v["via"]: v for v in drc.violations}
+    assert set(by_via) == {f"via{i}" for i in range(1000)} | {"reversed", "smd"}
+    assert by_via["via0"]["layers"] == ["L3"]
+    assert by_via["via0"]["ring_um"] == pytest.approx(1 * MIL)
+    assert by_via["smd"]["ring_um"] == pytest.approx(1 * MIL)
+    assert by_via["smd"]["bbox"] == (1e-3, 2e-3, 1e-3, 2e-3)
+    assert drc.edb.layout.reads == 1
+    # One evaluation per definition and layer range.
+    assert definitions["VIA"].reads == 3
+
+
+def test_annular_ring_keeps_previous_violations():
+    drc = _drc([_instance("via", "VIA")], {"VIA": _Definition(10 * MIL, {"TOP": _pad(1, 11 * MIL)})})
+    drc.violations.append({"rule": "other"})
+
+    drc._rule_min_annular_ring(MinAnnularRing(name="ar", value="2mil"))
+
+    assert [v["rule"] for v in drc.violations] == ["other", "minAnnularRing"]
+
+
+def _backdrill(side, layer, stub):
+    return {side: {"drill_to_layer": layer, "diameter": "0.3mm", "stub_length": stub}}
+
+
+def test_back_drill_stub_length():
+    instances = [
+        _instance("plain", "VIA"),
+        _instance("short", "VIA", backdrill=_backdrill("from_bottom", "L2", "4mil")),
+        _instance("long", "VIA", backdrill=_backdrill("from_bottom", "L2", "8mil")),
+        _instance("top", "VIA", backdrill=_backdrill("from_top", "L3", "10mil")),
+        # The barrel below L3 is only 0.5 mm long, which bounds the stub.
+        _instance("bounded", "VIA", "TOP", "BOT", _backdrill("from_bottom", "L3", "1")),
+        _instance("unknown_layer", "VIA", backdrill=_backdrill("from_bottom", "L9", "8mil")),
+    ]
+    instances += [_instance(f"copy{i}", "VIA", backdrill=_backdrill("from_bottom", "L2", "8mil")) for i in range(100)]
+    drc = _drc(instances)
+
+    drc._rule_back_drill_stub_length(BackDrillStubLength(name="stub", value="6mil"))
+
+    by_via = {v["via"]: v["stub_um"] for v in drc.violations}
+    assert set(by_via) == {"long", "top", "bounded"} | {f"copy{i}" for i in range(100)}
+    assert by_via["long"] == pytest.approx(8 * MIL)
+    assert by_via["top"] == pytest.approx(10 * MIL)
+    assert by_via["bounded"] == pytest.approx(0.5e-3)
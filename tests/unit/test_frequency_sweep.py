@@ -0,0 +1,128 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the local frequency sweep expansion engine."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pyedb.generic.frequency_sweep import (
+    FrequencySegment,
+    count_points,
+    estimate_cost,
+    expand,
+    format_frequency,
+    minimal_distribution,
+    optimize_distribution,
+    parse_distribution,
+    to_hz,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def test_parse_distribution_units_and_aliases():
+    segments = parse_distribution("LIN 0ghz 1GHZ 10MHz Linear Count 1GHz 2GHz 11 LogScale 1kHz 1MHz 10")
+    assert segments == [
+        FrequencySegment("LIN", 0.0, 1e9, 1e7),
+        FrequencySegment("LINC", 1e9, 2e9, 11.0),
+        FrequencySegment("DEC", 1e3, 1e6, 10.0),
+    ]
+    with pytest.raises(ValueError):
+        parse_distribution("FOO 1GHz 2GHz 3")
+    with pytest.raises(ValueError):
+        to_hz("$fmax")
+
+
+@pytest.mark.parametrize(
+    "distribution, expected",
+    [
+        ("LIN 0GHz 1GHz 0.25GHz", [0, 0.25e9, 0.5e9, 0.75e9, 1e9]),
+        ("LIN 0GHz 1GHz 0.3GHz", [0, 0.3e9, 0.6e9, 0.9e9]),
+        ("LINC 1GHz 2GHz 3", [1e9, 1.5e9, 2e9]),
+        ("DEC 1kHz 100kHz 1", [1e3, 1e4, 1e5]),
+        ("OCT 1GHz 4GHz 1", [1e9, 2e9, 4e9]),
+        ("ESTP 1MHz 100MHz 3", [1e6, 1e7, 1e8]),
+        ("LINC 1GHz 1GHz 1", [1e9]),
+    ],
+)
+def test_expand_segments(distribution, expected):
+    np.testing.assert_allclose(expand(distribution), expected)
+
+
+def test_expand_merges_and_deduplicates_setups():
+    frequencies = expand(["LIN 0GHz 10GHz 10MHz", "LIN 5GHz 15GHz 10MHz", "LINC 10GHz 10GHz 1"])
+    assert len(frequencies) == 1501
+    assert count_points("LIN 0GHz 10GHz 10MHz LIN 5GHz 15GHz 10MHz") == 1501
+    assert np.all(np.diff(frequencies) > 0)
+
+
+def test_estimate_cost():
+    assert estimate_cost("LIN 0GHz 10GHz 10MHz", "discrete", 2.0) == (1001, 1001, 2002.0)
+    assert estimate_cost("LIN 0GHz 10GHz 10MHz", "interpolating", 2.0).solved_points == 250
+
+
+@pytest.mark.parametrize(
+    "distributions",
+    [
+        ["DEC 1kHz 1GHz 10"],
+        ["OCT 1GHz 8GHz 4"],
+        ["ESTP 1MHz 1GHz 17"],
+        ["LIN 0GHz 10GHz 10MHz", "LINC 5GHz 20GHz 31", "DEC 1kHz 100MHz 5"],
+        ["LINC 0Hz 0Hz 1", "DEC 1kHz 1MHz 3"],
+    ],
+)
+def test_minimal_distribution_round_trip(distributions):
+    frequencies = expand(distributions)
+    np.testing.assert_allclose(expand(minimal_distribution(frequencies)), frequencies, rtol=1e-9)
+
+
+def test_optimize_distribution():
+    assert optimize_distribution(["LIN 0GHz 1GHz 0.1GHz", "LIN 0.5GHz 2GHz 0.1GHz"]) == ["LIN 0Hz 2GHz 100MHz"]
+    assert optimize_distribution("LIN 0GHz 1GHz 0.1GHz") is None
+    assert format_frequency(1234.5) == "1.2345kHz"
+
+
+def test_grpc_sweep_data_optimize_frequency_data():
+    from ansys.edb.core.simulation_setup.simulation_setup import (
+        FrequencyData as CoreFrequencyData,
+        SweepData as CoreSweepData,
+    )
+
+    from pyedb.grpc.database.simulation_setup.sweep_data import SweepData, _mapping_distribution
+
+    core = CoreSweepData(
+        "sweep",
+        [
+            CoreFrequencyData(_mapping_distribution["LIN"], "0GHz", "1GHz", "0.1GHz"),
+            CoreFrequencyData(_mapping_distribution["LIN"], "0.5GHz", "2GHz", "0.1GHz"),
+        ],
+    )
+    sweep = SweepData(MagicMock(), core=core)
+    assert len(sweep.frequencies) == 21
+    assert sweep.estimate_cost().solved_points == 21
+    assert sweep.optimize_frequency_data()
+    assert sweep.frequency_string == ["LIN 0Hz 2GHz 100MHz"]
+    assert not sweep.optimize_frequency_data()
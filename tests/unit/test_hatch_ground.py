@@ -0,0 +1,82 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the analytic hatch ground generator — no license required."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pyedb.libraries.rf_libraries.base_functions import HatchGround, _clip_to_box, _polygon_area
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _make_hatch(**kwargs):
+    edb = MagicMock()
+    edb.value = float
+    edb.grpc = True
+    return HatchGround(edb_cell=edb, layer_gnd="METAL_BOT", **kwargs)
+
+
+def test_hatch_created_as_single_polygon():
+    hatch = _make_hatch(width=100e-6, pitch=225e-6, ground_length=10e-3, ground_width=5e-3)
+
+    assert hatch.create()
+
+    create_polygon = hatch._edb.modeler.create_polygon
+    create_polygon.assert_called_once()
+    outline = create_polygon.call_args.args[0]
+    voids = create_polygon.call_args.kwargs["voids"]
+    assert np.allclose(outline.max(axis=0), [5e-3, 10e-3])
+    assert create_polygon.call_args.kwargs["net_name"] == "GND"
+    assert all(np.all(void >= 0) and np.all(void <= [5e-3, 10e-3]) for void in voids)
+    assert round(hatch.copper_fill_ratio, 2) == 69.75
+    assert hatch.board_size == 0.01
+    hatch._edb.modeler.polygons.__getitem__.assert_not_called()
+
+
+def test_rotated_hatch_fill_matches_infinite_grid():
+    hatch = _make_hatch(width=20e-6, pitch=50e-6, ground_length=10e-3, ground_width=10e-3, angle=45)
+
+    voids = hatch._hatch_voids()
+
+    assert len(voids) > 10000
+    assert hatch.copper_fill_ratio == pytest.approx(100 * (1 - (30 / 50) ** 2), abs=0.1)
+
+
+def test_no_voids_when_bars_overlap():
+    hatch = _make_hatch(width=100e-6, pitch=100e-6, ground_length=1e-3, ground_width=1e-3)
+
+    assert hatch._hatch_voids() == []
+    assert hatch.copper_fill_ratio == pytest.approx(100.0)
+
+
+def test_clip_to_box():
+    diamond = np.array([[0.0, -1.0], [1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]])
+
+    clipped = _clip_to_box(diamond, 0.0, 0.0, 2.0, 2.0)
+
+    assert _polygon_area(clipped) == pytest.approx(0.5)
+    assert len(_clip_to_box(diamond, 2.0, 2.0, 3.0, 3.0)) == 0
@@ -0,0 +1,126 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Import-time benchmark and regression budget for the lazy import surface — no license required.
+
+Each check runs ``python -X importtime`` in a fresh interpreter, so the results do not depend on what the test session
+already imported. The time budget can be tuned with the ``PYEDB_IMPORT_BUDGET_MS`` environment variable on slow
+machines.
+"""
+
+import os
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+IMPORT_BUDGET_MS = float(os.getenv("PYEDB_IMPORT_BUDGET_MS", "1000"))
+
+
+def _import_times(statement):
+    """Return ``{module: cumulative_microseconds}`` for the modules imported by ``statement``."""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_pyedb_does_not_load_backends():
+    modules = _import_times("import pyedb")
+    for heavy in ["pyedb.generic.design_types", "pyedb.grpc.edb", "pyedb.dotnet.edb", "pyedb.configuration", "numpy"]:
+        assert heavy not in modules
+
+
+def test_import_pyedb_within_budget():
+    modules = _import_times("import pyedb")
+    assert modules["pyedb"] / 1000 < IMPORT_BUDGET_MS / 4
+
+
+def test_import_grpc_edb_defers_heavy_subsystems():
+    modules = _import_times("import pyedb.grpc.edb")
+    for heavy in [
+        "pyedb.configuration.cfg_data",
+        "pyedb.configuration.configuration",
+        "pyedb.generic.control_file",
+        "pyedb.generic.process",
+        "pyedb.workflows.utilities.cutout",
+        "pyedb.generic.product_property",
+    ]:
+        assert heavy not in modules
+
+
+def test_lazy_attributes_resolve():
+    import pyedb
+    import pyedb.configuration
+    import pyedb.grpc.database
+    import pyedb.workflows
+
+    assert callable(pyedb.Edb)
+    assert pyedb.configuration.CfgData.__name__ == "CfgData"
+    assert pyedb.configuration.TerminalInfo.__name__ == "CfgTerminalInfo"
+    assert pyedb.grpc.database.Nets.__name__ == "Nets"
+    assert pyedb.workflows.Drc.__name__ == "Drc"
+    assert "CfgData" in dir(pyedb.configuration)
+    with pytest.raises(AttributeError):
+        pyedb.configuration.NotAnAttribute
+
+
+def test_simulation_setup_annotations_resolve():
+    import typing
+
+    from pyedb.grpc.database.simulation_setup.hfss_simulation_setup import HfssSimulationSetup
+    from pyedb.grpc.database.simulation_setup.raptor_x_simulation_setup import RaptorXSimulationSetup
+    from pyedb.grpc.database.simulation_setup.siwave_dcir_simulation_setup import SIWaveDCIRSimulationSetup
+    from pyedb.grpc.database.simulation_setup.siwave_simulation_setup import SiwaveSimulationSetup
+    from pyedb.grpc.edb import Edb
+
+    assert typing.get_type_hints(Edb.hfss_setups.fget)["return"] == dict[str, HfssSimulationSetup]
+    assert typing.get_type_hints(Edb.siwave_dc_setups.fget)["return"] == dict[str, SIWaveDCIRSimulationSetup]
+    assert typing.get_type_hints(Edb.siwave_ac_setups.fget)["return"] == dict[str, SiwaveSimulationSetup]
+    assert typing.get_type_hints(Edb.create_raptorx_setup)["return"] is RaptorXSimulationSetup
+    assert typing.get_type_hints(Edb.create_siwave_syz_setup)["return"] is SiwaveSimulationSetup
+    assert typing.get_type_hints(Edb.create_siwave_dc_setup)["return"] is SIWaveDCIRSimulationSetup
+
+
+@pytest.mark.slow
+def test_import_time_benchmark(capsys):
+    """Report the slowest modules imported by the gRPC backend."""
+    modules = _import_times("import pyedb.grpc.edb")
+    slowest = sorted(((t, m) for m, t in modules.items() if m.startswith("pyedb")), reverse=True)[:15]
+    with capsys.disabled():
+        print("\nCumulative import time of pyedb.grpc.edb (ms):")
+        for cumulative, module in slowest:
+            print(f"  {cumulative / 1000:9.1f}  {module}")
+    assert slowest
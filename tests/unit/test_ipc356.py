@@ -0,0 +1,135 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the IPC-D-356A test point netlist export — no license required."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pyedb.workflows.drc.ipc356 import extract_test_points, format_records, net_aliases, write_ipc356a
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _pad(geometry_type, *params):
+    return SimpleNamespace(geometry_type=geometry_type, parameters_values=list(params))
+
+
+def _instance(net, x, y, definition, start="TOP", stop="BOT", refdes=None, pin=""):
+    return SimpleNamespace(
+        net_name=net,
+        is_pin=refdes is not None,
+        name=pin,
+        aedt_name=f"{refdes}-{pin}" if refdes else "",
+        position=[x, y],
+        padstack_definition=definition,
+        start_layer=start,
+        stop_layer=stop,
+    )
+
+
+def _edb():
+    definitions = {
+        "VIA": SimpleNamespace(hole_diameter=0.2e-3, pad_by_layer={"TOP": _pad(1, 0.45e-3), "BOT": _pad(1, 0.45e-3)}),
+        "SMD": SimpleNamespace(hole_diameter=0.0, pad_by_layer={"TOP": _pad(3, 0.6e-3, 0.3e-3)}),
+    }
+    instances = [
+        _instance("GND", 10e-3, -2.5e-3, "VIA"),
+        _instance("A_VERY_LONG_NET_NAME", 1e-3, 2e-3, "SMD", "TOP", "TOP", "U-1", "A1"),
+        _instance("CLK", 5e-3, 6e-3, "SMD", "BOT", "BOT", "R12", "2"),
+        _instance("CLK", 4e-3, 6e-3, "VIA", "L2", "L3"),
+        _instance("", 0.0, 0.0, "VIA"),
+        _instance("GND", 0.0, 0.0, "UNKNOWN", "TOP", "L2"),
+    ]
+    stackup = SimpleNamespace(signal_layers=dict.fromkeys(["TOP", "L2", "L3", "BOT"]))
+    return SimpleNamespace(
+        layout=SimpleNamespace(padstack_instances=instances),
+        padstacks=SimpleNamespace(definitions=definitions),
+        stackup=stackup,
+    )
+
+
+def test_extract_test_points():
+    points = extract_test_points(_edb())
+
+    assert points.net.tolist() == ["A_VERY_LONG_NET_NAME", "CLK", "CLK", "GND", "GND"]
+    assert points.refdes.tolist() == ["U-1", "R12", "VIA", "VIA", "VIA"]
+    assert points.pin.tolist() == ["A1", "2", "", "", ""]
+    assert points.access.tolist() == [1, 4, 2, 0, 1]
+    np.testing.assert_allclose(points.hole, [0.0, 0.0, 0.2e-3, 0.2e-3, 0.0])
+    np.testing.assert_allclose(points.width, [0.6e-3, 0.0, 0.0, 0.45e-3, 0.0])
+
+
+def test_records_follow_the_fixed_column_layout():
+    points = extract_test_points(_edb())
+    aliases = net_aliases(points.net.tolist())
+
+    records = format_records(points, aliases).splitlines()
+
+    assert aliases == {"A_VERY_LONG_NET_NAME": "NNAME1"}
+    assert all(len(record) == 80 for record in records)
+    smd, _, _, via, _ = records
+    assert smd[:3] == "327"
+    assert smd[3:17] == "NNAME1".ljust(14)
+    assert smd[20:26] == "U-1   "
+    assert smd[26:31] == "-A1  "
+    assert smd[32:38] == "      "
+    assert smd[38:41] == "A01"
+    assert smd[41:57] == "X+001000Y+002000"
+    assert smd[57:71] == "X0600Y0300R000"
+    assert via[:17] == "317GND           "
+    assert via[20:32] == "VIA        M"
+    assert via[32:41] == "D0200PA00"
+    assert via[41:57] == "X+010000Y-002500"
+    assert format_records(points, aliases, 1, 3).splitlines() == records[1:3]
+
+
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_write_ipc356a(tmp_path, num_threads):
+    points = extract_test_points(_edb())
+    file_path = tmp_path / "board.ipc"
+
+    write_ipc356a(
+        str(file_path), points, job="board", comments=iter(["C RULE=x"]), chunk_size=1, num_threads=num_threads
+    )
+
+    lines = file_path.read_text().splitlines()
+    assert lines[1:5] == ["P  JOB   board", "P  UNITS CUST 1", "P  VER   IPC-D-356A", "P  IMAGE PRIMARY"]
+    assert lines[5] == "P  NNAME1     A_VERY_LONG_NET_NAME"
+    assert lines[6:11] == format_records(points, {"A_VERY_LONG_NET_NAME": "NNAME1"}).splitlines()
+    assert lines[11:] == ["C RULE=x", "999"]
+
+
+def test_write_empty_netlist(tmp_path):
+    file_path = tmp_path / "empty.ipc"
+    edb = SimpleNamespace(
+        layout=SimpleNamespace(padstack_instances=[]),
+        padstacks=SimpleNamespace(definitions={}),
+        stackup=SimpleNamespace(signal_layers={}),
+    )
+
+    write_ipc356a(str(file_path), extract_test_points(edb))
+
+    assert file_path.read_text().splitlines()[-1] == "999"
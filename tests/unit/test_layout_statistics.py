@@ -0,0 +1,159 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the single-pass layout statistics of the gRPC modeler — no license required."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyedb.generic.polygon_arrays import ARC_SENTINEL
+from pyedb.grpc.database.modeler import Modeler
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _value(value):
+    return SimpleNamespace(value=value)
+
+
+def _polygon_data(points, area=0.0):
+    return SimpleNamespace(
+        points=[SimpleNamespace(x=_value(x), y=_value(y)) for x, y in points],
+        is_closed=False,
+        area=lambda: area,
+    )
+
+
+class Path:
+    def __init__(self, layer, net, points, width, end_caps=(1, 1)):
+        self.layer = SimpleNamespace(name=layer)
+        self.net = SimpleNamespace(name=net)
+        self.is_void = False
+        self.center_line = _polygon_data(points)
+        self.width = _value(width)
+        self._end_caps = [_value(cap) for cap in end_caps]
+
+    def get_end_cap_style(self):
+        return self._end_caps
+
+
+class Polygon:
+    def __init__(self, layer, net, area, voids=(), is_void=False):
+        self.layer = SimpleNamespace(name=layer)
+        self.net = SimpleNamespace(name=net)
+        self.is_void = is_void
+        self.polygon_data = _polygon_data([], area)
+        self.voids = [SimpleNamespace(polygon_data=_polygon_data([], void_area)) for void_area in voids]
+
+
+class Text:
+    pass
+
+
+def _make_modeler(primitives):
+    pedb = MagicMock()
+    pedb.stackup.layers = {"TOP": None, "DIE": None, "BOT": None}
+    pedb.stackup.signal_layers = {"TOP": None, "BOT": None}
+    pedb.stackup.get_layout_thickness.return_value = 1.6e-3
+    pedb.components.capacitors = {"C1": None, "C2": None}
+    pedb.components.resistors = {"R1": None}
+    pedb.components.inductors = {}
+    pedb.components.Others = {"X1": None}
+    pedb.components.ICs = {"U1": None}
+    pedb.components.IOs = {}
+    pedb._hfss.get_layout_bounding_box.return_value = [0.0, 0.0, 10e-3, 10e-3]
+    pedb.layout.core.nets = ["GND", "SIG", "PWR"]
+    pedb.layout.core.padstack_instances = [object()] * 4
+    pedb.layout.core.primitives = primitives
+    modeler = Modeler.__new__(Modeler)
+    modeler._pedb = pedb
+    return modeler
+
+
+def _primitives():
+    return [
+        Path("TOP", "SIG", [(0.0, 0.0), (1e-3, 0.0), (0.5e-3, ARC_SENTINEL), (2e-3, 0.0)], 1e-4),
+        Path("BOT", "SIG", [(0.0, 0.0), (0.0, 2e-3)], 2e-4, end_caps=(0, 0)),
+        Polygon("TOP", "GND", 4e-6, voids=[1e-6]),
+        Polygon("TOP", "GND", 1e-6, is_void=True),
+        Polygon("BOT", "PWR", 2e-6),
+        Text(),
+    ]
+
+
+def test_counts_without_area():
+    stats = _make_modeler(_primitives()).get_layout_statistics()
+
+    assert stats.num_layers == 3
+    assert stats.num_capacitors == 2
+    assert stats.num_resistors == 1
+    assert stats.num_discrete_components == 2
+    assert stats.num_nets == 3
+    assert stats.num_vias == 4
+    assert stats.num_traces == 2
+    assert stats.num_polygons == 3
+    assert stats.layout_size == (0.01, 0.01)
+    assert stats.occupying_surface == {}
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_area_and_trace_length_per_layer(num_threads):
+    stats = _make_modeler(_primitives()).get_layout_statistics(evaluate_area=True, num_threads=num_threads)
+
+    top_length = 1e-3 + 3.14159265e-3 / 2
+    bot_length = 2e-3 + 2e-4
+    assert stats.trace_length["TOP"] == pytest.approx(top_length)
+    assert stats.trace_length["BOT"] == pytest.approx(bot_length)
+    assert stats.occupying_surface["TOP"] == pytest.approx(round(3e-6 + top_length * 1e-4, 6))
+    assert stats.occupying_ratio["BOT"] == pytest.approx(round((2e-6 + bot_length * 2e-4) / 1e-4, 6))
+
+
+def test_threads_use_the_pooled_server_of_the_caller():
+    from ansys.edb.core import session as core_session
+
+    from pyedb.grpc.rpc_session_pool import PooledRpcServer
+
+    sessions = []
+
+    def area():
+        sessions.append(core_session.MOD.current_session)
+        return 1e-6
+
+    server = PooledRpcServer(0, "/fake/ansys")
+    server.session = object()
+    primitives = [Polygon("TOP", "GND", 0.0), Polygon("BOT", "GND", 0.0)]
+    for primitive in primitives:
+        primitive.polygon_data.area = area
+    with server.bind():
+        _make_modeler(primitives).get_layout_statistics(evaluate_area=True, num_threads=2)
+
+    assert sessions and all(session is server.session for session in sessions)
+
+
+def test_area_restricted_to_nets():
+    stats = _make_modeler(_primitives()).get_layout_statistics(evaluate_area=True, net_list=["GND"])
+
+    assert list(stats.occupying_surface) == ["TOP"]
+    assert stats.trace_length["TOP"] == 0.0
@@ -0,0 +1,117 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from unittest.mock import MagicMock
+
+from ansys.edb.core.definition.material_def import MaterialProperty as CoreMaterialProperty
+import pytest
+
+from pyedb.grpc.database.definition.materials import Material, Materials
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _material_def(name, **properties):
+    material_def = MagicMock()
+    material_def.name = name
+    material_def.all_properties = [CoreMaterialProperty[key.upper()].value for key in properties]
+    material_def.get_property.side_effect = lambda prop: properties[prop.name.lower()]
+    material_def.dielectric_material_model.is_null = True
+    return material_def
+
+
+@pytest.fixture
+def materials():
+    edb = MagicMock()
+    edb.base_path = ""
+    edb.active_db.material_defs = [
+        _material_def("copper", conductivity=5.8e7),
+        _material_def("fr4", permittivity=4.4, dielectric_loss_tangent=0.02),
+    ]
+    materials = Materials(edb)
+    edb.materials = materials
+    return materials
+
+
+def test_snapshot_reads_each_material_once(materials):
+    snapshot = materials.snapshot()
+    assert snapshot["copper"]["conductivity"] == pytest.approx(5.8e7)
+    assert snapshot["copper"]["permittivity"] == 1.0
+    assert snapshot["fr4"]["dielectric_loss_tangent"] == pytest.approx(0.02)
+    assert snapshot["fr4"]["dc_permittivity"] is None
+
+    materials.snapshot()
+    for material_def in materials._Materials__edb.active_db.material_defs:
+        assert material_def.get_property.call_count == len(material_def.all_properties)
+
+
+def test_snapshot_returns_copies(materials):
+    materials.snapshot()["copper"]["conductivity"] = 0.0
+    assert materials.snapshot()["copper"]["conductivity"] == pytest.approx(5.8e7)
+
+
+def test_to_dict_uses_snapshot(materials):
+    material_def = materials._Materials__edb.active_db.material_defs[1]
+    material = Material(materials._Materials__edb, material_def)
+    first = material.to_dict()
+    assert first["name"] == "fr4"
+    assert first["permittivity"] == pytest.approx(4.4)
+    material.to_dict()
+    assert material_def.get_property.call_count == 2
+
+
+def test_material_edit_invalidates_snapshot(materials):
+    material_def = materials._Materials__edb.active_db.material_defs[0]
+    materials.snapshot()
+    material = Material(materials._Materials__edb, material_def)
+    material._Material__edb._value_setter = lambda value: value
+    material.permittivity = 2.0
+    assert not materials._snapshot_complete
+    materials.snapshot()
+    assert material_def.get_property.call_count == 2
+
+
+def test_refresh_rereads_database(materials):
+    materials.snapshot()
+    materials._Materials__edb.active_db.material_defs.append(_material_def("air", permittivity=1.0006))
+    assert "air" not in materials.snapshot()
+    assert "air" in materials.snapshot(refresh=True)
+
+
+def test_properties_by_name_reads_one_material(materials, monkeypatch):
+    copper, fr4 = materials._Materials__edb.active_db.material_defs
+    copper.is_null = fr4.is_null = False
+    missing = MagicMock(is_null=True)
+    by_name = {"copper": copper, "fr4": fr4}
+    monkeypatch.setattr(
+        "pyedb.grpc.database.definition.materials.CoreMaterialDef.find_by_name",
+        lambda _, name: by_name.get(name, missing),
+    )
+    assert materials._properties_by_name("copper")["conductivity"] == pytest.approx(5.8e7)
+    assert materials._properties_by_name("copper")["conductivity"] == pytest.approx(5.8e7)
+    assert copper.get_property.call_count == 1
+    assert fr4.get_property.call_count == 0
+    assert materials._properties_by_name("unknown") is None
+    materials.snapshot()
+    assert materials._properties_by_name("unknown") is None
+    assert copper.get_property.call_count == 1
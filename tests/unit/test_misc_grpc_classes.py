@@ -528,7 +528,7 @@ class TestLayer:
         layer._name = "solder_mask_top"
         layer._color = ()
         layer._type = ""
-        layer._cloned_layer = core.clone.return_value
+        layer._clone = core.clone.return_value
         return layer, core
 
     def test_id(self):
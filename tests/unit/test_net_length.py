@@ -0,0 +1,193 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the routed net length engine of the DRC workflows — no license required."""
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pyedb.workflows.drc.drc import DiffPair, DiffPairLengthMatch, Drc, Rules
+from pyedb.workflows.drc.net_length import NetLengthEngine
+from pyedb.workflows.drc.violations import ViolationStore
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+ARC = sys.float_info.max
+
+
+def _path(net, layer, points):
+    return SimpleNamespace(net_name=net, layer_name=layer, center_line=[list(point) for point in points])
+
+
+def _instance(net, x, y, layers, name=None):
+    return SimpleNamespace(
+        net_name=net,
+        is_pin=name is not None,
+        aedt_name=name,
+        id=hash((net, x, y)),
+        position=[SimpleNamespace(value=x), SimpleNamespace(value=y)],
+        layer_range_names=list(layers),
+    )
+
+
+class _Layout:
+    def __init__(self, paths, instances):
+        self._paths = paths
+        self.padstack_instances = instances
+        self.path_reads = 0
+
+    @property
+    def paths(self):
+        self.path_reads += 1
+        return self._paths
+
+
+def _edb():
+    paths = [
+        # P: U1-1 -> TOP trace -> via -> BOT trace -> U2-1, with a 3 mm stub on TOP.
+        _path("P", "TOP", [(0.0, 0.0), (10e-3, 0.0)]),
+        _path("P", "BOT", [(10e-3, 0.0), (10e-3, 5e-3)]),
+        _path("P", "TOP", [(0.0, 0.0), (0.0, 3e-3)]),
+        _path("N", "TOP", [(0.0, 1e-3), (15e-3, 1e-3)]),
+        # Half circle of 1 mm radius.
+        _path("ARC", "TOP", [(0.0, 0.0), (1e-3, ARC), (2e-3, 0.0)]),
+        _path("OTHER", "BOT", [(0.0, 0.0), (1.0, 0.0)]),
+    ]
+    instances = [
+        _instance("P", 0.0, 0.0, ["TOP"], "U1-1"),
+        _instance("P", 10e-3, 0.0, ["TOP", "BOT"]),
+        _instance("P", 10e-3, 5e-3, ["BOT"], "U2-1"),
+        _instance("N", 0.0, 1e-3, ["TOP"], "U1-2"),
+        _instance("N", 15e-3, 1e-3, ["TOP"], "U2-2"),
+        _instance("N", 5e-3, 5e-3, ["BOT"], "U3-2"),
+    ]
+    layers = {
+        "TOP": SimpleNamespace(lower_elevation=0.9e-3, upper_elevation=1.0e-3),
+        "BOT": SimpleNamespace(lower_elevation=0.0, upper_elevation=0.1e-3),
+    }
+    return SimpleNamespace(layout=_Layout(paths, instances), stackup=SimpleNamespace(layers=layers))
+
+
+def test_total_and_layer_lengths_include_vias_and_arcs():
+    engine = NetLengthEngine(_edb())
+
+    routing = engine.routing("P")
+
+    assert routing.trace_length == pytest.approx(18e-3)
+    assert routing.via_length == pytest.approx(0.9e-3)
+    assert engine.total_length("P") == pytest.approx(18.9e-3)
+    assert engine.layer_lengths("P") == pytest.approx({"TOP": 13e-3, "BOT": 5e-3})
+    assert routing.pins == ["U1-1", "U2-1"]
+    assert engine.total_length("ARC") == pytest.approx(np.pi * 1e-3)
+
+
+def test_nets_are_read_in_one_pass_and_cached():
+    edb = _edb()
+    engine = NetLengthEngine(edb)
+
+    lengths = engine.lengths(["P", "N", "ARC", "P"])
+    engine.total_length("N")
+
+    assert lengths == pytest.approx([18.9e-3, 15e-3, np.pi * 1e-3, 18.9e-3])
+    assert edb.layout.path_reads == 1
+    assert "OTHER" not in engine._routings
+
+    engine.clear_cache(["N"])
+    engine.total_length("N")
+    assert edb.layout.path_reads == 2
+
+
+def test_unrouted_net_has_no_length():
+    engine = NetLengthEngine(_edb())
+
+    assert engine.total_length("MISSING") == 0.0
+    assert engine.layer_lengths("MISSING") == {}
+
+
+def test_pin_to_pin_length_follows_the_routing():
+    engine = NetLengthEngine(_edb())
+
+    assert engine.pin_to_pin_length("P", "U1-1", "U2-1") == pytest.approx(15.9e-3)
+    assert engine.pin_to_pin_length("P", "U2-1", "U1-1") == pytest.approx(15.9e-3)
+    assert engine.pin_to_pin_length("N", "U1-2", "U2-2") == pytest.approx(15e-3)
+    assert engine.pin_to_pin_length("N", "U1-2", "U3-2") is None
+    with pytest.raises(KeyError):
+        engine.pin_to_pin_length("N", "U1-2", "U9-9")
+
+
+def test_match_groups():
+    engine = NetLengthEngine(_edb())
+
+    matches = engine.match_groups({"pair": ["P", "N"], "single": ["ARC"], "lane": ["N", "ARC", "P"], "empty": []})
+
+    assert set(matches) == {"pair", "single", "lane"}
+    assert matches["pair"].delta == pytest.approx(3.9e-3)
+    assert matches["pair"].lengths == pytest.approx([18.9e-3, 15e-3])
+    assert (matches["pair"].longest, matches["pair"].shortest) == ("P", "N")
+    assert matches["single"].delta == 0.0
+    assert (matches["lane"].longest, matches["lane"].shortest) == ("P", "ARC")
+    assert matches["lane"].delta == pytest.approx(18.9e-3 - np.pi * 1e-3)
+
+
+def test_drc_diff_pair_length_match_uses_routed_lengths():
+    edb = _edb()
+    edb.nets = SimpleNamespace(nets={"P": None, "N": None, "ARC": None})
+    edb.value = lambda value: {"1mm": 1e-3, "5mm": 5e-3}[value]
+    drc = Drc.__new__(Drc)
+    drc.edb = edb
+    drc.violations = []
+    drc.net_lengths = NetLengthEngine(edb)
+    pairs = [DiffPair(positive="P", negative="N"), DiffPair(positive="N", negative="ARC")]
+    pairs.append(DiffPair(positive="P", negative="UNKNOWN"))
+
+    drc._rule_diff_pair_length_match(DiffPairLengthMatch(name="dp", tolerance="5mm", pairs=pairs))
+    assert [(v["positive"], v["negative"]) for v in drc.violations] == [("N", "ARC")]
+
+    drc._rule_diff_pair_length_match(DiffPairLengthMatch(name="dp", tolerance="1mm", pairs=pairs))
+    assert drc.violations[1]["delta_um"] == pytest.approx(3.9e-3)
+    assert drc.violations[1]["limit_um"] == 1e-3
+    assert edb.layout.path_reads == 1
+
+
+def test_drc_check_reads_routings_again():
+    edb = _edb()
+    edb.nets = SimpleNamespace(nets={"P": None, "N": None})
+    edb.value = lambda value: {"5mm": 5e-3}[value]
+    drc = Drc.__new__(Drc)
+    drc.edb = edb
+    drc.violations = ViolationStore()
+    drc.copper_density_maps = {}
+    drc.net_lengths = NetLengthEngine(edb)
+    rules = Rules(
+        diff_pair_length_match=[
+            DiffPairLengthMatch(name="dp", tolerance="5mm", pairs=[DiffPair(positive="P", negative="N")])
+        ]
+    )
+
+    drc.check(rules)
+    drc.check(rules)
+
+    assert edb.layout.path_reads == 2
@@ -0,0 +1,127 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Unit tests for the net-name pattern index and its users."""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyedb.generic.net_name_index import NetNameIndex, _regex_literal_prefix
+from pyedb.grpc.database.net.differential_pair import DifferentialPairs
+from pyedb.workflows.drc.drc import Drc
+from pyedb.workflows.sipi.hfss_auto_configuration import HFSSAutoConfiguration
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+NAMES = ["GND", "VDD_1V8", "vdd_core", "DDR4_DQ0", "DDR4_DQ1", "DDR4_DQS0_P", "DDR4_DQS0_N", "DQ[0]", "CLK_P", "CLK_N"]
+
+
+def _brute_wildcard(names, pattern, flags=0):
+    body = "".join(".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern)
+    return sorted(n for n in names if re.fullmatch(body, n, flags | re.DOTALL))
+
+
+class TestNetNameIndex:
+    def test_prefix_and_suffix(self):
+        index = NetNameIndex(NAMES)
+        assert index.prefix("DDR4_DQ") == ["DDR4_DQ0", "DDR4_DQ1", "DDR4_DQS0_N", "DDR4_DQS0_P"]
+        assert index.prefix("vdd", case_sensitive=False) == ["VDD_1V8", "vdd_core"]
+        assert index.suffix("_P") == ["CLK_P", "DDR4_DQS0_P"]
+        assert index.suffix("_p", case_sensitive=False) == ["CLK_P", "DDR4_DQS0_P"]
+        assert index.prefix("") == sorted(NAMES)
+
+    @pytest.mark.parametrize(
+        "pattern", ["DDR4_*", "*_P", "DDR4_*_N", "*DQ*", "DDR4_DQ?", "?ND", "*", "DQ[0]", "DQ[*]", "VDD*", "MISSING*"]
+    )
+    @pytest.mark.parametrize("case_sensitive", [True, False])
+    def test_wildcard_matches_brute_force(self, pattern, case_sensitive):
+        index = NetNameIndex(NAMES)
+        flags = 0 if case_sensitive else re.IGNORECASE
+        assert index.wildcard(pattern, case_sensitive) == _brute_wildcard(NAMES, pattern, flags)
+
+    @pytest.mark.parametrize(
+        "pattern", ["DDR4.*", r"DDR4_DQS?\d", "CLK_[PN]", "vdd.*", "(GND|CLK).*", r"DQ\[0\]", "D+R"]
+    )
+    def test_regex_matches_brute_force(self, pattern):
+        index = NetNameIndex(NAMES)
+        for flags in (0, re.IGNORECASE):
+            expected = sorted(n for n in NAMES if re.match(pattern, n, flags))
+            assert index.regex(pattern, flags) == expected
+            assert index.regex(re.compile(pattern, flags)) == expected
+
+    def test_regex_literal_prefix(self):
+        assert _regex_literal_prefix("PCIe.*") == "PCIe"
+        assert _regex_literal_prefix(r"DDR4_DQS?\d") == "DDR4_DQ"
+        assert _regex_literal_prefix(r"DQ\[0\]") == "DQ[0]"
+        assert _regex_literal_prefix("(GND|CLK).*") == ""
+        assert _regex_literal_prefix(r"\dA") == ""
+
+    def test_select_prefers_exact_names(self):
+        index = NetNameIndex(NAMES + ["A*B"])
+        assert index.select("A*B") == ["A*B"]
+        assert index.select("GND", "CLK_?") == ["CLK_N", "CLK_P", "GND"]
+        assert index.select("gnd", re.compile("VDD"), case_sensitive=False) == ["GND", "VDD_1V8"]
+
+    def test_incremental_updates(self):
+        index = NetNameIndex(NAMES)
+        index.prefix("vdd", case_sensitive=False)
+        index.suffix("_n", case_sensitive=False)
+        index.add("VDD_3V3")
+        index.rename("CLK_N", "CLK_M")
+        index.discard("GND")
+        index.discard("GND")
+        index.update([f"BUS{i}" for i in range(100)])
+        names = set(NAMES) - {"GND", "CLK_N"} | {"VDD_3V3", "CLK_M"} | {f"BUS{i}" for i in range(100)}
+        assert list(index) == sorted(names)
+        assert len(index) == len(names)
+        assert index.prefix("VDD", case_sensitive=False) == ["VDD_1V8", "VDD_3V3", "vdd_core"]
+        assert index.suffix("_n", case_sensitive=False) == ["DDR4_DQS0_N"]
+        assert index.wildcard("BUS9?") == [f"BUS9{i}" for i in range(10)]
+
+
+class TestIndexUsers:
+    def test_auto_identify_pairs_by_suffix(self):
+        pedb = MagicMock()
+        pedb.nets.name_index = NetNameIndex(NAMES + ["LONE_P", "_P", "_N"])
+        pairs = DifferentialPairs(pedb)
+        pairs.create = MagicMock()
+        assert pairs.auto_identify() == ["DIFF_CLK", "DIFF_DDR4_DQS0"]
+        pairs.create.assert_any_call("DIFF_CLK", "CLK_P", "CLK_N")
+
+    def test_group_nets_by_prefix_first_pattern_wins(self):
+        config = HFSSAutoConfiguration()
+        config.signal_nets = ["PCIe_RX0_P", "PCIe_RX0_N", "pcie_TX0", "PCIe_TX1", "USB3_DP", "USB3_DN", "DDR4_A0"]
+        groups = config.group_nets_by_prefix(["PCIe", "PCIe_TX", "USB"])
+        assert groups == {
+            "PCIe": [["PCIe_RX0_N", "PCIe_RX0_P", "PCIe_TX1", "pcie_TX0"]],
+            "USB": [["USB3_DN", "USB3_DP"]],
+        }
+
+    def test_drc_expands_wildcards_without_index(self):
+        drc = Drc.__new__(Drc)
+        drc.edb = MagicMock()
+        del drc.edb.nets.name_index
+        drc.edb.nets.nets = dict.fromkeys(NAMES)
+        assert drc._net_name_index().select("CLK*") == ["CLK_N", "CLK_P"]
+        assert drc._net_name_index().select("*") == sorted(NAMES)
@@ -22,6 +22,7 @@
 
 """Unit tests for pyedb.grpc.database.nets (Nets and NetClasses) — no license required."""
 
+from collections.abc import Mapping
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -82,6 +83,10 @@ def _make_nets(net_specs=None):
     nets._pedb = pedb
     nets._nets_by_comp_dict = {}
     nets._comps_by_nets_dict = {}
+    nets._registry = None
+    nets._name_index = None
+    nets._table = None
+    nets._table_components = None
     return nets, mock_nets
 
 
@@ -109,10 +114,18 @@ class TestNetsProperties:
     def test_nets_returns_dict_keyed_by_name(self):
         nets, _ = _make_nets()
         result = nets.nets
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
         assert "GND" in result
         assert "SIG_A" in result
 
+    def test_nets_is_a_read_only_view_of_the_registry(self):
+        nets, _ = _make_nets()
+        result = nets.nets
+        with pytest.raises(TypeError):
+            result["NEW"] = None
+        nets._net_registry["NEW"] = None
+        assert "NEW" in result
+
     def test_nets_excludes_null_nets(self):
         net_specs = [("GND", True), ("NULLNET", False)]
         nets, mock_nets = _make_nets(net_specs)
@@ -172,23 +185,27 @@ class TestClassifyNets:
         nets, mock_nets = _make_nets()
         # SIG_A -> power, GND -> signal
         nets.classify_nets(power_nets=["SIG_A"], signal_nets=["GND"])
-        # The mock net for SIG_A should have is_power_ground set to True
         sig_a = next(n for n in mock_nets if n.name == "SIG_A")
         gnd = next(n for n in mock_nets if n.name == "GND")
-        sig_a.__setattr__  # ensure mock supports attribute access
-        assert sig_a.is_power_ground  # mock allows this write
+        assert sig_a.is_power_ground is True
+        assert gnd.is_power_ground is False
 
     def test_classify_nets_with_none_defaults_to_empty(self):
         nets, _ = _make_nets()
         result = nets.classify_nets(power_nets=None, signal_nets=None)
         assert result is True
 
-    def test_classify_nets_with_string_coerced_to_empty_list(self):
-        # When a string is passed (current behavior coerces to []),
-        # verify no exception is raised and True is returned.
-        nets, _ = _make_nets()
-        result = nets.classify_nets(power_nets="GND", signal_nets="SIG_A")
+    def test_classify_nets_with_string(self):
+        nets, mock_nets = _make_nets()
+        result = nets.classify_nets(power_nets="SIG_A", signal_nets="GND")
         assert result is True
+        assert mock_nets[2].is_power_ground is True
+        assert mock_nets[0].is_power_ground is False
+
+    def test_classify_nets_with_wildcard(self):
+        nets, mock_nets = _make_nets()
+        nets.classify_nets(power_nets=["SIG_*"])
+        assert [n.name for n in mock_nets if n.is_power_ground] == ["GND", "VDD", "SIG_A", "SIG_B"]
 
     def test_classify_nets_skips_unknown_nets(self):
         nets, _ = _make_nets()
@@ -856,3 +873,113 @@ class TestNetClassesCreateMultipleNets:
                 result = nc.create("MULTI_CLASS", ["GND", "VDD"])
 
         assert new_core.add_net.call_count == 2
+
+
+class TestNetsNameIndex:
+    def test_name_index_built_once_from_layout(self):
+        nets, _ = _make_nets([("GND", True), ("NULLNET", False), ("DDR_DQ0", False)])
+        nets._pedb.layout.nets[1].is_null = True
+        index = nets.name_index
+        assert list(index) == ["DDR_DQ0", "GND"]
+        assert nets.name_index is index
+
+    def test_select_accepts_single_and_list_selectors(self):
+        nets, _ = _make_nets()
+        assert nets.select("SIG_*") == ["SIG_A", "SIG_B"]
+        assert nets.select(["usb_*", "GND"], case_sensitive=False) == ["GND", "USB_DP"]
+
+    def test_net_create_rename_delete_update_index(self):
+        from pyedb.grpc.database.net.net import Net
+
+        nets, _ = _make_nets()
+        nets._pedb._nets = nets
+        index = nets.name_index
+        layout = MagicMock()
+        layout._pedb = nets._pedb
+        with patch("pyedb.grpc.database.net.net.CoreNet") as core_net:
+            core_net.create.return_value = MagicMock(name="core")
+            core_net.create.return_value.name = "SIG_C"
+            net = Net.create(layout, "SIG_C")
+        assert "SIG_C" in index
+        net.name = "SIG_D"
+        assert "SIG_C" not in index and "SIG_D" in index
+        net.delete()
+        assert "SIG_D" not in index
+        assert nets.select("SIG_*") == ["SIG_A", "SIG_B"]
+
+    def test_clear_cache(self):
+        nets, mock_nets = _make_nets()
+        assert "NEW" not in nets.name_index
+        mock_nets.append(_make_mock_net("NEW"))
+        assert "NEW" not in nets
+        nets.clear_cache()
+        assert "NEW" in nets.name_index
+        assert "NEW" in nets
+
+    def test_clear_name_index_is_clear_cache(self):
+        nets, mock_nets = _make_nets()
+        nets.name_index
+        mock_nets.append(_make_mock_net("NEW"))
+        nets.clear_name_index()
+        assert "NEW" in nets.name_index
+        assert "NEW" in nets
+
+
+class TestNetsRegistry:
+    def test_layout_traversed_once(self):
+        nets, _ = _make_nets()
+        traversals = []
+
+        class CountingNets(list):
+            def __iter__(self):
+                traversals.append(1)
+                return super().__iter__()
+
+        nets._pedb.layout.nets = CountingNets(nets._pedb.layout.nets)
+        nets.classify_nets(power_nets=["SIG_A", "SIG_B"], signal_nets="GND")
+        assert "SIG_A" in nets.power and "GND" in nets.signal
+        assert nets.netlist == ["GND", "VDD", "SIG_A", "SIG_B", "USB_DP"]
+        assert len(traversals) == 1
+
+    def test_registry_follows_create_rename_delete(self):
+        from pyedb.grpc.database.net.net import Net
+
+        nets, _ = _make_nets()
+        nets._pedb._nets = nets
+        assert "SIG_C" not in nets
+        layout = MagicMock()
+        layout._pedb = nets._pedb
+        with patch("pyedb.grpc.database.net.net.CoreNet") as core_net:
+            core_net.create.return_value.name = "SIG_C"
+            net = Net.create(layout, "SIG_C")
+        assert nets.nets["SIG_C"] is net
+        net.name = "SIG_D"
+        assert "SIG_C" not in nets and nets.nets["SIG_D"] is net
+        net.delete()
+        assert "SIG_D" not in nets.netlist
+
+    def test_table_single_pass_and_updates(self):
+        nets, mock_nets = _make_nets()
+        nets._pedb._nets = nets
+        for i, net in enumerate(mock_nets):
+            net.core.name = net.name
+            net.core.is_power_ground = net.is_power_ground
+            net.core.primitives = [object()] * i
+        nets._pedb.components.table.net_pins = {"VDD": [("U1", "A1"), ("U1", "A2"), ("C1", "1")]}
+        table = nets.table
+        assert nets.table is table
+        assert table.nets["VDD"].primitive_count == 1
+        assert table.nets["VDD"].component_count == 2
+        assert table.nets["USB_DP"].primitive_count == 4
+        assert table.power_ground == ["GND", "VDD"]
+        assert list(table.to_numpy()["component_count"]) == [0, 2, 0, 0, 0]
+
+        from pyedb.grpc.database.net.net import Net
+
+        mock_nets[2].core.is_null = False
+        wrapper = Net(nets._pedb, mock_nets[2].core)
+        wrapper.is_power_ground = True
+        assert table.nets["SIG_A"].is_power_ground is True
+        nets._pedb.components.table = MagicMock(net_pins={})
+        assert nets.table is not table
+        assert nets.table.nets["VDD"].component_count == 0
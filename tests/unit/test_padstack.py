@@ -172,6 +172,7 @@ class TestGrpcPadstacksStatic:
     def test_clear_instances_cache(self):
         """clear_instances_cache resets both instance caches to empty dicts."""
         padstacks = self.Padstacks.__new__(self.Padstacks)
+        padstacks._pedb = MagicMock()
         padstacks._instances_by_name = {"a": MagicMock()}
         padstacks._instances_by_net = {"GND": [MagicMock()]}
         padstacks.clear_instances_cache()
@@ -0,0 +1,108 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pyedb.generic.polygon_arrays import (
+    ARC_SENTINEL,
+    as_vertex_array,
+    flat_point_array,
+    polyline_length,
+    split_flat_points,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+SQUARE = np.array([[0.0, 0.0], [1e-3, 0.0], [1e-3, 1e-3], [0.0, 1e-3]])
+
+
+def test_numeric_lists_are_detected_once():
+    xy, heights = as_vertex_array(SQUARE.tolist())
+    np.testing.assert_array_equal(xy, SQUARE)
+    assert not heights.any()
+
+
+@pytest.mark.parametrize("points", [[[0, "1mm"], [1, 2]], [[0, 1], [1, 2, 3]], [[0, 1, 2, 3]], "abc"])
+def test_non_numeric_or_ragged_points_are_rejected(points):
+    assert as_vertex_array(points) is None
+
+
+def test_third_column_and_explicit_arc_heights():
+    points = np.column_stack([SQUARE, [0, 0, 2e-4, 0]])
+    _, heights = as_vertex_array(points)
+    np.testing.assert_array_equal(heights, [0, 0, 2e-4, 0])
+    _, heights = as_vertex_array(points, arc_heights=[1e-4, 0, 0, 0])
+    np.testing.assert_array_equal(heights, [1e-4, 0, 0, 0])
+    with pytest.raises(ValueError):
+        as_vertex_array(SQUARE, arc_heights=[0, 0])
+
+
+def test_flat_point_array_inserts_arc_points():
+    assert flat_point_array(SQUARE, np.zeros(4)) is SQUARE
+    flat = flat_point_array(SQUARE, np.array([5e-4, 0, 2e-4, 0]))
+    expected = [
+        [0.0, 0.0],
+        [1e-3, 0.0],
+        [2e-4, ARC_SENTINEL],
+        [1e-3, 1e-3],
+        [0.0, 1e-3],
+        [5e-4, ARC_SENTINEL],
+    ]
+    np.testing.assert_array_equal(flat, expected)
+
+
+def test_split_flat_points_inverts_flat_point_array():
+    heights = np.array([5e-4, 0, 2e-4, 0])
+
+    xy, split_heights = split_flat_points(flat_point_array(SQUARE, heights))
+
+    np.testing.assert_array_equal(xy, SQUARE)
+    np.testing.assert_array_equal(split_heights, heights)
+
+
+def test_polyline_length_with_arcs():
+    half_circle = np.array([[0.0, 0.0], [2e-3, 0.0]])
+
+    assert polyline_length(SQUARE) == pytest.approx(3e-3)
+    assert polyline_length(SQUARE, closed=True) == pytest.approx(4e-3)
+    assert polyline_length(half_circle, np.array([0.0, 1e-3])) == pytest.approx(np.pi * 1e-3)
+    assert polyline_length(half_circle, np.array([0.0, -1e-3])) == pytest.approx(np.pi * 1e-3)
+    assert polyline_length(SQUARE[:1]) == 0.0
+
+
+def test_grpc_polygon_data_from_array():
+    from pyedb.grpc.database.geometry.polygon_data import PolygonData
+
+    arc_heights = np.array([0, 0, 2e-4, 0])
+    polygon = PolygonData.create_from_array(MagicMock(), SQUARE, arc_heights=arc_heights, voids=[SQUARE * 0.5])
+    points = polygon.core.points
+    assert len(points) == 5
+    assert points[2].is_arc
+    assert points[2].arc_height.double == pytest.approx(2e-4)
+    assert (points[3].x.double, points[3].y.double) == (1e-3, 1e-3)
+    assert len(polygon.core.holes) == 1
+    with pytest.raises(TypeError):
+        PolygonData.create_from_array(MagicMock(), [["1mm", 0], [0, 0]])
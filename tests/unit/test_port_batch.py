@@ -0,0 +1,126 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the batched port creation of the gRPC source excitations."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyedb.generic.reference_pin_index import ReferencePinIndex
+from pyedb.grpc.database import source_excitations
+from pyedb.grpc.database.source_excitations import SourceExcitation
+from pyedb.grpc.database.utility.port_batch import PortBatchReport, PortBatchSpec
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _pin(pid, net_name, x, y):
+    pin = MagicMock()
+    pin.id = pid
+    pin.name = str(pid)
+    pin.net_name = net_name
+    pin.position = [x, y]
+    pin.terminal = None
+    pin.get_layer_range.return_value = ("TOP", "BOTTOM")
+    return pin
+
+
+@pytest.fixture
+def board(monkeypatch):
+    pins = {
+        "A1": _pin(1, "TX_P", 0, 0),
+        "A2": _pin(2, "TX_P", 1e-3, 0),
+        "A3": _pin(3, "TX_N", 2e-3, 0),
+        "B1": _pin(4, "GND", 0, 1e-3),
+        "B2": _pin(5, "GND", 2e-3, 1e-3),
+    }
+    component = MagicMock()
+    component.pins = pins
+    pedb = MagicMock()
+    pedb.components.instances = {"U1": component}
+    existing = MagicMock()
+    existing.name = "U1_TX_P_A1"
+    pedb.layout.terminals = [existing]
+    pedb.layout.pin_groups = []
+    pedb.padstacks.reference_pin_index.side_effect = lambda net, scope: ReferencePinIndex(
+        [pin for pin in pins.values() if pin.net_name == net]
+    )
+    created = []
+
+    def create(kind):
+        def factory(layout, name, *args, **kwargs):
+            terminal = MagicMock()
+            terminal.name = name
+            created.append((kind, name, args))
+            return terminal
+
+        return factory
+
+    monkeypatch.setattr(source_excitations.PadstackInstanceTerminal, "create", create("pin"))
+    monkeypatch.setattr(source_excitations.PinGroupTerminal, "create", create("pin_group_terminal"))
+    monkeypatch.setattr(source_excitations.PinGroup, "create", create("pin_group"))
+    return SourceExcitation(pedb), pins, created
+
+
+def test_spec_validation():
+    spec = PortBatchSpec("U1", nets="TX_P", reference_nets=["GND", "TX_P"])
+    assert spec.nets == []
+    with pytest.raises(ValueError):
+        PortBatchSpec("U1", nets=["TX_P"], reference_nets=["GND"], reference="closest")
+    with pytest.raises(ValueError):
+        PortBatchSpec("U1", nets=["TX_P"])
+
+
+def test_shared_pin_group_reference(board):
+    excitations, pins, created = board
+    report = excitations.create_port_batch(component="U1", nets=["TX_P", "TX_N", "RX"], reference_nets="GND")
+    assert isinstance(report, PortBatchReport)
+    assert list(report.ports) == ["U1_TX_P_A1_1", "U1_TX_P_A2", "U1_TX_N_A3"]
+    assert list(report.reference_terminals) == ["U1_GND_ref"]
+    reference = report.reference_terminals["U1_GND_ref"]
+    assert all(port.reference_terminal is reference for port in report.ports.values())
+    assert report.skipped == [("RX", "no pin on component U1")]
+    assert [kind for kind, _, _ in created].count("pin_group") == 1
+    assert set(report.timings) == {"collect", "reference", "terminals"}
+    assert report.to_dict()["elapsed"] == pytest.approx(report.elapsed)
+
+
+def test_group_by_net_with_nearest_reference(board):
+    excitations, pins, created = board
+    spec = PortBatchSpec("U1", nets=["TX_P", "TX_N"], reference_nets=["GND"], reference="nearest", group_by_net=True)
+    report = excitations.create_port_batch(spec)
+    assert list(report.ports) == ["U1_TX_P_A1_1", "U1_TX_N_A3"]
+    assert ("pin_group", "U1_TX_P", ([pins["A1"], pins["A2"]],)) in created
+    tx_p, tx_n = report.ports.values()
+    assert tx_p.reference_terminal is not tx_n.reference_terminal
+    assert len(report.reference_terminals) == 2
+
+
+def test_nearest_reference_out_of_range_is_skipped(board):
+    excitations, pins, created = board
+    report = excitations.create_port_batch(
+        component="U1", nets=["TX_N"], reference_nets=["GND"], reference="nearest", search_radius=1e-4
+    )
+    assert report.ports == {}
+    assert report.skipped == [("A3", "no reference pin within 0.0001 m")]
@@ -0,0 +1,112 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the shared reference pin spatial index."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from pyedb.generic.reference_pin_index import ReferencePinIndex
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _pin(name, x, y, terminal=None):
+    pin = MagicMock()
+    pin.name = name
+    pin.position = [x, y]
+    pin.terminal = terminal
+    return pin
+
+
+@pytest.fixture(params=["scipy", "numpy"])
+def make_index(request):
+    def make(pins, positions=None):
+        index = ReferencePinIndex(pins, positions)
+        if request.param == "numpy":
+            index._tree = None
+        return index
+
+    return make
+
+
+def test_query_radius_sorted_and_inclusive(make_index):
+    index = make_index(["a", "b", "c", "d"], [[0, 0], [2e-3, 0], [1e-3, 0], [3e-3, 0]])
+    assert index.query_radius([0, 0], 2e-3) == ["a", "c", "b"]
+    assert index.query_radius([0, 0], 2e-3, max_limit=2) == ["a", "c"]
+
+
+def test_query_radius_many_matches_brute_force(make_index):
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(0, 0.05, (300, 2))
+    points = rng.uniform(0, 0.05, (40, 2))
+    index = make_index(list(range(300)), positions)
+    results = index.query_radius_many(points, 4e-3, max_limit=3)
+    for point, result in zip(points, results):
+        distances = np.hypot(*(positions - point).T)
+        expected = [i for i in np.argsort(distances, kind="stable") if distances[i] <= 4e-3][:3]
+        assert result == expected
+
+
+def test_predicate_skips_before_limit(make_index):
+    pins = [_pin("near", 0, 0, terminal=MagicMock()), _pin("far", 1e-3, 0)]
+    index = make_index(pins)
+    assert index.query_radius([0, 0], 2e-3, 1, lambda pin: pin.terminal is None) == [pins[1]]
+
+
+def test_nearest(make_index):
+    index = make_index(["a", "b", "c"], [[0, 0], [1, 0], [2, 0]])
+    assert index.nearest([[1.9, 0], [0.2, 0]], k=2) == [["c", "b"], ["a", "b"]]
+    assert index.nearest([[10, 0]], max_distance=1) == [[]]
+
+
+def test_empty_index(make_index):
+    index = make_index([])
+    assert len(index) == 0
+    assert index.query_radius_many([[0, 0], [1, 1]], 1.0) == [[], []]
+    assert index.nearest([[0, 0]]) == [[]]
+
+
+def test_positions_must_match_pins():
+    with pytest.raises(ValueError):
+        ReferencePinIndex(["a"], [[0, 0], [1, 1]])
+
+
+def test_grpc_padstacks_share_index_between_pins():
+    from pyedb.grpc.database.padstacks import Padstacks
+
+    ground = [_pin("g1", 0, 0), _pin("g2", 4e-3, 0)]
+    pedb = MagicMock()
+    pedb.layout.padstack_instances = []
+    padstacks = Padstacks(pedb)
+    padstacks._instances_by_net = {"GND": ground}
+
+    first = padstacks.get_reference_pins(_pin("s1", 3e-3, 0), "GND", 5e-3, max_limit=1, component_only=False)
+    second = padstacks.get_reference_pins(_pin("s2", 1e-3, 0), "GND", 5e-3, component_only=False)
+    assert first == [ground[1]]
+    assert second == [ground[0], ground[1]]
+    assert list(padstacks._reference_pin_indexes) == [("GND", None)]
+    padstacks.clear_instances_cache()
+    assert padstacks._reference_pin_indexes == {}
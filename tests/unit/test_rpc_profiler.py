@@ -0,0 +1,137 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for the RPC profiler — stubs are replaced by in-process fakes."""
+
+import json
+
+from ansys.api.edb.v1.edb_messages_pb2 import ValueMessage
+from ansys.edb.core import session as core_session
+from ansys.edb.core.session import StubAccessor, StubType, _Session
+import pytest
+from typer.testing import CliRunner
+
+from pyedb.cli import app, common
+from pyedb.grpc import rpc_profiler as profiler_module
+from pyedb.grpc.rpc_profiler import RpcProfiler
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+class FakeValueStub:
+    def CreateValue(self, request):
+        return ValueMessage(text=request.text)
+
+    def StreamValues(self, request):
+        yield ValueMessage(text="a")
+        yield ValueMessage(text="bb")
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    session = _Session.__new__(_Session)
+    session.channel = object()
+    session.stubs = {StubType.value.name: FakeValueStub()}
+    monkeypatch.setattr(core_session.MOD, "current_session", session)
+    return session
+
+
+def _pyedb_api():
+    """Return a function that looks like a pyedb API to the profiler."""
+    namespace = {"__name__": "pyedb.fake.api", "StubAccessor": StubAccessor, "StubType": StubType}
+    exec(
+        "def create(text):\n"
+        "    from ansys.api.edb.v1.edb_messages_pb2 import ValueMessage\n"
+        "    return StubAccessor(StubType.value).__get__().CreateValue(ValueMessage(text=text))\n",
+        namespace,
+    )
+    return namespace["create"]
+
+
+def test_profiler_counts_calls_and_payloads(fake_session):
+    create = _pyedb_api()
+    with RpcProfiler() as profiler:
+        for _ in range(3):
+            assert create("1mm").text == "1mm"
+    report = profiler.report()
+    assert report["total"]["calls"] == 3
+    method = report["methods"][0]
+    assert method["method"] == "value.CreateValue"
+    assert method["request_bytes"] == method["response_bytes"] == 3 * ValueMessage(text="1mm").ByteSize()
+    assert report["api"][0]["api"] == "pyedb.fake.api.create"
+    assert report["api"][0]["calls"] == 3
+
+
+def test_profiler_is_inactive_outside_context(fake_session):
+    profiler = RpcProfiler()
+    with profiler:
+        pass
+    assert isinstance(fake_session.stub(StubType.value.name), FakeValueStub)
+    _pyedb_api()("1mm")
+    assert profiler.total_calls == 0
+    assert _Session.stub is profiler_module._original_stub
+
+
+def test_profiler_records_streamed_responses(fake_session):
+    with RpcProfiler() as profiler:
+        values = list(fake_session.stub(StubType.value.name).StreamValues(ValueMessage()))
+    assert [value.text for value in values] == ["a", "bb"]
+    method = profiler.report()["methods"][0]
+    assert method["calls"] == 1
+    assert method["response_bytes"] == sum(value.ByteSize() for value in values)
+
+
+def test_nested_profilers_both_record(fake_session):
+    create = _pyedb_api()
+    with RpcProfiler() as outer:
+        create("1")
+        with RpcProfiler() as inner:
+            create("2")
+        create("3")
+    assert outer.total_calls == 3
+    assert inner.total_calls == 1
+
+
+def test_collapsed_stacks(fake_session, tmp_path):
+    create = _pyedb_api()
+    with RpcProfiler() as profiler:
+        create("1mm")
+        create("2mm")
+    lines = profiler.collapsed_stacks(weight="calls")
+    assert len(lines) == 1
+    assert lines[0].endswith("pyedb.fake.api.create;value.CreateValue 2")
+    with pytest.raises(ValueError):
+        profiler.collapsed_stacks(weight="unknown")
+    path = profiler.write_flamegraph(tmp_path / "profile.folded")
+    assert "pyedb.fake.api.create;value.CreateValue " in path.read_text()
+    assert json.loads(profiler.write_json(tmp_path / "profile.json").read_text())["total"]["calls"] == 2
+    assert "value.CreateValue" in profiler.summary()
+
+
+def test_cli_profile_rpc_writes_reports(tmp_path):
+    common.reset_state()
+    report = tmp_path / "rpc.json"
+    result = CliRunner().invoke(app, ["--profile-rpc", str(report), "version"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(report.read_text())["total"]["calls"] == 0
+    assert (tmp_path / "rpc.folded").exists()
@@ -0,0 +1,210 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for RpcSessionPool — servers are replaced by in-process fakes."""
+
+import os
+import threading
+from types import SimpleNamespace
+
+from ansys.edb.core import session as core_session
+from ansys.edb.core.utility import io_manager as core_io_manager
+import pytest
+
+from pyedb.grpc import rpc_session_pool as pool_module
+from pyedb.grpc.edb_init import EdbInit
+from pyedb.grpc.rpc_session import RpcSession
+from pyedb.grpc.rpc_session_pool import RpcSessionPool, current_server
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+class FakeProcess:
+    def __init__(self):
+        self.pid = os.getpid()
+        self.dead = False
+
+    def poll(self):
+        return 1 if self.dead else None
+
+
+class FakeSession:
+    instances = []
+
+    def __init__(self, ip_address, port_num, ansys_em_root, dump_traffic_log):
+        self.port_num = port_num
+        self.ansys_em_root = ansys_em_root
+        self.local_server_proc = None
+        self.shared_memory = False
+        self.calls = []
+        FakeSession.instances.append(self)
+
+    def connect(self):
+        self.local_server_proc = FakeProcess()
+
+    def disconnect(self):
+        self.local_server_proc = None
+        if core_session.MOD.current_session is self:
+            core_session.MOD.current_session = None
+
+    def stub(self, name):
+        return SimpleNamespace(EnableCache=lambda msg: self.calls.append(name))
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeSession.instances = []
+    monkeypatch.setattr(pool_module, "_resolve_base_path", lambda version: "/fake/ansys")
+    monkeypatch.setattr(RpcSession, "_wait_for_process_exit", staticmethod(lambda proc, timeout=10.0: None))
+    pool = RpcSessionPool(size=2, edb_version="2026.1", session_factory=FakeSession).start()
+    yield pool
+    pool.close()
+
+
+def test_pool_launches_one_server_per_slot(pool):
+    ports = [server.port for server in pool.servers]
+    assert len(FakeSession.instances) == 2
+    assert len(set(ports)) == 2
+    assert all(server.is_alive() for server in pool.servers)
+    # Each server enabled caching through its own session.
+    assert all(session.calls == ["io_manager"] for session in FakeSession.instances)
+
+
+def test_session_binds_thread_to_server(pool):
+    global_session = core_session.MOD.current_session
+    global_io_manager = core_io_manager.MOD.io_manager
+    with pool.session() as server:
+        assert current_server() is server
+        assert core_session.MOD.current_session is server.session
+        assert core_io_manager.MOD.io_manager is server.io_manager
+    assert current_server() is None
+    assert core_session.MOD.current_session is global_session
+    assert core_io_manager.MOD.io_manager is global_io_manager
+
+
+def test_concurrent_sessions_use_distinct_servers(pool):
+    barrier = threading.Barrier(2)
+    seen = []
+
+    def worker():
+        with pool.session() as server:
+            barrier.wait(timeout=5)
+            seen.append((server.index, core_session.MOD.current_session))
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert sorted(index for index, _ in seen) == [0, 1]
+    assert seen[0][1] is not seen[1][1]
+
+
+def test_acquire_times_out_when_all_busy(pool):
+    first, second = pool.acquire(), pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+    pool.release(first)
+    assert pool.acquire(timeout=0.01) is first
+    pool.release(first)
+    pool.release(second)
+
+
+def test_dead_server_restarted_on_checkout(pool):
+    server = pool.servers[0]
+    old_session = server.session
+    old_session.local_server_proc.dead = True
+    assert pool.status()[0]["alive"] is False
+    with pool.session() as checked_out:
+        assert checked_out is server
+        assert server.session is not old_session
+        assert core_session.MOD.current_session is server.session
+    assert server.restarts == 1
+
+
+def test_health_check_restarts_idle_dead_servers(pool):
+    pool.servers[1].session.local_server_proc.dead = True
+    assert pool.health_check() == {0: True, 1: True}
+    assert pool.status()[1]["restarts"] == 1
+
+
+def test_close_stops_all_servers(pool):
+    sessions = list(FakeSession.instances)
+    pool.close()
+    assert pool.servers == []
+    assert all(session.local_server_proc is None for session in sessions)
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.acquire(timeout=0)
+
+
+def test_edb_init_opens_database_on_bound_server(pool, monkeypatch):
+    from ansys.edb.core import database
+
+    closed = []
+    opened_on = []
+
+    def fake_open(db_path, read_only):
+        opened_on.append(core_session.MOD.current_session)
+        return SimpleNamespace(close=lambda: closed.append(db_path))
+
+    monkeypatch.setattr(database.Database, "open", staticmethod(fake_open))
+    monkeypatch.setattr(RpcSession, "start", staticmethod(lambda **kw: pytest.fail("RpcSession must not start")))
+    monkeypatch.setattr(RpcSession, "close", staticmethod(lambda: pytest.fail("RpcSession must not close")))
+    monkeypatch.setattr(EdbInit, "_clean_variables", lambda self: None)
+    edb = EdbInit.__new__(EdbInit)
+    edb.logger = pool_module.settings.logger
+    edb._db = None
+    edb._pooled_server = None
+    with pool.session() as server:
+        assert edb._open("board.aedb", True) is not None
+        assert opened_on == [server.session]
+        assert server.open_db_count == 1
+        edb.close()
+    assert closed == ["board.aedb"]
+    assert server.open_db_count == 0
+
+
+def test_edb_init_rebinds_after_restart_on_open(pool, monkeypatch):
+    from ansys.edb.core import database
+
+    opened_on = []
+
+    def fake_open(db_path, read_only):
+        opened_on.append((core_session.MOD.current_session, core_io_manager.MOD.io_manager))
+        return SimpleNamespace(close=lambda: None)
+
+    monkeypatch.setattr(database.Database, "open", staticmethod(fake_open))
+    monkeypatch.setattr(EdbInit, "_clean_variables", lambda self: None)
+    edb = EdbInit.__new__(EdbInit)
+    edb.logger = pool_module.settings.logger
+    edb._db = None
+    edb._pooled_server = None
+    with pool.session() as server:
+        old_session = server.session
+        old_session.local_server_proc.dead = True
+        assert edb._open("board.aedb", True) is not None
+        assert server.session is not old_session
+        assert opened_on == [(server.session, server.io_manager)]
+        assert core_session.MOD.current_session is server.session
+        edb.close()
+    assert current_server() is None
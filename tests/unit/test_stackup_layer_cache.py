@@ -0,0 +1,145 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the cached layer views and transactional edits of the gRPC ``Stackup``."""
+
+from unittest.mock import MagicMock
+
+from ansys.edb.core.layer.layer_collection import LayerTypeSet as CoreLayerTypeSet
+import pytest
+
+from pyedb.grpc.database.layers.layer import Layer
+from pyedb.grpc.database.stackup import Stackup
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _core_layer(name):
+    layer = MagicMock()
+    layer.name = name
+    layer.is_null = False
+    return layer
+
+
+def _layer_collection():
+    layers = {
+        CoreLayerTypeSet.STACKUP_LAYER_SET: [_core_layer("top"), _core_layer("diel"), _core_layer("bottom")],
+        CoreLayerTypeSet.SIGNAL_LAYER_SET: [_core_layer("top"), _core_layer("bottom")],
+        CoreLayerTypeSet.DIELECTRIC_LAYER_SET: [_core_layer("diel")],
+        CoreLayerTypeSet.NON_STACKUP_LAYER_SET: [_core_layer("outline")],
+    }
+    core = MagicMock()
+    core.get_layers.side_effect = lambda layer_type_set: list(layers[layer_type_set])
+    return core, layers
+
+
+@pytest.fixture
+def stackup():
+    core, _ = _layer_collection()
+    return Stackup(MagicMock(), core)
+
+
+def test_layer_views_are_built_once(stackup):
+    first = stackup.layers
+    second = stackup.layers
+    assert list(first) == ["top", "diel", "bottom"]
+    assert first["top"] is second["top"]
+    assert first is not second
+    assert stackup.core.get_layers.call_count == 1
+
+
+def test_getitem_uses_cached_views(stackup):
+    assert stackup["outline"].name == "outline"
+    assert stackup["top"].name == "top"
+    assert stackup["missing"] is None
+    calls = stackup.core.get_layers.call_count
+    stackup["bottom"]
+    assert stackup.core.get_layers.call_count == calls
+
+
+def test_non_stackup_layer_is_not_cloned_on_construction():
+    core = _core_layer("outline")
+    layer = Layer(core=core)
+    core.clone.assert_not_called()
+    assert layer._cloned_layer is core.clone.return_value
+    assert layer._cloned_layer is core.clone.return_value
+    core.clone.assert_called_once()
+
+
+def test_rename_invalidates_cache(stackup):
+    stackup.layers["top"].name = "renamed"
+    assert stackup._layer_cache == {}
+
+
+def test_remove_layer_invalidates_cache(stackup, monkeypatch):
+    new_collection = MagicMock()
+    monkeypatch.setattr("pyedb.grpc.database.stackup.CoreLayerCollection.create", lambda: new_collection)
+    stackup.layers
+    assert stackup.remove_layer("diel")
+    assert stackup._layer_cache == {}
+    assert stackup._pedb.layout.core.layer_collection is new_collection
+    assert new_collection.add_layer_bottom.call_count == 2
+
+
+def test_transaction_commits_once(stackup):
+    live = stackup.core
+    working, _ = _layer_collection()
+    live.clone.return_value = working
+    with stackup.transaction():
+        assert stackup.core is working
+        with stackup.transaction():
+            assert stackup.core is working
+        assert stackup._pedb.layout.core.layer_collection is not working
+    assert stackup.core is live
+    assert stackup._pedb.layout.core.layer_collection is working
+
+
+def test_transaction_rolls_back_on_error(stackup):
+    live = stackup.core
+    previous = stackup._pedb.layout.core.layer_collection
+    with pytest.raises(ValueError):
+        with stackup.transaction():
+            raise ValueError("boom")
+    assert stackup.core is live
+    assert stackup._transaction_depth == 0
+    assert stackup._pedb.layout.core.layer_collection is previous
+
+
+def test_type_change_invalidates_cache(stackup):
+    stackup.signal_layers["top"].type = "user_layer"
+    assert stackup._layer_cache == {}
+
+
+def test_transaction_routes_wrappers_built_before_it(stackup):
+    live = stackup.core
+    before = stackup.layers["top"]
+    working, _ = _layer_collection()
+    working_top = _core_layer("top")
+    working.find_by_name.return_value = working_top
+    live.clone.return_value = working
+    with stackup.transaction():
+        before.thickness = 1e-5
+        assert before.core is working_top
+        working.find_by_name.assert_called_once_with("top")
+    assert working_top.thickness == stackup._pedb._value_setter.return_value
+    assert before.core is before._core
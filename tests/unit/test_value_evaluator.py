@@ -0,0 +1,138 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Unit tests for pyedb.generic.value_evaluator — no license required."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from pyedb.generic.settings import settings
+from pyedb.generic.value_evaluator import clear_cache, evaluate_expression, evaluate_expressions
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("4mil", 4 * 2.54e-5),
+        ("0.1mm", 1e-4),
+        (" -2.5um ", -2.5e-6),
+        ("1e9", 1e9),
+        ("2.4GHz", 2.4e9),
+        ("10pF", 10e-12),
+        (".5in", 0.0127),
+    ],
+)
+def test_evaluate_expression_resolves_plain_values(expression, expected):
+    assert evaluate_expression(expression) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("expression", ["$thickness", "w1", "1mm+2mm", "2*pad", "3furlong", "sin(1)", "1MM"])
+def test_evaluate_expression_delegates_variables_and_unknown_units(expression):
+    assert evaluate_expression(expression) is None
+
+
+def test_evaluate_expression_is_memoized():
+    clear_cache()
+    evaluate_expression("7mil")
+    evaluate_expression("7mil")
+    info = evaluate_expression.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_evaluate_expressions_broadcasts_unique_values():
+    fallback = MagicMock(return_value=42.0)
+    result = evaluate_expressions([["1mm", "w1"], ["1mm", "w1"]], fallback=fallback)
+    assert result.shape == (2, 2)
+    np.testing.assert_allclose(result, [[1e-3, 42.0], [1e-3, 42.0]])
+    fallback.assert_called_once_with("w1")
+
+
+def test_evaluate_expressions_without_fallback_returns_nan():
+    result = evaluate_expressions(["1mm", "$var"])
+    assert result[0] == pytest.approx(1e-3)
+    assert np.isnan(result[1])
+
+
+def test_evaluate_expressions_numeric_input():
+    result = evaluate_expressions(np.array([1, 2, 3]))
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, [1.0, 2.0, 3.0])
+
+
+@pytest.fixture
+def value_stub():
+    """Replace the EDB value service stub and count the server round trips."""
+    from ansys.api.edb.v1.edb_messages_pb2 import ValueMessage
+    from ansys.edb.core.utility.value import Value as CoreValue
+
+    stub = MagicMock()
+
+    def _create_value(message):
+        result = ValueMessage(text=message.text)
+        result.constant.real = 5.0
+        return result
+
+    stub.CreateValue.side_effect = _create_value
+    with patch.object(CoreValue, "_Value__stub", stub):
+        yield stub
+
+
+class TestEdbValue:
+    def _make_edb(self):
+        from pyedb.grpc.edb import Edb as GrpcEdb
+
+        edb = MagicMock()
+        edb.active_db = None
+        edb.active_cell = None
+        edb.value = lambda val: GrpcEdb.value(edb, val)
+        edb.values = lambda vals: GrpcEdb.values(edb, vals)
+        return edb
+
+    def test_plain_string_skips_server(self, value_stub):
+        result = self._make_edb().value("4mil")
+        assert value_stub.CreateValue.call_count == 0
+        assert float(result) == pytest.approx(1.016e-4)
+        assert str(result) == "4mil"
+
+    def test_variable_string_uses_server(self, value_stub):
+        result = self._make_edb().value("$h")
+        assert value_stub.CreateValue.call_count > 0
+        assert float(result) == 5.0
+
+    def test_disabled_local_evaluation_uses_server(self, value_stub):
+        settings.enable_local_value_evaluation = False
+        try:
+            self._make_edb().value("0.1mm")
+        finally:
+            settings.enable_local_value_evaluation = True
+        assert value_stub.CreateValue.call_count > 0
+
+    def test_values_vectorized(self, value_stub):
+        result = self._make_edb().values(["1mm", "w", "1mm", "w"])
+        assert {call.args[0].text for call in value_stub.CreateValue.call_args_list} == {"w"}
+        np.testing.assert_allclose(result, [1e-3, 5.0, 1e-3, 5.0])
@@ -0,0 +1,153 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the via reduction planner."""
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pyedb.generic import via_reduction
+from pyedb.generic.via_reduction import (
+    ViaSnapshot,
+    nearest_indices,
+    plan_cell_reduction,
+    plan_grid_sampling,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _via(via_id, x, y, net="GND"):
+    return SimpleNamespace(id=via_id, position=[x, y], net_name=net)
+
+
+@pytest.fixture
+def vias():
+    rng = np.random.default_rng(7)
+    points = rng.uniform(0, 10e-3, size=(400, 2))
+    return [_via(i + 1, x, y, "GND" if i % 4 else "VCC") for i, (x, y) in enumerate(points)]
+
+
+def test_snapshot_filters_nets_and_keeps_id_order(vias):
+    snapshot = ViaSnapshot.from_instances(vias, nets="VCC")
+    assert set(snapshot.nets) == {"VCC"}
+    assert len(snapshot) == 100
+
+    snapshot = ViaSnapshot.from_instances(vias, ids=[5, 2, 9])
+    assert snapshot.ids.tolist() == [5, 2, 9]
+    assert snapshot.positions[0].tolist() == vias[4].position
+    with pytest.raises(KeyError):
+        ViaSnapshot.from_instances(vias, ids=[1, 10000])
+
+
+def test_bounding_box_includes_boundary():
+    snapshot = ViaSnapshot.from_instances([_via(1, 0, 0), _via(2, 1e-3, 1e-3), _via(3, 2e-3, 0)])
+    assert snapshot.in_bounding_box([1e-3, 1e-3, 0, 0]).ids.tolist() == [1, 2]
+    with pytest.raises(Exception):
+        snapshot.in_bounding_box([0, 0, 1])
+
+
+def test_bounding_box_selects_by_position(vias):
+    rtree = pytest.importorskip("rtree")
+    # A via 10 um outside the box is not selected, even when its pad would overlap the box edge.
+    vias = vias + [_via(1000, 5e-3 + 10e-6, 5e-3)]
+    bounding_box = (1e-3, 2e-3, 5e-3, 6e-3)
+    index = rtree.index.Index()
+    for via in vias:
+        index.insert(via.id, via.position)
+
+    selected = ViaSnapshot.from_instances(vias).in_bounding_box(list(bounding_box)).ids.tolist()
+
+    assert 1000 not in selected
+    assert sorted(selected) == sorted(index.intersection(bounding_box))
+
+
+def test_grid_sampling_matches_brute_force(vias, monkeypatch):
+    snapshot = ViaSnapshot.from_instances(vias)
+    plan = plan_grid_sampling(snapshot, 5, 4)
+
+    x, y = snapshot.positions.T
+    x_grid, y_grid = np.meshgrid(np.linspace(x.min(), x.max(), 5), np.linspace(y.min(), y.max(), 4))
+    expected = {
+        int(snapshot.ids[np.argmin(np.square(gx - x) + np.square(gy - y))])
+        for gx, gy in zip(x_grid.ravel(), y_grid.ravel())
+    }
+    assert set(plan.kept_ids) == expected
+    assert plan.summary() == {"vias": 400, "kept": len(expected), "removed": 400 - len(expected)}
+
+    monkeypatch.setattr(via_reduction, "_CHUNK_SIZE", 3)
+    points = np.column_stack((x_grid.ravel(), y_grid.ravel()))
+    indices = nearest_indices(snapshot.positions, points)
+    monkeypatch.setitem(sys.modules, "scipy.spatial", None)
+    assert nearest_indices(snapshot.positions, points).tolist() == indices.tolist()
+
+
+def test_cell_reduction_keeps_via_closest_to_each_cell_center():
+    positions = [(0.1e-3, 0.1e-3), (0.45e-3, 0.55e-3), (0.9e-3, 0.9e-3), (1.2e-3, 0.2e-3), (2.6e-3, 0.5e-3)]
+    snapshot = ViaSnapshot.from_instances([_via(i, x, y) for i, (x, y) in enumerate(positions)])
+    plan = plan_cell_reduction(snapshot, 1e-3, 1e-3)
+
+    assert plan.kept_ids == [1, 3, 4]
+    assert plan.removed_ids == [0, 2]
+    assert len(plan.grid) == 3
+    assert np.allclose(
+        plan.grid[0], [[0.1e-3, 1.1e-3, 1.1e-3, 0.1e-3, 0.1e-3], [0.1e-3, 0.1e-3, 1.1e-3, 1.1e-3, 0.1e-3]]
+    )
+    assert np.allclose(plan.removed_positions, [positions[0], positions[2]])
+
+
+def test_cell_reduction_matches_per_cell_loop(vias):
+    snapshot = ViaSnapshot.from_instances(vias)
+    plan = plan_cell_reduction(snapshot, 2e-3, 1.5e-3)
+
+    x_min, y_min = snapshot.positions.min(axis=0)
+    cells = {}
+    for via_id, pos in zip(snapshot.ids, snapshot.positions):
+        key = (int((pos[0] - x_min) // 2e-3), int((pos[1] - y_min) // 1.5e-3))
+        cells.setdefault(key, []).append((int(via_id), pos))
+    expected = set()
+    for (i, j), items in cells.items():
+        center = [x_min + (i + 0.5) * 2e-3, y_min + (j + 0.5) * 1.5e-3]
+        expected.add(items[int(np.argmin([np.linalg.norm(pos - center) for _, pos in items]))][0])
+    assert set(plan.kept_ids) == expected
+    assert len(plan.grid) == len(cells)
+
+
+def test_apply_deletes_once_in_a_single_batch(vias):
+    plan = plan_cell_reduction(ViaSnapshot.from_instances(vias), 2e-3, 2e-3)
+    batches = []
+    assert plan.apply(batches.append) == plan.summary()["removed"]
+    assert len(batches) == 1
+    assert [via.id for via in batches[0]] == plan.removed_ids
+    assert plan.apply(batches.append) == 0
+    assert len(batches) == 1
+
+
+def test_empty_snapshot():
+    snapshot = ViaSnapshot.from_instances([])
+    assert plan_grid_sampling(snapshot, 2, 2).summary() == {"vias": 0, "kept": 0, "removed": 0}
+    plan = plan_cell_reduction(snapshot)
+    assert plan.grid == [] and plan.apply(lambda instances: None) == 0
@@ -0,0 +1,200 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the columnar DRC violation store — no license required."""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pyedb.workflows.drc.drc import Drc
+from pyedb.workflows.drc.violations import COLUMNS, ViolationStore
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence]
+
+
+def _store():
+    store = ViolationStore()
+    store.append({"rule": "minLineWidth", "layer": "TOP", "primitive": 12, "value_um": 80e-6, "limit_um": 90e-6})
+    store.append(
+        {
+            "rule": "minClearance",
+            "net1": "CLK",
+            "net2": "DATA",
+            "layer": "TOP",
+            "primitive1": 1,
+            "primitive2": 2,
+            "distance_um": 50e-6,
+            "limit_um": 100e-6,
+            "bbox": (0.0, 0.0, 1e-3, 1e-3),
+        }
+    )
+    store.add("minClearance", value=20e-6, limit=100e-6, net1="DATA", net2="GND", layer="BOT", bbox=(5e-3, 5e-3))
+    store.append({"rule": "copper_balance_window", "layer": "BOT", "limit_pct": 10, "windows": [(0, 0, 1, 1, 0.2)]})
+    return store
+
+
+def test_rows_keep_their_keys():
+    store = _store()
+
+    assert len(store) == 4
+    assert store[0] == {"rule": "minLineWidth", "layer": "TOP", "primitive": 12, "value_um": 80e-6, "limit_um": 90e-6}
+    assert store[1]["primitive2"] == 2
+    assert store[1]["bbox"] == (0.0, 0.0, 1e-3, 1e-3)
+    assert store[2] == {
+        "rule": "minClearance",
+        "value": 20e-6,
+        "limit": 100e-6,
+        "net1": "DATA",
+        "net2": "GND",
+        "layer": "BOT",
+        "bbox": (5e-3, 5e-3, 5e-3, 5e-3),
+    }
+    assert store[-1]["windows"] == [(0, 0, 1, 1, 0.2)]
+    assert [row["rule"] for row in store] == ["minLineWidth", "minClearance", "minClearance", "copper_balance_window"]
+    with pytest.raises(IndexError):
+        store[4]
+
+
+def test_non_numeric_values_are_kept_as_details():
+    store = ViolationStore()
+    store.append({"rule": "minLineWidth", "limit_um": "3.5mil"})
+
+    assert store[0] == {"rule": "minLineWidth", "limit_um": "3.5mil"}
+    assert np.isnan(store.column("limit")[0])
+
+
+def test_columns():
+    store = _store()
+
+    assert store.column("rule").tolist() == ["minLineWidth", "minClearance", "minClearance", "copper_balance_window"]
+    assert store.column("net1").tolist() == ["", "CLK", "DATA", ""]
+    assert store.column("object1").tolist() == [12, 1, None, None]
+    np.testing.assert_allclose(store.column("value"), [80e-6, 50e-6, 20e-6, np.nan])
+    with pytest.raises(KeyError):
+        store.column("unknown")
+
+
+def test_filter_and_query():
+    store = _store()
+
+    assert [row["rule"] for row in store.filter(layer="TOP")] == ["minLineWidth", "minClearance"]
+    assert len(store.filter(rule="minClearance", net="DATA")) == 2
+    assert len(store.filter(net="GND", layer="TOP")) == 0
+    assert len(store.filter(net="UNKNOWN")) == 0
+    assert [row["net1"] for row in store.query((0.5e-3, 0.5e-3, 6e-3, 6e-3))] == ["CLK", "DATA"]
+    assert len(store.query((2e-3, 2e-3, 3e-3, 3e-3))) == 0
+
+    store.add("minClearance", value=1e-6, limit=1e-4, bbox=(2.5e-3, 2.5e-3))
+    assert len(store.query((2e-3, 2e-3, 3e-3, 3e-3))) == 1
+
+
+def test_deduplicate_ignores_object_and_net_order():
+    store = _store()
+    store.add("minClearance", value=20e-6, limit=100e-6, net1="GND", net2="DATA", layer="BOT", bbox=(5e-3, 5e-3))
+    store.append(dict(store[1], primitive1=2, primitive2=1, net1="DATA", net2="CLK"))
+
+    assert store.deduplicate() == 2
+    assert len(store) == 4
+    assert store[1]["primitive1"] == 1
+    assert store.deduplicate() == 0
+
+
+def test_deduplicate_merges_rows_without_value_or_limit():
+    store = _store()
+    store.extend([dict(store[3]), dict(store[3])])
+    store.extend([{"rule": "x", "via": "V1"}, {"rule": "x", "via": "V1"}])
+
+    assert store.deduplicate() == 3
+    assert [row["rule"] for row in store] == [
+        "minLineWidth",
+        "minClearance",
+        "minClearance",
+        "copper_balance_window",
+        "x",
+    ]
+
+
+def test_summary():
+    summary = _store().summary()
+
+    assert summary["minClearance"] == {"count": 2, "min_value": 20e-6, "max_value": 50e-6}
+    assert summary["minLineWidth"]["count"] == 1
+    assert np.isnan(summary["copper_balance_window"]["min_value"])
+
+
+def test_clear():
+    store = _store()
+    store.clear()
+
+    assert len(store) == 0
+    assert store.summary() == {}
+
+
+def test_to_sqlite(tmp_path):
+    database = str(tmp_path / "drc.db")
+    _store().to_sqlite(database)
+    _store().to_sqlite(database)
+
+    with sqlite3.connect(database) as connection:
+        rows = connection.execute("SELECT * FROM violations").fetchall()
+        names = [column[1] for column in connection.execute("PRAGMA table_info(violations)")]
+    connection.close()
+
+    assert names == list(COLUMNS) + ["details"]
+    assert len(rows) == 4
+    assert rows[1][:8] == ("minClearance", "1", "2", "CLK", "DATA", "TOP", 50e-6, 100e-6)
+    assert rows[0][8:12] == (None, None, None, None)
+    assert json.loads(rows[3][-1]) == {"windows": [[0, 0, 1, 1, 0.2]]}
+
+
+def test_to_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = str(tmp_path / "drc.parquet")
+
+    _store().to_parquet(file_path, batch_size=3)
+
+    table = pq.read_table(file_path)
+    assert table.column_names == list(COLUMNS) + ["details"]
+    assert table.column("rule").to_pylist()[1:3] == ["minClearance", "minClearance"]
+
+
+def test_ipc356a_streams_violations(tmp_path):
+    drc = Drc.__new__(Drc)
+    drc.edb = SimpleNamespace(
+        layout=SimpleNamespace(padstack_instances=[]),
+        padstacks=SimpleNamespace(definitions={}),
+        stackup=SimpleNamespace(signal_layers={}),
+    )
+    drc.violations = _store()
+    file_path = tmp_path / "review.ipc"
+
+    drc.to_ipc356a(str(file_path))
+
+    lines = file_path.read_text().splitlines()
+    assert "C RULE=minLineWidth OBJ=12 NET= LIMIT=9e-05" in lines
+    assert "C RULE=minClearance OBJ=1 NET=CLK LIMIT=0.0001" in lines
+    assert lines[-1] == "999"